@@ -9,6 +9,7 @@ WRITE = 'write'
 
 FILE_KEY_NAME = 'file'
 
+META_KEY_CURSOR = '_cursor'
 META_KEY_FORMAT = '_format'
 META_KEY_LIMIT = '_limit'
 META_KEY_OFFSET = '_offset'
@@ -48,6 +48,7 @@ LogPolicy.allow_query([
     'pipeline_schedule_id',
     'pipeline_schedule_id[]',
     'start_timestamp',
+    'tail',
 ], scopes=[
     OauthScope.CLIENT_PRIVATE,
 ], on_action=[
@@ -45,6 +45,7 @@ PipelineRunPolicy.allow_read(PipelineRunPresenter.default_attributes + [
 ], condition=lambda policy: policy.has_at_least_viewer_role())
 
 PipelineRunPolicy.allow_read(PipelineRunPresenter.default_attributes + [
+    'block_run_status_counts',
     'block_runs',
     'block_runs_count',
     'pipeline_schedule_name',
@@ -97,6 +98,7 @@ PipelineRunPolicy.allow_query([
     'pipeline_uuid',
     'start_timestamp',
     'status',
+    'summary',
 ], scopes=[
     OauthScope.CLIENT_PRIVATE,
 ], on_action=[
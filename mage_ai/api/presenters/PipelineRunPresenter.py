@@ -42,6 +42,22 @@ class PipelineRunPresenter(BasePresenter):
             if include_pipeline_type or pipeline_type is not None:
                 additional_attributes.append('pipeline_type')
 
+            summary = query.get('summary', [False])
+            if summary:
+                summary = summary[0]
+            summary = str(summary).lower() in ('1', 'true')
+
+            if summary:
+                # Block run counts by status, without loading the block runs.
+                status_counts = getattr(self.model, 'block_run_status_counts', None) or dict()
+                data = self.model.to_dict(include_attributes=[
+                    attr for attr in additional_attributes
+                    if attr not in ['block_runs', 'block_runs_count']
+                ])
+                data['block_run_status_counts'] = status_counts
+                data['block_runs_count'] = sum(status_counts.values())
+                return data
+
             return self.model.to_dict(include_attributes=additional_attributes)
         elif constants.DETAIL == kwargs['format']:
             block_runs = self.model.block_runs
@@ -64,6 +80,7 @@ class PipelineRunPresenter(BasePresenter):
 PipelineRunPresenter.register_format(
     constants.LIST,
     PipelineRunPresenter.default_attributes + [
+        'block_run_status_counts',
         'block_runs',
         'block_runs_count',
         'pipeline_schedule_name',
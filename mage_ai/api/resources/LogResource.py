@@ -2,9 +2,15 @@ from datetime import datetime
 from typing import Dict, List
 from sqlalchemy.orm import aliased
 
-from mage_ai.api.operations.constants import META_KEY_LIMIT
+from mage_ai.api.errors import ApiError
+from mage_ai.api.operations.constants import META_KEY_CURSOR, META_KEY_LIMIT
 from mage_ai.api.resources.GenericResource import GenericResource
 from mage_ai.api.utils import get_query_timestamps
+from mage_ai.data_preparation.logging.log_index import (
+    DEFAULT_LOG_LINES_LIMIT,
+    LogFilter,
+    decode_cursor,
+)
 from mage_ai.data_preparation.logging.logger_manager_factory import LoggerManagerFactory
 from mage_ai.data_preparation.models.block.constants import LOG_PARTITION_EDIT_PIPELINE
 from mage_ai.data_preparation.models.file import File
@@ -27,7 +33,12 @@ class LogResource(GenericResource):
 
         arr = []
         if type(parent_model) is BlockRun:
-            arr = parent_model.logs
+            start_timestamp, end_timestamp = get_query_timestamps(query)
+            log_filter = self.log_filter(query, meta, start_timestamp, end_timestamp)
+            if log_filter is not None:
+                arr = await parent_model.logs_async(log_filter=log_filter)
+            else:
+                arr = parent_model.logs
         elif issubclass(parent_model.__class__, Pipeline):
             arr = await self.__pipeline_logs(parent_model, query, meta)
 
@@ -37,12 +48,67 @@ class LogResource(GenericResource):
             **kwargs,
         )
 
+    @classmethod
+    def log_filter(
+        self,
+        query_arg,
+        meta,
+        start_timestamp: datetime = None,
+        end_timestamp: datetime = None,
+    ) -> LogFilter:
+        """
+        Returns the filter of the entries to read from each log file, or None to read the whole
+        log files. The log files are only filtered if the levels, the number of most recent
+        entries (tail) or the cursor of a page are requested. With tail, each log file returns
+        a next_cursor to read the page of older entries.
+        """
+        levels = query_arg.get('level[]', [None])
+        if levels:
+            levels = levels[0]
+        if levels:
+            levels = levels.split(',')
+        else:
+            levels = []
+
+        tail = query_arg.get('tail', [None])
+        if tail:
+            tail = tail[0]
+
+        cursor = meta.get(META_KEY_CURSOR)
+
+        if not levels and not tail and not cursor:
+            return None
+
+        error = ApiError.RESOURCE_INVALID.copy()
+        if tail:
+            try:
+                tail = int(tail)
+            except ValueError:
+                error.update(message='Value is invalid for tail.')
+                raise ApiError(error)
+        if cursor:
+            try:
+                decode_cursor(cursor, None)
+            except ValueError:
+                error.update(message='Value is invalid for cursor.')
+                raise ApiError(error)
+
+        return LogFilter(
+            start_time=start_timestamp.timestamp() if start_timestamp else None,
+            end_time=end_timestamp.timestamp() if end_timestamp else None,
+            levels=levels,
+            limit=tail or (DEFAULT_LOG_LINES_LIMIT if cursor else None),
+            cursor=cursor,
+            tail=bool(tail),
+        )
+
     @classmethod
     @safe_db_query
     async def __pipeline_logs(self, pipeline: Pipeline, query_arg, meta) -> List[Dict]:
         pipeline_uuid = pipeline.uuid
 
         start_timestamp, end_timestamp = get_query_timestamps(query_arg)
+        log_filter = self.log_filter(query_arg, meta, start_timestamp, end_timestamp)
         pipeline_schedule_ids = query_arg.get('pipeline_schedule_id[]', [None])
         if pipeline_schedule_ids:
             pipeline_schedule_ids = pipeline_schedule_ids[0]
@@ -145,7 +211,7 @@ class LogResource(GenericResource):
                 model.pipeline_schedule_id = row.pipeline_schedule_id
                 model.pipeline_uuid = row.pipeline_uuid
                 model.variables = row.variables
-                logs = await model.logs_async()
+                logs = await model.logs_async(log_filter=log_filter)
                 pipeline_log_file_path = logs.get('path')
                 if pipeline_log_file_path not in processed_pipeline_run_log_files:
                     pipeline_run_logs.append(logs)
@@ -231,7 +297,7 @@ class LogResource(GenericResource):
             model2.block_uuid = row.block_uuid
             model2.pipeline_run = model
 
-            logs = await model2.logs_async()
+            logs = await model2.logs_async(log_filter=log_filter)
             block_log_file_path = logs.get('path')
             if block_log_file_path not in processed_block_run_log_files:
                 block_run_logs.append(logs)
@@ -263,7 +329,10 @@ class LogResource(GenericResource):
 
                 return should_add
 
-            block_run_logs += await logger.get_logs_in_subpartition_async(filter_func=__filter)
+            block_run_logs += await logger.get_logs_in_subpartition_async(
+                filter_func=__filter,
+                log_filter=log_filter,
+            )
 
         return [
             {
@@ -1,6 +1,18 @@
+import base64
+import json
+import threading
+import time
+
+import dateutil.parser
+from sqlalchemy import and_, or_
 from sqlalchemy.orm import selectinload
 
-from mage_ai.api.operations.constants import META_KEY_LIMIT, META_KEY_OFFSET
+from mage_ai.api.errors import ApiError
+from mage_ai.api.operations.constants import (
+    META_KEY_CURSOR,
+    META_KEY_LIMIT,
+    META_KEY_OFFSET,
+)
 from mage_ai.api.resources.DatabaseResource import DatabaseResource
 from mage_ai.api.utils import get_query_timestamps
 from mage_ai.data_preparation.models.constants import PipelineType
@@ -15,6 +27,49 @@ from mage_ai.orchestration.pipeline_scheduler import (
     configure_pipeline_run_payload,
     stop_pipeline_run,
 )
+from mage_ai.shared.hash import merge_dict
+
+# Seconds the total count of a pipeline runs query is reused for cursor (keyset) pagination.
+COUNT_CACHE_SECONDS = 30
+
+count_cache = dict()
+count_cache_lock = threading.Lock()
+
+
+def encode_cursor(pipeline_run: PipelineRun) -> str:
+    execution_date = pipeline_run.execution_date
+    return base64.urlsafe_b64encode(json.dumps(dict(
+        execution_date=execution_date.isoformat() if execution_date else None,
+        id=pipeline_run.id,
+    )).encode()).decode()
+
+
+def decode_cursor(cursor: str):
+    data = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    execution_date = data.get('execution_date')
+    if execution_date:
+        execution_date = dateutil.parser.parse(execution_date)
+    return execution_date, data['id']
+
+
+def cached_count(query) -> int:
+    """
+    Returns the number of rows of the query, counted at most once every COUNT_CACHE_SECONDS
+    for the same query and parameters.
+    """
+    statement = query.statement.compile()
+    key = (str(statement), repr(sorted(statement.params.items())))
+    now = time.monotonic()
+    with count_cache_lock:
+        entry = count_cache.get(key)
+        if entry and now - entry[1] < COUNT_CACHE_SECONDS:
+            return entry[0]
+    count = query.count()
+    with count_cache_lock:
+        for k in [k for k, v in count_cache.items() if now - v[1] >= COUNT_CACHE_SECONDS]:
+            del count_cache[k]
+        count_cache[key] = (count, now)
+    return count
 
 
 class PipelineRunResource(DatabaseResource):
@@ -50,6 +105,11 @@ class PipelineRunResource(DatabaseResource):
         if order_by_arg:
             order_by_arg = order_by_arg[0]
 
+        summary = query_arg.get('summary', [False])
+        if summary:
+            summary = summary[0]
+        summary = str(summary).lower() in ('1', 'true')
+
         order_by = None
         if order_by_arg:
             order_by = []
@@ -60,10 +120,12 @@ class PipelineRunResource(DatabaseResource):
                 else:
                     order_by.append((parts[0], 'asc'))
 
+        results = PipelineRun.query
+        if not summary:
+            # The summary has the block run counts by status instead of the block runs.
+            results = results.options(selectinload(PipelineRun.block_runs))
         results = (
-            PipelineRun.
-            query.
-            options(selectinload(PipelineRun.block_runs)).
+            results.
             options(selectinload(PipelineRun.pipeline_schedule)).
             join(PipelineSchedule, PipelineRun.pipeline_schedule_id == PipelineSchedule.id)
         )
@@ -88,6 +150,35 @@ class PipelineRunResource(DatabaseResource):
         if end_timestamp is not None:
             results = results.filter(PipelineRun.created_at <= end_timestamp)
 
+        if not order_by and META_KEY_CURSOR in meta:
+            # Keyset pagination: the page after the cursor, in (execution_date, id) order.
+            cursor = meta.get(META_KEY_CURSOR)
+            if cursor:
+                try:
+                    cursor_execution_date, cursor_id = decode_cursor(cursor)
+                except Exception:
+                    error = ApiError.RESOURCE_INVALID.copy()
+                    error.update(dict(message=f'Invalid cursor {cursor}.'))
+                    raise ApiError(error)
+                if cursor_execution_date is None:
+                    results = results.filter(
+                        PipelineRun.execution_date.is_(None),
+                        PipelineRun.id < cursor_id,
+                    )
+                else:
+                    results = results.filter(or_(
+                        PipelineRun.execution_date < cursor_execution_date,
+                        and_(
+                            PipelineRun.execution_date == cursor_execution_date,
+                            PipelineRun.id < cursor_id,
+                        ),
+                        PipelineRun.execution_date.is_(None),
+                    ))
+            return results.order_by(
+                PipelineRun.execution_date.desc().nullslast(),
+                PipelineRun.id.desc(),
+            )
+
         if order_by:
             arr = []
             for tup in order_by:
@@ -106,7 +197,6 @@ class PipelineRunResource(DatabaseResource):
     @safe_db_query
     async def process_collection(self, query_arg, meta, user, **kwargs):
         total_results = self.collection(query_arg, meta, user, **kwargs)
-        total_count = total_results.count()
 
         limit = int(meta.get(META_KEY_LIMIT, self.DEFAULT_LIMIT))
         offset = int(meta.get(META_KEY_OFFSET, 0))
@@ -115,6 +205,41 @@ class PipelineRunResource(DatabaseResource):
         if pipeline_type:
             pipeline_type = pipeline_type[0]
 
+        order_by_arg = query_arg.get('order_by[]', [None])
+        if order_by_arg:
+            order_by_arg = order_by_arg[0]
+
+        summary = query_arg.get('summary', [False])
+        if summary:
+            summary = summary[0]
+        summary = str(summary).lower() in ('1', 'true')
+
+        if META_KEY_CURSOR in meta and pipeline_type is None and not order_by_arg:
+            # Runs with the same execution date can't be split across pages with keyset
+            # pagination, so there's no need to adjust the page like with offset pagination.
+            results = total_results.limit(limit + 1).all()
+            has_next = len(results) > limit
+            results = results[:limit]
+            if summary:
+                self.__set_block_run_status_counts(results)
+
+            # The count of all the pages, so that it's cached across pages.
+            all_pages = self.collection(
+                query_arg,
+                merge_dict(meta, {META_KEY_CURSOR: None}),
+                user,
+                **kwargs,
+            )
+            result_set = self.build_result_set(results, user, **kwargs)
+            result_set.metadata = {
+                'count': cached_count(all_pages.order_by(None)),
+                'next': has_next,
+                'next_cursor': encode_cursor(results[-1]) if has_next else None,
+            }
+            return result_set
+
+        total_count = total_results.count()
+
         if pipeline_type is not None:
             pipeline_type_by_pipeline_uuid = dict()
             try:
@@ -144,7 +269,7 @@ class PipelineRunResource(DatabaseResource):
             pipeline_uuid = pipeline_uuid[0]
 
         if meta.get(META_KEY_LIMIT, None) is not None and \
-            total_results.count() >= 1 and \
+            len(results) >= 1 and \
                 (pipeline_uuid is not None or pipeline_schedule_id is not None):
 
             first_result = results[0]
@@ -173,6 +298,8 @@ class PipelineRunResource(DatabaseResource):
         results_size = len(results)
         has_next = results_size > limit
         final_end_idx = results_size - 1 if has_next else results_size
+        if summary:
+            self.__set_block_run_status_counts(results[0:final_end_idx])
 
         result_set = self.build_result_set(
             results[0:final_end_idx],
@@ -187,6 +314,15 @@ class PipelineRunResource(DatabaseResource):
 
         return result_set
 
+    @classmethod
+    def __set_block_run_status_counts(self, pipeline_runs):
+        counts_by_pipeline_run_id = PipelineRun.block_run_status_counts(
+            [pipeline_run.id for pipeline_run in pipeline_runs],
+        )
+        for pipeline_run in pipeline_runs:
+            pipeline_run.block_run_status_counts = \
+                counts_by_pipeline_run_id.get(pipeline_run.id, dict())
+
     @classmethod
     @safe_db_query
     def create(self, payload, user, **kwargs):
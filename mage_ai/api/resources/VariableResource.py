@@ -24,7 +24,11 @@ def get_variable_value(
         block_uuid,
         variable_uuid,
     )
-    if variable.variable_type in [VariableType.DATAFRAME, VariableType.GEO_DATAFRAME]:
+    if variable.variable_type in [
+        VariableType.CHUNKED_DATAFRAME,
+        VariableType.DATAFRAME,
+        VariableType.GEO_DATAFRAME,
+    ]:
         value = 'DataFrame'
         variable_type = 'pandas.DataFrame'
     else:
@@ -138,16 +138,10 @@ def infer_column_type(series, column_name, dtype, kwargs):
 
 
 def infer_object_type(series, column_name, kwargs):
-    clean_series = series.apply(lambda x: x.strip(' \'\"') if type(x) is str else x)
-    clean_series = clean_series.map(lambda x: x if (not isinstance(x, str) or x != '') else np.nan)
-    clean_series = clean_series.dropna()
-
-    exact_dtype = type(clean_series.iloc[0]) if clean_series.count() else None
+    values, counts, clean_series_nunique, exact_dtype = unique_clean_values(series)
     if exact_dtype in [list, tuple, set]:
         return ColumnType.LIST
 
-    series_nunique = series.nunique(dropna=False)
-    clean_series_nunique = clean_series.nunique()
     if np.issubdtype(exact_dtype, np.bool_):
         if clean_series_nunique <= 2:
             return ColumnType.TRUE_OR_FALSE
@@ -156,63 +150,53 @@ def infer_object_type(series, column_name, kwargs):
     elif clean_series_nunique <= 2:
         return ColumnType.TRUE_OR_FALSE
 
-    clean_series = clean_series.astype(str)
-    length = len(clean_series)
-    if all(clean_series.str.match(REGEX_NUMBER)):
-        if not all(clean_series.str.match(REGEX_INTEGER)):
+    # The patterns are matched against the unique values, weighted by their counts. The values
+    # are sorted by count, so that most checks are decided after a few values.
+    length = counts.sum()
+    lowercase_column_name = column_name.lower()
+    if all(REGEX_NUMBER.match(value) for value in values):
+        if not all(REGEX_INTEGER.match(value) for value in values):
             return ColumnType.NUMBER_WITH_DECIMALS
+        elif str_in_set(lowercase_column_name, RESERVED_PHONE_NUMBER_WORDS) and matches_ratio(
+            values, counts, REGEX_PHONE_NUMBER, NUMBER_TYPE_MATCHES_THRESHOLD
+        ):
+            return ColumnType.PHONE_NUMBER
+        elif str_in_set(lowercase_column_name, RESERVED_ZIP_CODE_WORDS) and matches_ratio(
+            values, counts, REGEX_ZIP_CODE, NUMBER_TYPE_MATCHES_THRESHOLD
+        ):
+            return ColumnType.ZIP_CODE
         else:
-            lowercase_column_name = column_name.lower()
-            correct_phone_nums = clean_series.str.match(REGEX_PHONE_NUMBER).sum()
-            correct_zip_codes = clean_series.str.match(REGEX_ZIP_CODE).sum()
-            if correct_phone_nums / length >= NUMBER_TYPE_MATCHES_THRESHOLD and str_in_set(
-                lowercase_column_name, RESERVED_PHONE_NUMBER_WORDS
-            ):
-                return ColumnType.PHONE_NUMBER
-            elif correct_zip_codes / length >= NUMBER_TYPE_MATCHES_THRESHOLD and str_in_set(
-                lowercase_column_name, RESERVED_ZIP_CODE_WORDS
-            ):
-                return ColumnType.ZIP_CODE
-            else:
-                clean_series = clean_series.str.replace(r'\.0*', '', regex=True)
-                try:
-                    clean_series.astype(int)
-                    return ColumnType.NUMBER
-                except OverflowError:
-                    if clean_series_nunique <= kwargs.get('category_cardinality_threshold', 255):
-                        return ColumnType.CATEGORY
-                    else:
-                        return ColumnType.CATEGORY_HIGH_CARDINALITY
+            try:
+                pd.Series(values).str.replace(r'\.0*', '', regex=True).astype(int)
+                return ColumnType.NUMBER
+            except OverflowError:
+                if clean_series_nunique <= kwargs.get('category_cardinality_threshold', 255):
+                    return ColumnType.CATEGORY
+                else:
+                    return ColumnType.CATEGORY_HIGH_CARDINALITY
 
     else:
-        matches = clean_series.str.match(REGEX_DATETIME).sum()
-        if matches / length >= DATETIME_MATCHES_THRESHOLD:
+        if matches_ratio(values, counts, REGEX_DATETIME, DATETIME_MATCHES_THRESHOLD):
             return ColumnType.DATETIME
-        # TODO: Refactor / Reduce cleaning logic
-        correct_emails = clean_series.str.match(REGEX_EMAIL).sum()
-        correct_phone_nums = clean_series.str.match(REGEX_PHONE_NUMBER).sum()
-        correct_zip_codes = clean_series.str.match(REGEX_ZIP_CODE).sum()
-        correct_lists = clean_series.str.match(REGEX_LIST).sum()
-        lowercase_column_name = column_name.lower()
-        if correct_emails / length >= STRING_TYPE_MATCHES_THRESHOLD:
+        if matches_ratio(values, counts, REGEX_EMAIL, STRING_TYPE_MATCHES_THRESHOLD):
             return ColumnType.EMAIL
-        elif correct_phone_nums / length >= STRING_TYPE_MATCHES_THRESHOLD and str_in_set(
-            lowercase_column_name, RESERVED_PHONE_NUMBER_WORDS
+        elif str_in_set(lowercase_column_name, RESERVED_PHONE_NUMBER_WORDS) and matches_ratio(
+            values, counts, REGEX_PHONE_NUMBER, STRING_TYPE_MATCHES_THRESHOLD
         ):
             return ColumnType.PHONE_NUMBER
-        elif correct_zip_codes / length >= STRING_TYPE_MATCHES_THRESHOLD and str_in_set(
-            lowercase_column_name, RESERVED_ZIP_CODE_WORDS
+        elif str_in_set(lowercase_column_name, RESERVED_ZIP_CODE_WORDS) and matches_ratio(
+            values, counts, REGEX_ZIP_CODE, STRING_TYPE_MATCHES_THRESHOLD
         ):
             return ColumnType.ZIP_CODE
-        elif correct_lists / length >= STRING_TYPE_MATCHES_THRESHOLD:
+        elif matches_ratio(values, counts, REGEX_LIST, STRING_TYPE_MATCHES_THRESHOLD):
             return ColumnType.LIST
-        elif series_nunique == 2:
+        elif series.nunique(dropna=False) == 2:
             return ColumnType.TRUE_OR_FALSE
 
         if clean_series_nunique / length >= 0.8:
             return ColumnType.TEXT
 
-        word_count = clean_series.map(lambda x: len(str(x).split(' '))).max()
+        word_count = max(value.count(' ') for value in values) + 1
         if word_count > MAXIMUM_WORD_LENGTH_FOR_CATEGORY_FEATURES:
             return ColumnType.TEXT
 
@@ -222,6 +206,80 @@ def infer_object_type(series, column_name, kwargs):
             return ColumnType.CATEGORY_HIGH_CARDINALITY
 
 
+def unique_clean_values(series):
+    """
+    Strips the quotes and spaces around the strings of an object series and drops the null and
+    empty values. The values are stripped and converted to strings once per unique value.
+
+    Returns:
+        The unique values as strings sorted by count in descending order, their counts, the
+        number of unique values before they are converted to strings, and the type of the first
+        value.
+    """
+    exact_dtype = None
+    values = series.to_numpy()
+    for idx in np.flatnonzero(series.notna().to_numpy()):
+        value = values[idx]
+        if type(value) is str:
+            value = value.strip(' \'\"')
+        if not isinstance(value, str) or value != '':
+            exact_dtype = type(value)
+            break
+    if exact_dtype in [list, tuple, set]:
+        return None, None, None, exact_dtype
+
+    value_counts = series.value_counts(sort=False)
+    clean_values = []
+    for value in value_counts.index:
+        if type(value) is str:
+            value = value.strip(' \'\"')
+        clean_values.append(np.nan if isinstance(value, str) and value == '' else value)
+    value_counts = value_counts.groupby(
+        pd.Index(clean_values, dtype=object),
+        sort=False,
+    ).sum()
+    clean_series_nunique = len(value_counts)
+
+    if pd.api.types.infer_dtype(value_counts.index, skipna=False) not in ['empty', 'string']:
+        # Values of different types can be equal, e.g. 1, 1.0 and True, so they are counted as
+        # one value although their strings differ. Convert each value to a string instead, one
+        # by one since astype(str) fails on values like tuples.
+        strings = []
+        for value in series.dropna().to_numpy():
+            if type(value) is str:
+                value = value.strip(' \'\"')
+                if value == '':
+                    continue
+            strings.append(str(value))
+        value_counts = pd.Series(strings, dtype=object).value_counts(sort=False)
+    value_counts = value_counts.sort_values(ascending=False, kind='stable')
+    return (
+        value_counts.index.to_numpy(dtype=object),
+        value_counts.to_numpy(),
+        clean_series_nunique,
+        exact_dtype,
+    )
+
+
+def matches_ratio(values, counts, pattern, threshold):
+    """
+    Returns whether the ratio of the values, weighted by their counts, that match the pattern
+    is at least the threshold. Stops as soon as the remaining values can't change the result.
+    """
+    length = int(counts.sum())
+    matches = 0
+    remaining = length
+    for value, count in zip(values, counts.tolist()):
+        remaining -= count
+        if pattern.match(value):
+            matches += count
+            if matches / length >= threshold:
+                return True
+        elif (matches + remaining) / length < threshold:
+            return False
+    return matches / length >= threshold
+
+
 def infer_column_types(df, **kwargs):
     column_types = kwargs.get('column_types', {})
     df_columns = df.columns.tolist()
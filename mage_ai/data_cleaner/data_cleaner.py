@@ -3,6 +3,7 @@ from mage_ai.data_cleaner.column_types import column_type_detector
 from mage_ai.data_cleaner.pipelines.base import DEFAULT_RULES, BasePipeline
 from mage_ai.data_cleaner.shared.utils import clean_dataframe
 from mage_ai.data_cleaner.statistics.calculator import StatisticsCalculator
+from mage_ai.data_cleaner.statistics.constants import ProfilingMode
 from mage_ai.shared.hash import merge_dict
 from mage_ai.shared.logger import timer, VerboseFunctionExec
 
@@ -20,8 +21,9 @@ def clean(
     rules=DEFAULT_RULES,
     rule_configs={},
     verbose=True,
+    profiling_mode=ProfilingMode.FULL,
 ):
-    cleaner = DataCleaner(verbose=verbose)
+    cleaner = DataCleaner(verbose=verbose, profiling_mode=profiling_mode)
     return cleaner.clean(
         df,
         column_types=column_types,
@@ -33,8 +35,9 @@ def clean(
 
 
 class DataCleaner:
-    def __init__(self, verbose=False):
+    def __init__(self, verbose=False, profiling_mode=ProfilingMode.FULL):
         self.verbose = verbose
+        self.profiling_mode = profiling_mode
 
     def analyze(self, df, column_types={}, df_original=None):
         """Analyze a dataframe
@@ -54,9 +57,11 @@ class DataCleaner:
             ):
                 df = clean_dataframe(df, column_types, dropna=False)
         with timer('data_cleaner.calculate_statistics'):
-            statistics = StatisticsCalculator(column_types, verbose=self.verbose).process(
-                df, df_original=df_original, is_clean=True
-            )
+            statistics = StatisticsCalculator(
+                column_types,
+                verbose=self.verbose,
+                profiling_mode=self.profiling_mode,
+            ).process(df, df_original=df_original, is_clean=True)
         with timer('data_cleaner.calculate_insights'):
             analysis = AnalysisCalculator(
                 df, column_types, statistics, verbose=self.verbose
@@ -1,6 +1,8 @@
 from mage_ai.data_cleaner.column_types.column_type_detector import find_syntax_errors
 from mage_ai.data_cleaner.column_types.constants import NUMBER_TYPES, ColumnType
 from mage_ai.data_cleaner.shared.utils import clean_dataframe
+from mage_ai.data_cleaner.statistics.constants import ProfilingMode
+from mage_ai.data_cleaner.statistics.sketches import ColumnProfile, DataFrameProfile
 from mage_ai.shared.constants import SAMPLE_SIZE
 from mage_ai.shared.custom_types import FrozenDict
 from mage_ai.shared.hash import merge_dict
@@ -15,6 +17,8 @@ EMAIL_DOMAIN_REGEX = r'\@([^\s]*)'
 INVALID_VALUE_SAMPLE_COUNT = 100
 OUTLIER_SAMPLE_COUNT = 100
 OUTLIER_ZSCORE_THRESHOLD = 3
+# Number of rows profiled at a time in the sketch profiling mode.
+PROFILE_CHUNK_SIZE = 100_000
 PUNCTUATION = r'[:;\.,\/\\&`"\'\(\)\[\]\{\}]'
 STOP_WORD_LIST = frozenset(['is', 'and', 'yet', 'but', 'a', 'or', 'nor', 'not', 'to', 'the'])
 VALUE_COUNT_LIMIT = 20
@@ -38,10 +42,12 @@ class StatisticsCalculator:
         # feature_set_version,
         column_types,
         verbose=False,
+        profiling_mode: ProfilingMode = ProfilingMode.FULL,
         **kwargs,
     ):
         self.column_types = column_types
         self.verbose = verbose
+        self.profiling_mode = ProfilingMode(profiling_mode or ProfilingMode.FULL)
 
     @property
     def data_tags(self):
@@ -88,6 +94,13 @@ class StatisticsCalculator:
             logger.exception(f'An error was caught while processing statistics: {err}')
             return {}
 
+    def sketch_statistics_overview(self, series, col, profile: ColumnProfile):
+        try:
+            return self.__sketch_statistics_overview(series, col, profile)
+        except Exception as err:
+            logger.exception(f'An error was caught while processing statistics: {err}')
+            return self.statistics_overview(series, col)
+
     def __calculate_statistics_overview(self, df, df_original=None, is_clean=True):
         with timer('statistics.calculate_statistics_overview.time', self.data_tags, verbose=False):
             if not is_clean:
@@ -97,10 +110,24 @@ class StatisticsCalculator:
                 count=len(df.index)
             )
 
-            arr_args_1 = ([df[col] for col in df.columns],)
-            arr_args_2 = ([col for col in df.columns],)
+            profile = None
+            if self.profiling_mode == ProfilingMode.SKETCH:
+                profile = DataFrameProfile(self.column_types)
+                for start in range(0, len(df.index), PROFILE_CHUNK_SIZE):
+                    profile.update(df.iloc[start:start + PROFILE_CHUNK_SIZE])
+                dicts = [
+                    self.sketch_statistics_overview(
+                        df[col],
+                        col,
+                        profile.columns.get(col) or ColumnProfile(self.column_types.get(col)),
+                    )
+                    for col in df.columns
+                ]
+            else:
+                arr_args_1 = ([df[col] for col in df.columns],)
+                arr_args_2 = ([col for col in df.columns],)
 
-            dicts = map(self.statistics_overview, *arr_args_1, *arr_args_2)
+                dicts = map(self.statistics_overview, *arr_args_1, *arr_args_2)
 
             for d in dicts:
                 data.update(d)
@@ -122,8 +149,11 @@ class StatisticsCalculator:
                 data['total_invalid_value_count'], df.size
             )
 
-            df_dedupe = df.drop_duplicates()
-            data['duplicate_row_count'] = row_count - df_dedupe.shape[0]
+            if profile is not None:
+                data['duplicate_row_count'] = profile.duplicate_row_count()
+            else:
+                df_dedupe = df.drop_duplicates()
+                data['duplicate_row_count'] = row_count - df_dedupe.shape[0]
 
             data['empty_column_count'] = len(
                 [col for col in df.columns if data[f'{col}/count'] == 0]
@@ -235,43 +265,16 @@ class StatisticsCalculator:
                 data[f'{col}/sum'] = series_non_null.sum()
                 data[f'{col}/skew'] = series_non_null.skew()
                 data[f'{col}/std'] = series_non_null.std()
-                # detect outliers
-                if data[f'{col}/std'] == 0:
-                    data[f'{col}/outlier_count'] = 0
-                else:
-                    series_z_score = (
-                        (series_non_null - data[f'{col}/average']) / data[f'{col}/std']
-                    ).abs()
-                    series_outliers = series_z_score[series_z_score >= OUTLIER_ZSCORE_THRESHOLD]
-                    data[f'{col}/outlier_count'] = series_outliers.count()
-                    data[f'{col}/outlier_ratio'] = self.__protected_division(
-                        data[f'{col}/outlier_count'], series.size
-                    )
-                    data[f'{col}/outliers'] = (
-                        series_non_null.loc[series_outliers.index]
-                        .iloc[:OUTLIER_SAMPLE_COUNT]
-                        .tolist()
-                    )
-                # generate five number summary
                 first_quartile = series_non_null.quantile(0.25, interpolation='nearest')
                 third_quartile = series_non_null.quantile(0.75, interpolation='nearest')
-                iqr = third_quartile - first_quartile
-                outlier_mask = (series_non_null <= first_quartile - 1.5 * iqr) | (
-                    series_non_null >= third_quartile + 1.5 * iqr
-                )
-                outliers = series_non_null[outlier_mask].unique().tolist()
-                data[f'{col}/box_plot_data'] = {
-                    'outliers': outliers[:OUTLIER_SAMPLE_COUNT],
-                    'min': data[f'{col}/min'],
-                    'first_quartile': first_quartile,
-                    'median': data[f'{col}/median'],
-                    'third_quartile': third_quartile,
-                    'max': data[f'{col}/max'],
-                }
-                if len(outliers) != 0:
-                    not_outliers = series_non_null[~outlier_mask]
-                    data[f'{col}/box_plot_data']['min'] = not_outliers.min()
-                    data[f'{col}/box_plot_data']['max'] = not_outliers.max()
+                data.update(self.__outlier_statistics(
+                    series,
+                    series_non_null,
+                    col,
+                    data,
+                    first_quartile,
+                    third_quartile,
+                ))
             elif column_type == ColumnType.DATETIME:
                 dates = pd.to_datetime(series_non_null, utc=True, errors='coerce').dropna()
                 data[f'{col}/max'] = dates.max().isoformat()
@@ -279,57 +282,8 @@ class StatisticsCalculator:
                     dates.sort_values().iloc[math.floor(len(dates) / 2)].isoformat()
                 )
                 data[f'{col}/min'] = dates.min().isoformat()
-            elif column_type == ColumnType.TEXT:
-                text_series = series_non_null
-                string_length = text_series.str.len()
-                data[f'{col}/avg_string_length'] = string_length.mean()
-                data[f'{col}/min_character_count'] = string_length.min()
-                data[f'{col}/max_character_count'] = string_length.max()
-                text_series = text_series.str.replace(PUNCTUATION, ' ', regex=True)
-                text_series = text_series.str.lower().str.strip()
-                text_series = text_series.str.split(r'\s+')
-
-                word_count = text_series.map(len)
-                data[f'{col}/max_word_count'] = word_count.max()
-                data[f'{col}/avg_word_count'] = word_count.mean()
-                data[f'{col}/min_word_count'] = word_count.min()
-
-                exploded_text_series = text_series.explode()
-                data[f'{col}/word_distribution'] = (
-                    exploded_text_series.value_counts().head(VALUE_COUNT_LIMIT).to_dict()
-                )
-                # TODO: Calculate average word count excluding stopwords
-                # data[f'{col}/word_count_excl_stopwords'] = (
-                #     len(exploded_text_series) - exploded_text_series.isin(STOP_WORD_LIST).sum()
-                # )
-            elif column_type == ColumnType.EMAIL:
-                valid_emails = series_non_null[~invalid_rows]
-                domains = valid_emails.str.extract(EMAIL_DOMAIN_REGEX, expand=False)
-                data[f'{col}/domain_distribution'] = (
-                    domains.value_counts().head(VALUE_COUNT_LIMIT).to_dict()
-                )
-            elif column_type == ColumnType.LIST:
-                lengths = series_non_null.str.len()
-                data[f'{col}/avg_list_length'] = lengths.mean()
-                data[f'{col}/max_list_length'] = lengths.max()
-                data[f'{col}/min_list_length'] = lengths.min()
-                data[f'{col}/length_distribution'] = (
-                    lengths.value_counts().head(VALUE_COUNT_LIMIT).to_dict()
-                )
-
-                elements = series_non_null.explode()
-                element_value_counts = elements.value_counts(dropna=False)
-                data[f'{col}/most_frequent_element'] = element_value_counts.index[0]
-                data[f'{col}/least_frequent_element'] = element_value_counts.index[-1]
-                if any(
-                    isinstance(idx, FrozenDict)
-                    for idx in element_value_counts.index[:VALUE_COUNT_LIMIT]
-                ):
-                    str_index = element_value_counts.index.astype(str)
-                    element_value_counts.index = str_index
-                data[f'{col}/element_distribution'] = element_value_counts.head(
-                    VALUE_COUNT_LIMIT
-                ).to_dict()
+            else:
+                data.update(self.__type_statistics(series_non_null, invalid_rows, column_type, col))
 
         if column_type not in NUMBER_TYPES:
             if dates is not None:
@@ -353,6 +307,181 @@ class StatisticsCalculator:
                 df_value_counts[mode].item() / df_value_counts.sum() if mode else 0
             )
 
+        return self.__add_invalid_value_statistics(data, series, series_non_null, invalid_rows, col)
+
+    def __sketch_statistics_overview(self, series, col, profile: ColumnProfile):
+        column_type = self.column_types.get(col)
+        series_non_null = series.dropna()
+        heavy_hitters = profile.frequent.heavy_hitters(VALUE_COUNT_LIMIT)
+
+        data = {
+            f'{col}/count': profile.count,
+            f'{col}/count_distinct': min(profile.distinct.count(), profile.count),
+            f'{col}/null_value_count': profile.null_count,
+            f'{col}/value_counts': {str(value): count for value, count in heavy_hitters},
+        }
+
+        data[f'{col}/null_value_rate'] = self.__protected_division(
+            data[f'{col}/null_value_count'], series.size
+        )
+        data[f'{col}/unique_value_rate'] = self.__protected_division(
+            data[f'{col}/count_distinct'], series.size
+        )
+        data[f'{col}/max_null_seq'] = (
+            profile.longest_null_sequence
+            if data[f'{col}/count'] != 0
+            else len(series)
+        )
+
+        invalid_rows = find_syntax_errors(series_non_null, column_type)
+
+        if profile.count > 0:
+            if profile.is_numeric:
+                moments = profile.moments
+                as_type = int if pd.api.types.is_integer_dtype(series.dtype) else float
+                data[f'{col}/average'] = moments.mean
+                data[f'{col}/max'] = as_type(moments.max)
+                data[f'{col}/median'] = profile.quantiles.quantile(0.5)
+                data[f'{col}/min'] = as_type(moments.min)
+                data[f'{col}/sum'] = as_type(moments.sum)
+                data[f'{col}/skew'] = moments.skew()
+                data[f'{col}/std'] = moments.std()
+                data.update(self.__outlier_statistics(
+                    series,
+                    pd.to_numeric(series_non_null, errors='coerce').dropna(),
+                    col,
+                    data,
+                    profile.quantiles.quantile(0.25),
+                    profile.quantiles.quantile(0.75),
+                ))
+            elif profile.is_datetime:
+                if profile.moments.count > 0:
+                    for key, value in [
+                        ('max', profile.moments.max),
+                        ('median', profile.quantiles.quantile(0.5)),
+                        ('min', profile.moments.min),
+                    ]:
+                        data[f'{col}/{key}'] = pd.Timestamp(int(value), tz='UTC').isoformat()
+            else:
+                data.update(self.__type_statistics(series_non_null, invalid_rows, column_type, col))
+
+        if column_type not in NUMBER_TYPES:
+            mode, mode_count = heavy_hitters[0] if heavy_hitters else (None, 0)
+            if profile.is_datetime:
+                if mode is not None:
+                    mode = mode.isoformat()
+                # Same as the full mode, the ratio is out of the valid dates.
+                mode_ratio = self.__protected_division(mode_count, profile.moments.count)
+            else:
+                mode_ratio = self.__protected_division(mode_count, series.size)
+            data[f'{col}/mode'] = mode
+            data[f'{col}/mode_ratio'] = mode_ratio if mode else 0
+
+        return self.__add_invalid_value_statistics(data, series, series_non_null, invalid_rows, col)
+
+    def __type_statistics(self, series_non_null, invalid_rows, column_type, col):
+        data = dict()
+        if column_type == ColumnType.TEXT:
+            text_series = series_non_null
+            string_length = text_series.str.len()
+            data[f'{col}/avg_string_length'] = string_length.mean()
+            data[f'{col}/min_character_count'] = string_length.min()
+            data[f'{col}/max_character_count'] = string_length.max()
+            text_series = text_series.str.replace(PUNCTUATION, ' ', regex=True)
+            text_series = text_series.str.lower().str.strip()
+            text_series = text_series.str.split(r'\s+')
+
+            word_count = text_series.map(len)
+            data[f'{col}/max_word_count'] = word_count.max()
+            data[f'{col}/avg_word_count'] = word_count.mean()
+            data[f'{col}/min_word_count'] = word_count.min()
+
+            exploded_text_series = text_series.explode()
+            data[f'{col}/word_distribution'] = (
+                exploded_text_series.value_counts().head(VALUE_COUNT_LIMIT).to_dict()
+            )
+            # TODO: Calculate average word count excluding stopwords
+            # data[f'{col}/word_count_excl_stopwords'] = (
+            #     len(exploded_text_series) - exploded_text_series.isin(STOP_WORD_LIST).sum()
+            # )
+        elif column_type == ColumnType.EMAIL:
+            valid_emails = series_non_null[~invalid_rows]
+            domains = valid_emails.str.extract(EMAIL_DOMAIN_REGEX, expand=False)
+            data[f'{col}/domain_distribution'] = (
+                domains.value_counts().head(VALUE_COUNT_LIMIT).to_dict()
+            )
+        elif column_type == ColumnType.LIST:
+            lengths = series_non_null.str.len()
+            data[f'{col}/avg_list_length'] = lengths.mean()
+            data[f'{col}/max_list_length'] = lengths.max()
+            data[f'{col}/min_list_length'] = lengths.min()
+            data[f'{col}/length_distribution'] = (
+                lengths.value_counts().head(VALUE_COUNT_LIMIT).to_dict()
+            )
+
+            elements = series_non_null.explode()
+            element_value_counts = elements.value_counts(dropna=False)
+            data[f'{col}/most_frequent_element'] = element_value_counts.index[0]
+            data[f'{col}/least_frequent_element'] = element_value_counts.index[-1]
+            if any(
+                isinstance(idx, FrozenDict)
+                for idx in element_value_counts.index[:VALUE_COUNT_LIMIT]
+            ):
+                str_index = element_value_counts.index.astype(str)
+                element_value_counts.index = str_index
+            data[f'{col}/element_distribution'] = element_value_counts.head(
+                VALUE_COUNT_LIMIT
+            ).to_dict()
+        return data
+
+    def __outlier_statistics(
+        self,
+        series,
+        series_non_null,
+        col,
+        statistics,
+        first_quartile,
+        third_quartile,
+    ):
+        data = dict()
+        # detect outliers
+        if statistics[f'{col}/std'] == 0:
+            data[f'{col}/outlier_count'] = 0
+        else:
+            series_z_score = (
+                (series_non_null - statistics[f'{col}/average']) / statistics[f'{col}/std']
+            ).abs()
+            series_outliers = series_z_score[series_z_score >= OUTLIER_ZSCORE_THRESHOLD]
+            data[f'{col}/outlier_count'] = series_outliers.count()
+            data[f'{col}/outlier_ratio'] = self.__protected_division(
+                data[f'{col}/outlier_count'], series.size
+            )
+            data[f'{col}/outliers'] = (
+                series_non_null.loc[series_outliers.index]
+                .iloc[:OUTLIER_SAMPLE_COUNT]
+                .tolist()
+            )
+        # generate five number summary
+        iqr = third_quartile - first_quartile
+        outlier_mask = (series_non_null <= first_quartile - 1.5 * iqr) | (
+            series_non_null >= third_quartile + 1.5 * iqr
+        )
+        outliers = series_non_null[outlier_mask].unique().tolist()
+        data[f'{col}/box_plot_data'] = {
+            'outliers': outliers[:OUTLIER_SAMPLE_COUNT],
+            'min': statistics[f'{col}/min'],
+            'first_quartile': first_quartile,
+            'median': statistics[f'{col}/median'],
+            'third_quartile': third_quartile,
+            'max': statistics[f'{col}/max'],
+        }
+        if len(outliers) != 0:
+            not_outliers = series_non_null[~outlier_mask]
+            data[f'{col}/box_plot_data']['min'] = not_outliers.min()
+            data[f'{col}/box_plot_data']['max'] = not_outliers.max()
+        return data
+
+    def __add_invalid_value_statistics(self, data, series, series_non_null, invalid_rows, col):
         # Detect mismatched formats for some column types
         data[f'{col}/invalid_value_count'] = invalid_rows.sum()
         invalid_values = series_non_null[invalid_rows]
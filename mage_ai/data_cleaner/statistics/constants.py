@@ -0,0 +1,9 @@
+from enum import Enum
+
+
+class ProfilingMode(str, Enum):
+    # Exact statistics computed from all the values of each column.
+    FULL = 'full'
+    # Distinct counts, value counts and quantiles estimated with sketches that are computed in
+    # one vectorized pass over each chunk of rows.
+    SKETCH = 'sketch'
@@ -0,0 +1,448 @@
+import math
+from typing import Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+from mage_ai.data_cleaner.column_types.constants import NUMBER_TYPES, ColumnType
+
+"""
+Sketches of the distribution of a column that are computed with vectorized operations over a
+chunk of rows, and that can be merged, so that a data frame can be profiled chunk by chunk or
+in parallel without holding all the values of a column.
+"""
+
+HLL_PRECISION = 14
+COUNT_MIN_DEPTH = 4
+COUNT_MIN_WIDTH = 2048
+# Number of rows of each chunk whose values become heavy hitter candidates.
+HEAVY_HITTER_SAMPLE_SIZE = 1024
+HEAVY_HITTER_CANDIDATES = 200
+TDIGEST_COMPRESSION = 200
+
+# Odd multipliers of the multiplicative hashing of the rows of the count-min sketch.
+HASH_MULTIPLIERS = np.array([
+    0x9E3779B97F4A7C15,
+    0xC2B2AE3D27D4EB4F,
+    0x165667B19E3779F9,
+    0xD6E8FEB86659FD93,
+    0xFF51AFD7ED558CCD,
+    0xC4CEB9FE1A85EC53,
+], dtype=np.uint64)
+
+
+def hash_values(values: pd.Series) -> np.ndarray:
+    """
+    Returns a 64-bit hash of each value.
+    """
+    try:
+        return pd.util.hash_pandas_object(values, index=False).to_numpy()
+    except TypeError:
+        # Unhashable values, e.g. lists and dicts.
+        return pd.util.hash_pandas_object(values.astype(str), index=False).to_numpy()
+
+
+class HyperLogLog:
+    """
+    Estimates the number of distinct values.
+    """
+
+    def __init__(self, precision: int = HLL_PRECISION):
+        self.precision = precision
+        self.registers = np.zeros(1 << precision, dtype=np.uint8)
+
+    def add_hashes(self, hashes: np.ndarray) -> None:
+        if len(hashes) == 0:
+            return
+        value_bits = 64 - self.precision
+        indices = (hashes >> np.uint64(value_bits)).astype(np.intp)
+        values = hashes & np.uint64((1 << value_bits) - 1)
+        # The values have at most 52 bits, so they are exact as floats and the exponent is
+        # their number of bits.
+        ranks = value_bits - np.frexp(values.astype(np.float64))[1] + 1
+        # Max rank of each register without ufunc.at: mark the (register, rank) pairs that
+        # occur and take the highest marked rank of each register.
+        occurs = np.zeros((len(self.registers), value_bits + 2), dtype=bool)
+        occurs[:, 0] = True
+        occurs[indices, ranks] = True
+        max_ranks = occurs.shape[1] - 1 - np.argmax(occurs[:, ::-1], axis=1)
+        self.registers = np.maximum(self.registers, max_ranks.astype(np.uint8))
+
+    def merge(self, other: 'HyperLogLog') -> None:
+        self.registers = np.maximum(self.registers, other.registers)
+
+    def count(self) -> int:
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / np.sum(np.power(2.0, -self.registers.astype(np.float64)))
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if estimate <= 2.5 * m and zeros > 0:
+            # Linear counting is more accurate for small cardinalities.
+            estimate = m * math.log(m / zeros)
+        return int(round(estimate))
+
+
+class TDigest:
+    """
+    Estimates the quantiles of numeric values with a merging t-digest. The centroids are
+    compressed by grouping the sorted centroids by the integer part of the arcsine scale
+    function, so that each compression is a few vectorized operations.
+    """
+
+    def __init__(self, compression: int = TDIGEST_COMPRESSION):
+        self.compression = compression
+        self.means = np.empty(0, dtype=np.float64)
+        self.weights = np.empty(0, dtype=np.float64)
+        self.min = math.inf
+        self.max = -math.inf
+
+    @property
+    def total_weight(self) -> float:
+        return float(self.weights.sum())
+
+    def update(self, values: np.ndarray) -> None:
+        values = np.asarray(values, dtype=np.float64)
+        values = values[~np.isnan(values)]
+        if len(values) == 0:
+            return
+        values = np.sort(values)
+        self.min = min(self.min, float(values[0]))
+        self.max = max(self.max, float(values[-1]))
+        self.__compress(
+            np.concatenate([self.means, values]),
+            np.concatenate([self.weights, np.ones(len(values))]),
+        )
+
+    def merge(self, other: 'TDigest') -> None:
+        if len(other.means) == 0:
+            return
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self.__compress(
+            np.concatenate([self.means, other.means]),
+            np.concatenate([self.weights, other.weights]),
+        )
+
+    def quantile(self, q: float) -> float:
+        if len(self.means) == 0:
+            return math.nan
+        total = self.total_weight
+        midpoints = np.cumsum(self.weights) - self.weights / 2
+        return float(np.interp(
+            q * total,
+            np.concatenate([[0], midpoints, [total]]),
+            np.concatenate([[self.min], self.means, [self.max]]),
+        ))
+
+    def __compress(self, means: np.ndarray, weights: np.ndarray) -> None:
+        # The means are two sorted runs, which a stable sort merges in linear time.
+        order = np.argsort(means, kind='stable')
+        means = means[order]
+        weights = weights[order]
+        total = weights.sum()
+        quantiles = (np.cumsum(weights) - weights / 2) / total
+        scale = self.compression / (2 * math.pi) * np.arcsin(2 * quantiles - 1)
+        groups = np.floor(scale - scale[0]).astype(np.int64)
+        starts = np.concatenate([[0], np.flatnonzero(np.diff(groups)) + 1])
+        self.weights = np.add.reduceat(weights, starts)
+        self.means = np.add.reduceat(means * weights, starts) / self.weights
+
+
+class CountMinSketch:
+    """
+    Estimates the count of each value, and keeps the values that are the most likely to be the
+    most frequent (heavy hitters) as candidates.
+    """
+
+    def __init__(
+        self,
+        depth: int = COUNT_MIN_DEPTH,
+        width: int = COUNT_MIN_WIDTH,
+        candidate_limit: int = HEAVY_HITTER_CANDIDATES,
+    ):
+        # The width is a power of 2 so that the column of a value is the top bits of its hash.
+        self.width_bits = max(int(width - 1).bit_length(), 1)
+        self.table = np.zeros((depth, 1 << self.width_bits), dtype=np.int64)
+        self.candidate_limit = candidate_limit
+        # Candidate values by hash.
+        self.candidates = dict()
+        self.total = 0
+
+    def update(self, values: pd.Series, hashes: np.ndarray) -> None:
+        if len(hashes) == 0:
+            return
+        for row, columns in enumerate(self.__columns(hashes)):
+            self.table[row] += np.bincount(columns, minlength=self.table.shape[1])
+        self.total += len(hashes)
+
+        step = max(len(hashes) // HEAVY_HITTER_SAMPLE_SIZE, 1)
+        sample_hashes, positions = np.unique(hashes[::step], return_index=True)
+        # Add the candidates in the order they appear, so that values with the same count are
+        # returned in that order.
+        order = np.argsort(positions)
+        sample_values = values.iloc[::step].iloc[positions[order]].tolist()
+        for value_hash, value in zip(sample_hashes[order].tolist(), sample_values):
+            self.candidates.setdefault(value_hash, value)
+        self.__prune_candidates()
+
+    def merge(self, other: 'CountMinSketch') -> None:
+        self.table += other.table
+        self.total += other.total
+        for value_hash, value in other.candidates.items():
+            self.candidates.setdefault(value_hash, value)
+        self.__prune_candidates()
+
+    def estimate(self, hashes: np.ndarray) -> np.ndarray:
+        return np.min(
+            [self.table[row][columns] for row, columns in enumerate(self.__columns(hashes))],
+            axis=0,
+        )
+
+    def heavy_hitters(self, limit: int) -> List[Tuple]:
+        """
+        Returns the (value, estimated count) of the most frequent values in descending order of
+        count.
+        """
+        return [(value, count) for _, value, count in self.__top_candidates(limit)]
+
+    def __columns(self, hashes: np.ndarray) -> List[np.ndarray]:
+        shift = np.uint64(64 - self.width_bits)
+        return [
+            ((hashes * multiplier) >> shift).astype(np.intp)
+            for multiplier in HASH_MULTIPLIERS[:self.table.shape[0]]
+        ]
+
+    def __top_candidates(self, limit: int) -> List[Tuple]:
+        if not self.candidates:
+            return []
+        hashes = np.fromiter(self.candidates.keys(), dtype=np.uint64, count=len(self.candidates))
+        counts = self.estimate(hashes)
+        values = list(self.candidates.values())
+        return [
+            (int(hashes[idx]), values[idx], int(counts[idx]))
+            for idx in np.argsort(-counts, kind='stable')[:limit]
+        ]
+
+    def __prune_candidates(self) -> None:
+        if len(self.candidates) > self.candidate_limit:
+            self.candidates = {
+                value_hash: value
+                for value_hash, value, _ in self.__top_candidates(self.candidate_limit)
+            }
+
+
+class Moments:
+    """
+    Count, mean, central moments, min, max and sum of numeric values, merged with the pairwise
+    update formulas so that they stay accurate for values with a large mean.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.m3 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self.sum = 0
+
+    def update(self, values: np.ndarray) -> None:
+        if len(values) == 0:
+            return
+        other = Moments()
+        other.count = len(values)
+        other.mean = float(values.mean())
+        deviations = values - other.mean
+        squared_deviations = deviations * deviations
+        other.m2 = float(squared_deviations.sum())
+        other.m3 = float(np.dot(squared_deviations, deviations))
+        other.min = values.min()
+        other.max = values.max()
+        other.sum = float(values.sum(dtype=np.float64))
+        self.merge(other)
+
+    def merge(self, other: 'Moments') -> None:
+        if other.count == 0:
+            return
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.m3 = (
+            self.m3 + other.m3 +
+            delta ** 3 * self.count * other.count * (self.count - other.count) / count ** 2 +
+            3 * delta * (self.count * other.m2 - other.count * self.m2) / count
+        )
+        self.m2 = self.m2 + other.m2 + delta ** 2 * self.count * other.count / count
+        self.mean = self.mean + delta * other.count / count
+        self.count = count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self.sum = self.sum + other.sum
+
+    def std(self) -> float:
+        if self.count < 2:
+            return math.nan
+        return math.sqrt(self.m2 / (self.count - 1))
+
+    def skew(self) -> float:
+        """
+        Returns the adjusted Fisher-Pearson skewness, the same as `pandas.Series.skew`.
+        """
+        count = self.count
+        if count < 3:
+            return math.nan
+        if self.m2 == 0:
+            return 0.0
+        skew = math.sqrt(count) * self.m3 / self.m2 ** 1.5
+        return skew * math.sqrt(count * (count - 1)) / (count - 2)
+
+
+class ColumnProfile:
+    """
+    Sketches of the values of a column: distinct count, heavy hitters, the longest sequence of
+    nulls, and the moments and quantiles of the numeric and datetime values.
+    """
+
+    def __init__(self, column_type: str = None):
+        self.column_type = column_type
+        self.size = 0
+        self.null_count = 0
+        # Number of nulls at the start and at the end of the column, and the longest sequence
+        # of nulls, so that the sequences of consecutive chunks can be joined.
+        self.leading_null_count = 0
+        self.trailing_null_count = 0
+        self.longest_null_sequence = 0
+        self.distinct = HyperLogLog()
+        self.frequent = CountMinSketch()
+        self.moments = None
+        self.quantiles = None
+        if self.is_numeric or self.is_datetime:
+            self.moments = Moments()
+            self.quantiles = TDigest()
+
+    @property
+    def count(self) -> int:
+        return self.size - self.null_count
+
+    @property
+    def is_datetime(self) -> bool:
+        return self.column_type == ColumnType.DATETIME
+
+    @property
+    def is_numeric(self) -> bool:
+        return self.column_type in NUMBER_TYPES
+
+    def update(self, series: pd.Series) -> None:
+        is_null = series.isna().to_numpy()
+        size = len(is_null)
+        if size == 0:
+            return
+        non_null_positions = np.flatnonzero(~is_null)
+        if len(non_null_positions) == 0:
+            self.__join_null_sequences(size, size, size, size)
+        else:
+            leading = int(non_null_positions[0])
+            trailing = size - 1 - int(non_null_positions[-1])
+            gaps = np.diff(non_null_positions) - 1
+            self.__join_null_sequences(
+                size,
+                leading,
+                trailing,
+                max(leading, trailing, int(gaps.max()) if len(gaps) else 0),
+            )
+        self.null_count += int(is_null.sum())
+
+        series_non_null = series[~is_null]
+        hashes = hash_values(series_non_null)
+        self.distinct.add_hashes(hashes)
+
+        if self.is_numeric:
+            self.frequent.update(series_non_null, hashes)
+            values = pd.to_numeric(series_non_null, errors='coerce').to_numpy(dtype=np.float64)
+            values = values[~np.isnan(values)]
+            self.moments.update(values)
+            self.quantiles.update(values)
+        elif self.is_datetime:
+            # The frequent dates are counted after parsing, so that the same date in different
+            # formats is counted once.
+            dates = pd.to_datetime(series_non_null, utc=True, errors='coerce').dropna()
+            self.frequent.update(dates, hash_values(dates))
+            values = dates.to_numpy(dtype='datetime64[ns]').astype(np.int64)
+            self.moments.update(values)
+            self.quantiles.update(values)
+        else:
+            self.frequent.update(series_non_null, hashes)
+
+    def merge(self, other: 'ColumnProfile') -> None:
+        """
+        Merges the profile of the rows that follow the rows of this profile.
+        """
+        self.__join_null_sequences(
+            other.size,
+            other.leading_null_count,
+            other.trailing_null_count,
+            other.longest_null_sequence,
+        )
+        self.null_count += other.null_count
+        self.distinct.merge(other.distinct)
+        self.frequent.merge(other.frequent)
+        if self.moments is not None and other.moments is not None:
+            self.moments.merge(other.moments)
+            self.quantiles.merge(other.quantiles)
+
+    def __join_null_sequences(
+        self,
+        size: int,
+        leading: int,
+        trailing: int,
+        longest: int,
+    ) -> None:
+        self.longest_null_sequence = max(
+            self.longest_null_sequence,
+            longest,
+            self.trailing_null_count + leading,
+        )
+        if self.leading_null_count == self.size:
+            self.leading_null_count += leading
+        if trailing == size:
+            self.trailing_null_count += size
+        else:
+            self.trailing_null_count = trailing
+        self.size += size
+
+
+class DataFrameProfile:
+    """
+    Profiles of the columns of a data frame, computed chunk by chunk. The hash of each row is
+    kept (8 bytes per row) to count the duplicate rows exactly.
+    """
+
+    def __init__(self, column_types: Dict[str, str]):
+        self.column_types = column_types
+        self.columns = dict()
+        self.row_hashes = []
+
+    @property
+    def row_count(self) -> int:
+        return sum(len(hashes) for hashes in self.row_hashes)
+
+    def update(self, df: pd.DataFrame) -> None:
+        for col in df.columns:
+            if col not in self.columns:
+                self.columns[col] = ColumnProfile(self.column_types.get(col))
+            self.columns[col].update(df[col])
+        if len(df.columns):
+            self.row_hashes.append(hash_values(df))
+
+    def merge(self, other: 'DataFrameProfile') -> None:
+        for col, profile in other.columns.items():
+            if col in self.columns:
+                self.columns[col].merge(profile)
+            else:
+                self.columns[col] = profile
+        self.row_hashes.extend(other.row_hashes)
+
+    def duplicate_row_count(self) -> int:
+        if not self.row_hashes:
+            return 0
+        hashes = np.concatenate(self.row_hashes)
+        return len(hashes) - len(np.unique(hashes))
@@ -6,6 +6,19 @@ from typing import Dict
 from mage_ai.shared.hash import merge_dict
 from mage_ai.shared.security import filter_out_config_values
 
+# The sources write the Singer messages with their type first, e.g. {"type": "RECORD", ...}.
+# These messages are never logs, so the lines that start with them aren't parsed.
+SINGER_MESSAGE_PREFIXES = (
+    '{"type": "ACTIVATE_VERSION", "stream": ',
+    '{"type": "RECORD", "stream": ',
+    '{"type": "SCHEMA", "stream": ',
+    '{"type": "STATE", "value": ',
+)
+SINGER_MESSAGE_PREFIXES_BYTES = tuple(prefix.encode() for prefix in SINGER_MESSAGE_PREFIXES)
+# A line is only logged if it's a list, has a "level" or has the type "LOG".
+LOG_KEYWORDS = ('"level"', '"LOG"')
+LOG_KEYWORDS_BYTES = tuple(keyword.encode() for keyword in LOG_KEYWORDS)
+
 
 def print_log_from_line(
     line: str,
@@ -14,6 +27,9 @@ def print_log_from_line(
     logging_tags: Dict = None,
     tags: Dict = None,
 ):
+    if not is_log_line(line):
+        return
+
     from mage_integrations.utils.logger.constants import (
         LOG_LEVEL_ERROR,
         LOG_LEVEL_EXCEPTION,
@@ -88,6 +104,20 @@ def print_log_from_line(
         pass
 
 
+def is_log_line(line) -> bool:
+    """
+    Returns whether the line of the output of a source or a destination can be a log, without
+    parsing it as JSON.
+    """
+    if isinstance(line, bytes):
+        prefixes, keywords, list_start = SINGER_MESSAGE_PREFIXES_BYTES, LOG_KEYWORDS_BYTES, b'['
+    else:
+        prefixes, keywords, list_start = SINGER_MESSAGE_PREFIXES, LOG_KEYWORDS, '['
+    if line.startswith(prefixes):
+        return False
+    return any(keyword in line for keyword in keywords) or line.lstrip().startswith(list_start)
+
+
 def print_logs_from_output(
     output: str,
     config: Dict = None,
@@ -113,6 +113,10 @@ def create_block_runs(pipeline_run: PipelineRun, logger: DictLogger) -> List[Blo
     if is_sql_source:
         record_counts_by_stream = index_by(lambda x: x['id'], integration_pipeline.count_records())
 
+    key_range_partitions = 1
+    if is_sql_source:
+        key_range_partitions = __key_range_partitions(integration_pipeline)
+
     arr = []
 
     for stream in integration_pipeline.streams():
@@ -126,7 +130,11 @@ def create_block_runs(pipeline_run: PipelineRun, logger: DictLogger) -> List[Blo
         record_counts = None
         if is_sql_source:
             record_counts = record_counts_by_stream[tap_stream_id]['count']
-        number_of_batches = math.ceil((record_counts or 1) / BATCH_FETCH_LIMIT)
+        if key_range_partitions > 1:
+            # The source loads the key ranges of the stream concurrently in a single batch.
+            number_of_batches = 1
+        else:
+            number_of_batches = math.ceil((record_counts or 1) / BATCH_FETCH_LIMIT)
         tags2 = merge_dict(tags, dict(
             number_of_batches=number_of_batches,
             record_counts=record_counts,
@@ -165,6 +173,15 @@ def create_block_runs(pipeline_run: PipelineRun, logger: DictLogger) -> List[Blo
     return arr
 
 
+def __key_range_partitions(integration_pipeline: IntegrationPipeline) -> int:
+    config = integration_pipeline.source_config.get('config') or dict()
+    try:
+        return int(config.get('key_range_partitions') or 1)
+    except (TypeError, ValueError):
+        # The value is interpolated with the variables when the source runs.
+        return 1
+
+
 def update_stream_states(pipeline_run: PipelineRun, logger: DictLogger, variables: Dict) -> None:
     from mage_integrations.sources.utils import (
         update_source_state_from_destination_state,
@@ -2,7 +2,12 @@ import asyncio
 import copy
 import logging
 import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import redirect_stderr, redirect_stdout
+from dataclasses import dataclass
 from typing import Callable, Dict, List, Union
 
 import yaml
@@ -14,7 +19,36 @@ from mage_ai.data_preparation.models.constants import BlockType
 from mage_ai.data_preparation.models.pipeline import Pipeline
 from mage_ai.data_preparation.shared.stream import StreamToLogger
 from mage_ai.data_preparation.shared.utils import get_template_vars
+from mage_ai.shared.config import BaseConfig
 from mage_ai.shared.hash import merge_dict
+from mage_ai.streaming.batch_queue import BatchQueue
+
+
+@dataclass
+class StreamingExecutionConfig(BaseConfig):
+    """
+    Configured with the "streaming_execution_config" key of the pipeline's "executor_config".
+    """
+    # Give each downstream block its own copy of the batch. The last downstream block of a
+    # block gets the original batch. Disable it if the transformers and sinks don't mutate
+    # their input.
+    copy_batch: bool = True
+    # Number of threads used to run the downstream branches of the source concurrently.
+    # print() output of blocks running concurrently can be attributed to the wrong block.
+    max_workers: int = 1
+    # Number of batches handled in the background while the source reads the next batches.
+    # With 0, each batch is handled before the source reads the next one. The offsets of a
+    # batch are only committed once it and the batches before it are handled.
+    max_in_flight_batches: int = 0
+    # Max number of records in flight. The source blocks until records are handled.
+    max_in_flight_records: int = 0
+    # Pause the source once this many records are in flight, until the number of records in
+    # flight drops to the low watermark. Sources keep their connection alive while paused;
+    # e.g. the Kafka consumer keeps polling without fetching records.
+    high_watermark_records: int = 0
+    low_watermark_records: int = 0
+    # Interval to log the metrics of the records in flight.
+    metrics_interval_seconds: int = 60
 
 
 class StreamingPipelineExecutor(PipelineExecutor):
@@ -22,6 +56,10 @@ class StreamingPipelineExecutor(PipelineExecutor):
         super().__init__(pipeline, **kwargs)
         # TODO: Support custom log destination for streaming pipelines
         self.parse_and_validate_blocks()
+        self.execution_config = StreamingExecutionConfig.load(
+            config=(self.pipeline.executor_config or dict()).get('streaming_execution_config')
+            or dict(),
+        )
 
     def parse_and_validate_blocks(self):
         """
@@ -96,6 +134,7 @@ class StreamingPipelineExecutor(PipelineExecutor):
             raise e
 
     def __execute_in_python(self, build_block_output_stdout: Callable[..., object] = None):
+        from mage_ai.streaming.sinks.segment_buffer import move_legacy_buffer
         from mage_ai.streaming.sinks.sink_factory import SinkFactory
         from mage_ai.streaming.sources.base import SourceConsumeMethod
         from mage_ai.streaming.sources.source_factory import SourceFactory
@@ -109,15 +148,19 @@ class StreamingPipelineExecutor(PipelineExecutor):
             ),
         )
 
+        # Each sink has its own buffer, so that sinks don't replay each other's records. The
+        # buffer file that the sinks shared before is replayed by each sink, like before.
+        buffer_dir = os.path.join(self.pipeline.pipeline_variables_dir, 'buffer')
+        shared_legacy_buffer_path = move_legacy_buffer(buffer_dir)
         sinks_by_uuid = dict()
         for sink_block in self.sink_blocks:
             sinks_by_uuid[sink_block.uuid] = SinkFactory.get_sink(
                 self.__interpolate_vars(sink_block.content),
-                buffer_path=os.path.join(
-                    self.pipeline.pipeline_variables_dir,
-                    'buffer',
-                ),
+                buffer_path=os.path.join(buffer_dir, sink_block.uuid),
+                shared_legacy_buffer_path=shared_legacy_buffer_path,
             )
+        if os.path.isfile(shared_legacy_buffer_path):
+            os.remove(shared_legacy_buffer_path)
 
         def __deepcopy(data):
             if data is None:
@@ -132,55 +175,166 @@ class StreamingPipelineExecutor(PipelineExecutor):
             except Exception:
                 return copy.copy(data)
 
-        def handle_batch_events_recursively(curr_block, outputs_by_block: Dict, **kwargs):
-            curr_block_output = outputs_by_block[curr_block.uuid]
-            for downstream_block in curr_block.downstream_blocks:
-                if downstream_block.type == BlockType.TRANSFORMER:
-                    execute_block_kwargs = dict(
-                        global_vars=kwargs,
-                        input_args=[__deepcopy(curr_block_output)],
-                        logger=self.logger,
-                    )
-                    if build_block_output_stdout:
-                        execute_block_kwargs['build_block_output_stdout'] = \
-                            build_block_output_stdout
-                    outputs_by_block[downstream_block.uuid] = \
-                        downstream_block.execute_block(
-                            **execute_block_kwargs,
-                    )['output']
-                elif downstream_block.type == BlockType.DATA_EXPORTER:
-                    sinks_by_uuid[downstream_block.uuid].batch_write(
-                        __deepcopy(curr_block_output))
-                if downstream_block.downstream_blocks:
-                    handle_batch_events_recursively(
-                        downstream_block,
-                        outputs_by_block,
-                        **kwargs,
-                    )
+        def build_inputs(data, count: int) -> List:
+            # Copy the data before handing it to any downstream block, since downstream blocks
+            # can run concurrently.
+            if not self.execution_config.copy_batch:
+                return [data] * count
+            return [__deepcopy(data) for _ in range(count - 1)] + [data]
 
-        def handle_batch_events(messages: List[Union[Dict, str]], **kwargs):
-            # Handle the events with DFS
+        branch_pool = None
+        # The futures of the branches that haven't completed, so that they can be cancelled.
+        branch_futures = set()
+        if self.execution_config.max_workers > 1:
+            branch_pool = ThreadPoolExecutor(max_workers=self.execution_config.max_workers)
 
-            outputs_by_block = dict()
-            outputs_by_block[self.source_block.uuid] = messages
+        def handle_block(block, data, **kwargs):
+            if block.type == BlockType.TRANSFORMER:
+                execute_block_kwargs = dict(
+                    global_vars=kwargs,
+                    input_args=[data],
+                    logger=self.logger,
+                )
+                if build_block_output_stdout:
+                    execute_block_kwargs['build_block_output_stdout'] = \
+                        build_block_output_stdout
+                output = block.execute_block(**execute_block_kwargs)['output']
+                if block.downstream_blocks:
+                    handle_downstream_blocks(block, output, **kwargs)
+            elif block.type == BlockType.DATA_EXPORTER:
+                sinks_by_uuid[block.uuid].batch_write(data)
 
-            handle_batch_events_recursively(self.source_block, outputs_by_block, **kwargs)
+        def handle_downstream_blocks(curr_block, curr_block_output, concurrent=False, **kwargs):
+            downstream_blocks = curr_block.downstream_blocks
+            inputs = build_inputs(curr_block_output, len(downstream_blocks))
 
-        async def handle_event_async(message, **kwargs):
-            outputs_by_block = dict()
-            outputs_by_block[self.source_block.uuid] = [message]
+            if not concurrent or branch_pool is None or len(downstream_blocks) <= 1:
+                for downstream_block, data in zip(downstream_blocks, inputs):
+                    handle_block(downstream_block, data, **kwargs)
+                return
+
+            # Blocks redirect sys.stdout while executing, which isn't thread safe.
+            stdout = sys.stdout
+            try:
+                futures = [
+                    branch_pool.submit(handle_block, downstream_block, data, **kwargs)
+                    for downstream_block, data in zip(downstream_blocks, inputs)
+                ]
+                branch_futures.update(futures)
+                try:
+                    for future in futures:
+                        future.result()
+                except Exception:
+                    for future in futures:
+                        future.cancel()
+                    raise
+                finally:
+                    branch_futures.difference_update(futures)
+            finally:
+                sys.stdout = stdout
+
+        def handle_batch_events_sync(messages: List[Union[Dict, str]], **kwargs):
+            # Only the branches of the source run concurrently, so that branches never wait
+            # for the threads of the pool they run in.
+            handle_downstream_blocks(self.source_block, messages, concurrent=True, **kwargs)
+
+        batch_queue = None
+        batch_errors = []
+
+        def log_queue_metrics(message: str):
+            self.logger.info(f'{message} Metrics: {batch_queue.metrics()}')
+
+        def pause_source():
+            source.pause()
+            log_queue_metrics('Pause source.')
 
-            handle_batch_events_recursively(self.source_block, outputs_by_block, **kwargs)
+        def resume_source():
+            source.resume()
+            log_queue_metrics('Resume source.')
+
+        def handle_batches_from_queue():
+            # A single thread handles the batches in the order they are read.
+            metrics_logged_at = time.monotonic()
+            while True:
+                item = batch_queue.get()
+                if item is None:
+                    return
+                messages, kwargs = item
+                try:
+                    handle_batch_events_sync(messages, **kwargs)
+                except Exception as err:
+                    batch_errors.append(err)
+                    # The offsets of the failed batch and of the queued batches must not be
+                    # committed, so that their records are read again.
+                    source.checkpoint_manager.fail()
+                    batch_queue.close()
+                    return
+                batch_queue.task_done()
+
+                if time.monotonic() - metrics_logged_at >= \
+                        self.execution_config.metrics_interval_seconds:
+                    log_queue_metrics('Streaming batch queue.')
+                    metrics_logged_at = time.monotonic()
+
+        def raise_batch_error():
+            if batch_errors:
+                raise batch_errors[0]
+
+        if self.execution_config.max_in_flight_batches > 0:
+            batch_queue = BatchQueue(
+                max_batches=self.execution_config.max_in_flight_batches,
+                max_records=self.execution_config.max_in_flight_records,
+                high_watermark=self.execution_config.high_watermark_records,
+                low_watermark=self.execution_config.low_watermark_records,
+                on_high_watermark=pause_source,
+                on_low_watermark=resume_source,
+            )
+            batch_thread = threading.Thread(target=handle_batches_from_queue, daemon=True)
+            batch_thread.start()
+
+        def handle_batch_events(messages: List[Union[Dict, str]], **kwargs):
+            if batch_queue is None:
+                handle_batch_events_sync(messages, **kwargs)
+                return
+
+            raise_batch_error()
+            # The offsets that the source checkpoints after the handler returns are only
+            # committed once the batch and the batches before it are handled.
+            batch_id = source.checkpoint_manager.start_batch()
+            try:
+                batch_queue.put(
+                    messages,
+                    on_done=lambda: source.checkpoint_manager.complete_batch(batch_id),
+                    **kwargs,
+                )
+            except Exception:
+                raise_batch_error()
+                raise
+
+        async def handle_event_async(message, **kwargs):
+            handle_batch_events_sync([message], **kwargs)
 
         # Long running method
-        if source.consume_method == SourceConsumeMethod.BATCH_READ:
-            source.batch_read(handler=handle_batch_events)
-        elif source.consume_method == SourceConsumeMethod.READ_ASYNC:
-            loop = asyncio.get_event_loop()
-            if loop is not None:
-                loop.run_until_complete(source.read_async(handler=handle_event_async))
-            else:
-                asyncio.run(source.read_async(handler=handle_event_async))
+        try:
+            if source.consume_method == SourceConsumeMethod.BATCH_READ:
+                source.batch_read(handler=handle_batch_events)
+                if batch_queue is not None:
+                    batch_queue.join()
+                    raise_batch_error()
+            elif source.consume_method == SourceConsumeMethod.READ_ASYNC:
+                loop = asyncio.get_event_loop()
+                if loop is not None:
+                    loop.run_until_complete(source.read_async(handler=handle_event_async))
+                else:
+                    asyncio.run(source.read_async(handler=handle_event_async))
+        finally:
+            if batch_queue is not None:
+                batch_queue.close()
+            if branch_pool is not None:
+                # shutdown(cancel_futures=True) requires Python 3.9.
+                for future in list(branch_futures):
+                    future.cancel()
+                branch_pool.shutdown(wait=False)
 
     def __execute_in_flink(self):
         """
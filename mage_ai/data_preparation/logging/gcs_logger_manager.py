@@ -1,8 +1,10 @@
 from dataclasses import dataclass
+from typing import Dict
 
 from google.cloud import storage
 from google.oauth2 import service_account
 
+from mage_ai.data_preparation.logging.log_index import LogFilter, filter_log_content
 from mage_ai.data_preparation.logging.logger_manager import LoggerManager
 from mage_ai.data_preparation.repo_manager import RepoConfig
 from mage_ai.shared.config import BaseConfig
@@ -64,6 +66,11 @@ class GCSLoggerManager(LoggerManager):
         """
         return self.get_logs()
 
+    def read_logs(self, log_filter: LogFilter) -> Dict:
+        logs = self.get_logs()
+        logs.update(filter_log_content(logs['content'], log_filter, path=logs['path']))
+        return logs
+
     def output_logs_to_destination(self):
         key = self.get_log_filepath()
         bucket = self.gcs_client.get_bucket(self.gcs_config.bucket)
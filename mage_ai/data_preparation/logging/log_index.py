@@ -0,0 +1,341 @@
+import base64
+import logging
+import logging.handlers
+import os
+import re
+import struct
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, List
+
+import numpy as np
+import simplejson
+
+"""
+Sidecar index of the log files, so that the tail, a time range or the lines of some levels of
+a log file can be read by seeking to their offsets instead of reading the whole file.
+
+Each log file `<name>.log` has an index file `<name>.log.index` with one fixed-width record
+per log entry (a formatted log record, which can span multiple lines): the byte offset and
+length of the entry in the log file, its timestamp and its level.
+"""
+
+LOG_INDEX_FILE_SUFFIX = '.index'
+LOG_INDEX_DTYPE = np.dtype([
+    ('offset', '<u8'),
+    ('length', '<u4'),
+    ('timestamp', '<f8'),
+    ('level', 'u1'),
+])
+LOG_INDEX_RECORD_FORMAT = '<QIdB'
+
+DEFAULT_LOG_LINES_LIMIT = 1000
+
+# Levels of the log entries written by DictLogger. The code of a level in the index is its
+# position in this list plus 1, 0 is for the entries without a level.
+LOG_LEVELS = [
+    'CRITICAL',
+    'DEBUG',
+    'ERROR',
+    'EXCEPTION',
+    'INFO',
+    'LOG',
+    'WARNING',
+]
+LOG_LEVEL_CODES = {level: idx + 1 for idx, level in enumerate(LOG_LEVELS)}
+
+LOG_ENTRY_LEVEL_PATTERN = re.compile(rb'"level": "([A-Z]+)"')
+LOG_RECORD_LEVEL_PATTERN = re.compile(r'"level": "([A-Z]+)"')
+LOG_ENTRY_TIMESTAMP_FORMAT = '%Y-%m-%dT%H:%M:%S'
+LOG_ENTRY_TIMESTAMP_PATTERN = re.compile(rb'^(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}) ')
+
+
+@dataclass
+class LogFilter:
+    """
+    Lines to read from a log file.
+
+    Args:
+        start_time (float): Only read the entries logged at or after this Unix timestamp.
+        end_time (float): Only read the entries logged at or before this Unix timestamp.
+        levels (List[str]): Only read the entries of these levels, e.g. ['ERROR', 'EXCEPTION'].
+        limit (int): Maximum number of entries to read.
+        cursor (str): The `next_cursor` returned with the previous page.
+        tail (bool): Read the most recent entries first, the next pages have older entries.
+    """
+    start_time: float = None
+    end_time: float = None
+    levels: List[str] = None
+    limit: int = DEFAULT_LOG_LINES_LIMIT
+    cursor: str = None
+    tail: bool = False
+
+
+def index_filepath(log_filepath: str) -> str:
+    return f'{log_filepath}{LOG_INDEX_FILE_SUFFIX}'
+
+
+def is_index_file(filepath: str) -> bool:
+    return filepath.endswith(LOG_INDEX_FILE_SUFFIX)
+
+
+class IndexedRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """
+    RotatingFileHandler that appends a record to the index file of the log file for each log
+    entry it writes, and rotates the index files with the log files.
+
+    A log file must only be written by a single handler in a single process: the offsets of the
+    index records are wrong if another process writes to the log file between the write of an
+    entry and the read of the file position.
+    """
+
+    def __init__(self, filename, *args, **kwargs):
+        super().__init__(filename, *args, **kwargs)
+        self.index_stream = None
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            if self.shouldRollover(record):
+                self.doRollover()
+            if self.stream is None:
+                self.stream = self._open()
+            msg = self.format(record) + self.terminator
+            self.stream.write(msg)
+            self.stream.flush()
+
+            # The position after the write is the end of this entry, since this handler is the
+            # only writer of the log file.
+            end = os.lseek(self.stream.fileno(), 0, os.SEEK_CUR)
+            length = len(msg.encode(self.stream.encoding or 'utf-8'))
+            match = LOG_RECORD_LEVEL_PATTERN.search(record.getMessage())
+            level = match.group(1) if match else record.levelname
+            if self.index_stream is None:
+                # Unbuffered, so that each record is appended with a single write.
+                self.index_stream = open(index_filepath(self.baseFilename), 'ab', buffering=0)
+            self.index_stream.write(struct.pack(
+                LOG_INDEX_RECORD_FORMAT,
+                end - length,
+                length,
+                record.created,
+                LOG_LEVEL_CODES.get(level, 0),
+            ))
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def doRollover(self) -> None:
+        self.__close_index_stream()
+        super().doRollover()
+        if self.backupCount <= 0:
+            return
+        for i in range(self.backupCount - 1, 0, -1):
+            source = index_filepath(self.rotation_filename(f'{self.baseFilename}.{i}'))
+            destination = index_filepath(self.rotation_filename(f'{self.baseFilename}.{i + 1}'))
+            if os.path.exists(source):
+                if os.path.exists(destination):
+                    os.remove(destination)
+                os.rename(source, destination)
+        destination = index_filepath(self.rotation_filename(f'{self.baseFilename}.1'))
+        if os.path.exists(destination):
+            os.remove(destination)
+        if os.path.exists(index_filepath(self.baseFilename)):
+            os.rename(index_filepath(self.baseFilename), destination)
+
+    def close(self) -> None:
+        self.acquire()
+        try:
+            self.__close_index_stream()
+        finally:
+            self.release()
+        super().close()
+
+    def __close_index_stream(self) -> None:
+        if self.index_stream is not None:
+            self.index_stream.close()
+            self.index_stream = None
+
+
+def load_log_index(log_filepath: str) -> np.ndarray:
+    """
+    Returns the index of the log file sorted by offset. The parts of the log file that aren't
+    in the index file (e.g. written before the index existed) are indexed by scanning them.
+    """
+    size = os.path.getsize(log_filepath)
+    index = np.empty(0, dtype=LOG_INDEX_DTYPE)
+    if os.path.exists(index_filepath(log_filepath)):
+        with open(index_filepath(log_filepath), 'rb') as f:
+            data = f.read()
+        # Ignore a record that is being written.
+        data = data[:len(data) - len(data) % LOG_INDEX_DTYPE.itemsize]
+        index = np.frombuffer(data, dtype=LOG_INDEX_DTYPE)
+        # Ignore the records of a previous log file with the same name.
+        index = index[index['offset'] + index['length'] <= size]
+        if len(index) >= 2 and np.any(np.diff(index['offset'].astype(np.int64)) < 0):
+            index = index[np.argsort(index['offset'], kind='stable')]
+
+    if len(index) == 0:
+        return __scan_log_file(log_filepath, 0, size)
+
+    parts = []
+    first = int(index['offset'][0])
+    if first > 0:
+        parts.append(__scan_log_file(log_filepath, 0, first))
+    parts.append(index)
+    end = int(index['offset'][-1]) + int(index['length'][-1])
+    if end < size:
+        parts.append(__scan_log_file(log_filepath, end, size))
+    return np.concatenate(parts) if len(parts) >= 2 else index
+
+
+def build_log_index(data: bytes, base_offset: int = 0) -> np.ndarray:
+    """
+    Returns the index of log content by scanning it. A line that doesn't start with a
+    timestamp belongs to the entry of the previous line.
+    """
+    offsets = []
+    timestamps = []
+    levels = []
+    timestamp_cache = dict()
+
+    position = 0
+    for line in data.split(b'\n'):
+        match = LOG_ENTRY_TIMESTAMP_PATTERN.match(line)
+        if match or not offsets:
+            timestamp = 0
+            if match:
+                timestamp_str = match.group(1)
+                timestamp = timestamp_cache.get(timestamp_str)
+                if timestamp is None:
+                    timestamp = datetime.strptime(
+                        timestamp_str.decode(),
+                        LOG_ENTRY_TIMESTAMP_FORMAT,
+                    ).timestamp()
+                    timestamp_cache[timestamp_str] = timestamp
+            level_match = LOG_ENTRY_LEVEL_PATTERN.search(line)
+            offsets.append(base_offset + position)
+            timestamps.append(timestamp)
+            levels.append(LOG_LEVEL_CODES.get(level_match.group(1).decode(), 0)
+                          if level_match else 0)
+        position += len(line) + 1
+
+    index = np.empty(len(offsets), dtype=LOG_INDEX_DTYPE)
+    index['offset'] = offsets
+    index['length'] = np.diff(np.append(offsets, base_offset + len(data)))
+    index['timestamp'] = timestamps
+    index['level'] = levels
+    # The content may end with a newline, which doesn't start an entry.
+    return index[index['length'] > 0]
+
+
+def read_log_file(log_filepath: str, log_filter: LogFilter) -> Dict:
+    """
+    Reads the log entries of the log file that match the filter by seeking to their offsets.
+
+    Returns:
+        Dict: The content of the entries in file order, and the `next_cursor` to read the
+            next page, or None if there are no more entries.
+    """
+    if not os.path.exists(log_filepath):
+        return dict(content='', next_cursor=None)
+
+    index = load_log_index(log_filepath)
+    selected, next_cursor = __select_entries(index, log_filter, log_filepath)
+
+    parts = []
+    with open(log_filepath, 'rb') as f:
+        for start, end in __contiguous_ranges(selected):
+            f.seek(start)
+            parts.append(f.read(end - start))
+
+    return dict(
+        content=b''.join(parts).decode('utf-8', errors='replace'),
+        next_cursor=next_cursor,
+    )
+
+
+def filter_log_content(content: str, log_filter: LogFilter, path: str = None) -> Dict:
+    """
+    Same as `read_log_file` for the content of a log file that isn't stored locally.
+    """
+    data = (content or '').encode()
+    selected, next_cursor = __select_entries(build_log_index(data), log_filter, path)
+    return dict(
+        content=b''.join(
+            data[start:end] for start, end in __contiguous_ranges(selected)
+        ).decode('utf-8', errors='replace'),
+        next_cursor=next_cursor,
+    )
+
+
+def encode_cursor(path: str, offset: int) -> str:
+    return base64.urlsafe_b64encode(
+        simplejson.dumps(dict(path=path, offset=offset)).encode(),
+    ).decode()
+
+
+def decode_cursor(cursor: str, path: str) -> int:
+    """
+    Returns the offset of the last entry read from the file, or None if the cursor is for
+    another file.
+    """
+    try:
+        data = simplejson.loads(base64.urlsafe_b64decode(cursor.encode()))
+        if data.get('path') != path:
+            return None
+        return int(data['offset'])
+    except Exception as err:
+        raise ValueError(f'Invalid log cursor {cursor}.') from err
+
+
+def __select_entries(index: np.ndarray, log_filter: LogFilter, path: str):
+    mask = np.ones(len(index), dtype=bool)
+    if log_filter.start_time is not None:
+        mask &= index['timestamp'] >= log_filter.start_time
+    if log_filter.end_time is not None:
+        mask &= index['timestamp'] <= log_filter.end_time
+    if log_filter.levels:
+        mask &= np.isin(
+            index['level'],
+            [LOG_LEVEL_CODES.get(level.upper(), 0) for level in log_filter.levels],
+        )
+
+    cursor = decode_cursor(log_filter.cursor, path) if log_filter.cursor else None
+    if cursor is not None:
+        if log_filter.tail:
+            mask &= index['offset'] < cursor
+        else:
+            mask &= index['offset'] > cursor
+
+    matches = index[mask]
+    limit = log_filter.limit
+    if limit is None or limit <= 0 or len(matches) <= limit:
+        return matches, None
+
+    if log_filter.tail:
+        selected = matches[-limit:]
+        return selected, encode_cursor(path, int(selected['offset'][0]))
+    selected = matches[:limit]
+    return selected, encode_cursor(path, int(selected['offset'][-1]))
+
+
+def __contiguous_ranges(entries: np.ndarray):
+    """
+    Returns the byte ranges of the entries, merging the entries that are next to each other so
+    that each range is read with one seek.
+    """
+    if len(entries) == 0:
+        return []
+    starts = entries['offset'].astype(np.int64)
+    ends = starts + entries['length'].astype(np.int64)
+    breaks = np.flatnonzero(starts[1:] != ends[:-1]) + 1
+    range_starts = np.concatenate([[0], breaks])
+    range_ends = np.concatenate([breaks - 1, [len(entries) - 1]])
+    return list(zip(starts[range_starts].tolist(), ends[range_ends].tolist()))
+
+
+def __scan_log_file(log_filepath: str, start: int, end: int) -> np.ndarray:
+    with open(log_filepath, 'rb') as f:
+        f.seek(start)
+        data = f.read(end - start)
+    return build_log_index(data, base_offset=start)
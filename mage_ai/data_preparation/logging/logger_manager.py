@@ -1,12 +1,17 @@
 import asyncio
 import io
 import logging
-import logging.handlers
 import os
 from datetime import datetime
 from typing import Callable, Dict, List
 
 from mage_ai.data_preparation.logging import LoggingConfig
+from mage_ai.data_preparation.logging.log_index import (
+    IndexedRotatingFileHandler,
+    LogFilter,
+    is_index_file,
+    read_log_file,
+)
 from mage_ai.data_preparation.models.constants import LOGS_DIR
 from mage_ai.data_preparation.models.file import File
 from mage_ai.data_preparation.repo_manager import (
@@ -85,9 +90,10 @@ class LoggerManager:
                 # If there is a destination configuration, use a stream handler
                 handler = self.create_stream_handler()
             else:
-                # If no destination configuration, use a rotating file handler
+                # If no destination configuration, use a rotating file handler that indexes
+                # the log entries
                 log_filepath = self.get_log_filepath(create_dir=True)
-                handler = logging.handlers.RotatingFileHandler(
+                handler = IndexedRotatingFileHandler(
                     log_filepath,
                     backupCount=10,
                     maxBytes=MAX_LOG_FILE_SIZE,
@@ -230,12 +236,42 @@ class LoggerManager:
         file = File.from_path(self.get_log_filepath())
         return await file.to_dict_async(include_content=True)
 
-    async def get_logs_in_subpartition_async(self, filter_func: Callable = None) -> List[Dict]:
+    def read_logs(self, log_filter: LogFilter) -> Dict:
+        """
+        Read the entries of the current log file that match the filter, using the index of the
+        log file to seek to them.
+
+        Args:
+            log_filter (LogFilter): The time range, levels and page of the entries to read.
+
+        Returns:
+            dict: A dictionary containing the logs, including the content of the entries and
+                  the cursor of the next page.
+        """
+        return self.__read_log_file(self.get_log_filepath(), log_filter)
+
+    async def read_logs_async(self, log_filter: LogFilter) -> Dict:
+        """
+        Read the entries of the current log file that match the filter asynchronously.
+        """
+        return await asyncio.get_running_loop().run_in_executor(
+            None,
+            self.read_logs,
+            log_filter,
+        )
+
+    async def get_logs_in_subpartition_async(
+        self,
+        filter_func: Callable = None,
+        log_filter: LogFilter = None,
+    ) -> List[Dict]:
         """
         Get logs asynchronously from multiple log files within the subpartition.
 
         Args:
             filter_func (Callable, optional): A filter function to apply on each log file.
+            log_filter (LogFilter, optional): Only read the entries of each log file that
+                match the filter.
 
         Returns:
             List[Dict]: A list of dictionaries containing the logs, including their content.
@@ -246,7 +282,7 @@ class LoggerManager:
         if os.path.exists(base_path):
             for filename in os.listdir(base_path):
                 full_path = f'{base_path}/{filename}'
-                if not os.path.isfile(full_path):
+                if not os.path.isfile(full_path) or is_index_file(full_path):
                     continue
 
                 file = File.from_path(full_path)
@@ -258,10 +294,27 @@ class LoggerManager:
                 if should_add:
                     files.append(file)
 
+        if log_filter is not None:
+            loop = asyncio.get_running_loop()
+            return await asyncio.gather(*[
+                loop.run_in_executor(
+                    None,
+                    self.__read_log_file,
+                    os.path.join(file.dir_path, file.filename),
+                    log_filter,
+                ) for file in files
+            ])
+
         return await asyncio.gather(
             *[file.to_dict_async(include_content=True) for file in files]
         )
 
+    def __read_log_file(self, log_filepath: str, log_filter: LogFilter) -> Dict:
+        file = File.from_path(log_filepath)
+        data = file.to_dict()
+        data.update(read_log_file(data['path'], log_filter))
+        return data
+
     def output_logs_to_destination(self):
         """
         Output logs to the configured destination.
@@ -1,7 +1,9 @@
 from dataclasses import dataclass
+from typing import Dict
 
 from botocore.exceptions import ClientError
 
+from mage_ai.data_preparation.logging.log_index import LogFilter, filter_log_content
 from mage_ai.data_preparation.logging.logger_manager import LoggerManager
 from mage_ai.data_preparation.repo_manager import RepoConfig
 from mage_ai.services.aws.s3 import s3
@@ -66,6 +68,11 @@ class S3LoggerManager(LoggerManager):
         """
         return self.get_logs()
 
+    def read_logs(self, log_filter: LogFilter) -> Dict:
+        logs = self.get_logs()
+        logs.update(filter_log_content(logs['content'], log_filter, path=logs['path']))
+        return logs
+
     def output_logs_to_destination(self):
         key = self.get_log_filepath()
         self.s3_client.upload(key, self.stream.getvalue())
@@ -23,6 +23,11 @@ from mage_ai.data_preparation.logging.logger import DictLogger
 from mage_ai.data_preparation.logging.logger_manager_factory import LoggerManagerFactory
 from mage_ai.data_preparation.models.block.errors import HasDownstreamDependencies
 from mage_ai.data_preparation.models.block.extension.utils import handle_run_tests
+from mage_ai.data_preparation.models.block.output_analysis import (
+    OutputAnalysisConfig,
+    OutputAnalysisStatus,
+    submit_output_analysis,
+)
 from mage_ai.data_preparation.models.block.utils import (
     clean_name,
     fetch_input_variables,
@@ -1298,8 +1303,8 @@ class Block:
                         )
                     except Exception:
                         analysis = None
-                    if analysis is not None:
-                        stats = analysis.get('statistics', {})
+                    if analysis and analysis.get('statistics'):
+                        stats = analysis['statistics']
                         column_types = (analysis.get('metadata') or {}).get('column_types', {})
                         row_count = stats.get('original_row_count', stats.get('count'))
                         column_count = stats.get('original_column_count', len(column_types))
@@ -1418,8 +1423,8 @@ df = get_variable('{self.pipeline.uuid}', '{self.uuid}', 'df')
                     )
                 except Exception:
                     analysis = None
-                if analysis is not None:
-                    stats = analysis.get('statistics', {})
+                if analysis and analysis.get('statistics'):
+                    stats = analysis['statistics']
                     column_types = (analysis.get('metadata') or {}).get('column_types', {})
                     row_count = stats.get('original_row_count', stats.get('count'))
                     column_count = stats.get('original_column_count', len(column_types))
@@ -1880,47 +1885,21 @@ df = get_variable('{self.pipeline.uuid}', '{block_uuid}', 'df')
     def analyze_outputs(self, variable_mapping, shape_only: bool = False) -> None:
         if self.pipeline is None:
             return
+        output_analysis_config = OutputAnalysisConfig.load(
+            config=self.pipeline.repo_config.output_analysis_config or dict(),
+        )
         for uuid, data in variable_mapping.items():
             if type(data) is pd.DataFrame:
                 if data.shape[1] > DATAFRAME_ANALYSIS_MAX_COLUMNS or shape_only:
-                    self.pipeline.variable_manager.add_variable(
-                        self.pipeline.uuid,
-                        self.uuid,
-                        uuid,
-                        dict(
-                            statistics=dict(
-                                original_row_count=data.shape[0],
-                                original_column_count=data.shape[1],
-                            ),
-                        ),
-                        variable_type=VariableType.DATAFRAME_ANALYSIS,
-                    )
+                    self.__add_output_analysis(uuid, self.__shape_analysis(data))
+                    continue
+                if output_analysis_config.asynchronous:
+                    self.__submit_output_analysis(uuid, data, output_analysis_config)
                     continue
-                if data.shape[0] > DATAFRAME_ANALYSIS_MAX_ROWS:
-                    data_for_analysis = data.sample(DATAFRAME_ANALYSIS_MAX_ROWS).reset_index(
-                        drop=True,
-                    )
-                else:
-                    data_for_analysis = data.reset_index(drop=True)
                 try:
-                    from mage_ai.data_cleaner.data_cleaner import clean as clean_data
-                    analysis = clean_data(
-                        data_for_analysis,
-                        df_original=data,
-                        transform=False,
-                        verbose=False,
-                    )
-                    self.pipeline.variable_manager.add_variable(
-                        self.pipeline.uuid,
-                        self.uuid,
+                    self.__add_output_analysis(
                         uuid,
-                        dict(
-                            metadata=dict(column_types=analysis['column_types']),
-                            statistics=analysis['statistics'],
-                            insights=analysis['insights'],
-                            suggestions=analysis['suggestions'],
-                        ),
-                        variable_type=VariableType.DATAFRAME_ANALYSIS,
+                        self.__compute_output_analysis(data, output_analysis_config),
                     )
                 except Exception:
                     pass
@@ -1928,6 +1907,79 @@ df = get_variable('{self.pipeline.uuid}', '{block_uuid}', 'df')
                     # print('\nFailed to analyze dataframe:')
                     # print(traceback.format_exc())
 
+    def __submit_output_analysis(
+        self,
+        uuid: str,
+        data: pd.DataFrame,
+        output_analysis_config: OutputAnalysisConfig,
+    ) -> None:
+        """
+        Computes the analysis of the data frame in the background executor. The analysis
+        variable has the shape of the data frame with the status of the analysis until then.
+        """
+        def analyze() -> Dict:
+            try:
+                analysis = self.__compute_output_analysis(data, output_analysis_config)
+                analysis['metadata']['analysis_status'] = OutputAnalysisStatus.COMPLETED
+            except Exception:
+                analysis = self.__shape_analysis(data)
+                analysis['metadata'] = dict(analysis_status=OutputAnalysisStatus.FAILED)
+            return analysis
+
+        pending_analysis = self.__shape_analysis(data)
+        pending_analysis['metadata'] = dict(analysis_status=OutputAnalysisStatus.PENDING)
+
+        submit_output_analysis(
+            os.path.join(self.pipeline.variable_manager.variables_dir, self.pipeline.uuid,
+                         self.uuid, uuid),
+            analyze,
+            lambda analysis: self.__add_output_analysis(uuid, analysis),
+            pending_analysis,
+        )
+
+    def __compute_output_analysis(
+        self,
+        data: pd.DataFrame,
+        output_analysis_config: OutputAnalysisConfig,
+    ) -> Dict:
+        if data.shape[0] > DATAFRAME_ANALYSIS_MAX_ROWS:
+            data_for_analysis = data.sample(DATAFRAME_ANALYSIS_MAX_ROWS).reset_index(
+                drop=True,
+            )
+        else:
+            data_for_analysis = data.reset_index(drop=True)
+        from mage_ai.data_cleaner.data_cleaner import clean as clean_data
+        analysis = clean_data(
+            data_for_analysis,
+            df_original=data,
+            transform=False,
+            verbose=False,
+            profiling_mode=output_analysis_config.profiling_mode,
+        )
+        return dict(
+            metadata=dict(column_types=analysis['column_types']),
+            statistics=analysis['statistics'],
+            insights=analysis['insights'],
+            suggestions=analysis['suggestions'],
+        )
+
+    def __shape_analysis(self, data: pd.DataFrame) -> Dict:
+        return dict(
+            statistics=dict(
+                original_row_count=data.shape[0],
+                original_column_count=data.shape[1],
+            ),
+        )
+
+    def __add_output_analysis(self, uuid: str, analysis: Dict) -> None:
+        self.pipeline.variable_manager.add_variable(
+            self.pipeline.uuid,
+            self.uuid,
+            uuid,
+            analysis,
+            variable_type=VariableType.DATAFRAME_ANALYSIS,
+        )
+
     def set_global_vars(self, global_vars: Dict) -> None:
         self.global_vars = global_vars
         for upstream_block in self.upstream_blocks:
@@ -2087,6 +2139,8 @@ df = get_variable('{self.pipeline.uuid}', '{block_uuid}', 'df')
                 uuid,
                 data,
                 partition=execution_partition,
+                # Dynamic child blocks each read one item of the output.
+                index_items=bool(is_dynamic_block(self)),
             )
 
         for uuid in variables_data['removed_variables']:
@@ -2121,6 +2175,8 @@ df = get_variable('{self.pipeline.uuid}', '{block_uuid}', 'df')
                 uuid,
                 data,
                 partition=execution_partition,
+                # Dynamic child blocks each read one item of the output.
+                index_items=bool(is_dynamic_block(self)),
             )
 
         for uuid in variables_data['removed_variables']:
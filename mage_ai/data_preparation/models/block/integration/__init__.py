@@ -2,13 +2,18 @@ import json
 import os
 import subprocess
 from logging import Logger
-from typing import Dict, List
+from typing import Dict, List, Tuple
 
 import pandas as pd
 
 from mage_ai.data_integrations.logger.utils import print_log_from_line
 from mage_ai.data_integrations.utils.config import build_config, get_catalog_by_stream
 from mage_ai.data_preparation.models.block import PYTHON_COMMAND, Block
+from mage_ai.data_preparation.models.block.integration.streaming import (
+    IntegrationStreamingConfig,
+    stream_source_to_destination,
+    streamed_filepath,
+)
 from mage_ai.data_preparation.models.constants import BlockType
 from mage_ai.shared.hash import merge_dict
 from mage_ai.shared.security import filter_out_config_values
@@ -91,34 +96,80 @@ class IntegrationBlock(Block):
 
         outputs = []
         if BlockType.DATA_LOADER == self.type:
-            lines_in_file = 0
+            # A marker left by a previous run would make the data exporter block skip the
+            # output of this run, whether it's streamed or not.
+            if os.path.exists(streamed_filepath(source_output_file_path)):
+                os.remove(streamed_filepath(source_output_file_path))
 
-            with open(source_output_file_path, 'w') as f:
-                config, config_json = build_config(
-                    self.pipeline.data_loader.file_path,
+            config, args = self.__source_args(
+                variables_dictionary_for_config,
+                source_state_file_path,
+                query_data,
+                selected_streams,
+            )
+
+            streaming_config = IntegrationStreamingConfig.load(
+                config=self.pipeline.repo_config.integration_streaming_config or dict(),
+            )
+            if streaming_config.enabled and self.__streams_to_destination():
+                destination_config, destination_args = self.__destination_args(
                     variables_dictionary_for_config,
+                    destination_table,
+                    stream,
                 )
-                args = [
-                    PYTHON_COMMAND,
-                    self.pipeline.source_file_path,
-                    '--config_json',
-                    config_json,
-                    '--log_to_stdout',
-                    '1',
-                    '--settings',
-                    self.pipeline.settings_file_path,
-                    '--state',
-                    source_state_file_path,
-                    '--query_json',
-                    json.dumps(query_data),
-                ]
+                try:
+                    result = stream_source_to_destination(
+                        args,
+                        destination_args,
+                        source_output_file_path,
+                        lambda line: print_log_from_line(
+                            line,
+                            config=config,
+                            logger=logger,
+                            logging_tags=logging_tags,
+                            tags=tags,
+                        ),
+                        lambda line: print_log_from_line(
+                            line,
+                            config=destination_config,
+                            logger=logger,
+                            logging_tags=logging_tags,
+                            tags=tags,
+                        ),
+                        streaming_config,
+                    )
+                except subprocess.CalledProcessError as err:
+                    cmd = err.cmd if isinstance(err.cmd, str) else str(err.cmd)
+                    raise subprocess.CalledProcessError(
+                        err.returncode,
+                        filter_out_config_values(cmd, config),
+                    )
+
+                outputs.append(result['source_proc'])
+                destination_error = result['destination_error']
+                if destination_error is not None:
+                    if not streaming_config.spill_to_disk:
+                        raise Exception(filter_out_config_values(
+                            str(destination_error),
+                            destination_config,
+                        ))
+                    error = filter_out_config_values(str(destination_error), destination_config)
+                    msg = f'Destination failed while streaming {result["lines"]} lines: {error}. ' \
+                          'The data exporter block will load them from output file ' \
+                          f'{source_output_file_path}. The rows loaded before the failure ' \
+                          'are duplicated if the destination only appends rows.'
+                else:
+                    msg = f'Finished streaming {result["lines"]} lines from source to destination.'
+                if logger:
+                    logger.info(msg, **updated_logging_tags)
+                else:
+                    print(msg)
+
+                return outputs
 
-                if len(selected_streams) >= 1:
-                    args += [
-                        '--selected_streams_json',
-                        json.dumps(selected_streams),
-                    ]
+            lines_in_file = 0
 
+            with open(source_output_file_path, 'w') as f:
                 proc = subprocess.Popen(args, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
 
                 for line in proc.stdout:
@@ -274,9 +325,16 @@ class IntegrationBlock(Block):
 
             self.test_functions = test_functions
         elif BlockType.DATA_EXPORTER == self.type:
-            override = {}
-            if destination_table:
-                override['table'] = destination_table
+            if os.path.exists(streamed_filepath(source_output_file_path)):
+                # The data loader block already streamed the source output to the destination.
+                os.remove(streamed_filepath(source_output_file_path))
+                msg = f'Skip loading {source_output_file_path}, the data loader block has ' \
+                      'already streamed it to the destination.'
+                if logger:
+                    logger.info(msg, **updated_logging_tags)
+                else:
+                    print(msg)
+                return outputs
 
             file_size = os.path.getsize(source_output_file_path)
             msg = f'Reading {file_size} bytes from {source_output_file_path} as input file.'
@@ -285,26 +343,12 @@ class IntegrationBlock(Block):
             else:
                 print(msg)
 
-            config, config_json = build_config(
-                self.pipeline.data_exporter.file_path,
+            config, args = self.__destination_args(
                 variables_dictionary_for_config,
-                override=override,
+                destination_table,
+                stream,
             )
-
-            proc = subprocess.Popen([
-                PYTHON_COMMAND,
-                self.pipeline.destination_file_path,
-                '--config_json',
-                config_json,
-                '--log_to_stdout',
-                '1',
-                '--settings',
-                self.pipeline.data_exporter.file_path,
-                '--state',
-                self.pipeline.destination_state_file_path(
-                    destination_table=destination_table,
-                    stream=stream,
-                ),
+            proc = subprocess.Popen(args + [
                 '--input_file_path',
                 source_output_file_path,
             ], stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
@@ -330,6 +374,78 @@ class IntegrationBlock(Block):
 
         return outputs
 
+    def __source_args(
+        self,
+        variables_dictionary_for_config: Dict,
+        source_state_file_path: str,
+        query_data: Dict,
+        selected_streams: List[str],
+    ) -> Tuple[Dict, List[str]]:
+        config, config_json = build_config(
+            self.pipeline.data_loader.file_path,
+            variables_dictionary_for_config,
+        )
+        args = [
+            PYTHON_COMMAND,
+            self.pipeline.source_file_path,
+            '--config_json',
+            config_json,
+            '--log_to_stdout',
+            '1',
+            '--settings',
+            self.pipeline.settings_file_path,
+            '--state',
+            source_state_file_path,
+            '--query_json',
+            json.dumps(query_data),
+        ]
+
+        if len(selected_streams) >= 1:
+            args += [
+                '--selected_streams_json',
+                json.dumps(selected_streams),
+            ]
+
+        return config, args
+
+    def __destination_args(
+        self,
+        variables_dictionary_for_config: Dict,
+        destination_table: str,
+        stream: str,
+    ) -> Tuple[Dict, List[str]]:
+        override = {}
+        if destination_table:
+            override['table'] = destination_table
+
+        config, config_json = build_config(
+            self.pipeline.data_exporter.file_path,
+            variables_dictionary_for_config,
+            override=override,
+        )
+        args = [
+            PYTHON_COMMAND,
+            self.pipeline.destination_file_path,
+            '--config_json',
+            config_json,
+            '--log_to_stdout',
+            '1',
+            '--settings',
+            self.pipeline.data_exporter.file_path,
+            '--state',
+            self.pipeline.destination_state_file_path(
+                destination_table=destination_table,
+                stream=stream,
+            ),
+        ]
+
+        return config, args
+
+    def __streams_to_destination(self) -> bool:
+        downstream_blocks = self.downstream_blocks
+        return len(downstream_blocks) == 1 and \
+            BlockType.DATA_EXPORTER == downstream_blocks[0].type
+
 
 class SourceBlock(IntegrationBlock):
     pass
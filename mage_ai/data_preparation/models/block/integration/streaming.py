@@ -0,0 +1,163 @@
+import queue
+import subprocess
+import threading
+from dataclasses import dataclass
+from typing import Callable, Dict, List
+
+from mage_ai.shared.config import BaseConfig
+
+"""
+Streaming mode of the integration pipelines: the source and the destination of a stream run
+concurrently, the lines the source writes are passed to the destination through a bounded
+buffer instead of being written to the source output file and read by the destination once the
+source has finished.
+"""
+
+STREAMED_FILE_SUFFIX = '.streamed'
+
+
+@dataclass
+class IntegrationStreamingConfig(BaseConfig):
+    # Run the source and the destination of a stream concurrently. Only used when the data
+    # loader block of the pipeline is followed by the data exporter block, without
+    # transformer blocks.
+    enabled: bool = False
+    # Maximum number of lines that the source can be ahead of the destination.
+    buffer_size: int = 10_000
+    # Also write the lines to the source output file, so that the data exporter block can load
+    # them from the file if the destination fails. The data exporter block loads all the lines
+    # of the file again, so the rows that the destination loaded before it failed are
+    # duplicated in destinations that only append rows (i.e. without unique constraints).
+    spill_to_disk: bool = True
+
+
+def streamed_filepath(source_output_file_path: str) -> str:
+    """
+    Path of the file that marks the source output file as already loaded by the destination.
+    """
+    return f'{source_output_file_path}{STREAMED_FILE_SUFFIX}'
+
+
+def stream_source_to_destination(
+    source_args: List[str],
+    destination_args: List[str],
+    source_output_file_path: str,
+    log_source_line: Callable[[bytes], None],
+    log_destination_line: Callable[[bytes], None],
+    streaming_config: IntegrationStreamingConfig,
+) -> Dict:
+    """
+    Runs the source and the destination processes concurrently, writing each line of the source
+    output to the input of the destination.
+
+    Args:
+        source_args (List[str]): The command of the source process.
+        destination_args (List[str]): The command of the destination process, which reads its
+            input from stdin.
+        source_output_file_path (str): The file that the lines are spilled to.
+        log_source_line (Callable[[bytes], None]): Logs a line of the source output. Raises an
+            error if the line is an error log.
+        log_destination_line (Callable[[bytes], None]): Logs a line of the destination output.
+            Raises an error if the line is an error log.
+        streaming_config (IntegrationStreamingConfig): The streaming config.
+
+    Returns:
+        Dict: The source process, the number of lines the source wrote, whether the destination
+            loaded them and the error of the destination if it failed.
+    """
+    source_proc = subprocess.Popen(
+        source_args,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+    )
+    destination_proc = subprocess.Popen(
+        destination_args,
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+    )
+
+    buffer = queue.Queue(maxsize=max(streaming_config.buffer_size, 1))
+    state = dict(lines=0, source_error=None, destination_error=None)
+
+    def read_source() -> None:
+        output_file = None
+        try:
+            if streaming_config.spill_to_disk:
+                output_file = open(source_output_file_path, 'wb')
+            for line in source_proc.stdout:
+                if output_file is not None:
+                    output_file.write(line)
+                buffer.put(line)
+                log_source_line(line)
+                state['lines'] += 1
+        except Exception as err:
+            state['source_error'] = err
+            source_proc.kill()
+        finally:
+            if output_file is not None:
+                output_file.close()
+            buffer.put(None)
+
+    def write_destination() -> None:
+        while True:
+            line = buffer.get()
+            if line is None:
+                break
+            if state['destination_error'] is not None:
+                # Keep draining the buffer so that the source isn't blocked.
+                continue
+            try:
+                destination_proc.stdin.write(line)
+            except Exception as err:
+                state['destination_error'] = err
+        try:
+            destination_proc.stdin.close()
+        except Exception as err:
+            if state['destination_error'] is None:
+                state['destination_error'] = err
+
+    threads = [
+        threading.Thread(target=read_source, daemon=True),
+        threading.Thread(target=write_destination, daemon=True),
+    ]
+    for thread in threads:
+        thread.start()
+
+    for line in destination_proc.stdout:
+        if state['destination_error'] is not None:
+            continue
+        try:
+            log_destination_line(line)
+        except Exception as err:
+            state['destination_error'] = err
+
+    for thread in threads:
+        thread.join()
+    # The stdin of the destination is already closed and the outputs are read, communicate()
+    # would try to flush the stdin.
+    for proc in [source_proc, destination_proc]:
+        proc.wait()
+        proc.stdout.close()
+
+    if state['source_error'] is not None:
+        raise state['source_error']
+    if source_proc.returncode:
+        raise subprocess.CalledProcessError(source_proc.returncode, source_proc.args)
+
+    destination_error = state['destination_error']
+    if destination_error is None and destination_proc.returncode:
+        destination_error = subprocess.CalledProcessError(
+            destination_proc.returncode,
+            destination_proc.args,
+        )
+    if destination_error is None:
+        with open(streamed_filepath(source_output_file_path), 'w') as f:
+            f.write('')
+
+    return dict(
+        destination_error=destination_error,
+        lines=state['lines'],
+        loaded=destination_error is None,
+        source_proc=source_proc,
+    )
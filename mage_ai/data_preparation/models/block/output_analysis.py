@@ -0,0 +1,101 @@
+import concurrent.futures
+import threading
+from dataclasses import dataclass
+from enum import Enum
+from typing import Callable, Dict
+
+from mage_ai.data_cleaner.statistics.constants import ProfilingMode
+from mage_ai.shared.config import BaseConfig
+
+OUTPUT_ANALYSIS_MAX_WORKERS = 1
+
+
+class OutputAnalysisStatus(str, Enum):
+    COMPLETED = 'completed'
+    FAILED = 'failed'
+    PENDING = 'pending'
+
+
+@dataclass
+class OutputAnalysisConfig(BaseConfig):
+    # How the statistics of the data frames returned by the blocks are computed: 'full' or
+    # 'sketch'.
+    profiling_mode: ProfilingMode = ProfilingMode.FULL
+    # Compute the statistics and insights in a background thread after the outputs are stored,
+    # so that the block completes without waiting for them. Until the analysis is written, the
+    # analysis variable only has the shape of the data frame and its `metadata.analysis_status`
+    # is 'pending'.
+    asynchronous: bool = False
+
+
+__executor = None
+__lock = threading.Lock()
+# The latest submission by analysis variable, so that the analysis of a previous execution of
+# a block that finishes late doesn't overwrite the analysis of the latest execution.
+__latest_submissions = dict()
+__futures = set()
+__submission_count = 0
+
+
+def submit_output_analysis(
+    key: str,
+    analyze: Callable[[], Dict],
+    write: Callable[[Dict], None],
+    pending_analysis: Dict,
+) -> concurrent.futures.Future:
+    """
+    Writes the pending analysis, then computes the analysis in the background executor and
+    writes it unless the analysis of the same variable was submitted again in the meantime.
+
+    Args:
+        key (str): The unique key of the analysis variable.
+        analyze (Callable[[], Dict]): Computes the analysis.
+        write (Callable[[Dict], None]): Writes an analysis to the analysis variable.
+        pending_analysis (Dict): The analysis to write until the analysis is computed.
+    """
+    global __executor
+    global __submission_count
+
+    with __lock:
+        if __executor is None:
+            __executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=OUTPUT_ANALYSIS_MAX_WORKERS,
+                thread_name_prefix='output_analysis',
+            )
+        __submission_count += 1
+        submission = __submission_count
+        __latest_submissions[key] = submission
+        write(pending_analysis)
+
+        future = __executor.submit(__run_output_analysis, key, submission, analyze, write)
+        __futures.add(future)
+    future.add_done_callback(__discard_future)
+    return future
+
+
+def wait_for_output_analyses(timeout: float = None) -> None:
+    """
+    Waits for the analyses submitted to the background executor to be written.
+    """
+    with __lock:
+        futures = list(__futures)
+    concurrent.futures.wait(futures, timeout=timeout)
+
+
+def __run_output_analysis(
+    key: str,
+    submission: int,
+    analyze: Callable[[], Dict],
+    write: Callable[[Dict], None],
+) -> None:
+    analysis = analyze()
+    with __lock:
+        if __latest_submissions.get(key) != submission:
+            return
+        write(analysis)
+        __latest_submissions.pop(key)
+
+
+def __discard_future(future: concurrent.futures.Future) -> None:
+    with __lock:
+        __futures.discard(future)
@@ -52,6 +52,38 @@ def dynamic_block_uuid(
     return uuid
 
 
+def dynamic_child_block_run_attributes(
+    block,
+    block_metadata: Dict,
+    index: int,
+    upstream_block_uuid: str = None,
+) -> Dict:
+    """
+    Builds the attributes of the block run for a dynamic child block.
+
+    Args:
+        block: The dynamic child block.
+        block_metadata (Dict): The metadata of the block.
+        index (int): The index of the dynamic block.
+        upstream_block_uuid (str, optional): The UUID of the upstream block.
+
+    Returns:
+        Dict: The block_uuid and metrics of the block run.
+    """
+    metadata = block_metadata.copy()
+    metadata.update(dict(dynamic_block_index=index))
+
+    return dict(
+        block_uuid=dynamic_block_uuid(
+            block.uuid,
+            metadata,
+            index,
+            upstream_block_uuid=upstream_block_uuid,
+        ),
+        metrics=metadata,
+    )
+
+
 def create_block_run_from_dynamic_child(
     block,
     pipeline_run,
@@ -73,18 +105,15 @@ def create_block_run_from_dynamic_child(
     Returns:
         block_run: The created block run.
     """
-    metadata = block_metadata.copy()
-    metadata.update(dict(dynamic_block_index=index))
-
-    block_uuid = dynamic_block_uuid(
-        block.uuid,
-        metadata,
+    attributes = dynamic_child_block_run_attributes(
+        block,
+        block_metadata,
         index,
         upstream_block_uuid=upstream_block_uuid,
     )
     block_run = pipeline_run.create_block_run(
-        block_uuid,
-        metrics=metadata,
+        attributes['block_uuid'],
+        metrics=attributes['metrics'],
         skip_if_exists=skip_if_exists,
     )
 
@@ -162,100 +191,90 @@ def create_block_runs_from_dynamic_block(
     if type(values) is pd.DataFrame:
         values = values.to_dict(orient='records')
 
-    all_block_runs = []
+    block_runs_attributes = []
     # Dynamic child blocks (aka created from a dynamic block)
     for downstream_block in block.downstream_blocks:
         is_dynamic = is_dynamic_block(downstream_block)
         should_reduce = should_reduce_output(downstream_block)
         descendants = get_all_descendants(downstream_block)
 
-        block_runs_created_by_block_uuid = {}
-        dynamic_child_block_runs = []
-        for idx, _ in enumerate(values):
-            if idx < len(block_metadata):
-                metadata = block_metadata[idx].copy()
+        dynamic_upstream_block_uuids = []
+        for upstream_block in downstream_block.upstream_blocks:
+            if block_uuid_original == upstream_block.uuid and block_uuid_original != block_uuid:
+                dynamic_upstream_block_uuids.append(block_uuid)
             else:
-                metadata = {}
+                dynamic_upstream_block_uuids.append(upstream_block.uuid)
 
-            arr = []
-            for upstream_block in downstream_block.upstream_blocks:
-                if block_uuid_original == upstream_block.uuid and block_uuid_original != block_uuid:
-                    arr.append(block_uuid)
-                else:
-                    arr.append(upstream_block.uuid)
-
-            block_run = create_block_run_from_dynamic_child(
-                downstream_block,
-                pipeline_run,
-                merge_dict(metadata, dict(
-                    dynamic_upstream_block_uuids=arr,
-                )),
-                idx,
-                upstream_block_uuid=block_uuid,
-            )
-            all_block_runs.append(block_run)
-            dynamic_child_block_runs.append(block_run)
-
-            if is_dynamic or should_reduce:
-                continue
-
-            # Schedule all descendants
+        # How each descendant depends on its upstream blocks doesn't depend on the value, so
+        # it's computed once instead of once per value.
+        descendants_to_create = []
+        if not is_dynamic and not should_reduce:
             for b in descendants:
                 # If block has dynamic upstream, skip since creation of downstream
                 # is handled in pipeline scheduler
                 if find(lambda x: is_dynamic_block(x), b.upstream_blocks):
                     continue
 
-                """
-                If a descendant has an immediate upstream block that is different than
-                the current downstream_block that reduces output, skip this loop because
-                this descendant will be created by that other upstream block that reduces output
-                """
-                # if find(
-                #     lambda x: downstream_block.uuid != x.uuid and should_reduce_output(x),
-                #     b.upstream_blocks,
-                # ):
-                #     continue
-
-                arr = []
+                upstream_dependencies = []
                 for upstream_block in b.upstream_blocks:
                     ancestors = get_all_ancestors(upstream_block)
                     # If the upstream block has the current dynamic child as an ancestor,
                     # then have this block depend on a block UUID with the dynamic UUID suffix;
                     # e.g. block_uuid:index
                     if downstream_block.uuid in [a.uuid for a in ancestors]:
-                        arr.append(dynamic_block_uuid(
-                            upstream_block.uuid,
-                            metadata,
-                            idx,
-                        ))
+                        upstream_dependencies.append((upstream_block.uuid, True))
                     elif downstream_block.uuid == upstream_block.uuid:
-                        arr.append(block_run.block_uuid)
+                        upstream_dependencies.append((None, False))
                     elif is_dynamic_block_child(upstream_block):
                         # Needs to know that the ancestors are dynamic
                         # or dynamic child without reduce
-                        arr.append(dynamic_block_uuid(
-                            upstream_block.uuid,
-                            metadata,
-                            idx,
-                        ))
+                        upstream_dependencies.append((upstream_block.uuid, True))
                     else:
-                        arr.append(upstream_block.uuid)
+                        upstream_dependencies.append((upstream_block.uuid, False))
+                descendants_to_create.append((b, upstream_dependencies))
+
+        block_runs_created_by_block_uuid = {}
+        dynamic_child_block_uuids = []
+        for idx, _ in enumerate(values):
+            if idx < len(block_metadata):
+                metadata = block_metadata[idx].copy()
+            else:
+                metadata = {}
 
+            attributes = dynamic_child_block_run_attributes(
+                downstream_block,
+                merge_dict(metadata, dict(
+                    dynamic_upstream_block_uuids=dynamic_upstream_block_uuids,
+                )),
+                idx,
+                upstream_block_uuid=block_uuid,
+            )
+            block_runs_attributes.append(attributes)
+            dynamic_child_block_uuids.append(attributes['block_uuid'])
+
+            # Schedule all descendants
+            for b, upstream_dependencies in descendants_to_create:
                 b_uuid = dynamic_block_uuid(b.uuid, metadata, idx)
                 if b_uuid in block_runs_created_by_block_uuid:
                     continue
                 block_runs_created_by_block_uuid[b_uuid] = True
 
-                br = create_block_run_from_dynamic_child(
+                arr = []
+                for upstream_block_uuid, is_dynamic_upstream in upstream_dependencies:
+                    if upstream_block_uuid is None:
+                        arr.append(attributes['block_uuid'])
+                    elif is_dynamic_upstream:
+                        arr.append(dynamic_block_uuid(upstream_block_uuid, metadata, idx))
+                    else:
+                        arr.append(upstream_block_uuid)
+
+                block_runs_attributes.append(dynamic_child_block_run_attributes(
                     b,
-                    pipeline_run,
                     merge_dict(metadata, dict(
                         dynamic_upstream_block_uuids=arr,
                     )),
                     idx,
-                )
-                all_block_runs.append(br)
+                ))
 
         if should_reduce:
             for b in descendants:
@@ -315,17 +334,16 @@ def create_block_runs_from_dynamic_block(
                 arr = []
                 for upstream_block in b.upstream_blocks:
                     if downstream_block.uuid == upstream_block.uuid:
-                        arr += [b.block_uuid for b in dynamic_child_block_runs]
+                        arr += dynamic_child_block_uuids
                     else:
                         arr.append(upstream_block.uuid)
 
-                all_block_runs.append(pipeline_run.create_block_run(
-                    b.uuid,
+                block_runs_attributes.append(dict(
+                    block_uuid=b.uuid,
                     metrics=dict(dynamic_upstream_block_uuids=arr),
-                    skip_if_exists=True,
                 ))
 
-    return all_block_runs
+    return pipeline_run.bulk_create_block_runs(block_runs_attributes)
 
 
 def get_all_ancestors(block) -> List:
@@ -602,6 +620,37 @@ def fetch_input_variables(
                 continue
 
             variables = input_variables_by_uuid[upstream_block_uuid]
+
+            upstream_in_dynamic_upstream = dynamic_upstream_block_uuids and find(
+                lambda x: upstream_block_uuid in x,
+                dynamic_upstream_block_uuids or [],
+            )
+
+            if dynamic_upstream_block_uuids and (should_reduce or upstream_in_dynamic_upstream):
+                reduce_output_indexes.append((idx, upstream_block_uuid))
+                continue
+
+            if is_dynamic_block(upstream_block) and spark is None:
+                # Only read the item of each output for this dynamic child block instead of
+                # the whole output.
+                index_to_use = 0 if dynamic_block_index is None else dynamic_block_index
+                items = [
+                    pipeline.variable_manager.get_variable_object(
+                        pipeline.uuid,
+                        upstream_block_uuid,
+                        var,
+                        partition=execution_partition,
+                    ).read_item(index_to_use)
+                    for var in variables[:2]
+                ]
+
+                input_vars[idx] = items[0] if len(items) >= 1 else None
+
+                # output_0 is the metadata for dynamic blocks
+                if len(items) >= 2:
+                    kwargs_vars.append(items[1])
+                continue
+
             variable_values = [
                 pipeline.variable_manager.get_variable(
                     pipeline.uuid,
@@ -613,14 +662,7 @@ def fetch_input_variables(
                 for var in variables
             ]
 
-            upstream_in_dynamic_upstream = dynamic_upstream_block_uuids and find(
-                lambda x: upstream_block_uuid in x,
-                dynamic_upstream_block_uuids or [],
-            )
-
-            if dynamic_upstream_block_uuids and (should_reduce or upstream_in_dynamic_upstream):
-                reduce_output_indexes.append((idx, upstream_block_uuid))
-            elif is_dynamic_block(upstream_block):
+            if is_dynamic_block(upstream_block):
                 val = None
                 if len(variable_values) >= 1:
                     arr = variable_values[0]
@@ -641,7 +683,7 @@ def fetch_input_variables(
                     if type(arr) is list and len(arr) >= 1 and index_to_use < len(arr):
                         val = arr[index_to_use]
                     kwargs_vars.append(val)
-            elif not dynamic_upstream_block_uuids or not upstream_in_dynamic_upstream:
+            else:
                 if type(variable_values) is list and len(variable_values) == 1:
                     final_val = variable_values[0]
                 else:
@@ -15,6 +15,11 @@ DATAFRAME_ANALYSIS_MAX_ROWS = 100_000
 DATAFRAME_SAMPLE_COUNT = 1000
 DATAFRAME_SAMPLE_COUNT_PREVIEW = 10
 DATAFRAME_SAMPLE_MAX_COLUMNS = 1000
+# Storage format for dataframe variables: parquet (default) or arrow (memory-mapped IPC file)
+DATAFRAME_STORAGE_FORMAT = os.getenv('VARIABLE_DATAFRAME_STORAGE_FORMAT', 'parquet') or 'parquet'
+# Read arrow dataframe variables without copying the memory-mapped buffers. The numeric columns
+# of the frames are then read-only.
+DATAFRAME_ARROW_ZERO_COPY_READ = os.getenv('VARIABLE_DATAFRAME_ARROW_ZERO_COPY_READ') == '1'
 LOGS_DIR = '.logs'
 MAX_PRINT_OUTPUT_LINES = int(os.getenv('MAX_PRINT_OUTPUT_LINES', 1000) or 1000)
 PIPELINE_CONFIG_FILE = 'metadata.yaml'
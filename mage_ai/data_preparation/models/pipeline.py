@@ -1,4 +1,5 @@
 import asyncio
+import copy
 import datetime
 import json
 import os
@@ -26,6 +27,7 @@ from mage_ai.data_preparation.models.constants import (
     PipelineType,
 )
 from mage_ai.data_preparation.models.file import File
+from mage_ai.data_preparation.models.pipelines.cache import pipeline_config_cache
 from mage_ai.data_preparation.models.variable import Variable
 from mage_ai.data_preparation.repo_manager import (
     RepoConfig,
@@ -200,6 +202,7 @@ class Pipeline:
             duplicate_pipeline.config_path,
             yaml.dump(duplicate_pipeline_dict)
         )
+        pipeline_config_cache.invalidate(duplicate_pipeline.repo_path, duplicate_pipeline_uuid)
 
         return cls.get(
             duplicate_pipeline_uuid,
@@ -277,19 +280,25 @@ class Pipeline:
             PIPELINE_CONFIG_FILE,
         )
 
+        catalog_config_path = os.path.join(
+            repo_path,
+            PIPELINES_FOLDER,
+            uuid,
+            DATA_INTEGRATION_CATALOG_FILE,
+        )
+
         if not os.path.exists(config_path):
             raise Exception(f'Pipeline {uuid} does not exist.')
-        async with aiofiles.open(config_path, mode='r') as f:
-            config = yaml.safe_load(await f.read()) or {}
 
-        if PipelineType.INTEGRATION == config.get('type'):
+        signature = pipeline_config_cache.file_signature([config_path, catalog_config_path])
+        cached = pipeline_config_cache.lookup(repo_path, uuid, signature)
+        if cached is not None:
+            config, catalog = cached
+        else:
+            async with aiofiles.open(config_path, mode='r') as f:
+                config = yaml.safe_load(await f.read()) or {}
+
             catalog = None
-            catalog_config_path = os.path.join(
-                repo_path,
-                PIPELINES_FOLDER,
-                uuid,
-                DATA_INTEGRATION_CATALOG_FILE,
-            )
             if os.path.exists(catalog_config_path):
                 async with aiofiles.open(catalog_config_path, mode='r') as f:
                     try:
@@ -298,6 +307,10 @@ class Pipeline:
                         catalog = {}
                         print('pipeline.get_async')
                         print(err)
+            pipeline_config_cache.set(repo_path, uuid, signature, (config, catalog))
+            config, catalog = copy.deepcopy((config, catalog))
+
+        if PipelineType.INTEGRATION == config.get('type'):
             pipeline = IntegrationPipeline(
                 uuid,
                 catalog=catalog,
@@ -448,10 +461,19 @@ class Pipeline:
         return config
 
     def load_config_from_yaml(self):
+        config, catalog = pipeline_config_cache.get(
+            self.repo_path,
+            self.uuid,
+            [self.config_path, self.catalog_config_path],
+            self.__load_config_and_catalog,
+        )
+        self.load_config(config, catalog=catalog)
+
+    def __load_config_and_catalog(self):
         catalog = None
         if os.path.exists(self.catalog_config_path):
             catalog = self.get_catalog_from_json()
-        self.load_config(self.get_config_from_yaml(), catalog=catalog)
+        return self.get_config_from_yaml(), catalog
 
     def load_config(self, config, catalog=None):
         if not config:
@@ -763,6 +785,7 @@ class Pipeline:
             self.uuid = new_uuid
             new_pipeline_path = self.dir_path
             os.rename(old_pipeline_path, new_pipeline_path)
+            pipeline_config_cache.invalidate(self.repo_path, old_uuid)
             await self.save_async()
             transfer_related_models_for_pipeline(old_uuid, new_uuid)
 
@@ -1328,6 +1351,8 @@ class Pipeline:
         except Exception as err:
             print(f'Could not delete secrets directory due to {str(err)}')
 
+        pipeline_config_cache.invalidate(self.repo_path, self.uuid)
+
     def delete_block(
         self,
         block: Block,
@@ -1455,6 +1480,7 @@ class Pipeline:
         content = yaml.dump(pipeline_dict)
 
         safe_write(self.config_path, content)
+        pipeline_config_cache.invalidate(self.repo_path, self.uuid)
 
         File.create(
             PIPELINE_CONFIG_FILE,
@@ -1533,6 +1559,7 @@ class Pipeline:
                 raise Exception('Invalid pipeline metadata.yaml content, please try saving again.')
 
         await safe_write_async(self.config_path, content)
+        pipeline_config_cache.invalidate(self.repo_path, self.uuid)
 
         await File.create_async(
             PIPELINE_CONFIG_FILE,
@@ -0,0 +1,105 @@
+import copy
+import os
+import threading
+from typing import Any, Callable, Dict, List, Tuple
+
+
+class PipelineConfigCache:
+    """
+    In-process cache of the parsed metadata.yaml config and data integration catalog of the
+    pipelines, keyed by (repo path, pipeline uuid).
+
+    Parsing metadata.yaml is most of the cost of loading a pipeline. An entry is only used while
+    the modification time and size of the pipeline's files are the ones it was loaded with, and
+    is invalidated when the pipeline is saved. Each lookup returns a copy of the config, so
+    every `Pipeline` still gets its own blocks and config that it can modify.
+    """
+
+    def __init__(self):
+        self.entries = dict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(
+        self,
+        repo_path: str,
+        uuid: str,
+        file_paths: List[str],
+        load: Callable[[], Any],
+    ) -> Any:
+        """
+        Returns a copy of the cached value of the pipeline, or loads it with `load` if the files
+        changed since it was cached.
+
+        Args:
+            repo_path (str): The project path.
+            uuid (str): The pipeline uuid.
+            file_paths (List[str]): The files the value is loaded from.
+            load (Callable[[], Any]): Loads the value from the files.
+        """
+        signature = self.file_signature(file_paths)
+        value = self.lookup(repo_path, uuid, signature)
+        if value is not None:
+            return value
+        value = load()
+        self.set(repo_path, uuid, signature, value)
+        return copy.deepcopy(value)
+
+    def lookup(self, repo_path: str, uuid: str, signature: Tuple) -> Any:
+        key = self.__key(repo_path, uuid)
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None or signature is None or entry[0] != signature:
+                self.misses += 1
+                return None
+            self.hits += 1
+            value = entry[1]
+        return copy.deepcopy(value)
+
+    def set(self, repo_path: str, uuid: str, signature: Tuple, value: Any) -> None:
+        if signature is None:
+            return
+        with self.lock:
+            self.entries[self.__key(repo_path, uuid)] = (signature, value)
+
+    def invalidate(self, repo_path: str, uuid: str) -> None:
+        with self.lock:
+            self.entries.pop(self.__key(repo_path, uuid), None)
+
+    def clear(self) -> None:
+        with self.lock:
+            self.entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def file_signature(self, file_paths: List[str]) -> Tuple:
+        """
+        Returns the modification time and size of each file, or None if the first file (the
+        pipeline's metadata.yaml) doesn't exist.
+        """
+        signature = []
+        for idx, file_path in enumerate(file_paths):
+            try:
+                stat = os.stat(file_path)
+            except FileNotFoundError:
+                if idx == 0:
+                    return None
+                signature.append(None)
+                continue
+            signature.append((stat.st_mtime_ns, stat.st_size))
+        return tuple(signature)
+
+    def metrics(self) -> Dict:
+        with self.lock:
+            return dict(
+                hits=self.hits,
+                misses=self.misses,
+                size=len(self.entries),
+            )
+
+    def __key(self, repo_path: str, uuid: str) -> Tuple[str, str]:
+        return (os.path.abspath(repo_path), uuid)
+
+
+pipeline_config_cache = PipelineConfigCache()
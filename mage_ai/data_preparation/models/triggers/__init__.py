@@ -41,6 +41,8 @@ class SettingsConfig(BaseConfig):
     skip_if_previous_running: bool = False
     allow_blocks_to_fail: bool = False
     landing_time_enabled: bool = False
+    # Priority class (high, normal or low) of the jobs of the trigger's pipeline runs.
+    priority: str = None
 
 
 @dataclass
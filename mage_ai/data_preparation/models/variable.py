@@ -1,20 +1,26 @@
+import inspect
 import json
 import os
+import pickle
 import traceback
 from enum import Enum
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterator, List
 
 import numpy as np
 import pandas as pd
 import polars as pl
+import pyarrow as pa
+import simplejson
 from pandas.api.types import is_object_dtype
 from pandas.core.indexes.range import RangeIndex
 
 from mage_ai.data_cleaner.shared.utils import is_geo_dataframe, is_spark_dataframe
 from mage_ai.data_preparation.models.constants import (
     DATAFRAME_ANALYSIS_KEYS,
+    DATAFRAME_ARROW_ZERO_COPY_READ,
     DATAFRAME_SAMPLE_COUNT,
     DATAFRAME_SAMPLE_MAX_COLUMNS,
+    DATAFRAME_STORAGE_FORMAT,
     VARIABLE_DIR,
 )
 from mage_ai.data_preparation.models.utils import (  # dask_from_pandas,
@@ -28,9 +34,11 @@ from mage_ai.data_preparation.models.utils import (  # dask_from_pandas,
 )
 from mage_ai.data_preparation.storage.base_storage import BaseStorage
 from mage_ai.data_preparation.storage.local_storage import LocalStorage
-from mage_ai.shared.parsers import sample_output
+from mage_ai.shared.parsers import encode_complex, sample_output
 from mage_ai.shared.utils import clean_name
 
+DATAFRAME_ARROW_FILE = 'data.arrow'
+DATAFRAME_CHUNKED_PARQUET_FILE = 'chunked_data.parquet'
 DATAFRAME_COLUMN_TYPES_FILE = 'data_column_types.json'
 DATAFRAME_PARQUET_FILE = 'data.parquet'
 DATAFRAME_PARQUET_SAMPLE_FILE = 'sample_data.parquet'
@@ -39,8 +47,15 @@ DATAFRAME_CSV_FILE = 'data.csv'
 JSON_FILE = 'data.json'
 JSON_SAMPLE_FILE = 'sample_data.json'
 
+# Each item of a list, or row of a dataframe, serialized one after another, and the offsets
+# of the items in the file, so that a single item can be read without reading the variable.
+ITEMS_FILE = 'items.data'
+ITEMS_INDEX_FILE = 'items.index'
+ITEMS_INDEX_OFFSET = np.dtype('<u8')
+
 
 class VariableType(str, Enum):
+    CHUNKED_DATAFRAME = 'chunked_dataframe'
     DATAFRAME = 'dataframe'
     DATAFRAME_ANALYSIS = 'dataframe_analysis'
     GEO_DATAFRAME = 'geo_dataframe'
@@ -48,6 +63,11 @@ class VariableType(str, Enum):
     SPARK_DATAFRAME = 'spark_dataframe'
 
 
+class DataframeStorageFormat(str, Enum):
+    ARROW = 'arrow'
+    PARQUET = 'parquet'
+
+
 class Variable:
     def __init__(
         self,
@@ -57,7 +77,8 @@ class Variable:
         partition: str = None,
         spark=None,
         storage: BaseStorage = None,
-        variable_type: VariableType = None
+        variable_type: VariableType = None,
+        dataframe_storage_format: DataframeStorageFormat = None,
     ) -> None:
         self.uuid = uuid
         if storage is None:
@@ -79,6 +100,8 @@ class Variable:
         if not self.storage.path_exists(self.variable_dir_path):
             self.storage.makedirs(self.variable_dir_path)
 
+        self.dataframe_storage_format = dataframe_storage_format or DATAFRAME_STORAGE_FORMAT
+
         self.variable_type = variable_type
         self.check_variable_type(spark=spark)
 
@@ -94,11 +117,16 @@ class Variable:
         """
         Infer variable type based on data in the storage.
         """
-        if self.variable_type is None and self.storage.path_exists(
-            os.path.join(self.variable_path, DATAFRAME_PARQUET_FILE)
+        if self.variable_type is None and (
+            self.storage.path_exists(os.path.join(self.variable_path, DATAFRAME_PARQUET_FILE)) or
+            self.storage.path_exists(os.path.join(self.variable_path, DATAFRAME_ARROW_FILE))
         ):
-            # If parquet file exists for given variable, set the variable type to DATAFRAME
+            # If parquet or arrow file exists for given variable, set the variable type to DATAFRAME
             self.variable_type = VariableType.DATAFRAME
+        elif self.variable_type is None and self.storage.path_exists(
+            os.path.join(self.variable_path, DATAFRAME_CHUNKED_PARQUET_FILE)
+        ):
+            self.variable_type = VariableType.CHUNKED_DATAFRAME
         elif ((self.variable_type == VariableType.DATAFRAME or self.variable_type is None)
                 and os.path.exists(
                 os.path.join(self.variable_dir_path, f'{self.uuid}', 'data.sh'))):
@@ -117,20 +145,23 @@ class Variable:
         csv_file_path = os.path.join(self.variable_path, DATAFRAME_CSV_FILE)
         if self.storage.path_exists(csv_file_path):
             return
-        df = self.__read_parquet()
+        df = self.__read_dataframe()
         self.storage.write_csv(df, csv_file_path)
 
     def delete(self):
         """
         Delete the variable data.
         """
-        if self.variable_type is None and self.storage.path_exists(
-            os.path.join(self.variable_dir_path, f'{self.uuid}', DATAFRAME_PARQUET_FILE)
+        if self.variable_type is None and (
+            self.storage.path_exists(os.path.join(self.variable_path, DATAFRAME_PARQUET_FILE)) or
+            self.storage.path_exists(os.path.join(self.variable_path, DATAFRAME_ARROW_FILE))
         ):
-            # If parquet file exists for given variable, set the variable type to DATAFRAME
+            # If parquet or arrow file exists for given variable, set the variable type to DATAFRAME
             self.variable_type = VariableType.DATAFRAME
         if self.variable_type == VariableType.DATAFRAME:
             self.__delete_parquet()
+        elif self.variable_type == VariableType.CHUNKED_DATAFRAME:
+            return self.storage.remove_dir(self.variable_path)
         elif self.variable_type == VariableType.DATAFRAME_ANALYSIS:
             return self.__delete_dataframe_analysis()
         return self.__delete_json()
@@ -153,9 +184,14 @@ class Variable:
             sample_count (int, optional): The number of rows to sample, used for
                 DATAFRAME variable.
             spark (None, optional): Spark context, used to read SPARK_DATAFRAME variable.
+
+        For CHUNKED_DATAFRAME variable, an iterator of dataframes is returned unless sample
+        is set, in which case a dataframe with the sampled rows is returned.
         """
         if self.variable_type == VariableType.DATAFRAME:
-            return self.__read_parquet(sample=sample, sample_count=sample_count)
+            return self.__read_dataframe(sample=sample, sample_count=sample_count)
+        elif self.variable_type == VariableType.CHUNKED_DATAFRAME:
+            return self.__read_chunked_dataframe(sample=sample, sample_count=sample_count)
         elif self.variable_type == VariableType.SPARK_DATAFRAME:
             return self.__read_spark_parquet(sample=sample, sample_count=sample_count, spark=spark)
         elif self.variable_type == VariableType.GEO_DATAFRAME:
@@ -164,6 +200,41 @@ class Variable:
             return self.__read_dataframe_analysis(dataframe_analysis_keys=dataframe_analysis_keys)
         return self.__read_json(sample=sample)
 
+    def read_item(self, index: int) -> Any:
+        """
+        Read the item at the index of a list variable, or the row at the index of a DATAFRAME
+        variable as a dict, e.g. the input of a dynamic child block.
+
+        If the variable was written with `index_items`, only the item is read from storage.
+        Otherwise, the whole variable is read. Returns None if the index is out of range.
+        """
+        index_file_path = os.path.join(self.variable_path, ITEMS_INDEX_FILE)
+        if self.storage.path_exists(index_file_path):
+            offset_size = ITEMS_INDEX_OFFSET.itemsize
+            offsets = self.storage.read_bytes(
+                index_file_path,
+                index * offset_size,
+                (index + 2) * offset_size,
+            )
+            if index < 0 or len(offsets) < 2 * offset_size:
+                return None
+            start, end = np.frombuffer(offsets, dtype=ITEMS_INDEX_OFFSET)
+            content = self.storage.read_bytes(
+                os.path.join(self.variable_path, ITEMS_FILE),
+                int(start),
+                int(end),
+            )
+            if self.variable_type == VariableType.DATAFRAME:
+                return pickle.loads(content)
+            return json.loads(content)
+
+        data = self.read_data()
+        if type(data) is pd.DataFrame:
+            return data.iloc[index].to_dict()
+        elif type(data) is list and 0 <= index < len(data):
+            return data[index]
+        return None
+
     async def read_data_async(
         self,
         dataframe_analysis_keys: List[str] = None,
@@ -182,9 +253,14 @@ class Variable:
             sample_count (int, optional): The number of rows to sample, used for
                 DATAFRAME variable.
             spark (None, optional): Spark context, used to read SPARK_DATAFRAME variable.
+
+        For CHUNKED_DATAFRAME variable, an iterator of dataframes is returned unless sample
+        is set, in which case a dataframe with the sampled rows is returned.
         """
         if self.variable_type == VariableType.DATAFRAME:
-            return self.__read_parquet(sample=sample, sample_count=sample_count)
+            return self.__read_dataframe(sample=sample, sample_count=sample_count)
+        elif self.variable_type == VariableType.CHUNKED_DATAFRAME:
+            return self.__read_chunked_dataframe(sample=sample, sample_count=sample_count)
         elif self.variable_type == VariableType.SPARK_DATAFRAME:
             return self.__read_spark_parquet(sample=sample, sample_count=sample_count, spark=spark)
         elif self.variable_type == VariableType.DATAFRAME_ANALYSIS:
@@ -193,15 +269,20 @@ class Variable:
             )
         return await self.__read_json_async(sample=sample)
 
-    def write_data(self, data: Any) -> None:
+    def write_data(self, data: Any, index_items: bool = False) -> None:
         """
         Write variable data to the persistent storage.
 
         Args:
-            data (Any): Variable data to be written to storage.
+            data (Any): Variable data to be written to storage. A generator of dataframes is
+                written as a CHUNKED_DATAFRAME variable without being materialized in memory.
+            index_items (bool, optional): Also write each item of a list, or row of a dataframe,
+                with an index, so that `read_item` reads a single item.
         """
         if self.variable_type is None and type(data) is pd.DataFrame:
             self.variable_type = VariableType.DATAFRAME
+        elif self.variable_type is None and inspect.isgenerator(data):
+            self.variable_type = VariableType.CHUNKED_DATAFRAME
         elif self.variable_type is None and type(data) is pl.DataFrame:
             self.variable_type = VariableType.POLARS_DATAFRAME
         elif is_spark_dataframe(data):
@@ -210,7 +291,9 @@ class Variable:
             self.variable_type = VariableType.GEO_DATAFRAME
 
         if self.variable_type == VariableType.DATAFRAME:
-            self.__write_parquet(data)
+            self.__write_dataframe(data)
+        elif self.variable_type == VariableType.CHUNKED_DATAFRAME:
+            self.__write_chunked_dataframe(data)
         elif self.variable_type == VariableType.POLARS_DATAFRAME:
             self.__write_polars_dataframe(data)
         elif self.variable_type == VariableType.SPARK_DATAFRAME:
@@ -222,15 +305,23 @@ class Variable:
         else:
             self.__write_json(data)
 
-    async def write_data_async(self, data: Any) -> None:
+        if index_items:
+            self.__write_items(data)
+
+    async def write_data_async(self, data: Any, index_items: bool = False) -> None:
         """
         Write variable data to the persistent storage.
 
         Args:
-            data (Any): Variable data to be written to storage.
+            data (Any): Variable data to be written to storage. A generator of dataframes is
+                written as a CHUNKED_DATAFRAME variable without being materialized in memory.
+            index_items (bool, optional): Also write each item of a list, or row of a dataframe,
+                with an index, so that `read_item` reads a single item.
         """
         if self.variable_type is None and type(data) is pd.DataFrame:
             self.variable_type = VariableType.DATAFRAME
+        elif self.variable_type is None and inspect.isgenerator(data):
+            self.variable_type = VariableType.CHUNKED_DATAFRAME
         elif self.variable_type is None and type(data) is pl.DataFrame:
             self.variable_type = VariableType.POLARS_DATAFRAME
         elif is_spark_dataframe(data):
@@ -239,7 +330,9 @@ class Variable:
             self.variable_type = VariableType.GEO_DATAFRAME
 
         if self.variable_type == VariableType.DATAFRAME:
-            self.__write_parquet(data)
+            self.__write_dataframe(data)
+        elif self.variable_type == VariableType.CHUNKED_DATAFRAME:
+            self.__write_chunked_dataframe(data)
         elif self.variable_type == VariableType.POLARS_DATAFRAME:
             self.__write_polars_dataframe(data)
         elif self.variable_type == VariableType.SPARK_DATAFRAME:
@@ -251,6 +344,9 @@ class Variable:
         else:
             await self.__write_json_async(data)
 
+        if index_items:
+            self.__write_items(data)
+
     def __delete_dataframe_analysis(self) -> None:
         for k in DATAFRAME_ANALYSIS_KEYS:
             file_path = os.path.join(self.variable_path, f'{k}.json')
@@ -268,11 +364,12 @@ class Variable:
             self.storage.remove_dir(self.variable_path)
 
     def __delete_parquet(self) -> None:
-        file_path = os.path.join(self.variable_path, DATAFRAME_PARQUET_FILE)
-
-        if self.storage.path_exists(file_path):
-            self.storage.remove(file_path)
-            self.storage.remove_dir(self.variable_path)
+        for file_name in [DATAFRAME_PARQUET_FILE, DATAFRAME_ARROW_FILE]:
+            file_path = os.path.join(self.variable_path, file_name)
+            if self.storage.path_exists(file_path):
+                self.storage.remove(file_path)
+                self.storage.remove_dir(self.variable_path)
+                return
 
     def __read_json(self, default_value: Dict = None, sample: bool = False) -> Dict:
         if default_value is None:
@@ -341,6 +438,31 @@ class Variable:
         except Exception:
             traceback.print_exc()
 
+    def __write_items(self, data: Any) -> None:
+        if self.variable_type == VariableType.DATAFRAME and type(data) is pd.DataFrame:
+            items = [pickle.dumps(row) for row in data.to_dict('records')]
+        elif self.variable_type is None and type(data) is list:
+            # Serialized the same way as the whole list in the JSON file.
+            items = [
+                simplejson.dumps(
+                    item,
+                    default=encode_complex,
+                    ignore_nan=True,
+                ).encode()
+                for item in data
+            ]
+        else:
+            return
+
+        offsets = np.zeros(len(items) + 1, dtype=ITEMS_INDEX_OFFSET)
+        np.cumsum([len(item) for item in items], out=offsets[1:])
+        self.storage.makedirs(self.variable_path, exist_ok=True)
+        self.storage.write_bytes(os.path.join(self.variable_path, ITEMS_FILE), b''.join(items))
+        self.storage.write_bytes(
+            os.path.join(self.variable_path, ITEMS_INDEX_FILE),
+            offsets.tobytes(),
+        )
+
     def __read_geo_dataframe(self, sample: bool = False, sample_count: int = None):
         import geopandas as gpd
 
@@ -361,6 +483,42 @@ class Variable:
                 df = df.iloc[:sample_count]
         return df
 
+    def __read_dataframe(
+        self,
+        sample: bool = False,
+        sample_count: int = None,
+    ) -> pd.DataFrame:
+        if self.storage.path_exists(os.path.join(self.variable_path, DATAFRAME_ARROW_FILE)):
+            return self.__read_arrow(sample=sample, sample_count=sample_count)
+        return self.__read_parquet(sample=sample, sample_count=sample_count)
+
+    def __read_arrow(
+        self,
+        sample: bool = False,
+        sample_count: int = None,
+    ) -> pd.DataFrame:
+        file_path = os.path.join(self.variable_path, DATAFRAME_ARROW_FILE)
+        try:
+            table = self.storage.read_arrow(file_path)
+        except Exception:
+            traceback.print_exc()
+            return pd.DataFrame()
+
+        if sample:
+            # Slicing the mapped table is zero-copy, so no separate sample file is needed.
+            sample_count = sample_count or DATAFRAME_SAMPLE_COUNT
+            table = table.slice(0, sample_count)
+            if table.num_columns > DATAFRAME_SAMPLE_MAX_COLUMNS:
+                table = table.select(list(range(DATAFRAME_SAMPLE_MAX_COLUMNS)))
+
+        if DATAFRAME_ARROW_ZERO_COPY_READ:
+            # split_blocks avoids consolidating columns into 2D blocks, which lets numeric
+            # columns without nulls reference the memory-mapped buffers directly. Those columns
+            # are read-only.
+            return table.to_pandas(split_blocks=True)
+        # Copy the buffers so that blocks can modify their input data frames in place.
+        return table.to_pandas()
+
     def __read_parquet(
         self,
         sample: bool = False,
@@ -404,6 +562,24 @@ class Variable:
                 df = cast_column_types(df, column_types)
         return df
 
+    def __read_chunked_dataframe(
+        self,
+        sample: bool = False,
+        sample_count: int = None,
+    ) -> Iterator[pd.DataFrame]:
+        if sample:
+            df = self.__read_parquet(sample=True, sample_count=sample_count)
+            if df.shape[0] > 0:
+                return df
+            # Sample file is missing, fall back to the first chunk
+            for chunk in self.__read_chunked_dataframe():
+                return chunk.iloc[:sample_count or DATAFRAME_SAMPLE_COUNT]
+            return df
+
+        return self.storage.read_parquet_chunks(
+            os.path.join(self.variable_path, DATAFRAME_CHUNKED_PARQUET_FILE),
+        )
+
     def __read_spark_parquet(self, sample: bool = False, sample_count: int = None, spark=None):
         if spark is None:
             return None
@@ -425,6 +601,40 @@ class Variable:
         df_sample_output = data.iloc[:DATAFRAME_SAMPLE_COUNT]
         df_sample_output.to_file(os.path.join(self.variable_path, 'sample_data.sh'))
 
+    def __write_dataframe(self, data: pd.DataFrame) -> None:
+        arrow_file_path = os.path.join(self.variable_path, DATAFRAME_ARROW_FILE)
+        if self.dataframe_storage_format == DataframeStorageFormat.ARROW:
+            try:
+                self.__write_arrow(data)
+                return
+            except (
+                pa.ArrowInvalid,
+                pa.ArrowNotImplementedError,
+                pa.ArrowTypeError,
+            ) as err:
+                # Fall back to parquet for columns Arrow can't represent losslessly
+                print(f'Writing variable {self.uuid} in parquet format instead of arrow: {err}')
+        # The arrow file takes precedence on read, so remove a stale one before writing parquet
+        if self.storage.path_exists(arrow_file_path):
+            self.storage.remove(arrow_file_path)
+        self.__write_parquet(data)
+
+    def __write_arrow(self, data: pd.DataFrame) -> None:
+        table = pa.Table.from_pandas(data)
+        for field in table.schema:
+            # Nested values (dicts, lists) don't round trip through Arrow the same way they do
+            # through the JSON serialization used by the parquet format.
+            if pa.types.is_nested(field.type):
+                raise pa.ArrowTypeError(f'Column "{field.name}" has nested type {field.type}.')
+
+        self.storage.makedirs(self.variable_path, exist_ok=True)
+        self.storage.write_arrow(table, os.path.join(self.variable_path, DATAFRAME_ARROW_FILE))
+
+        for file_name in [DATAFRAME_PARQUET_FILE, DATAFRAME_PARQUET_SAMPLE_FILE]:
+            file_path = os.path.join(self.variable_path, file_name)
+            if self.storage.path_exists(file_path):
+                self.storage.remove(file_path)
+
     def __write_parquet(self, data: pd.DataFrame) -> None:
         column_types = {}
         df_output = data.copy()
@@ -506,6 +716,51 @@ class Variable:
             print(f'Sample output error: {err}.')
             traceback.print_exc()
 
+    def __write_chunked_dataframe(self, data: Iterator[pd.DataFrame]) -> None:
+        state = dict(column_count=0, row_count=0, sample=None)
+
+        def __chunks():
+            for chunk in data:
+                if type(chunk) is pl.DataFrame:
+                    chunk = chunk.to_pandas()
+                elif type(chunk) is not pd.DataFrame:
+                    raise Exception(
+                        'Please yield Pandas or Polars dataframes from the block, '
+                        f'found {type(chunk).__name__}.'
+                    )
+                state['row_count'] += chunk.shape[0]
+                state['column_count'] = chunk.shape[1]
+                if state['sample'] is None:
+                    state['sample'] = chunk.iloc[
+                        :DATAFRAME_SAMPLE_COUNT,
+                        :DATAFRAME_SAMPLE_MAX_COLUMNS
+                    ]
+                yield chunk
+
+        self.storage.makedirs(self.variable_path, exist_ok=True)
+        self.storage.write_parquet_chunks(
+            __chunks(),
+            os.path.join(self.variable_path, DATAFRAME_CHUNKED_PARQUET_FILE),
+        )
+
+        if state['sample'] is not None:
+            try:
+                self.storage.write_parquet(
+                    state['sample'],
+                    os.path.join(self.variable_path, DATAFRAME_PARQUET_SAMPLE_FILE),
+                )
+            except Exception as err:
+                print(f'Sample output error: {err}.')
+                traceback.print_exc()
+
+        # The chunks aren't kept in memory for the block to analyze, so record their shape here.
+        self.__write_dataframe_analysis(dict(
+            statistics=dict(
+                original_row_count=state['row_count'],
+                original_column_count=state['column_count'],
+            ),
+        ))
+
     def __write_polars_dataframe(self, data: pl.DataFrame) -> None:
         self.storage.makedirs(self.variable_path, exist_ok=True)
 
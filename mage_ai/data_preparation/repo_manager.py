@@ -49,9 +49,11 @@ class RepoConfig:
         self.emr_config = None
         self.features = None
         self.gcp_cloud_run_config = None
+        self.integration_streaming_config = None
         self.k8s_executor_config = None
         self.spark_config = None
         self.notification_config = None
+        self.output_analysis_config = None
         self.queue_config = None
         self.help_improve_mage = None
         self.openai_api_key = None
@@ -104,9 +106,12 @@ class RepoConfig:
             self.emr_config = repo_config.get('emr_config')
             self.features = repo_config.get('features', {})
             self.gcp_cloud_run_config = repo_config.get('gcp_cloud_run_config')
+            self.integration_streaming_config = \
+                repo_config.get('integration_streaming_config', dict())
             self.k8s_executor_config = repo_config.get('k8s_executor_config')
             self.spark_config = repo_config.get('spark_config')
             self.notification_config = repo_config.get('notification_config', dict())
+            self.output_analysis_config = repo_config.get('output_analysis_config', dict())
             self.queue_config = repo_config.get('queue_config', dict())
             self.project_uuid = repo_config.get('project_uuid')
             self.help_improve_mage = repo_config.get('help_improve_mage')
@@ -151,8 +156,10 @@ class RepoConfig:
             features=self.features,
             gcp_cloud_run_config=self.gcp_cloud_run_config,
             help_improve_mage=self.help_improve_mage,
+            integration_streaming_config=self.integration_streaming_config,
             notification_config=self.notification_config,
             openai_api_key=self.openai_api_key,
+            output_analysis_config=self.output_analysis_config,
             project_type=self.project_type,
             project_uuid=self.project_uuid,
             queue_config=self.queue_config,
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Dict, List
+from typing import Dict, Iterator, List
 
 
 class BaseStorage(ABC):
@@ -73,6 +73,34 @@ class BaseStorage(ABC):
         """
         pass
 
+    @abstractmethod
+    def read_bytes(self, file_path: str, start: int, end: int) -> bytes:
+        """
+        Read the bytes of a file from the start offset up to, but excluding, the end offset.
+        """
+        pass
+
+    @abstractmethod
+    def write_bytes(self, file_path: str, content: bytes) -> None:
+        """
+        Write bytes to a file with file path.
+        """
+        pass
+
+    @abstractmethod
+    def read_arrow(self, file_path: str):
+        """
+        Read an Arrow IPC file into a pyarrow Table.
+        """
+        pass
+
+    @abstractmethod
+    def write_arrow(self, table, file_path: str) -> None:
+        """
+        Write a pyarrow Table to a file in Arrow IPC (Feather v2) format.
+        """
+        pass
+
     @abstractmethod
     def write_parquet(self, df, file_path: str) -> None:
         """
@@ -80,6 +108,21 @@ class BaseStorage(ABC):
         """
         pass
 
+    @abstractmethod
+    def read_parquet_chunks(self, file_path: str) -> Iterator:
+        """
+        Read a parquet file one row group at a time, yielding a Pandas dataframe per row group.
+        """
+        pass
+
+    @abstractmethod
+    def write_parquet_chunks(self, chunks: Iterator, file_path: str) -> int:
+        """
+        Write an iterator of Pandas dataframes to a parquet file, one row group per dataframe.
+        Returns the total number of rows written.
+        """
+        pass
+
     @abstractmethod
     def write_polars_dataframe(self, df, file_path: str) -> None:
         """
@@ -1,14 +1,20 @@
 from mage_ai.data_preparation.models.file import File
 from mage_ai.data_preparation.storage.base_storage import BaseStorage
+from mage_ai.data_preparation.storage.utils import (
+    read_parquet_row_groups,
+    write_parquet_row_groups,
+)
 from mage_ai.shared.parsers import encode_complex
-from typing import Dict, List
+from typing import Dict, Iterator, List
 import aiofiles
 import json
 import os
 import pandas as pd
 import polars as pl
+import pyarrow as pa
 import shutil
 import simplejson
+import uuid
 
 
 class LocalStorage(BaseStorage):
@@ -75,6 +81,39 @@ class LocalStorage(BaseStorage):
             )
             await file.write(fcontent)
 
+    def read_bytes(self, file_path: str, start: int, end: int) -> bytes:
+        with open(file_path, 'rb') as file:
+            file.seek(start)
+            return file.read(max(end - start, 0))
+
+    def write_bytes(self, file_path: str, content: bytes) -> None:
+        File.create_parent_directories(file_path)
+        with open(file_path, 'wb') as file:
+            file.write(content)
+
+    def read_arrow(self, file_path: str) -> pa.Table:
+        """
+        Memory-map the file so that the buffers of the returned table reference the page cache
+        instead of being copied into the process heap.
+        """
+        with pa.memory_map(file_path, 'r') as source:
+            return pa.ipc.open_file(source).read_all()
+
+    def write_arrow(self, table: pa.Table, file_path: str) -> None:
+        File.create_parent_directories(file_path)
+        # Write to a temporary file and replace the file, instead of truncating it, so that the
+        # processes that still have the previous file memory-mapped keep reading it.
+        temp_file_path = f'{file_path}.{uuid.uuid4().hex}.tmp'
+        try:
+            # Leave the file uncompressed so it can be memory-mapped on read.
+            with pa.OSFile(temp_file_path, 'wb') as sink:
+                with pa.ipc.new_file(sink, table.schema) as writer:
+                    writer.write_table(table)
+            os.replace(temp_file_path, file_path)
+        finally:
+            if os.path.exists(temp_file_path):
+                os.remove(temp_file_path)
+
     def read_parquet(self, file_path: str, **kwargs) -> pd.DataFrame:
         return pd.read_parquet(file_path, engine='pyarrow')
 
@@ -86,6 +125,13 @@ class LocalStorage(BaseStorage):
         File.create_parent_directories(file_path)
         df.to_parquet(file_path)
 
+    def read_parquet_chunks(self, file_path: str) -> Iterator[pd.DataFrame]:
+        return read_parquet_row_groups(file_path)
+
+    def write_parquet_chunks(self, chunks: Iterator[pd.DataFrame], file_path: str) -> int:
+        File.create_parent_directories(file_path)
+        return write_parquet_row_groups(chunks, file_path)
+
     def write_polars_dataframe(self, df: pl.DataFrame, file_path: str) -> None:
         File.create_parent_directories(file_path)
         df.write_parquet(file_path)
@@ -1,13 +1,18 @@
 from mage_ai.services.aws.s3 import s3
 from mage_ai.data_preparation.storage.base_storage import BaseStorage
+from mage_ai.data_preparation.storage.utils import (
+    read_parquet_row_groups,
+    write_parquet_row_groups,
+)
 from mage_ai.shared.constants import S3_PREFIX
 from mage_ai.shared.parsers import encode_complex
 from mage_ai.shared.urls import s3_url_path
-from typing import Dict, List
+from typing import Dict, Iterator, List
 import io
 import json
 import pandas as pd
 import polars as pl
+import pyarrow as pa
 import simplejson
 
 
@@ -75,6 +80,25 @@ class S3Storage(BaseStorage):
         """
         return self.write_json_file(file_path, data)
 
+    def read_bytes(self, file_path: str, start: int, end: int) -> bytes:
+        if end <= start:
+            return b''
+        return self.client.read_range(s3_url_path(file_path), start, end)
+
+    def write_bytes(self, file_path: str, content: bytes) -> None:
+        self.client.upload(s3_url_path(file_path), content)
+
+    def read_arrow(self, file_path: str) -> pa.Table:
+        buffer = pa.py_buffer(self.client.get_object(s3_url_path(file_path)).read())
+        return pa.ipc.open_file(buffer).read_all()
+
+    def write_arrow(self, table: pa.Table, file_path: str) -> None:
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+        buffer = io.BytesIO(sink.getvalue().to_pybytes())
+        self.client.upload_object(s3_url_path(file_path), buffer)
+
     def read_parquet(self, file_path: str, **kwargs) -> pd.DataFrame:
         buffer = io.BytesIO(self.client.get_object(s3_url_path(file_path)).read())
         return pd.read_parquet(buffer, **kwargs)
@@ -85,6 +109,19 @@ class S3Storage(BaseStorage):
         buffer.seek(0)
         self.client.upload_object(s3_url_path(file_path), buffer)
 
+    def read_parquet_chunks(self, file_path: str) -> Iterator[pd.DataFrame]:
+        buffer = io.BytesIO(self.client.get_object(s3_url_path(file_path)).read())
+        return read_parquet_row_groups(buffer)
+
+    def write_parquet_chunks(self, chunks: Iterator[pd.DataFrame], file_path: str) -> int:
+        # The compressed file is buffered in memory before upload; only the
+        # uncompressed chunks are streamed.
+        buffer = io.BytesIO()
+        row_count = write_parquet_row_groups(chunks, buffer)
+        buffer.seek(0)
+        self.client.upload_object(s3_url_path(file_path), buffer)
+        return row_count
+
     def write_polars_dataframe(self, df: pl.DataFrame, file_path: str) -> None:
         buffer = io.BytesIO()
         df.write_parquet(buffer)
@@ -1,3 +1,50 @@
+from typing import Iterator
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+
+def read_parquet_row_groups(source) -> Iterator[pd.DataFrame]:
+    parquet_file = pq.ParquetFile(source)
+    for i in range(parquet_file.num_row_groups):
+        yield parquet_file.read_row_group(i).to_pandas()
+
+
+def write_parquet_row_groups(chunks: Iterator[pd.DataFrame], sink) -> int:
+    """
+    Write each dataframe as its own row group so that only one chunk has to be held in memory
+    at a time, both when writing and when reading the file back. Every chunk is cast to the
+    schema of the first chunk.
+    """
+    row_count = 0
+    writer = None
+    try:
+        for df in chunks:
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            if writer is None:
+                writer = pq.ParquetWriter(sink, table.schema)
+            elif not table.schema.equals(writer.schema):
+                try:
+                    table = table.cast(writer.schema)
+                except Exception as err:
+                    raise Exception(
+                        'Dataframe chunks must have the same columns and types as the first '
+                        f'chunk: {err}',
+                    )
+            writer.write_table(table)
+            row_count += table.num_rows
+    finally:
+        if writer is not None:
+            writer.close()
+
+    if writer is None:
+        # Write an empty file so that the variable still exists when there are no chunks
+        pq.write_table(pa.table({}), sink)
+
+    return row_count
+
+
 # import numpy as np
 # import pandas as pd
 # import pyarrow as pa
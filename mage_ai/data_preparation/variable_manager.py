@@ -1,3 +1,4 @@
+import inspect
 import os
 from datetime import datetime
 from typing import Any, Dict, List
@@ -50,10 +51,13 @@ class VariableManager:
         variable_uuid: str,
         data: Any,
         partition: str = None,
-        variable_type: VariableType = None
+        variable_type: VariableType = None,
+        index_items: bool = False,
     ) -> None:
         if type(data) is pd.DataFrame:
             variable_type = VariableType.DATAFRAME
+        elif inspect.isgenerator(data):
+            variable_type = VariableType.CHUNKED_DATAFRAME
         elif is_spark_dataframe(data):
             variable_type = VariableType.SPARK_DATAFRAME
         elif is_geo_dataframe(data):
@@ -69,7 +73,7 @@ class VariableManager:
         # Delete data if it exists
         variable.delete()
         variable.variable_type = variable_type
-        variable.write_data(data)
+        variable.write_data(data, index_items=index_items)
 
     async def add_variable_async(
         self,
@@ -78,10 +82,13 @@ class VariableManager:
         variable_uuid: str,
         data: Any,
         partition: str = None,
-        variable_type: VariableType = None
+        variable_type: VariableType = None,
+        index_items: bool = False,
     ) -> None:
         if type(data) is pd.DataFrame:
             variable_type = VariableType.DATAFRAME
+        elif inspect.isgenerator(data):
+            variable_type = VariableType.CHUNKED_DATAFRAME
         elif is_spark_dataframe(data):
             variable_type = VariableType.SPARK_DATAFRAME
         elif is_geo_dataframe(data):
@@ -97,7 +104,7 @@ class VariableManager:
         # Delete data if it exists
         variable.delete()
         variable.variable_type = variable_type
-        await variable.write_data_async(data)
+        await variable.write_data_async(data, index_items=index_items)
 
     def clean_variables(
         self,
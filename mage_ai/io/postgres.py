@@ -1,4 +1,4 @@
-from typing import IO, List, Union
+from typing import IO, Callable, Dict, List, Union
 
 import numpy as np
 import pandas as pd
@@ -10,6 +10,13 @@ from sshtunnel import SSHTunnelForwarder
 from mage_ai.io.config import BaseConfigLoader, ConfigKey
 from mage_ai.io.constants import UNIQUE_CONFLICT_METHOD_UPDATE
 from mage_ai.io.export_utils import BadConversionError, PandasTypes
+from mage_ai.io.postgres_copy import (
+    COPY_READ_SIZE,
+    CopyStream,
+    binary_copy_values,
+    iter_binary_copy_chunks,
+    iter_csv_copy_chunks,
+)
 from mage_ai.io.sql import BaseSQL
 from mage_ai.shared.parsers import encode_complex
 from mage_ai.shared.utils import is_port_in_use
@@ -301,9 +308,21 @@ class Postgres(BaseSQL):
                 ))
             return val
 
-        df_ = df.copy()
-        columns = df_.columns
+        columns = df.columns
+        insert_columns = ', '.join([f'"{col}"'for col in columns])
+
+        if not use_insert_command:
+            self.__copy_dataframe(
+                cursor,
+                df,
+                dtypes,
+                full_table_name,
+                insert_columns,
+                serialize_obj,
+            )
+            return
 
+        df_ = df.copy()
         for col in columns:
             df_col_dropna = df_[col].dropna()
             if df_col_dropna.count() == 0:
@@ -314,49 +333,87 @@ class Postgres(BaseSQL):
                 df_[col] = df_[col].apply(lambda x: serialize_obj(x))
         df_.replace({np.NaN: None}, inplace=True)
 
-        insert_columns = ', '.join([f'"{col}"'for col in columns])
-
-        if use_insert_command:
-            # Use INSERT command
-            values_placeholder = ', '.join(["%s" for i in range(len(columns))])
-            values = []
-            for _, row in df_.iterrows():
-                values.append(tuple(row))
-            commands = [
-                f'INSERT INTO {full_table_name} ({insert_columns})',
-                f'VALUES ({values_placeholder})',
-            ]
-
-            unique_constraints = \
-                [f'"{self._clean_column_name(col, allow_reserved_words=allow_reserved_words)}"'
-                 for col in unique_constraints]
-            columns_cleaned = \
-                [f'"{self._clean_column_name(col, allow_reserved_words=allow_reserved_words)}"'
-                 for col in columns]
-
-            commands.append(f"ON CONFLICT ({', '.join(unique_constraints)})")
-            if UNIQUE_CONFLICT_METHOD_UPDATE == unique_conflict_method:
-                update_command = [f'{col} = EXCLUDED.{col}' for col in columns_cleaned]
-                commands.append(
-                    f"DO UPDATE SET {', '.join(update_command)}",
-                )
-            else:
-                commands.append('DO NOTHING')
-            cursor.executemany('\n'.join(commands), values)
+        # Use INSERT command
+        values_placeholder = ', '.join(["%s" for i in range(len(columns))])
+        values = []
+        for _, row in df_.iterrows():
+            values.append(tuple(row))
+        commands = [
+            f'INSERT INTO {full_table_name} ({insert_columns})',
+            f'VALUES ({values_placeholder})',
+        ]
+
+        unique_constraints = \
+            [f'"{self._clean_column_name(col, allow_reserved_words=allow_reserved_words)}"'
+             for col in unique_constraints]
+        columns_cleaned = \
+            [f'"{self._clean_column_name(col, allow_reserved_words=allow_reserved_words)}"'
+             for col in columns]
+
+        commands.append(f"ON CONFLICT ({', '.join(unique_constraints)})")
+        if UNIQUE_CONFLICT_METHOD_UPDATE == unique_conflict_method:
+            update_command = [f'{col} = EXCLUDED.{col}' for col in columns_cleaned]
+            commands.append(
+                f"DO UPDATE SET {', '.join(update_command)}",
+            )
         else:
-            # Use COPY command
-            df_.to_csv(
-                buffer,
-                header=False,
-                index=False,
-                na_rep='',
+            commands.append('DO NOTHING')
+        cursor.executemany('\n'.join(commands), values)
+
+    def __copy_dataframe(
+        self,
+        cursor: _psycopg.cursor,
+        df: DataFrame,
+        dtypes: List[str],
+        full_table_name: str,
+        insert_columns: str,
+        serialize_obj: Callable,
+    ) -> None:
+        """
+        Stream the data frame to the table with COPY in chunks of rows. Uses the binary format
+        if every column has a fixed width type in the table and no nulls, otherwise CSV.
+        """
+        def print_progress(rows_copied: int, row_count: int) -> None:
+            if self.verbose and rows_copied < row_count:
+                with self.printer.print_msg(f'Copied {rows_copied}/{row_count} rows'):
+                    pass
+
+        values = binary_copy_values(df, self.__column_types(cursor, full_table_name))
+        if values is not None:
+            cursor.copy_expert(
+                f'COPY {full_table_name} ({insert_columns}) FROM STDIN (FORMAT binary)',
+                CopyStream(iter_binary_copy_chunks(values, on_chunk=print_progress)),
+                size=COPY_READ_SIZE,
             )
-            buffer.seek(0)
-            cursor.copy_expert(f"""
+            return
+
+        column_serializers = dict()
+        for col in df.columns:
+            first_valid_index = df[col].first_valid_index()
+            if first_valid_index is None:
+                continue
+            if dtypes[col] == PandasTypes.OBJECT \
+                    or (df[col].dtype == PandasTypes.OBJECT and not
+                        isinstance(df[col].loc[first_valid_index], str)):
+                column_serializers[col] = serialize_obj
+
+        cursor.copy_expert(f"""
 COPY {full_table_name} ({insert_columns}) FROM STDIN (
     FORMAT csv
     , DELIMITER \',\'
     , NULL \'\'
     , FORCE_NULL({insert_columns})
 );
-        """, buffer)
+        """, CopyStream(iter_csv_copy_chunks(
+            df,
+            column_serializers,
+            on_chunk=print_progress,
+        )), size=COPY_READ_SIZE)
+
+    def __column_types(self, cursor: _psycopg.cursor, full_table_name: str) -> Dict[str, str]:
+        cursor.execute(
+            'SELECT attname, format_type(atttypid, atttypmod) FROM pg_attribute '
+            'WHERE attrelid = %s::regclass AND attnum > 0 AND NOT attisdropped',
+            (full_table_name,),
+        )
+        return dict(cursor.fetchall())
@@ -0,0 +1,208 @@
+import io
+import struct
+from typing import Callable, Dict, Iterator, List, Tuple, Union
+
+import numpy as np
+from pandas import DataFrame, Series
+
+"""
+Utilities for streaming data frames to PostgreSQL with `COPY ... FROM STDIN`.
+"""
+
+COPY_CHUNK_SIZE = 100000
+# Number of bytes psycopg2 reads from the copy stream at a time.
+COPY_READ_SIZE = 1024 * 1024
+
+BINARY_COPY_HEADER = b'PGCOPY\n\xff\r\n\x00' + struct.pack('>ii', 0, 0)
+BINARY_COPY_TRAILER = struct.pack('>h', -1)
+
+# Microseconds between the Unix epoch and the PostgreSQL epoch (2000-01-01).
+POSTGRES_EPOCH_MICROSECONDS = 946684800000000
+
+# Binary format of the PostgreSQL types whose values have a fixed width.
+BINARY_FORMAT_BY_COLUMN_TYPE = {
+    'bigint': '>i8',
+    'boolean': '?',
+    'double precision': '>f8',
+    'integer': '>i4',
+    'real': '>f4',
+    'smallint': '>i2',
+    'timestamp with time zone': '>i8',
+    'timestamp without time zone': '>i8',
+}
+
+
+class CopyStream(io.RawIOBase):
+    """
+    File-like object that reads the chunks of bytes from an iterator on demand, so that only
+    one encoded chunk is held in memory while `copy_expert` streams it to the database.
+    """
+
+    def __init__(self, chunks: Iterator[bytes]):
+        self.chunks = chunks
+        self.chunk = b''
+        self.position = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def read(self, size: int = -1) -> bytes:
+        if size is None or size < 0:
+            data = b''.join([self.chunk[self.position:]] + list(self.chunks))
+            self.chunk = b''
+            self.position = 0
+            return data
+
+        parts = []
+        while size > 0:
+            if self.position >= len(self.chunk):
+                self.chunk = next(self.chunks, None)
+                self.position = 0
+                if self.chunk is None:
+                    self.chunk = b''
+                    break
+            part = self.chunk[self.position:self.position + size]
+            self.position += len(part)
+            size -= len(part)
+            parts.append(part)
+        return b''.join(parts)
+
+
+def __fixed_width_values(column: Series, column_type: str, binary_format: str) -> np.ndarray:
+    """
+    Returns the values of the column in the binary format of the column type, or None if the
+    column can't be written in binary format.
+    """
+    dtype = column.dtype
+    if column.isna().any():
+        return None
+
+    if column_type.startswith('timestamp'):
+        if dtype.kind != 'M':
+            return None
+        if column.dt.tz is not None:
+            if column_type != 'timestamp with time zone':
+                return None
+            column = column.dt.tz_convert('UTC').dt.tz_localize(None)
+        elif column_type != 'timestamp without time zone':
+            return None
+        microseconds = column.to_numpy(dtype='datetime64[us]').astype(np.int64)
+        return microseconds - POSTGRES_EPOCH_MICROSECONDS
+
+    if not isinstance(dtype, np.dtype):
+        # Extension types, e.g. nullable integers.
+        return None
+    values = column.to_numpy()
+    target_kind = np.dtype(binary_format).kind
+    if target_kind == 'i':
+        if values.dtype.kind not in ('i', 'u'):
+            return None
+        info = np.iinfo(np.dtype(binary_format))
+        if len(values) > 0 and (values.min() < info.min or values.max() > info.max):
+            return None
+    elif target_kind == 'f':
+        if values.dtype.kind not in ('f', 'i', 'u'):
+            return None
+    elif target_kind == 'b':
+        if values.dtype.kind != 'b':
+            return None
+    return values
+
+
+def binary_copy_values(
+    df: DataFrame,
+    column_types: Dict[str, str],
+) -> Union[List[Tuple[np.ndarray, str]], None]:
+    """
+    Returns the values and binary format of each column to write with a binary COPY, or None
+    if the data frame can't be written in binary format.
+
+    Only columns without nulls whose table column type has a fixed width are supported, so that
+    each row has the same width and all the rows of a chunk are encoded with one numpy
+    structured array.
+
+    Args:
+        df (DataFrame): Data frame to export.
+        column_types (Dict[str, str]): Table column types by column name, as returned by
+            PostgreSQL's `format_type`.
+    """
+    values = []
+    for col in df.columns:
+        column_type = column_types.get(col)
+        binary_format = BINARY_FORMAT_BY_COLUMN_TYPE.get(column_type)
+        if binary_format is None:
+            return None
+        column_values = __fixed_width_values(df[col], column_type, binary_format)
+        if column_values is None:
+            return None
+        values.append((column_values, binary_format))
+    return values
+
+
+def iter_binary_copy_chunks(
+    values: List[Tuple[np.ndarray, str]],
+    chunk_size: int = COPY_CHUNK_SIZE,
+    on_chunk: Callable[[int, int], None] = None,
+) -> Iterator[bytes]:
+    """
+    Yields the data of a binary COPY in chunks of rows.
+
+    Args:
+        values (List): Values of each column, as returned by `binary_copy_values`.
+        chunk_size (int): Number of rows encoded at a time.
+        on_chunk (Callable[[int, int], None]): Called with the number of rows encoded so far
+            and the total number of rows after each chunk.
+    """
+    row_dtype = np.dtype(
+        [('field_count', '>i2')] +
+        [
+            field
+            for idx, (_, binary_format) in enumerate(values)
+            for field in ((f'length_{idx}', '>i4'), (f'value_{idx}', binary_format))
+        ]
+    )
+    row_count = len(values[0][0]) if values else 0
+
+    yield BINARY_COPY_HEADER
+    for start in range(0, row_count, chunk_size):
+        end = min(start + chunk_size, row_count)
+        rows = np.empty(end - start, dtype=row_dtype)
+        rows['field_count'] = len(values)
+        for idx, (column_values, binary_format) in enumerate(values):
+            rows[f'length_{idx}'] = np.dtype(binary_format).itemsize
+            rows[f'value_{idx}'] = column_values[start:end]
+        yield rows.tobytes()
+        if on_chunk is not None:
+            on_chunk(end, row_count)
+    yield BINARY_COPY_TRAILER
+
+
+def iter_csv_copy_chunks(
+    df: DataFrame,
+    column_serializers: Dict[str, Callable],
+    chunk_size: int = COPY_CHUNK_SIZE,
+    on_chunk: Callable[[int, int], None] = None,
+) -> Iterator[bytes]:
+    """
+    Yields the data of a CSV COPY in chunks of rows. Only the rows of one chunk are copied to
+    serialize their values.
+
+    Args:
+        df (DataFrame): Data frame to export.
+        column_serializers (Dict[str, Callable]): Functions that serialize the values of the
+            columns that can't be written as is, by column name.
+        chunk_size (int): Number of rows encoded at a time.
+        on_chunk (Callable[[int, int], None]): Called with the number of rows encoded so far
+            and the total number of rows after each chunk.
+    """
+    row_count = len(df.index)
+    for start in range(0, row_count, chunk_size):
+        end = min(start + chunk_size, row_count)
+        chunk = df.iloc[start:end]
+        if column_serializers:
+            chunk = chunk.copy()
+            for col, serialize in column_serializers.items():
+                chunk[col] = chunk[col].map(serialize, na_action='ignore')
+        yield chunk.to_csv(header=False, index=False, na_rep='').encode()
+        if on_chunk is not None:
+            on_chunk(end, row_count)
@@ -173,7 +173,12 @@ class BaseSQL(BaseSQLConnection):
             query_string (str): Query to execute on the database.
             limit (int, Optional): The number of rows to limit the loaded dataframe to. Defaults
                 to 10,000,000.
-            **kwargs: Additional query parameters.
+            **kwargs: Additional query parameters. Pass `chunksize` to get an iterator of data
+                frames instead; returning it from a block stores the output as a chunked
+                variable. The connection must stay open until the iterator is consumed, so it
+                can't be returned from inside a `with` block of the loader. Most drivers (e.g.
+                psycopg2) still fetch the whole result set into memory on execute, only the
+                data frames are built chunk by chunk.
 
         Returns:
             DataFrame: The data frame corresponding to the data returned by the given query.
@@ -23,10 +23,12 @@ from sqlalchemy import (
     Table,
     or_,
 )
-from sqlalchemy.orm import joinedload, relationship, validates
+from sqlalchemy.orm import relationship, selectinload, validates
+from sqlalchemy.orm.attributes import set_committed_value
 from sqlalchemy.sql import func
 from sqlalchemy.sql.functions import coalesce
 
+from mage_ai.data_preparation.logging.log_index import LogFilter
 from mage_ai.data_preparation.logging.logger_manager_factory import LoggerManagerFactory
 from mage_ai.data_preparation.models.block.utils import (
     get_all_ancestors,
@@ -50,7 +52,7 @@ from mage_ai.settings.repo import get_repo_path
 from mage_ai.shared.array import find
 from mage_ai.shared.constants import ENV_PROD
 from mage_ai.shared.dates import compare
-from mage_ai.shared.hash import ignore_keys, index_by, merge_dict
+from mage_ai.shared.hash import group_by, ignore_keys, index_by, merge_dict
 from mage_ai.shared.utils import clean_name
 from mage_ai.usage_statistics.logger import UsageStatisticLogger
 
@@ -245,7 +247,22 @@ class PipelineSchedule(BaseModel):
         return current_execution_date
 
     @safe_db_query
-    def should_schedule(self, previous_runtimes: List[int] = None) -> bool:
+    def should_schedule(
+        self,
+        previous_runtimes: List[int] = None,
+        pipeline: Pipeline = None,
+        pipeline_runs: List['PipelineRun'] = None,
+    ) -> bool:
+        """
+        Args:
+            previous_runtimes (List[int], optional): Runtimes of previous pipeline runs, used
+                when landing time is enabled.
+            pipeline (Pipeline, optional): The schedule's pipeline, if already loaded.
+            pipeline_runs (List[PipelineRun], optional): Pipeline runs of this schedule that were
+                prefetched by the caller. They must include every run for an @once schedule and
+                every run at or after the current execution date otherwise. Defaults to
+                lazily loading all pipeline runs of the schedule.
+        """
         now = datetime.now(tz=pytz.UTC)
 
         if self.status != ScheduleStatus.ACTIVE:
@@ -257,20 +274,24 @@ class PipelineSchedule(BaseModel):
 
             return False
 
-        try:
-            Pipeline.get(self.pipeline_uuid)
-        except Exception:
-            print(
-                f'[WARNING] Pipeline {self.pipeline_uuid} cannot be found '
-                + f'for pipeline schedule ID {self.id}.',
-            )
-            return False
+        if pipeline is None:
+            try:
+                pipeline = Pipeline.get(self.pipeline_uuid)
+            except Exception:
+                print(
+                    f'[WARNING] Pipeline {self.pipeline_uuid} cannot be found '
+                    + f'for pipeline schedule ID {self.id}.',
+                )
+                return False
+
+        if pipeline_runs is None:
+            pipeline_runs = self.pipeline_runs
 
         if self.schedule_interval == '@once':
-            pipeline_run_count = len(self.pipeline_runs)
+            pipeline_run_count = len(pipeline_runs)
             if pipeline_run_count == 0:
                 return True
-            executor_count = self.pipeline.executor_count
+            executor_count = pipeline.executor_count
             # Used by streaming pipeline to launch multiple executors
             if executor_count > 1 and pipeline_run_count < executor_count:
                 return True
@@ -288,7 +309,7 @@ class PipelineSchedule(BaseModel):
                     x.execution_date.replace(tzinfo=pytz.UTC),
                     current_execution_date,
                 ) == 0,
-                self.pipeline_runs
+                pipeline_runs
             ):
                 if self.landing_time_enabled():
                     if not previous_runtimes or len(previous_runtimes) == 0:
@@ -434,6 +455,27 @@ class PipelineRun(BaseModel):
     def block_runs_count(self) -> int:
         return len(self.block_runs)
 
+    @classmethod
+    @safe_db_query
+    def block_run_status_counts(cls, pipeline_run_ids: List[int]) -> Dict[int, Dict[str, int]]:
+        """
+        Returns the number of block runs in each status by pipeline run id, counted with one
+        GROUP BY query instead of loading the block runs.
+        """
+        if not pipeline_run_ids:
+            return dict()
+        rows = (
+            BlockRun.select(BlockRun.pipeline_run_id, BlockRun.status, func.count(BlockRun.id)).
+            filter(BlockRun.pipeline_run_id.in_(pipeline_run_ids)).
+            group_by(BlockRun.pipeline_run_id, BlockRun.status).
+            all()
+        )
+        counts_by_pipeline_run_id = dict()
+        for pipeline_run_id, status, count in rows:
+            counts = counts_by_pipeline_run_id.setdefault(pipeline_run_id, dict())
+            counts[status.value if status is not None else None] = count
+        return counts_by_pipeline_run_id
+
     @property
     def execution_partition(self) -> str:
         if self.variables and self.variables.get('execution_partition'):
@@ -489,12 +531,15 @@ class PipelineRun(BaseModel):
             repo_config=self.pipeline.repo_config,
         ).get_logs()
 
-    async def logs_async(self):
-        return await LoggerManagerFactory.get_logger_manager(
+    async def logs_async(self, log_filter: LogFilter = None):
+        logger_manager = LoggerManagerFactory.get_logger_manager(
             pipeline_uuid=self.pipeline_uuid,
             partition=self.execution_partition,
             repo_config=self.pipeline.repo_config,
-        ).get_logs_async()
+        )
+        if log_filter is not None:
+            return await logger_manager.read_logs_async(log_filter)
+        return await logger_manager.get_logs_async()
 
     @property
     def pipeline_schedule_name(self):
@@ -526,7 +571,7 @@ class PipelineRun(BaseModel):
             self.pipeline_schedule_id.in_(schedule_ids),
         )
         if include_block_runs:
-            query = query.options(joinedload(PipelineRun.block_runs))
+            query = query.options(selectinload(PipelineRun.block_runs))
         return query.all()
 
     @classmethod
@@ -584,6 +629,68 @@ class PipelineRun(BaseModel):
             **kwargs,
         )
 
+    @safe_db_query
+    def bulk_create_block_runs(
+        self,
+        block_runs_attributes: List[Dict],
+        chunk_size: int = 1000,
+    ) -> List['BlockRun']:
+        """
+        Create the block runs that don't exist in this pipeline run yet, skipping the ones
+        whose block_uuid already exists like `create_block_run` with `skip_if_exists`.
+
+        The existing block UUIDs are fetched with one query and the new block runs are inserted
+        with one statement per chunk, instead of a lookup and an insert per block run.
+
+        Args:
+            block_runs_attributes (List[Dict]): The block_uuid and the other attributes of each
+                block run, e.g. metrics.
+            chunk_size (int): Number of block runs inserted per statement.
+
+        Returns:
+            List[BlockRun]: The block runs for the block UUIDs, including the existing ones.
+        """
+        block_uuids = set(r[0] for r in db_connection.session.query(BlockRun.block_uuid).filter(
+            BlockRun.pipeline_run_id == self.id,
+        ))
+
+        # The list keeps the order of the attributes, the set is for membership checks.
+        block_uuids_to_return = []
+        block_uuids_to_return_set = set()
+        mappings = []
+        for attributes in block_runs_attributes:
+            block_uuid = attributes['block_uuid']
+            if block_uuid not in block_uuids_to_return_set:
+                block_uuids_to_return.append(block_uuid)
+                block_uuids_to_return_set.add(block_uuid)
+            if block_uuid in block_uuids:
+                continue
+            block_uuids.add(block_uuid)
+            mappings.append(merge_dict(dict(
+                pipeline_run_id=self.id,
+                status=BlockRun.BlockRunStatus.INITIAL,
+            ), attributes))
+
+        if mappings:
+            try:
+                for idx in range(0, len(mappings), chunk_size):
+                    db_connection.session.bulk_insert_mappings(
+                        BlockRun,
+                        mappings[idx:idx + chunk_size],
+                    )
+                db_connection.session.commit()
+            except Exception as err:
+                db_connection.session.rollback()
+                raise err
+
+        if not block_uuids_to_return:
+            return []
+        block_runs_by_uuid = index_by(
+            lambda block_run: block_run.block_uuid,
+            BlockRun.query.filter(BlockRun.pipeline_run_id == self.id).all(),
+        )
+        return [block_runs_by_uuid[block_uuid] for block_uuid in block_uuids_to_return]
+
     def create_block_runs(self) -> List['BlockRun']:
         pipeline = self.pipeline
         blocks = pipeline.get_executable_blocks()
@@ -612,6 +719,22 @@ class PipelineRun(BaseModel):
 
         return [self.create_block_run(block_uuid) for block_uuid in block_uuids]
 
+    def refresh_block_runs(self) -> List['BlockRun']:
+        """
+        Reload the state of all block runs of this pipeline run with a single query instead of
+        refreshing each block run individually. Block runs created since the relationship was
+        loaded are included.
+        """
+        block_runs = (
+            BlockRun.
+            query.
+            filter(BlockRun.pipeline_run_id == self.id).
+            populate_existing().
+            all()
+        )
+        set_committed_value(self, 'block_runs', block_runs)
+        return block_runs
+
     def any_blocks_failed(self) -> bool:
         return any(
             b.status == BlockRun.BlockRunStatus.FAILED
@@ -746,6 +869,9 @@ class BlockRun(BaseModel):
     started_at = Column(DateTime(timezone=True))
     completed_at = Column(DateTime(timezone=True))
     metrics = Column(JSON)
+    # Number of upstream block runs that haven't finished yet. It's None until the pipeline
+    # scheduler computes it.
+    remaining_upstream_count = Column(Integer)
 
     pipeline_run = relationship(PipelineRun, back_populates='block_runs')
 
@@ -759,14 +885,17 @@ class BlockRun(BaseModel):
             repo_config=pipeline.repo_config,
         ).get_logs()
 
-    async def logs_async(self):
+    async def logs_async(self, log_filter: LogFilter = None):
         pipeline = await Pipeline.get_async(self.pipeline_run.pipeline_uuid)
-        return await LoggerManagerFactory.get_logger_manager(
+        logger_manager = LoggerManagerFactory.get_logger_manager(
             pipeline_uuid=pipeline.uuid,
             block_uuid=clean_name(self.block_uuid),
             partition=self.pipeline_run.execution_partition,
             repo_config=pipeline.repo_config,
-        ).get_logs_async()
+        )
+        if log_filter is not None:
+            return await logger_manager.read_logs_async(log_filter)
+        return await logger_manager.get_logs_async()
 
     @classmethod
     @safe_db_query
@@ -776,6 +905,39 @@ class BlockRun(BaseModel):
         }, synchronize_session=False)
         db_connection.session.commit()
 
+    @classmethod
+    @safe_db_query
+    def batch_update_remaining_upstream_count(
+        self,
+        remaining_upstream_count_by_id: Dict[int, int],
+    ) -> None:
+        block_run_ids_by_count = group_by(
+            lambda block_run_id: remaining_upstream_count_by_id[block_run_id],
+            remaining_upstream_count_by_id.keys(),
+        )
+        for remaining_upstream_count, block_run_ids in block_run_ids_by_count.items():
+            BlockRun.query.filter(BlockRun.id.in_(block_run_ids)).update({
+                BlockRun.remaining_upstream_count: remaining_upstream_count,
+            }, synchronize_session=False)
+        db_connection.session.commit()
+
+    @classmethod
+    @safe_db_query
+    def batch_decrement_remaining_upstream_count(
+        self,
+        block_run_ids: List[int],
+        value: int = 1,
+    ) -> None:
+        # Decrement in the database so that concurrent decrements from different block run
+        # processes aren't lost.
+        BlockRun.query.filter(
+            BlockRun.id.in_(block_run_ids),
+            BlockRun.remaining_upstream_count.isnot(None),
+        ).update({
+            BlockRun.remaining_upstream_count: BlockRun.remaining_upstream_count - value,
+        }, synchronize_session=False)
+        db_connection.session.commit()
+
     @classmethod
     @safe_db_query
     def get(self, pipeline_run_id: int = None, block_uuid: str = None) -> 'BlockRun':
@@ -1,6 +1,7 @@
 from enum import Enum
-from typing import Callable, Union
+from typing import Callable, Dict, Union
 
+from mage_ai.orchestration.queue.fair_queue import JobPriority
 from mage_ai.orchestration.queue.queue_factory import QueueFactory
 
 
@@ -20,15 +21,20 @@ class JobManager:
         uid: Union[str, int],
         target: Callable,
         *args,
+        priority: JobPriority = None,
+        group: str = None,
         **kwargs
     ):
         job_id = self.__job_id(job_type, uid)
 
-        self.queue.enqueue(job_id, target, *args, **kwargs)
+        self.queue.enqueue(job_id, target, *args, priority=priority, group=group, **kwargs)
 
     def clean_up_jobs(self):
         self.queue.clean_up_jobs()
 
+    def metrics(self) -> Dict:
+        return self.queue.metrics()
+
     def has_block_run_job(self, block_run_id):
         job_id = self.__job_id(JobType.BLOCK_RUN, block_run_id)
         return self.queue.has_job(job_id)
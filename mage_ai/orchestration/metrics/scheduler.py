@@ -0,0 +1,35 @@
+import time
+from contextlib import contextmanager
+from typing import Dict
+
+
+class SchedulerTickMetrics:
+    """
+    Timings (in seconds) and counters collected during one scheduler tick.
+    """
+
+    def __init__(self):
+        self.counts = dict()
+        self.started_at = time.monotonic()
+        self.timings = dict()
+
+    def increment(self, key: str, value: int = 1) -> None:
+        self.counts[key] = self.counts.get(key, 0) + value
+
+    def set(self, key: str, value: int) -> None:
+        self.counts[key] = value
+
+    @contextmanager
+    def timer(self, key: str):
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            self.timings[key] = round(self.timings.get(key, 0) + time.monotonic() - start, 4)
+
+    def to_dict(self) -> Dict:
+        return dict(
+            counts=self.counts,
+            timings=self.timings,
+            total=round(time.monotonic() - self.started_at, 4),
+        )
@@ -5,7 +5,8 @@ from typing import Any, Dict, List, Set, Tuple
 
 import pytz
 from dateutil.relativedelta import relativedelta
-from sqlalchemy import desc, func
+from sqlalchemy import and_, desc, func, or_
+from sqlalchemy.orm.attributes import set_committed_value
 
 from mage_ai.data_integrations.utils.scheduler import (
     clear_source_output_files,
@@ -41,23 +42,26 @@ from mage_ai.orchestration.db.models.schedules import (
 )
 from mage_ai.orchestration.job_manager import JobType, job_manager
 from mage_ai.orchestration.metrics.pipeline_run import calculate_metrics
+from mage_ai.orchestration.metrics.scheduler import SchedulerTickMetrics
 from mage_ai.orchestration.notification.config import NotificationConfig
 from mage_ai.orchestration.notification.sender import NotificationSender
 from mage_ai.orchestration.utils.distributed_lock import DistributedLock
 from mage_ai.orchestration.utils.git import log_git_sync, run_git_sync
 from mage_ai.orchestration.utils.resources import get_compute, get_memory
+from mage_ai.orchestration.utils.scheduler_shard import SchedulerShardManager
 from mage_ai.server.logger import Logger
 from mage_ai.settings import HOSTNAME
 from mage_ai.settings.repo import get_repo_path
 from mage_ai.shared.array import find
 from mage_ai.shared.dates import compare
 from mage_ai.shared.environments import get_env
-from mage_ai.shared.hash import index_by, merge_dict
+from mage_ai.shared.hash import group_by, index_by, merge_dict
 from mage_ai.shared.retry import retry
 
 MEMORY_USAGE_MAXIMUM = 0.95
 
 lock = DistributedLock()
+shard_manager = SchedulerShardManager()
 logger = Logger().new_server_logger(__name__)
 
 
@@ -65,10 +69,13 @@ class PipelineScheduler:
     def __init__(
         self,
         pipeline_run: PipelineRun,
+        pipeline: Pipeline = None,
     ) -> None:
         self.pipeline_run = pipeline_run
         self.pipeline_schedule = pipeline_run.pipeline_schedule
-        self.pipeline = Pipeline.get(pipeline_run.pipeline_uuid)
+        if pipeline is None:
+            pipeline = Pipeline.get(pipeline_run.pipeline_uuid)
+        self.pipeline = pipeline
 
         # Get the list of integration stream if the pipeline is data integration pipeline
         self.streams = []
@@ -106,6 +113,11 @@ class PipelineScheduler:
             self.pipeline_schedule.get_settings().allow_blocks_to_fail
             if self.pipeline_schedule else False
         )
+        # Jobs are fair queued by pipeline, in the priority class of the trigger if it has one.
+        self.job_priority = (
+            self.pipeline_schedule.get_settings().priority
+            if self.pipeline_schedule else None
+        )
 
     def start(self, should_schedule: bool = True) -> bool:
         """Start the pipeline run.
@@ -172,8 +184,7 @@ class PipelineScheduler:
 
         self.__run_heartbeat()
 
-        for b in self.pipeline_run.block_runs:
-            b.refresh()
+        self.pipeline_run.refresh_block_runs()
 
         if PipelineType.STREAMING == self.pipeline.type:
             self.__schedule_pipeline()
@@ -251,6 +262,7 @@ class PipelineScheduler:
             )
 
         update_status()
+        self.__decrement_remaining_upstream_counts(block_run)
 
         self.logger.info(
             f'BlockRun {block_run.id} (block_uuid: {block_uuid}) completes.',
@@ -285,6 +297,7 @@ class PipelineScheduler:
             )
 
         update_status()
+        self.__decrement_remaining_upstream_counts(block_run)
 
         self.logger.info(
             f'BlockRun {block_run.id} (block_uuid: {block_uuid}) completes.',
@@ -306,6 +319,7 @@ class PipelineScheduler:
             )
 
         update_status()
+        self.__decrement_remaining_upstream_counts(block_run, failed=True)
 
         if 'error' in kwargs:
             metrics['error'] = kwargs['error']
@@ -354,69 +368,173 @@ class PipelineScheduler:
     def executable_block_runs(self) -> List[BlockRun]:
         """Get the list of executable block runs.
 
-        This property returns a list of block runs that are considered executable for the
-        pipeline run. It first builds the block UUIDs for the completed block runs and the block
-        runs in progress.
-        The method iterates over the initial block runs and determines their executability based
-        on the status of their dynamic upstream block runs or upstream blocks.
-        * If the block run has dynamic upstream block UUIDs, it checks if all of them are present in
-        the finished block UUIDs or completed block UUIDs depending on the `allow_blocks_to_fail`
-        flag.
-        * If the block run does not have dynamic upstream block UUIDs, it checks if all upstream
-        blocks are completed.
-        If a block run's upstream blocks all completed, it is added to the list of executable block
-        runs.
+        This property returns a list of initial block runs whose upstream block runs are all
+        completed (or finished, for dynamic block runs if `allow_blocks_to_fail` is enabled).
+
+        Each block run keeps a remaining upstream count, which is computed once and decremented
+        when an upstream block run finishes (see `on_block_complete` and `on_block_failure`),
+        so only the block runs whose count reached 0 need to be checked:
+        * Initial block runs without a count get their count computed and persisted.
+        * Block runs whose count reached 0 are checked against their upstream block runs before
+        being returned, and their count is corrected if it's out of date; e.g. the block run
+        was created while one of its upstream block runs was completing.
+        * If no block run is ready and none is queued or running, the counts of all initial
+        block runs are recomputed so that the pipeline run can't get stuck on a count that
+        is too high.
 
         Returns:
             List[BlockRun]: A list of executable block runs for the pipeline run.
         """
-        def _build_block_uuids(block_runs: List[BlockRun]) -> List[str]:
-            arr = set()
+        initial_block_runs = self.pipeline_run.initial_block_runs
 
-            for block_run in block_runs:
-                if block_run.status in [
-                    BlockRun.BlockRunStatus.COMPLETED,
-                    BlockRun.BlockRunStatus.UPSTREAM_FAILED,
-                    BlockRun.BlockRunStatus.FAILED,
-                ]:
-                    block_uuid = block_run.block_uuid
-                    block = self.pipeline.get_block(block_uuid)
-                    arr.add(block_uuid)
-
-                    # Block runs for replicated blocks have the following block UUID convention:
-                    # [block.uuid]:[block.replicated_block]
-                    if block and block.replicated_block:
-                        arr.add(block.uuid)
+        block_runs_to_check = [
+            b for b in initial_block_runs
+            if b.remaining_upstream_count is None or b.remaining_upstream_count <= 0
+        ]
+        if not block_runs_to_check and initial_block_runs and \
+                not self.pipeline_run.queued_or_running_block_runs:
+            block_runs_to_check = initial_block_runs
 
-            return arr
+        if not block_runs_to_check:
+            return []
 
-        completed_block_uuids = _build_block_uuids(self.pipeline_run.completed_block_runs)
-        finished_block_uuids = _build_block_uuids(self.pipeline_run.block_runs)
+        remaining_upstream_count_by_id = self.__compute_remaining_upstream_counts(
+            block_runs_to_check,
+        )
 
+        updated_counts = dict()
         executable_block_runs = list()
-        for block_run in self.pipeline_run.initial_block_runs:
-            completed = False
+        for block_run in block_runs_to_check:
+            count = remaining_upstream_count_by_id.get(block_run.id)
+            if count is None:
+                continue
+            if count == 0:
+                executable_block_runs.append(block_run)
+            if count != block_run.remaining_upstream_count:
+                updated_counts[block_run.id] = count
+                set_committed_value(block_run, 'remaining_upstream_count', count)
 
-            dynamic_upstream_block_uuids = block_run.metrics and block_run.metrics.get(
-                'dynamic_upstream_block_uuids',
-            )
+        if updated_counts:
+            BlockRun.batch_update_remaining_upstream_count(updated_counts)
 
-            if dynamic_upstream_block_uuids:
-                if self.allow_blocks_to_fail:
-                    completed = all(uuid in finished_block_uuids
-                                    for uuid in dynamic_upstream_block_uuids)
-                else:
-                    completed = all(uuid in completed_block_uuids
-                                    for uuid in dynamic_upstream_block_uuids)
+        return executable_block_runs
+
+    def __upstream_block_uuids(self, block_run: BlockRun) -> Tuple[List[str], bool]:
+        """
+        Returns the block UUIDs the block run depends on, and whether they are the dynamic
+        upstream block UUIDs of the block run. Returns None for the block UUIDs if the block
+        of the block run doesn't exist.
+        """
+        dynamic_upstream_block_uuids = block_run.metrics and block_run.metrics.get(
+            'dynamic_upstream_block_uuids',
+        )
+        if dynamic_upstream_block_uuids:
+            return dynamic_upstream_block_uuids, True
+
+        block = self.pipeline.get_block(block_run.block_uuid)
+        if block is None:
+            return None, False
+
+        upstream_block_uuids = []
+        for b in block.upstream_blocks:
+            # Replicated block’s have a block_run block_uuid value with this convention:
+            # [block_uuid]:[replicated_block_uuid]
+            if b.replicated_block:
+                upstream_block_uuids.append(f'{b.uuid}:{b.replicated_block}')
             else:
-                block = self.pipeline.get_block(block_run.block_uuid)
-                completed = block is not None and \
-                    block.all_upstream_blocks_completed(completed_block_uuids)
+                upstream_block_uuids.append(b.uuid)
 
-            if completed:
-                executable_block_runs.append(block_run)
+        return upstream_block_uuids, False
 
-        return executable_block_runs
+    def __finished_block_uuids(self, block_run: BlockRun) -> Set[str]:
+        block_uuids = set([block_run.block_uuid])
+        # Block runs for replicated blocks have the following block UUID convention:
+        # [block.uuid]:[block.replicated_block]
+        if ':' in block_run.block_uuid:
+            block = self.pipeline.get_block(block_run.block_uuid)
+            if block and block.replicated_block:
+                block_uuids.add(block.uuid)
+        return block_uuids
+
+    def __compute_remaining_upstream_counts(
+        self,
+        block_runs: List[BlockRun],
+    ) -> Dict[int, int]:
+        completed_block_uuids = set()
+        finished_block_uuids = set()
+        for block_run in self.pipeline_run.block_runs:
+            if block_run.status == BlockRun.BlockRunStatus.COMPLETED:
+                completed_block_uuids.update(self.__finished_block_uuids(block_run))
+            if block_run.status in [
+                BlockRun.BlockRunStatus.COMPLETED,
+                BlockRun.BlockRunStatus.UPSTREAM_FAILED,
+                BlockRun.BlockRunStatus.FAILED,
+            ]:
+                finished_block_uuids.update(self.__finished_block_uuids(block_run))
+
+        remaining_upstream_count_by_id = dict()
+        for block_run in block_runs:
+            upstream_block_uuids, is_dynamic = self.__upstream_block_uuids(block_run)
+            if upstream_block_uuids is None:
+                continue
+
+            if is_dynamic and self.allow_blocks_to_fail:
+                block_uuids = finished_block_uuids
+            else:
+                block_uuids = completed_block_uuids
+
+            remaining_upstream_count_by_id[block_run.id] = len(
+                set(uuid for uuid in upstream_block_uuids if uuid not in block_uuids),
+            )
+
+        return remaining_upstream_count_by_id
+
+    def __decrement_remaining_upstream_counts(
+        self,
+        block_run: BlockRun,
+        failed: bool = False,
+    ) -> None:
+        """
+        Decrement the remaining upstream counts of the initial block runs that depend on a block
+        run that just finished. Only the block runs of the downstream blocks are loaded.
+
+        Args:
+            block_run (BlockRun): The block run that finished.
+            failed (bool): Whether the block run failed. Failed block runs only count as
+                finished for dynamic block runs if `allow_blocks_to_fail` is enabled.
+        """
+        if failed and not self.allow_blocks_to_fail:
+            return
+
+        block = self.pipeline.get_block(block_run.block_uuid)
+        if block is None or not block.downstream_blocks:
+            return
+
+        finished_block_uuids = self.__finished_block_uuids(block_run)
+        downstream_block_uuids = [b.uuid for b in block.downstream_blocks]
+        # Dynamic child and replicated block runs have the following block UUID convention:
+        # [block_uuid]:[suffix]
+        downstream_block_runs = BlockRun.query.filter(
+            BlockRun.pipeline_run_id == self.pipeline_run.id,
+            BlockRun.status == BlockRun.BlockRunStatus.INITIAL,
+            BlockRun.remaining_upstream_count.isnot(None),
+            or_(
+                BlockRun.block_uuid.in_(downstream_block_uuids),
+                *[BlockRun.block_uuid.like(f'{uuid}:%') for uuid in downstream_block_uuids],
+            ),
+        ).all()
+
+        block_run_ids_by_value = dict()
+        for downstream_block_run in downstream_block_runs:
+            upstream_block_uuids, is_dynamic = self.__upstream_block_uuids(downstream_block_run)
+            if upstream_block_uuids is None or (failed and not is_dynamic):
+                continue
+            value = len(finished_block_uuids.intersection(upstream_block_uuids))
+            if value >= 1:
+                block_run_ids_by_value.setdefault(value, []).append(downstream_block_run.id)
+
+        for value, block_run_ids in block_run_ids_by_value.items():
+            BlockRun.batch_decrement_remaining_upstream_count(block_run_ids, value=value)
 
     def build_tags(self, **kwargs):
         base_tags = dict(
@@ -462,6 +580,8 @@ class PipelineScheduler:
                 BlockRun.BlockRunStatus.CONDITION_FAILED,
             ]
         )
+        if not failed_block_uuids and not condition_failed_block_uuids:
+            return
 
         statuses = {
             BlockRun.BlockRunStatus.CONDITION_FAILED: condition_failed_block_uuids,
@@ -491,6 +611,9 @@ class PipelineScheduler:
                         block_run.update(status=status)
                         updated_status = True
 
+            if updated_status and BlockRun.BlockRunStatus.UPSTREAM_FAILED == block_run.status:
+                self.__decrement_remaining_upstream_counts(block_run, failed=True)
+
             if not updated_status:
                 not_updated_block_runs.append(block_run)
 
@@ -548,6 +671,8 @@ class PipelineScheduler:
                 b.id,
                 self.pipeline_run.get_variables(),
                 self.build_tags(**tags),
+                priority=self.job_priority,
+                group=self.pipeline.uuid,
             )
 
     def __schedule_integration_streams(self, block_runs: List[BlockRun] = None) -> None:
@@ -676,6 +801,8 @@ class PipelineScheduler:
                     data_exporter_block,
                     self.pipeline_run.id,
                     variables,
+                    priority=self.job_priority,
+                    group=self.pipeline.uuid,
                 )
 
             if job_manager.has_pipeline_run_job(self.pipeline_run.id) or \
@@ -695,6 +822,8 @@ class PipelineScheduler:
                 data_exporter_block,
                 self.pipeline_run.id,
                 variables,
+                priority=self.job_priority,
+                group=self.pipeline.uuid,
             )
 
     def __schedule_pipeline(self) -> None:
@@ -722,6 +851,8 @@ class PipelineScheduler:
             self.pipeline_run.id,
             self.pipeline_run.get_variables(),
             self.build_tags(),
+            priority=self.job_priority,
+            group=self.pipeline.uuid,
         )
 
     def __fetch_crashed_block_runs(self) -> None:
@@ -1275,170 +1406,307 @@ def schedule_all():
     1. Check whether any new pipeline runs need to be scheduled.
     2. Run git sync if "sync_on_pipeline_run" is enabled.
     3. In active pipeline runs, check whether any block runs need to be scheduled.
+
+    Schedules, their pipeline runs and backfills are loaded with a fixed number of bulk queries
+    and each pipeline is only loaded once per tick. Returns the timings and counts of the tick,
+    which are also logged.
+
+    If scheduler sharding is enabled, this instance only handles the pipeline schedules and
+    pipeline runs it holds the lease for, instead of locking every pipeline schedule.
     """
+    tick_metrics = SchedulerTickMetrics()
+    sharded = shard_manager.enabled
+
     db_connection.session.expire_all()
 
-    repo_pipelines = set(Pipeline.get_all_pipelines(get_repo_path()))
+    with tick_metrics.timer('sync_schedules'):
+        repo_pipelines = set(Pipeline.get_all_pipelines(get_repo_path()))
 
-    # Sync schedules from yaml file to DB
-    sync_schedules(list(repo_pipelines))
+        # Sync schedules from yaml file to DB
+        sync_schedules(list(repo_pipelines))
 
-    active_pipeline_schedules = \
-        list(PipelineSchedule.active_schedules(pipeline_uuids=repo_pipelines))
+    with tick_metrics.timer('load_pipeline_schedules'):
+        active_pipeline_schedules = \
+            list(PipelineSchedule.active_schedules(pipeline_uuids=repo_pipelines))
 
-    backfills = Backfill.filter(pipeline_schedule_ids=[ps.id for ps in active_pipeline_schedules])
+        if sharded:
+            tick_metrics.set('shard_members', len(shard_manager.heartbeat()))
+            leased_schedule_ids = shard_manager.acquire_leases(
+                'pipeline_schedules',
+                [str(ps.id) for ps in active_pipeline_schedules],
+            )
+            active_pipeline_schedules = [
+                ps for ps in active_pipeline_schedules
+                if str(ps.id) in leased_schedule_ids
+            ]
 
-    backfills_by_pipeline_schedule_id = index_by(
-        lambda backfill: backfill.pipeline_schedule_id,
-        backfills,
-    )
+        backfills = Backfill.filter(
+            pipeline_schedule_ids=[ps.id for ps in active_pipeline_schedules],
+        )
 
-    active_pipeline_schedule_ids_with_landing_time_enabled = set()
-    for pipeline_schedule in active_pipeline_schedules:
-        if pipeline_schedule.landing_time_enabled():
-            active_pipeline_schedule_ids_with_landing_time_enabled.add(pipeline_schedule.id)
-
-    previous_pipeline_run_by_pipeline_schedule_id = {}
-    if len(active_pipeline_schedule_ids_with_landing_time_enabled) >= 1:
-        row_number_column = (
-                func.
-                row_number().
-                over(
-                    order_by=desc(PipelineRun.execution_date),
-                    partition_by=PipelineRun.pipeline_schedule_id,
-                ).
-                label('row_number')
+        backfills_by_pipeline_schedule_id = index_by(
+            lambda backfill: backfill.pipeline_schedule_id,
+            backfills,
         )
 
-        query = PipelineRun.query.filter(
-            PipelineRun.pipeline_schedule_id.in_(
-                active_pipeline_schedule_ids_with_landing_time_enabled,
-            ),
-            PipelineRun.status == PipelineRun.PipelineRunStatus.COMPLETED,
+        active_pipeline_schedule_ids_with_landing_time_enabled = set()
+        for pipeline_schedule in active_pipeline_schedules:
+            if pipeline_schedule.landing_time_enabled():
+                active_pipeline_schedule_ids_with_landing_time_enabled.add(pipeline_schedule.id)
+
+        previous_pipeline_run_by_pipeline_schedule_id = {}
+        if len(active_pipeline_schedule_ids_with_landing_time_enabled) >= 1:
+            row_number_column = (
+                    func.
+                    row_number().
+                    over(
+                        order_by=desc(PipelineRun.execution_date),
+                        partition_by=PipelineRun.pipeline_schedule_id,
+                    ).
+                    label('row_number')
+            )
+
+            query = PipelineRun.query.filter(
+                PipelineRun.pipeline_schedule_id.in_(
+                    active_pipeline_schedule_ids_with_landing_time_enabled,
+                ),
+                PipelineRun.status == PipelineRun.PipelineRunStatus.COMPLETED,
+            )
+            query = query.add_column(row_number_column)
+            query = query.from_self().filter(row_number_column == 1)
+            for tup in query.all():
+                pr, _ = tup
+                previous_pipeline_run_by_pipeline_schedule_id[pr.pipeline_schedule_id] = pr
+
+        pipeline_runs_by_pipeline_schedule_id = __fetch_pipeline_runs_for_pipeline_schedules(
+            active_pipeline_schedules,
         )
-        query = query.add_column(row_number_column)
-        query = query.from_self().filter(row_number_column == 1)
-        for tup in query.all():
-            pr, _ = tup
-            previous_pipeline_run_by_pipeline_schedule_id[pr.pipeline_schedule_id] = pr
+
+    tick_metrics.set('active_pipeline_schedules', len(active_pipeline_schedules))
 
     pipeline_by_uuid = dict()
     concurrency_config_by_uuid = dict()
 
+    def get_pipeline(pipeline_uuid: str) -> Pipeline:
+        if pipeline_uuid not in pipeline_by_uuid:
+            try:
+                pipeline_by_uuid[pipeline_uuid] = Pipeline.get(pipeline_uuid)
+            except Exception:
+                pipeline_by_uuid[pipeline_uuid] = None
+        return pipeline_by_uuid[pipeline_uuid]
+
     git_sync_result = None
     sync_config = get_sync_config()
-    for pipeline_schedule in active_pipeline_schedules:
-        lock_key = f'pipeline_schedule_{pipeline_schedule.id}'
-        if not lock.try_acquire_lock(lock_key):
-            continue
+    with tick_metrics.timer('schedule_pipeline_schedules'):
+        for pipeline_schedule in active_pipeline_schedules:
+            lock_key = f'pipeline_schedule_{pipeline_schedule.id}'
+            if sharded:
+                # The lease may have expired and been taken by another instance if the tick
+                # takes longer than the lease timeout.
+                if str(pipeline_schedule.id) not in \
+                        shard_manager.renew_leases('pipeline_schedules'):
+                    continue
+            elif not lock.try_acquire_lock(lock_key):
+                continue
 
-        previous_runtimes = []
-        if pipeline_schedule.id in active_pipeline_schedule_ids_with_landing_time_enabled:
-            previous_pipeline_run = previous_pipeline_run_by_pipeline_schedule_id.get(
-                pipeline_schedule.id,
-            )
-            if previous_pipeline_run:
-                previous_runtimes = pipeline_schedule.runtime_history(
-                    pipeline_run=previous_pipeline_run,
+            previous_runtimes = []
+            if pipeline_schedule.id in active_pipeline_schedule_ids_with_landing_time_enabled:
+                previous_pipeline_run = previous_pipeline_run_by_pipeline_schedule_id.get(
+                    pipeline_schedule.id,
                 )
+                if previous_pipeline_run:
+                    previous_runtimes = pipeline_schedule.runtime_history(
+                        pipeline_run=previous_pipeline_run,
+                    )
 
-        # Decide whether to schedule any pipeline runs
-        should_schedule = pipeline_schedule.should_schedule(previous_runtimes=previous_runtimes)
-        initial_pipeline_runs = [
-            r for r in pipeline_schedule.pipeline_runs
-            if r.status == PipelineRun.PipelineRunStatus.INITIAL
-        ]
+            pipeline_uuid = pipeline_schedule.pipeline_uuid
+            pipeline = get_pipeline(pipeline_uuid)
+            pipeline_runs = pipeline_runs_by_pipeline_schedule_id.get(pipeline_schedule.id, [])
 
-        if not should_schedule and not initial_pipeline_runs:
-            lock.release_lock(lock_key)
-            continue
+            # Decide whether to schedule any pipeline runs
+            should_schedule = pipeline_schedule.should_schedule(
+                pipeline=pipeline,
+                pipeline_runs=pipeline_runs,
+                previous_runtimes=previous_runtimes,
+            )
+            initial_pipeline_runs = [
+                r for r in pipeline_runs
+                if r.status == PipelineRun.PipelineRunStatus.INITIAL
+            ]
 
-        pipeline_uuid = pipeline_schedule.pipeline_uuid
-        if pipeline_uuid not in pipeline_by_uuid:
-            pipeline = pipeline_by_uuid.setdefault(pipeline_uuid, Pipeline.get(pipeline_uuid))
-        else:
-            pipeline = pipeline_by_uuid[pipeline_uuid]
+            if not should_schedule and not initial_pipeline_runs:
+                if not sharded:
+                    lock.release_lock(lock_key)
+                continue
 
-        if pipeline_uuid not in concurrency_config_by_uuid:
-            concurrency_config = concurrency_config_by_uuid.setdefault(
-                pipeline_uuid,
-                ConcurrencyConfig.load(config=pipeline.concurrency_config),
-            )
-        else:
-            concurrency_config = concurrency_config_by_uuid[pipeline_uuid]
+            if pipeline is None:
+                logger.warning(
+                    f'Pipeline {pipeline_uuid} cannot be loaded for pipeline schedule ID '
+                    f'{pipeline_schedule.id}.',
+                )
+                if not sharded:
+                    lock.release_lock(lock_key)
+                continue
 
-        running_pipeline_runs = [
-            r for r in pipeline_schedule.pipeline_runs
-            if r.status == PipelineRun.PipelineRunStatus.RUNNING
-        ]
+            if pipeline_uuid not in concurrency_config_by_uuid:
+                concurrency_config = concurrency_config_by_uuid.setdefault(
+                    pipeline_uuid,
+                    ConcurrencyConfig.load(config=pipeline.concurrency_config),
+                )
+            else:
+                concurrency_config = concurrency_config_by_uuid[pipeline_uuid]
 
-        if should_schedule and \
-                pipeline_schedule.id not in backfills_by_pipeline_schedule_id:
-            # Perform git sync if "sync_on_pipeline_run" is enabled and no other git sync has been
-            # run for this scheduler loop.
-            if not git_sync_result and sync_config and sync_config.sync_on_pipeline_run:
-                git_sync_result = run_git_sync(lock=lock, sync_config=sync_config)
+            running_pipeline_runs = [
+                r for r in pipeline_runs
+                if r.status == PipelineRun.PipelineRunStatus.RUNNING
+            ]
 
-            payload = dict(
-                execution_date=pipeline_schedule.current_execution_date(),
-                pipeline_schedule_id=pipeline_schedule.id,
-                pipeline_uuid=pipeline_uuid,
-                variables=pipeline_schedule.variables,
-            )
+            if should_schedule and \
+                    pipeline_schedule.id not in backfills_by_pipeline_schedule_id:
+                # Perform git sync if "sync_on_pipeline_run" is enabled and no other git sync has
+                # been run for this scheduler loop.
+                if not git_sync_result and sync_config and sync_config.sync_on_pipeline_run:
+                    git_sync_result = run_git_sync(lock=lock, sync_config=sync_config)
+
+                payload = dict(
+                    execution_date=pipeline_schedule.current_execution_date(),
+                    pipeline_schedule_id=pipeline_schedule.id,
+                    pipeline_uuid=pipeline_uuid,
+                    variables=pipeline_schedule.variables,
+                )
 
-            if len(previous_runtimes) >= 1:
-                payload['metrics'] = dict(previous_runtimes=previous_runtimes)
+                if len(previous_runtimes) >= 1:
+                    payload['metrics'] = dict(previous_runtimes=previous_runtimes)
 
-            if PipelineType.INTEGRATION == pipeline.type:
-                payload['create_block_runs'] = False
+                if PipelineType.INTEGRATION == pipeline.type:
+                    payload['create_block_runs'] = False
 
-            if pipeline_schedule.get_settings().skip_if_previous_running and \
-                    (initial_pipeline_runs or running_pipeline_runs):
-                # Cancel the current pipeline run if previous pipeline runs haven't completed
-                payload['create_block_runs'] = False
-                pipeline_run = PipelineRun.create(**payload)
-                pipeline_run.update(status=PipelineRun.PipelineRunStatus.CANCELLED)
-            else:
-                pipeline_run = PipelineRun.create(**payload)
-                # Log Git sync status for new pipeline runs if a git sync result exists
-                if git_sync_result:
-                    pipeline_scheduler = PipelineScheduler(pipeline_run)
-                    log_git_sync(
-                        git_sync_result,
-                        pipeline_scheduler.logger,
-                        pipeline_scheduler.build_tags(),
-                    )
-                initial_pipeline_runs.append(pipeline_run)
+                if pipeline_schedule.get_settings().skip_if_previous_running and \
+                        (initial_pipeline_runs or running_pipeline_runs):
+                    # Cancel the current pipeline run if previous pipeline runs haven't completed
+                    payload['create_block_runs'] = False
+                    pipeline_run = PipelineRun.create(**payload)
+                    pipeline_run.update(status=PipelineRun.PipelineRunStatus.CANCELLED)
+                else:
+                    pipeline_run = PipelineRun.create(**payload)
+                    # Log Git sync status for new pipeline runs if a git sync result exists
+                    if git_sync_result:
+                        pipeline_scheduler = PipelineScheduler(pipeline_run, pipeline=pipeline)
+                        log_git_sync(
+                            git_sync_result,
+                            pipeline_scheduler.logger,
+                            pipeline_scheduler.build_tags(),
+                        )
+                    initial_pipeline_runs.append(pipeline_run)
+                tick_metrics.increment('created_pipeline_runs')
+
+            # Enforce pipeline concurrency limit
+            pipeline_run_quota = len(initial_pipeline_runs)
+            if concurrency_config.pipeline_run_limit:
+                pipeline_run_quota = concurrency_config.pipeline_run_limit - \
+                    len(running_pipeline_runs)
+
+            if pipeline_run_quota > 0:
+                initial_pipeline_runs.sort(key=lambda x: x.execution_date)
+                for r in initial_pipeline_runs[:pipeline_run_quota]:
+                    PipelineScheduler(r, pipeline=pipeline).start(should_schedule=False)
+                    tick_metrics.increment('started_pipeline_runs')
+
+            if not sharded:
+                # Sharded schedules are held by their lease instead of the lock.
+                lock.release_lock(lock_key)
+
+    with tick_metrics.timer('schedule_active_pipeline_runs'):
+        # Schedule active pipeline runs. Block runs are reloaded in bulk by
+        # PipelineScheduler.schedule, so they aren't eagerly loaded here.
+        active_pipeline_runs = PipelineRun.active_runs_for_pipelines(
+            pipeline_uuids=repo_pipelines,
+        )
+        if sharded:
+            # Pipeline runs are sharded by their pipeline schedule so that they are handled by
+            # the same instance as their pipeline schedule.
+            leased_schedule_ids = shard_manager.acquire_leases(
+                'pipeline_runs',
+                [str(r.pipeline_schedule_id) for r in active_pipeline_runs],
+            )
+            active_pipeline_runs = [
+                r for r in active_pipeline_runs
+                if str(r.pipeline_schedule_id) in leased_schedule_ids
+            ]
+        logger.info(f'Active pipeline runs: {[p.id for p in active_pipeline_runs]}')
 
-        # Enforce pipeline concurrency limit
-        pipeline_run_quota = len(initial_pipeline_runs)
-        if concurrency_config.pipeline_run_limit:
-            pipeline_run_quota = concurrency_config.pipeline_run_limit - \
-                len(running_pipeline_runs)
+        for r in active_pipeline_runs:
+            if sharded and \
+                    str(r.pipeline_schedule_id) not in shard_manager.renew_leases('pipeline_runs'):
+                continue
+            try:
+                PipelineScheduler(r, pipeline=get_pipeline(r.pipeline_uuid)).schedule()
+            except Exception:
+                logger.exception(f'Failed to schedule {r}')
+                traceback.print_exc()
+                continue
+        job_manager.clean_up_jobs()
 
-        if pipeline_run_quota > 0:
-            initial_pipeline_runs.sort(key=lambda x: x.execution_date)
-            for r in initial_pipeline_runs[:pipeline_run_quota]:
-                PipelineScheduler(r).start(should_schedule=False)
+    tick_metrics.set('active_pipeline_runs', len(active_pipeline_runs))
 
-        lock.release_lock(lock_key)
+    metrics = tick_metrics.to_dict()
+    logger.info(f'Scheduler tick metrics: {metrics}')
 
-    # Schedule active pipeline runs
-    active_pipeline_runs = PipelineRun.active_runs_for_pipelines(
-        pipeline_uuids=repo_pipelines,
-        include_block_runs=True,
-    )
-    logger.info(f'Active pipeline runs: {[p.id for p in active_pipeline_runs]}')
+    queue_metrics = job_manager.metrics()
+    if queue_metrics:
+        logger.info(f'Job queue metrics: {queue_metrics}')
 
-    for r in active_pipeline_runs:
-        try:
-            r.refresh()
-            PipelineScheduler(r).schedule()
-        except Exception:
-            logger.exception(f'Failed to schedule {r}')
-            traceback.print_exc()
+    return metrics
+
+
+def __fetch_pipeline_runs_for_pipeline_schedules(
+    pipeline_schedules: List[PipelineSchedule],
+) -> Dict[int, List[PipelineRun]]:
+    """
+    Fetch, in a single query, the pipeline runs needed to decide whether each pipeline schedule
+    should create a new pipeline run, instead of lazily loading every pipeline run of every
+    schedule:
+    1. Initial and running pipeline runs.
+    2. All pipeline runs of @once schedules.
+    3. Pipeline runs at or after the current execution date of the schedule.
+    """
+    if not pipeline_schedules:
+        return dict()
+
+    once_pipeline_schedule_ids = []
+    pipeline_schedule_ids_by_execution_date = dict()
+    for pipeline_schedule in pipeline_schedules:
+        if pipeline_schedule.schedule_interval == ScheduleInterval.ONCE:
+            once_pipeline_schedule_ids.append(pipeline_schedule.id)
             continue
-    job_manager.clean_up_jobs()
+
+        current_execution_date = pipeline_schedule.current_execution_date()
+        if current_execution_date is not None:
+            pipeline_schedule_ids_by_execution_date.setdefault(
+                current_execution_date,
+                [],
+            ).append(pipeline_schedule.id)
+
+    conditions = [
+        PipelineRun.status.in_([
+            PipelineRun.PipelineRunStatus.INITIAL,
+            PipelineRun.PipelineRunStatus.RUNNING,
+        ]),
+    ]
+    if once_pipeline_schedule_ids:
+        conditions.append(PipelineRun.pipeline_schedule_id.in_(once_pipeline_schedule_ids))
+    for execution_date, ids in pipeline_schedule_ids_by_execution_date.items():
+        conditions.append(and_(
+            PipelineRun.pipeline_schedule_id.in_(ids),
+            PipelineRun.execution_date >= execution_date,
+        ))
+
+    pipeline_runs = PipelineRun.query.filter(
+        PipelineRun.pipeline_schedule_id.in_([ps.id for ps in pipeline_schedules]),
+        or_(*conditions),
+    ).all()
+
+    return group_by(lambda pr: pr.pipeline_schedule_id, pipeline_runs)
 
 
 def schedule_with_event(event: Dict = None):
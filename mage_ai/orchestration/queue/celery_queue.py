@@ -1,6 +1,8 @@
+from typing import Callable
+
 from mage_ai.orchestration.queue.config import QueueConfig
+from mage_ai.orchestration.queue.fair_queue import JobPriority
 from mage_ai.orchestration.queue.queue import Queue
-from typing import Callable
 
 
 class CeleryQueue(Queue):
@@ -19,7 +21,15 @@ class CeleryQueue(Queue):
     def clean_up_jobs(self):
         pass
 
-    def enqueue(self, job_id: str, target: Callable, *args, **kwargs):
+    def enqueue(
+        self,
+        job_id: str,
+        target: Callable,
+        *args,
+        priority: JobPriority = None,
+        group: str = None,
+        **kwargs,
+    ):
         pass
 
     def has_job(self, job_id: str):
@@ -1,5 +1,6 @@
 from dataclasses import dataclass
 from enum import Enum
+from typing import Dict
 
 from mage_ai.shared.config import BaseConfig
 
@@ -12,6 +13,13 @@ class QueueType(str, Enum):
 @dataclass
 class ProcessQueueConfig(BaseConfig):
     redis_url: str = None
+    # Run the jobs in a pool of long-lived worker processes instead of one process per job.
+    prefork: bool = False
+    # Replace a pooled worker after it has run this many jobs. 0 means no limit.
+    max_jobs_per_worker: int = 0
+    # Replace a pooled worker once its memory usage exceeds this many MB after a job.
+    # 0 means no limit.
+    max_worker_memory_mb: int = 0
 
 
 @dataclass
@@ -19,3 +27,9 @@ class QueueConfig(BaseConfig):
     queue_type: QueueType = QueueType.PROCESS
     concurrency: int = 20
     process_queue_config: ProcessQueueConfig = None
+    # Priority class (high, normal or low) of the jobs of each pipeline, by pipeline uuid.
+    # Jobs of pipelines that aren't listed and whose trigger has no priority are normal.
+    pipeline_priorities: Dict[str, str] = None
+    # Share of the workers of each pipeline relative to the other pipelines of the same
+    # priority class, by pipeline uuid. Defaults to 1.
+    pipeline_weights: Dict[str, float] = None
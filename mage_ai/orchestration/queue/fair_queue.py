@@ -0,0 +1,159 @@
+import heapq
+import threading
+import time
+from collections import deque
+from enum import Enum
+from typing import Any, Dict, List
+
+# Upper bounds in seconds of the buckets of the queue wait histograms.
+QUEUE_WAIT_BUCKETS = [0.1, 0.5, 1, 5, 10, 30, 60, 300, 900, 3600]
+DEFAULT_JOB_GROUP = 'default'
+
+
+class JobPriority(str, Enum):
+    HIGH = 'high'
+    NORMAL = 'normal'
+    LOW = 'low'
+
+
+# Jobs of a higher priority class are always dequeued first.
+PRIORITY_ORDER = [JobPriority.HIGH, JobPriority.NORMAL, JobPriority.LOW]
+
+
+class QueueWaitHistogram:
+    """
+    Histogram of the number of seconds jobs waited in the queue.
+    """
+
+    def __init__(self, buckets: List[float] = None):
+        self.buckets = buckets or QUEUE_WAIT_BUCKETS
+        # The last count is for the waits longer than the last bucket.
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.max = 0
+        self.sum = 0
+
+    def observe(self, seconds: float) -> None:
+        idx = 0
+        while idx < len(self.buckets) and seconds > self.buckets[idx]:
+            idx += 1
+        self.counts[idx] += 1
+        self.count += 1
+        self.max = max(self.max, seconds)
+        self.sum += seconds
+
+    def to_dict(self) -> Dict:
+        return dict(
+            buckets={
+                str(le): count for le, count in zip(self.buckets + ['+Inf'], self.counts)
+            },
+            count=self.count,
+            max=round(self.max, 3),
+            sum=round(self.sum, 3),
+        )
+
+
+class _PriorityClass:
+    def __init__(self):
+        self.jobs_by_group = dict()
+        # Heap of (virtual start time, sequence, group) of the groups with queued jobs.
+        self.heap = []
+        self.finish_time_by_group = dict()
+        self.virtual_time = 0
+        self.size = 0
+        self.wait_histogram = QueueWaitHistogram()
+
+
+class FairQueue:
+    """
+    Thread-safe queue of jobs with priority classes and weighted fair queuing across groups
+    (e.g. pipelines).
+
+    Jobs of a higher priority class are always dequeued before the jobs of a lower priority
+    class. Within a priority class, each group is served in proportion to its weight, so a
+    group with thousands of queued jobs (e.g. a backfill) can't starve the other groups. Jobs
+    of the same group are dequeued in FIFO order.
+    """
+
+    def __init__(self, weights: Dict[str, float] = None):
+        self.weights = weights or dict()
+        self.condition = threading.Condition()
+        self.classes = {priority: _PriorityClass() for priority in PRIORITY_ORDER}
+        self.sequence = 0
+
+    def __len__(self) -> int:
+        with self.condition:
+            return sum(c.size for c in self.classes.values())
+
+    def put(
+        self,
+        job: Any,
+        priority: JobPriority = JobPriority.NORMAL,
+        group: str = DEFAULT_JOB_GROUP,
+    ) -> None:
+        with self.condition:
+            priority_class = self.classes[JobPriority(priority)]
+            jobs = priority_class.jobs_by_group.get(group)
+            if jobs is None:
+                jobs = priority_class.jobs_by_group[group] = deque()
+            jobs.append((job, time.monotonic()))
+            priority_class.size += 1
+            if len(jobs) == 1:
+                # The group became active: it's scheduled no earlier than the virtual time so
+                # that being idle doesn't earn it credit.
+                self.__schedule_group(
+                    priority_class,
+                    group,
+                    max(
+                        priority_class.finish_time_by_group.get(group, 0),
+                        priority_class.virtual_time,
+                    ),
+                )
+            self.condition.notify()
+
+    def get(self, timeout: float = None) -> Any:
+        """
+        Returns the next job, waiting for one if the queue is empty. Returns None if no job was
+        queued before the timeout.
+        """
+        with self.condition:
+            if not self.condition.wait_for(lambda: len(self) > 0, timeout=timeout):
+                return None
+            for priority in PRIORITY_ORDER:
+                priority_class = self.classes[priority]
+                if priority_class.size > 0:
+                    return self.__pop(priority_class)
+
+    def metrics(self) -> Dict:
+        with self.condition:
+            return {
+                priority.value: dict(
+                    jobs_queued=priority_class.size,
+                    queue_wait_seconds=priority_class.wait_histogram.to_dict(),
+                )
+                for priority, priority_class in self.classes.items()
+            }
+
+    def __pop(self, priority_class: _PriorityClass) -> Any:
+        start_time, _, group = heapq.heappop(priority_class.heap)
+        jobs = priority_class.jobs_by_group[group]
+        job, queued_at = jobs.popleft()
+        priority_class.size -= 1
+        priority_class.virtual_time = start_time
+        priority_class.wait_histogram.observe(time.monotonic() - queued_at)
+
+        finish_time = start_time + 1 / self.weights.get(group, 1)
+        priority_class.finish_time_by_group[group] = finish_time
+        if jobs:
+            self.__schedule_group(priority_class, group, finish_time)
+        else:
+            del priority_class.jobs_by_group[group]
+            if not priority_class.jobs_by_group:
+                # Reset the virtual clock once the class is idle.
+                priority_class.finish_time_by_group.clear()
+                priority_class.virtual_time = 0
+        return job
+
+    def __schedule_group(self, priority_class: _PriorityClass, group: str, start_time: float):
+        self.sequence += 1
+        heapq.heappush(priority_class.heap, (start_time, self.sequence, group))
@@ -1,23 +1,37 @@
 import multiprocessing as mp
+import multiprocessing.connection
 import os
 import signal
+import threading
 import time
+import traceback
 from enum import Enum
 from multiprocessing import Manager
-from typing import Callable
+from queue import Empty
+from typing import Callable, Dict
 
 import newrelic.agent
+import psutil
 import sentry_sdk
 from sentry_sdk import capture_exception
 
 from mage_ai.orchestration.db.process import start_session_and_run
 from mage_ai.orchestration.queue.config import QueueConfig
+from mage_ai.orchestration.queue.fair_queue import (
+    DEFAULT_JOB_GROUP,
+    FairQueue,
+    JobPriority,
+)
 from mage_ai.orchestration.queue.queue import Queue
 from mage_ai.services.newrelic import initialize_new_relic
 from mage_ai.services.redis.redis import init_redis_client
 from mage_ai.settings import HOSTNAME, REDIS_URL, SENTRY_DSN, SENTRY_TRACES_SAMPLE_RATE
 
 LIVENESS_TIMEOUT_SECONDS = 300
+# Interval at which the pre-forked worker pool refreshes its liveness while waiting for workers.
+POOL_HEARTBEAT_SECONDS = 60
+# Key of the worker stats that accumulates the stats of the workers that exited.
+RETIRED_WORKERS_KEY = 'retired'
 
 
 class JobStatus(str, Enum):
@@ -42,6 +56,14 @@ class ProcessQueue(Queue):
             size (int): The size of the worker pool (defaults to the number of CPUs).
             mp_manager (Manager): A multiprocessing manager for maintaining a shared dictionary for
                 jobs.
+            prefork (bool): Whether the jobs run in a pool of long-lived worker processes instead
+                of one process per job.
+            worker_stats: A shared dictionary with the stats of the pooled workers by process id.
+            fair_queue (FairQueue): The jobs waiting for a worker, ordered by priority class and
+                weighted fair queuing across pipelines.
+            capacity (mp.Semaphore): The number of workers available to run a job. A job is
+                only moved from the fair queue to the multiprocessing queue once a worker is
+                available.
 
         """
         self.queue_config = queue_config
@@ -50,6 +72,11 @@ class ProcessQueue(Queue):
         self.size = queue_config.concurrency or os.cpu_count()
         self.mp_manager = Manager()
         self.job_dict = self.mp_manager.dict()
+        self.prefork = bool(self.process_queue_config and self.process_queue_config.prefork)
+        self.worker_stats = self.mp_manager.dict()
+        self.fair_queue = FairQueue(weights=queue_config.pipeline_weights)
+        self.capacity = mp.Semaphore(self.size)
+        self.dispatcher_thread = None
 
         # Initialize redis client to track jobs across multiple replicas
         if self.process_queue_config and self.process_queue_config.redis_url:
@@ -74,7 +101,15 @@ class ProcessQueue(Queue):
             if job_id in self.job_dict and not self.has_job(job_id):
                 del self.job_dict[job_id]
 
-    def enqueue(self, job_id: str, target: Callable, *args, **kwargs):
+    def enqueue(
+        self,
+        job_id: str,
+        target: Callable,
+        *args,
+        priority: JobPriority = None,
+        group: str = None,
+        **kwargs,
+    ):
         """
         Enqueues a job to be executed in the worker pool.
 
@@ -82,6 +117,9 @@ class ProcessQueue(Queue):
             job_id (str): The ID of the job.
             target (Callable): The target function to execute.
             *args: Variable length argument list for the target function.
+            priority (JobPriority): The priority class of the job. Defaults to the priority of
+                its group in the queue config.
+            group (str): The group (pipeline) the job is fair queued in.
             **kwargs: Keyword arguments for the target function.
 
         """
@@ -93,10 +131,31 @@ class ProcessQueue(Queue):
             self.redis_client.set(job_id, self.client_id)
         if self.redis_client:
             self.redis_client.set(self.client_id, '1', ex=LIVENESS_TIMEOUT_SECONDS)
-        self.queue.put([job_id, target, args, kwargs])
         self.job_dict[job_id] = JobStatus.QUEUED
-        if not self.is_worker_pool_alive():
-            self.start_worker_pool()
+        self.fair_queue.put(
+            [job_id, target, args, kwargs, time.time()],
+            priority=self._job_priority(self.queue_config, priority, group),
+            group=group or DEFAULT_JOB_GROUP,
+        )
+        if self.dispatcher_thread is None or not self.dispatcher_thread.is_alive():
+            self.dispatcher_thread = threading.Thread(target=self.dispatch_jobs, daemon=True)
+            self.dispatcher_thread.start()
+
+    def dispatch_jobs(self):
+        """
+        Moves the jobs from the fair queue to the worker pool, one job per available worker, so
+        that the order in which the jobs run follows the fair queue.
+        """
+        while True:
+            self.capacity.acquire()
+            while True:
+                args = self.fair_queue.get()
+                # Skip the jobs cancelled while waiting in the fair queue.
+                if self.job_dict.get(args[0]) == JobStatus.QUEUED:
+                    break
+            self.queue.put(args)
+            if not self.is_worker_pool_alive():
+                self.start_worker_pool()
 
     def has_job(self, job_id: str) -> bool:
         """
@@ -144,12 +203,34 @@ class ProcessQueue(Queue):
         """
         Starts the worker pool by creating a new process for executing jobs.
         """
+        if self.prefork:
+            from mage_ai.orchestration.db import engine
+
+            engine.dispose()
+            self.worker_pool_proc = mp.Process(
+                target=run_prefork_worker_pool,
+                args=[
+                    self.queue,
+                    self.size,
+                    self.job_dict,
+                    self.worker_stats,
+                    self.capacity,
+                    self.redis_client,
+                    self.client_id,
+                    self.process_queue_config.max_jobs_per_worker,
+                    self.process_queue_config.max_worker_memory_mb,
+                ],
+            )
+            self.worker_pool_proc.start()
+            return
+
         self.worker_pool_proc = mp.Process(
             target=poll_job_and_execute,
             args=[
                 self.queue,
                 self.size,
                 self.job_dict,
+                self.capacity,
                 self.redis_client,
                 self.client_id,
             ],
@@ -168,28 +249,70 @@ class ProcessQueue(Queue):
             return False
         return self.worker_pool_proc.is_alive()
 
+    def metrics(self) -> Dict:
+        """
+        Returns the queue latency and worker utilization of the pre-forked worker pool, and the
+        queue wait histogram of each priority class.
+
+        Returns:
+            Dict: The number of queued and running jobs, the number of live workers, the number
+                of jobs run, the average and max seconds jobs waited in the queue, the ratio
+                of time the live workers spent running jobs, and the number of queued jobs and
+                histogram of the seconds jobs waited for a worker by priority class.
+
+        """
+        job_statuses = list(self.job_dict.values())
+        stats_by_worker = dict(self.worker_stats)
+        now = time.time()
+
+        jobs_run = 0
+        queue_wait_seconds = 0
+        max_queue_wait_seconds = 0
+        busy_seconds = 0
+        uptime_seconds = 0
+        for key, stats in stats_by_worker.items():
+            jobs_run += stats['jobs']
+            queue_wait_seconds += stats['queue_wait_seconds']
+            max_queue_wait_seconds = max(max_queue_wait_seconds, stats['max_queue_wait_seconds'])
+            if key != RETIRED_WORKERS_KEY:
+                busy_seconds += stats['busy_seconds']
+                if stats['job_started_at']:
+                    busy_seconds += now - stats['job_started_at']
+                uptime_seconds += now - stats['started_at']
+
+        return dict(
+            jobs_queued=len([s for s in job_statuses if s == JobStatus.QUEUED]),
+            jobs_running=len([s for s in job_statuses if isinstance(s, int)]),
+            jobs_run=jobs_run,
+            priority_classes=self.fair_queue.metrics(),
+            queue_latency_avg_seconds=round(queue_wait_seconds / jobs_run, 3) if jobs_run else 0,
+            queue_latency_max_seconds=round(max_queue_wait_seconds, 3),
+            worker_utilization=round(busy_seconds / uptime_seconds, 3) if uptime_seconds else 0,
+            workers=len(stats_by_worker) - (1 if RETIRED_WORKERS_KEY in stats_by_worker else 0),
+        )
+
 
 class Worker(mp.Process):
     def __init__(
         self,
-        queue: mp.Queue,
+        args,
         job_dict,
     ):
         """
-        A worker process for executing jobs from the process queue.
+        A worker process for executing a job from the process queue.
 
         Args:
-            queue (mp.Queue): The multiprocessing queue from which jobs are fetched.
+            args: The job fetched from the multiprocessing queue.
             job_dict: The shared job dictionary.
 
         Attributes:
-            queue (mp.Queue): The multiprocessing queue from which jobs are fetched.
+            args: The job fetched from the multiprocessing queue.
             job_dict: The shared job dictionary.
             dsn (str): The Sentry DSN for error reporting.
 
         """
         super().__init__()
-        self.queue = queue
+        self.args = args
         self.job_dict = job_dict
         self.dsn = SENTRY_DSN
         if self.dsn:
@@ -204,30 +327,30 @@ class Worker(mp.Process):
         """
         The entry point for the worker process.
 
-        Fetches a job from the queue, executes it, and updates the job status in the job dictionary.
+        Executes the job and updates the job status in the job dictionary.
 
         """
-        if not self.queue.empty():
-            args = self.queue.get()
-            job_id = args[0]
-            print(f'Run worker for job {job_id}')
-            if self.job_dict[job_id] != JobStatus.QUEUED:
-                return
-            self.job_dict[job_id] = self.pid
-            try:
-                start_session_and_run(args[1], *args[2], **args[3])
-            except Exception as e:
-                if self.dsn:
-                    capture_exception(e)
-                raise
-            finally:
-                self.job_dict[job_id] = JobStatus.COMPLETED
+        args = self.args
+        job_id = args[0]
+        print(f'Run worker for job {job_id}')
+        if self.job_dict[job_id] != JobStatus.QUEUED:
+            return
+        self.job_dict[job_id] = self.pid
+        try:
+            start_session_and_run(args[1], *args[2], **args[3])
+        except Exception as e:
+            if self.dsn:
+                capture_exception(e)
+            raise
+        finally:
+            self.job_dict[job_id] = JobStatus.COMPLETED
 
 
 def poll_job_and_execute(
     queue: mp.Queue,
     size: int,
     job_dict,
+    capacity,
     redis_client,
     client_id: str,
 ):
@@ -238,20 +361,222 @@ def poll_job_and_execute(
         queue: The multiprocessing queue from which jobs are fetched.
         size: The size of the worker pool.
         job_dict: The shared job dictionary.
+        capacity: The semaphore released when a worker exits.
 
     """
     workers = []
     while True:
-        workers = [w for w in workers if w.is_alive()]
+        alive_workers = [w for w in workers if w.is_alive()]
+        for _ in range(len(workers) - len(alive_workers)):
+            capacity.release()
+        workers = alive_workers
         print(f'Worker pool size: {len(workers)}')
         if not workers and queue.empty():
             break
         while not queue.empty():
             if len(workers) >= size:
                 break
-            worker = Worker(queue, job_dict)
+            try:
+                args = queue.get_nowait()
+            except Empty:
+                break
+            worker = Worker(args, job_dict)
             worker.start()
             workers.append(worker)
         time.sleep(1)
         if redis_client and client_id:
             redis_client.set(client_id, '1', ex=LIVENESS_TIMEOUT_SECONDS)
+
+
+class PooledWorker(mp.Process):
+    def __init__(
+        self,
+        queue: mp.Queue,
+        job_dict,
+        worker_stats,
+        capacity,
+        max_jobs: int = 0,
+        max_memory_mb: int = 0,
+    ):
+        """
+        A long-lived worker process of the pre-forked worker pool. Runs jobs from the process
+        queue until it has run `max_jobs` jobs or its memory usage exceeds `max_memory_mb`, so
+        that the pool can replace it.
+
+        Args:
+            queue (mp.Queue): The multiprocessing queue from which jobs are fetched.
+            job_dict: The shared job dictionary.
+            worker_stats: The shared dictionary with the stats of the workers by process id.
+            capacity: The semaphore released once the worker is available for another job.
+            max_jobs (int): The number of jobs to run before exiting. 0 means no limit.
+            max_memory_mb (int): The memory usage in MB above which the worker exits after a
+                job. 0 means no limit.
+
+        """
+        super().__init__()
+        self.queue = queue
+        self.job_dict = job_dict
+        self.worker_stats = worker_stats
+        self.capacity = capacity
+        self.max_jobs = max_jobs
+        self.max_memory_mb = max_memory_mb
+        self.dsn = SENTRY_DSN
+
+    def run(self):
+        """
+        The entry point for the worker process.
+
+        Initializes Sentry and New Relic once, then blocks on the queue for jobs and runs them.
+
+        """
+        if self.dsn:
+            sentry_sdk.init(
+                self.dsn,
+                traces_sample_rate=SENTRY_TRACES_SAMPLE_RATE,
+            )
+        initialize_new_relic()
+
+        stats = dict(
+            busy_seconds=0,
+            job_started_at=None,
+            jobs=0,
+            max_queue_wait_seconds=0,
+            queue_wait_seconds=0,
+            started_at=time.time(),
+        )
+        self.worker_stats[self.pid] = stats
+
+        parent_pid = os.getppid()
+        jobs_run = 0
+        while not self.max_jobs or jobs_run < self.max_jobs:
+            try:
+                args = self.queue.get(timeout=POOL_HEARTBEAT_SECONDS)
+            except Empty:
+                if os.getppid() != parent_pid:
+                    # The worker pool exited.
+                    break
+                continue
+
+            job_id = args[0]
+            if self.job_dict.get(job_id) != JobStatus.QUEUED:
+                self.capacity.release()
+                continue
+            jobs_run += 1
+
+            started_at = time.time()
+            queue_wait_seconds = started_at - args[4] if len(args) > 4 else 0
+            stats['jobs'] += 1
+            stats['job_started_at'] = started_at
+            stats['queue_wait_seconds'] += queue_wait_seconds
+            stats['max_queue_wait_seconds'] = max(
+                stats['max_queue_wait_seconds'],
+                queue_wait_seconds,
+            )
+            self.worker_stats[self.pid] = stats
+
+            self.run_job(job_id, args)
+
+            stats['busy_seconds'] += time.time() - started_at
+            stats['job_started_at'] = None
+            self.worker_stats[self.pid] = stats
+            self.capacity.release()
+
+            if self.max_memory_mb and \
+                    psutil.Process().memory_info().rss > self.max_memory_mb * 1024 * 1024:
+                print(f'Worker {self.pid} exceeded {self.max_memory_mb} MB of memory.')
+                break
+
+    @newrelic.agent.background_task(name='worker-run', group='Task')
+    def run_job(self, job_id: str, args):
+        print(f'Run worker {self.pid} for job {job_id}')
+        self.job_dict[job_id] = self.pid
+        try:
+            start_session_and_run(args[1], *args[2], **args[3])
+        except Exception as e:
+            if self.dsn:
+                capture_exception(e)
+            traceback.print_exc()
+        finally:
+            self.job_dict[job_id] = JobStatus.COMPLETED
+
+
+def retire_worker_stats(worker_stats, pid: int) -> bool:
+    """
+    Adds the stats of a worker that exited to the stats of the retired workers.
+
+    Returns:
+        bool: True if the worker exited while running a job, e.g. because the job was killed.
+
+    """
+    stats = worker_stats.pop(pid, None)
+    if stats is None:
+        return False
+    retired = worker_stats.get(RETIRED_WORKERS_KEY) or dict(
+        jobs=0,
+        max_queue_wait_seconds=0,
+        queue_wait_seconds=0,
+    )
+    retired['jobs'] += stats['jobs']
+    retired['queue_wait_seconds'] += stats['queue_wait_seconds']
+    retired['max_queue_wait_seconds'] = max(
+        retired['max_queue_wait_seconds'],
+        stats['max_queue_wait_seconds'],
+    )
+    worker_stats[RETIRED_WORKERS_KEY] = retired
+    return stats['job_started_at'] is not None
+
+
+def run_prefork_worker_pool(
+    queue: mp.Queue,
+    size: int,
+    job_dict,
+    worker_stats,
+    capacity,
+    redis_client,
+    client_id: str,
+    max_jobs_per_worker: int = 0,
+    max_worker_memory_mb: int = 0,
+):
+    """
+    Keeps a pool of long-lived workers running jobs from the queue. Workers that exit, e.g.
+    after reaching their max number of jobs or memory or because their job was killed, are
+    replaced.
+
+    Args:
+        queue: The multiprocessing queue from which jobs are fetched.
+        size: The size of the worker pool.
+        job_dict: The shared job dictionary.
+        worker_stats: The shared dictionary with the stats of the workers by process id.
+        capacity: The semaphore released on behalf of the workers that exit while running a
+            job.
+        max_jobs_per_worker: The number of jobs a worker runs before it's replaced.
+        max_worker_memory_mb: The memory usage in MB above which a worker is replaced.
+
+    """
+    workers = dict()
+    while True:
+        for pid, worker in list(workers.items()):
+            if not worker.is_alive():
+                worker.join()
+                if retire_worker_stats(worker_stats, pid):
+                    capacity.release()
+                del workers[pid]
+        while len(workers) < size:
+            worker = PooledWorker(
+                queue,
+                job_dict,
+                worker_stats,
+                capacity,
+                max_jobs=max_jobs_per_worker,
+                max_memory_mb=max_worker_memory_mb,
+            )
+            worker.start()
+            workers[worker.pid] = worker
+        print(f'Worker pool size: {len(workers)}')
+        if redis_client and client_id:
+            redis_client.set(client_id, '1', ex=LIVENESS_TIMEOUT_SECONDS)
+        # Wait until a worker exits instead of polling.
+        mp.connection.wait(
+            [w.sentinel for w in workers.values()],
+            timeout=POOL_HEARTBEAT_SECONDS,
+        )
@@ -1,5 +1,8 @@
 from abc import ABC, abstractmethod
-from typing import Callable
+from typing import Callable, Dict
+
+from mage_ai.orchestration.queue.config import QueueConfig
+from mage_ai.orchestration.queue.fair_queue import JobPriority
 
 
 class Queue(ABC):
@@ -8,7 +11,15 @@ class Queue(ABC):
         pass
 
     @abstractmethod
-    def enqueue(self, job_id: str, target: Callable, *args, **kwargs):
+    def enqueue(
+        self,
+        job_id: str,
+        target: Callable,
+        *args,
+        priority: JobPriority = None,
+        group: str = None,
+        **kwargs,
+    ):
         pass
 
     @abstractmethod
@@ -19,5 +30,31 @@ class Queue(ABC):
     def kill_job(self, job_id: str):
         pass
 
+    def metrics(self) -> Dict:
+        """
+        Returns the metrics of the queue, e.g. its queue latency and worker utilization, or an
+        empty dict if the queue doesn't collect metrics.
+        """
+        return dict()
+
     def _print(self, msg):
         print(f'[{self.__class__.__name__}] {msg}')
+
+    def _job_priority(self, queue_config: QueueConfig, priority: JobPriority, group: str):
+        """
+        Returns the priority class of a job: the given priority, or the priority of its group
+        (pipeline) in the queue config, or normal. An invalid priority falls back to normal, so
+        that a misconfigured trigger doesn't prevent its jobs from running.
+        """
+        if priority is None and group is not None and queue_config.pipeline_priorities:
+            priority = queue_config.pipeline_priorities.get(group)
+        if not priority:
+            return JobPriority.NORMAL
+        try:
+            return JobPriority(priority)
+        except ValueError:
+            self._print(
+                f'Invalid job priority {priority} of group {group}, expected one of '
+                f'{[p.value for p in JobPriority]}. Using {JobPriority.NORMAL.value} priority.',
+            )
+            return JobPriority.NORMAL
@@ -0,0 +1,219 @@
+import bisect
+import hashlib
+import os
+import time
+import uuid
+from typing import Dict, Iterable, List, Set
+
+from mage_ai.services.redis.redis import init_redis_client
+from mage_ai.settings import (
+    HOSTNAME,
+    REDIS_URL,
+    SCHEDULER_LEASE_TIMEOUT,
+    SCHEDULER_SHARDING_ENABLED,
+)
+
+DEFAULT_VIRTUAL_NODES = 64
+
+
+def hash_key(key: str) -> int:
+    return int(hashlib.md5(key.encode()).hexdigest()[:16], 16)
+
+
+class ConsistentHashRing:
+    """
+    Map keys to members so that adding or removing a member only moves the keys owned by
+    that member. Each member is placed on the ring multiple times to even out the shards.
+    """
+
+    def __init__(self, members: Iterable[str], virtual_nodes: int = DEFAULT_VIRTUAL_NODES):
+        self.members = sorted(set(members))
+        ring = sorted(
+            (hash_key(f'{member}_{i}'), member)
+            for member in self.members
+            for i in range(virtual_nodes)
+        )
+        self.hashes = [h for h, _ in ring]
+        self.nodes = [member for _, member in ring]
+
+    def get_member(self, key: str) -> str:
+        if not self.nodes:
+            return None
+        idx = bisect.bisect(self.hashes, hash_key(key)) % len(self.hashes)
+        return self.nodes[idx]
+
+
+class SchedulerShardManager:
+    """
+    Split the pipeline schedules and pipeline runs across scheduler replicas.
+
+    Each replica heartbeats into a Redis sorted set of members. Keys are assigned to members
+    with a consistent hash ring, and a replica only works on an assigned key after it holds
+    the key's lease. When the membership changes, a replica releases the leases of the keys
+    that are no longer assigned to it, so that the new owner can pick them up on its next tick.
+    Leases of replicas that die expire after the lease timeout.
+    """
+
+    def __init__(
+        self,
+        instance_id: str = None,
+        key_prefix: str = 'SCHEDULER',
+        lease_timeout: int = SCHEDULER_LEASE_TIMEOUT,
+        redis_client=None,
+        sharding_enabled: bool = SCHEDULER_SHARDING_ENABLED,
+        virtual_nodes: int = DEFAULT_VIRTUAL_NODES,
+    ):
+        self.instance_id = instance_id or \
+            f'HOST_{HOSTNAME}_PID_{os.getpid()}_{uuid.uuid4().hex[:8]}'
+        self.key_prefix = key_prefix
+        self.lease_timeout = lease_timeout
+        self.sharding_enabled = sharding_enabled
+        self.virtual_nodes = virtual_nodes
+        if redis_client is None and sharding_enabled:
+            redis_client = init_redis_client(REDIS_URL)
+        self.redis_client = redis_client
+
+        self.leased_keys_by_group: Dict[str, Set[str]] = dict()
+        self.renewed_at_by_group: Dict[str, float] = dict()
+        self.ring = ConsistentHashRing([self.instance_id], virtual_nodes=virtual_nodes)
+
+    @property
+    def enabled(self) -> bool:
+        return self.sharding_enabled and self.redis_client is not None
+
+    @property
+    def members(self) -> List[str]:
+        return self.ring.members
+
+    @property
+    def members_key(self) -> str:
+        return f'{self.key_prefix}_MEMBERS'
+
+    def __lease_key(self, group: str, key: str) -> str:
+        return f'{self.key_prefix}_LEASE_{group}_{key}'
+
+    @property
+    def renew_interval(self) -> float:
+        return self.lease_timeout / 3
+
+    def heartbeat(self) -> List[str]:
+        """
+        Register this instance as a live member, drop the members that stopped heartbeating
+        and rebuild the hash ring if the membership changed.
+        """
+        now = time.time()
+        pipe = self.redis_client.pipeline()
+        pipe.zadd(self.members_key, {self.instance_id: now})
+        pipe.zremrangebyscore(self.members_key, '-inf', now - self.lease_timeout)
+        pipe.zrange(self.members_key, 0, -1)
+        members = pipe.execute()[-1]
+
+        if sorted(set(members)) != self.ring.members:
+            self.ring = ConsistentHashRing(members, virtual_nodes=self.virtual_nodes)
+
+        return self.members
+
+    def leave(self) -> None:
+        for group in list(self.leased_keys_by_group.keys()):
+            self.release_leases(group, self.leased_keys_by_group.pop(group))
+            self.renewed_at_by_group.pop(group, None)
+        self.redis_client.zrem(self.members_key, self.instance_id)
+
+    def is_assigned(self, key: str) -> bool:
+        return self.ring.get_member(key) == self.instance_id
+
+    def acquire_leases(self, group: str, keys: Iterable[str]) -> Set[str]:
+        """
+        Acquire or renew the leases of the keys assigned to this instance and release the
+        leases of the keys in the same group that are no longer assigned to it.
+
+        Returns the keys this instance holds the lease for. Uses a fixed number of Redis round
+        trips regardless of the number of keys.
+        """
+        assigned = [k for k in dict.fromkeys(keys) if self.is_assigned(k)]
+
+        previously_leased = self.leased_keys_by_group.get(group, set())
+        self.release_leases(group, previously_leased - set(assigned))
+
+        pipe = self.redis_client.pipeline()
+        for key in assigned:
+            pipe.set(
+                self.__lease_key(group, key),
+                self.instance_id,
+                nx=True,
+                ex=self.lease_timeout,
+            )
+        results = pipe.execute()
+
+        leased = set()
+        not_acquired = []
+        for key, acquired in zip(assigned, results):
+            if acquired:
+                leased.add(key)
+            else:
+                not_acquired.append(key)
+
+        if not_acquired:
+            # Renew the leases this instance already holds.
+            pipe = self.redis_client.pipeline()
+            for key in not_acquired:
+                pipe.get(self.__lease_key(group, key))
+            owners = pipe.execute()
+            renewed = [k for k, owner in zip(not_acquired, owners) if owner == self.instance_id]
+            if renewed:
+                pipe = self.redis_client.pipeline()
+                for key in renewed:
+                    pipe.expire(self.__lease_key(group, key), self.lease_timeout)
+                pipe.execute()
+                leased.update(renewed)
+
+        self.leased_keys_by_group[group] = leased
+        self.renewed_at_by_group[group] = time.time()
+
+        return leased
+
+    def renew_leases(self, group: str) -> Set[str]:
+        """
+        Renew the leases of the group and the membership of this instance if a third of the
+        lease timeout passed since the leases were acquired or renewed, so that they don't expire
+        during a long tick. Leases that expired and were taken by another instance are dropped.
+
+        Returns the keys this instance still holds the lease for.
+        """
+        leased = self.leased_keys_by_group.get(group, set())
+        now = time.time()
+        if now - self.renewed_at_by_group.get(group, now) < self.renew_interval:
+            return leased
+
+        keys = list(leased)
+        pipe = self.redis_client.pipeline()
+        pipe.zadd(self.members_key, {self.instance_id: now})
+        for key in keys:
+            pipe.get(self.__lease_key(group, key))
+        owners = pipe.execute()[1:]
+
+        renewed = set(k for k, owner in zip(keys, owners) if owner == self.instance_id)
+        if renewed:
+            pipe = self.redis_client.pipeline()
+            for key in renewed:
+                pipe.expire(self.__lease_key(group, key), self.lease_timeout)
+            pipe.execute()
+
+        self.leased_keys_by_group[group] = renewed
+        self.renewed_at_by_group[group] = now
+
+        return renewed
+
+    def release_leases(self, group: str, keys: Iterable[str]) -> None:
+        keys = list(keys)
+        if not keys:
+            return
+        pipe = self.redis_client.pipeline()
+        for key in keys:
+            pipe.get(self.__lease_key(group, key))
+        owners = pipe.execute()
+        pipe = self.redis_client.pipeline()
+        for key, owner in zip(keys, owners):
+            if owner == self.instance_id:
+                pipe.delete(self.__lease_key(group, key))
+        pipe.execute()
@@ -38,9 +38,23 @@ def run_scheduler():
         LoopTimeTrigger().start()
     except Exception as e:
         traceback.print_exc()
+        __leave_scheduler_shards()
         raise e
 
 
+def __leave_scheduler_shards():
+    # Release the leases right away so that the restarted scheduler, which joins with a new
+    # instance ID, doesn't wait for them to expire.
+    from mage_ai.orchestration.pipeline_scheduler import shard_manager
+
+    if not shard_manager.enabled:
+        return
+    try:
+        shard_manager.leave()
+    except Exception:
+        traceback.print_exc()
+
+
 class SchedulerManager:
     """
     Singleton class to manage scheduler process.
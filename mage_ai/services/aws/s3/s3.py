@@ -33,6 +33,22 @@ class Client:
     def read(self, object_key: str):
         return self.get_object(object_key).read()
 
+    def read_range(self, object_key: str, start: int, end: int):
+        """
+        Read the bytes of the object from the start offset up to, but excluding, the end offset.
+        """
+        try:
+            return self.client.get_object(
+                Bucket=self.bucket,
+                Key=object_key,
+                Range=f'bytes={start}-{end - 1}',
+            )['Body'].read()
+        except self.client.exceptions.ClientError as err:
+            # The range starts after the end of the object.
+            if err.response.get('Error', {}).get('Code') == 'InvalidRange':
+                return b''
+            raise err
+
     def get_object(self, object_key: str):
         return self.client.get_object(Bucket=self.bucket, Key=object_key)['Body']
 
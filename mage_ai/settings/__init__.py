@@ -51,6 +51,10 @@ ACTIVE_DIRECTORY_DIRECTORY_ID = os.getenv('ACTIVE_DIRECTORY_DIRECTORY_ID', None)
 
 HOSTNAME = os.getenv('HOSTNAME')
 REDIS_URL = os.getenv('REDIS_URL')
+# Shard pipeline schedules across scheduler replicas. Requires REDIS_URL to be set.
+SCHEDULER_SHARDING_ENABLED = \
+    os.getenv('SCHEDULER_SHARDING_ENABLED', 'False').lower() in ('true', '1', 't')
+SCHEDULER_LEASE_TIMEOUT = int(os.getenv('SCHEDULER_LEASE_TIMEOUT', 60) or 60)
 SERVER_VERBOSITY = os.getenv('SERVER_VERBOSITY', 'info') or 'info'
 
 SHELL_COMMAND = os.getenv('SHELL_COMMAND', None)
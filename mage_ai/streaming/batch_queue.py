@@ -0,0 +1,133 @@
+import threading
+import time
+from collections import deque
+from typing import Callable, Dict, List, Tuple
+
+
+class BatchQueue:
+    """
+    Thread-safe FIFO queue of batches between a streaming source and the blocks and sinks
+    handling the batches.
+
+    * `put` blocks while the queue holds `max_batches` batches or `max_records` records.
+    * When the number of queued records reaches `high_watermark`, `on_high_watermark` is called
+    (e.g. to pause the source). Once it drops to `low_watermark`, `on_low_watermark` is called
+    (e.g. to resume the source).
+    * The `on_done` callback of a batch is called by `task_done`, e.g. to checkpoint the offsets
+    of the batch once it's handled.
+    """
+
+    def __init__(
+        self,
+        max_batches: int = 1,
+        max_records: int = 0,
+        high_watermark: int = 0,
+        low_watermark: int = 0,
+        on_high_watermark: Callable = None,
+        on_low_watermark: Callable = None,
+    ):
+        self.max_batches = max(max_batches, 1)
+        self.max_records = max_records
+        self.high_watermark = high_watermark
+        self.low_watermark = min(low_watermark, high_watermark)
+        self.on_high_watermark = on_high_watermark
+        self.on_low_watermark = on_low_watermark
+
+        self.batches = deque()
+        self.closed = False
+        # Reentrant so that the watermark callbacks can read the metrics.
+        self.condition = threading.Condition(threading.RLock())
+        self.paused = False
+        self.records = 0
+
+        self.max_depth = 0
+        self.pause_count = 0
+        self.records_processed = 0
+
+    def put(self, batch: List, on_done: Callable = None, **kwargs) -> None:
+        with self.condition:
+            # A batch larger than max_records is still accepted if the queue is empty.
+            while not self.closed and self.batches and (
+                len(self.batches) >= self.max_batches or
+                (self.max_records and self.records + len(batch) > self.max_records)
+            ):
+                self.condition.wait()
+            if self.closed:
+                raise Exception('Batch queue is closed.')
+
+            self.batches.append((batch, kwargs, time.monotonic(), on_done))
+            self.records += len(batch)
+            self.max_depth = max(self.max_depth, self.records)
+
+            should_pause = self.high_watermark and not self.paused and \
+                self.records >= self.high_watermark
+            if should_pause:
+                self.paused = True
+                self.pause_count += 1
+                # Called while holding the lock so that it can't run after on_low_watermark.
+                if self.on_high_watermark:
+                    self.on_high_watermark()
+            self.condition.notify_all()
+
+    def get(self) -> Tuple[List, Dict]:
+        """
+        Returns the oldest batch and the keyword arguments it was put with, waiting for one if
+        the queue is empty. Returns None once the queue is closed and empty. The batch stays in
+        the queue until `task_done` is called.
+        """
+        with self.condition:
+            while not self.batches and not self.closed:
+                self.condition.wait()
+            if not self.batches:
+                return None
+            batch, kwargs, _, _ = self.batches[0]
+            return batch, kwargs
+
+    def task_done(self) -> None:
+        with self.condition:
+            batch, _, _, on_done = self.batches.popleft()
+            self.records -= len(batch)
+            self.records_processed += len(batch)
+
+            should_resume = self.paused and self.records <= self.low_watermark
+            if should_resume:
+                self.paused = False
+                if self.on_low_watermark:
+                    self.on_low_watermark()
+            self.condition.notify_all()
+        # Called without the lock, so that a slow checkpoint doesn't block the source.
+        if on_done is not None:
+            on_done()
+
+    def join(self) -> None:
+        with self.condition:
+            while self.batches and not self.closed:
+                self.condition.wait()
+
+    def close(self) -> None:
+        with self.condition:
+            self.closed = True
+            self.condition.notify_all()
+
+    @property
+    def lag_seconds(self) -> float:
+        """
+        Seconds since the oldest batch in the queue was put.
+        """
+        with self.condition:
+            if not self.batches:
+                return 0
+            return round(time.monotonic() - self.batches[0][2], 3)
+
+    def metrics(self) -> Dict:
+        lag_seconds = self.lag_seconds
+        with self.condition:
+            return dict(
+                depth_batches=len(self.batches),
+                depth_records=self.records,
+                lag_seconds=lag_seconds,
+                max_depth_records=self.max_depth,
+                pause_count=self.pause_count,
+                paused=self.paused,
+                records_processed=self.records_processed,
+            )
@@ -1,6 +1,8 @@
 from enum import Enum
 
 DEFAULT_BATCH_SIZE = 100
+DEFAULT_CHECKPOINT_INTERVAL_COUNT = 100
+DEFAULT_CHECKPOINT_INTERVAL_SECONDS = 10
 DEFAULT_TIMEOUT_MS = 500
 
 
@@ -62,7 +62,9 @@ class AmazonS3Sink(BaseSink):
             return
         self._print(f'Upload {len(self.buffer)} records to S3.')
 
-        df = pd.DataFrame(self.buffer)
+        # Records buffered by another thread during the upload are kept in the buffer.
+        buffer_offset = self.buffer_offset
+        df = pd.DataFrame(self.buffer[:buffer_offset[0]])
         buffer = BytesIO()
         if self.config.file_type == 'parquet':
             df.to_parquet(buffer)
@@ -87,7 +89,7 @@ class AmazonS3Sink(BaseSink):
         object_key = os.path.join(object_key, filename)
 
         self.client.put_object(Body=buffer, Bucket=self.config.bucket, Key=object_key)
-        self.clear_buffer()
+        self.clear_buffer(buffer_offset)
 
     def __reset_timer(self):
         try:
@@ -42,7 +42,9 @@ class AzureDataLakeSink(BaseSink):
             return
         self._print(f'Upload {len(self.buffer)} records to DeltaTable.')
 
-        df = pd.DataFrame(self.buffer)
+        # Records buffered by another thread during the upload are kept in the buffer.
+        buffer_offset = self.buffer_offset
+        df = pd.DataFrame(self.buffer[:buffer_offset[0]])
 
         if self.config.file_type == 'delta':
             curr_time = datetime.now(timezone.utc)
@@ -62,11 +64,11 @@ class AzureDataLakeSink(BaseSink):
 
                 self._print(f'Data written to {self.config.table_uri}')
             except Exception as e:
-                self.clear_buffer()
+                self.clear_buffer(buffer_offset)
                 raise Exception(e)
         else:
-            self.clear_buffer()
+            self.clear_buffer(buffer_offset)
             raise Exception(f'File type {self.config.file_type} \
                               is not supported.')
 
-        self.clear_buffer()
+        self.clear_buffer(buffer_offset)
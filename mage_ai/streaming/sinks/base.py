@@ -1,10 +1,10 @@
 from abc import ABC, abstractmethod
 from datetime import datetime, timezone
-from typing import Dict, List
-import json
-import os
+from typing import Dict, List, Tuple
 import traceback
 
+from mage_ai.streaming.sinks.segment_buffer import SegmentBuffer
+
 
 class BaseSink(ABC):
     config_class = None
@@ -15,6 +15,10 @@ class BaseSink(ABC):
                 config.pop('connector_type')
             self.config = self.config_class.load(config=config)
         self.buffer_path = kwargs.get('buffer_path')
+        self.segment_buffer = SegmentBuffer(
+            self.buffer_path,
+            shared_legacy_path=kwargs.get('shared_legacy_buffer_path'),
+        ) if self.buffer_path else None
         self.buffer = self.read_buffer() or []
         self.buffer_start_time = None
         self.init_client()
@@ -30,12 +34,26 @@ class BaseSink(ABC):
     def batch_write(self, data: List[Dict]):
         pass
 
-    def clear_buffer(self):
-        self.buffer = []
-        if not self.buffer_path:
-            return
-        with open(self.buffer_path, 'w'):
-            pass
+    @property
+    def buffer_offset(self) -> Tuple[int, Tuple[int, int]]:
+        """
+        Offset of the end of the buffer. Pass it to `clear_buffer` to only clear the records
+        buffered before the offset was taken; e.g. while the buffer is being uploaded.
+        """
+        return (
+            len(self.buffer),
+            self.segment_buffer.offset if self.segment_buffer is not None else None,
+        )
+
+    def clear_buffer(self, offset: Tuple[int, Tuple[int, int]] = None):
+        segment_offset = None
+        if offset is None:
+            self.buffer = []
+        else:
+            records_count, segment_offset = offset
+            self.buffer = self.buffer[records_count:]
+        if self.segment_buffer is not None:
+            self.segment_buffer.commit(segment_offset)
 
     def has_buffer_timed_out(self, buffer_timeout_seconds):
         if self.buffer_start_time is None:
@@ -46,17 +64,16 @@ class BaseSink(ABC):
                 self.buffer_start_time).total_seconds() >= buffer_timeout_seconds
 
     def read_buffer(self):
-        buffer = []
-        if not self.buffer_path or not os.path.exists(self.buffer_path):
-            return buffer
+        """
+        Read the records that were buffered but not cleared before the sink was restarted.
+        """
+        if self.segment_buffer is None:
+            return []
         try:
-            with open(self.buffer_path) as fp:
-                for line in fp:
-                    buffer.append(json.loads(line))
+            return self.segment_buffer.read()
         except Exception:
             traceback.print_exc()
-            pass
-        return buffer
+            return []
 
     def test_connection(self):
         return True
@@ -67,11 +84,8 @@ class BaseSink(ABC):
         if not self.buffer:
             self.buffer_start_time = datetime.now(timezone.utc)
         self.buffer += data
-        if not self.buffer_path or not data:
-            return
-        with open(self.buffer_path, 'a') as fp:
-            for record in data:
-                fp.write(json.dumps(record) + '\n')
+        if self.segment_buffer is not None:
+            self.segment_buffer.append(data)
 
     def _print(self, msg):
         print(f'[{self.__class__.__name__}] {msg}')
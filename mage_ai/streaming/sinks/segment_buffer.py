@@ -0,0 +1,224 @@
+import json
+import os
+import pickle
+import struct
+import threading
+import traceback
+import zlib
+from typing import Dict, List, Tuple
+
+COMMIT_FILE_NAME = 'commit.json'
+# Buffer files written before segments were used contain one JSON record per line.
+LEGACY_BUFFER_SUFFIX = '.legacy'
+SEGMENT_FILE_SUFFIX = '.seg'
+DEFAULT_SEGMENT_SIZE_BYTES = 64 * 1024 * 1024
+
+# Length and CRC32 of the frame payload.
+FRAME_HEADER = struct.Struct('<II')
+
+
+def move_legacy_buffer(path: str) -> str:
+    """
+    Renames the buffer file at the path, written before segments were used, so that the path can
+    be used as a directory. Returns the path of the renamed file.
+    """
+    legacy_path = f'{path}{LEGACY_BUFFER_SUFFIX}'
+    if os.path.isfile(path):
+        os.rename(path, legacy_path)
+    return legacy_path
+
+
+def read_legacy_buffer(legacy_path: str) -> List[Dict]:
+    if not os.path.isfile(legacy_path):
+        return []
+
+    records = []
+    try:
+        with open(legacy_path) as fp:
+            for line in fp:
+                records.append(json.loads(line))
+    except Exception:
+        traceback.print_exc()
+    return records
+
+
+class SegmentBuffer:
+    """
+    Append-only write-ahead buffer of sink records.
+
+    Each `append` writes one length-prefixed, checksummed frame with the pickled batch of
+    records to the current segment file. Segments are rotated once they reach
+    `segment_size_bytes`. `commit` marks the records before an offset as written to the sink:
+    fully committed segments are deleted and the offset is persisted, so recovery only replays
+    the frames after the committed offset. A partially written frame at the end of a segment,
+    e.g. because of a crash, is ignored.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        segment_size_bytes: int = DEFAULT_SEGMENT_SIZE_BYTES,
+        shared_legacy_path: str = None,
+    ):
+        """
+        Args:
+            path (str): The directory of the segments.
+            segment_size_bytes (int): The size of a segment before it's rotated.
+            shared_legacy_path (str): A legacy buffer file shared with other buffers, e.g. the
+                buffer of all the sinks of a pipeline. Its records are appended when the
+                directory of the segments is created, and the file is kept for the other
+                buffers.
+        """
+        self.path = path
+        self.segment_size_bytes = segment_size_bytes
+        self.lock = threading.RLock()
+        self.segment_file = None
+
+        legacy_path = move_legacy_buffer(self.path)
+        legacy_records = read_legacy_buffer(legacy_path)
+        if shared_legacy_path is not None and not os.path.isdir(self.path):
+            legacy_records += read_legacy_buffer(shared_legacy_path)
+        os.makedirs(self.path, exist_ok=True)
+
+        self.committed_offset = self.__read_commit()
+        segments = self.__segments()
+        self.segment = max(segments[-1], self.committed_offset[0]) if segments \
+            else self.committed_offset[0]
+        self.position = self.__valid_length(self.segment)
+
+        if legacy_records:
+            self.append(legacy_records)
+        if os.path.isfile(legacy_path):
+            os.remove(legacy_path)
+
+    @property
+    def offset(self) -> Tuple[int, int]:
+        """
+        Offset after the last appended frame, as (segment, position in segment).
+        """
+        with self.lock:
+            return (self.segment, self.position)
+
+    def append(self, records: List[Dict]) -> None:
+        if not records:
+            return
+        payload = pickle.dumps(records, protocol=pickle.HIGHEST_PROTOCOL)
+        frame = FRAME_HEADER.pack(len(payload), zlib.crc32(payload)) + payload
+        with self.lock:
+            if self.position > 0 and self.position + len(frame) > self.segment_size_bytes:
+                self.__rotate()
+            fp = self.__segment_file()
+            fp.write(frame)
+            fp.flush()
+            self.position += len(frame)
+
+    def commit(self, offset: Tuple[int, int] = None) -> None:
+        """
+        Mark the frames before the offset as committed. Commits everything appended so far if
+        no offset is given.
+        """
+        with self.lock:
+            if offset is None:
+                offset = self.offset
+            segment, position = offset
+            if position > 0 and (segment, position) == self.offset:
+                # Start a new segment so that the current one can be deleted.
+                self.__rotate()
+                segment, position = self.offset
+
+            self.__write_commit((segment, position))
+            self.committed_offset = (segment, position)
+            for s in self.__segments():
+                if s < segment:
+                    os.remove(self.__segment_path(s))
+
+    def read(self) -> List[Dict]:
+        """
+        Returns the records appended after the committed offset.
+        """
+        records = []
+        with self.lock:
+            committed_segment, committed_position = self.committed_offset
+            for segment in self.__segments():
+                if segment < committed_segment:
+                    continue
+                start = committed_position if segment == committed_segment else 0
+                for payload, _ in self.__read_frames(segment, start):
+                    records.extend(pickle.loads(payload))
+        return records
+
+    def close(self) -> None:
+        with self.lock:
+            if self.segment_file is not None:
+                self.segment_file.close()
+                self.segment_file = None
+
+    def __segment_path(self, segment: int) -> str:
+        return os.path.join(self.path, f'{segment:020d}{SEGMENT_FILE_SUFFIX}')
+
+    def __segments(self) -> List[int]:
+        return sorted(
+            int(fn[:-len(SEGMENT_FILE_SUFFIX)]) for fn in os.listdir(self.path)
+            if fn.endswith(SEGMENT_FILE_SUFFIX)
+        )
+
+    def __segment_file(self):
+        if self.segment_file is None:
+            segment_path = self.__segment_path(self.segment)
+            self.segment_file = open(segment_path, 'r+b' if os.path.exists(segment_path) else 'wb')
+            # Overwrite a partially written frame left by a crash.
+            self.segment_file.seek(self.position)
+            self.segment_file.truncate()
+        return self.segment_file
+
+    def __rotate(self) -> None:
+        self.close()
+        self.segment += 1
+        self.position = 0
+
+    def __read_frames(self, segment: int, start: int = 0):
+        """
+        Yields the payload of each complete frame and the position after it. Stops at the first
+        partially written or corrupted frame.
+        """
+        segment_path = self.__segment_path(segment)
+        if not os.path.exists(segment_path):
+            return
+        with open(segment_path, 'rb') as fp:
+            fp.seek(start)
+            position = start
+            while True:
+                header = fp.read(FRAME_HEADER.size)
+                if len(header) < FRAME_HEADER.size:
+                    return
+                length, checksum = FRAME_HEADER.unpack(header)
+                payload = fp.read(length)
+                if len(payload) < length or zlib.crc32(payload) != checksum:
+                    return
+                position += FRAME_HEADER.size + length
+                yield payload, position
+
+    def __valid_length(self, segment: int) -> int:
+        position = 0
+        for _, position in self.__read_frames(segment):
+            pass
+        return position
+
+    def __read_commit(self) -> Tuple[int, int]:
+        commit_path = os.path.join(self.path, COMMIT_FILE_NAME)
+        if not os.path.exists(commit_path):
+            return (0, 0)
+        try:
+            with open(commit_path) as fp:
+                commit = json.load(fp)
+            return (commit['segment'], commit['position'])
+        except Exception:
+            traceback.print_exc()
+            return (0, 0)
+
+    def __write_commit(self, offset: Tuple[int, int]) -> None:
+        commit_path = os.path.join(self.path, COMMIT_FILE_NAME)
+        tmp_path = f'{commit_path}.tmp'
+        with open(tmp_path, 'w') as fp:
+            json.dump(dict(segment=offset[0], position=offset[1]), fp)
+        os.replace(tmp_path, commit_path)
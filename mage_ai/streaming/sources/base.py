@@ -1,7 +1,12 @@
 from abc import ABC, abstractmethod
 from enum import Enum
-from typing import Callable, Dict
-import json
+from typing import Any, Callable, Dict
+
+from mage_ai.streaming.constants import (
+    DEFAULT_CHECKPOINT_INTERVAL_COUNT,
+    DEFAULT_CHECKPOINT_INTERVAL_SECONDS,
+)
+from mage_ai.streaming.sources.checkpoint import CheckpointManager
 
 
 class SourceConsumeMethod(str, Enum):
@@ -13,6 +18,9 @@ class SourceConsumeMethod(str, Enum):
 class BaseSource(ABC):
     config_class = None
     consume_method = SourceConsumeMethod.BATCH_READ
+    # Whether the offsets are checkpointed to the checkpoint file. Sources whose offsets are
+    # stored by the broker commit them in `commit_offsets` instead.
+    checkpoint_to_file = True
 
     def __init__(self, config: Dict, **kwargs):
         if self.config_class is not None:
@@ -20,7 +28,23 @@ class BaseSource(ABC):
                 config.pop('connector_type')
             self.config = self.config_class.load(config=config)
         self.checkpoint_path = kwargs.get('checkpoint_path')
+        config = getattr(self, 'config', None)
+        self.checkpoint_manager = CheckpointManager(
+            checkpoint_path=self.checkpoint_path if self.checkpoint_to_file else None,
+            commit_func=self.commit_offsets,
+            interval_count=getattr(
+                config,
+                'checkpoint_interval_count',
+                DEFAULT_CHECKPOINT_INTERVAL_COUNT,
+            ),
+            interval_seconds=getattr(
+                config,
+                'checkpoint_interval_seconds',
+                DEFAULT_CHECKPOINT_INTERVAL_SECONDS,
+            ),
+        )
         self.checkpoint = self.read_checkpoint()
+        self.paused = False
         self.init_client()
 
     def init_client():
@@ -38,25 +62,41 @@ class BaseSource(ABC):
     def batch_read(self, handler: Callable):
         pass
 
-    def read_checkpoint(self):
-        checkpoint = None
-        if self.checkpoint_path is None:
+    def pause(self):
+        """
+        Stop fetching messages until `resume` is called. It can be called from another thread,
+        so sources apply it in their consuming loop. Sources that don't support pausing are
+        throttled by their handler blocking instead.
+        """
+        self.paused = True
+
+    def resume(self):
+        self.paused = False
+
+    def read_checkpoint(self) -> Dict[str, Any]:
+        """
+        Returns the checkpointed offset of each partition, or None if the source has no
+        checkpoint file.
+        """
+        if self.checkpoint_path is None or not self.checkpoint_to_file:
             return None
-        try:
-            with open(self.checkpoint_path) as fp:
-                checkpoint = json.load(fp)
-        except Exception:
-            pass
-        return checkpoint
-
-    def update_checkpoint(self):
-        if self.checkpoint_path is None or self.checkpoint is None:
-            return
-        try:
-            with open(self.checkpoint_path, 'w') as fp:
-                json.dump(self.checkpoint, fp)
-        except Exception:
-            pass
+        return self.checkpoint_manager.offsets
+
+    def update_checkpoint(self, partition: str, offset: Any):
+        """
+        Record the offset of the last handled message in the partition. The offsets are
+        committed in batches by the checkpoint manager.
+        """
+        self.checkpoint_manager.update(partition, offset)
+
+    def commit_checkpoint(self):
+        """
+        Commit the offsets that haven't been committed yet.
+        """
+        self.checkpoint_manager.commit()
+
+    def commit_offsets(self, offsets: Dict[str, Any]):
+        pass
 
     def test_connection(self):
         return True
@@ -0,0 +1,157 @@
+import json
+import os
+import threading
+import time
+import traceback
+from collections import OrderedDict
+from typing import Any, Callable, Dict
+
+from mage_ai.streaming.constants import (
+    DEFAULT_CHECKPOINT_INTERVAL_COUNT,
+    DEFAULT_CHECKPOINT_INTERVAL_SECONDS,
+)
+
+
+class CheckpointManager:
+    """
+    Keep the latest processed offset of each partition (e.g. a Kafka partition or a Kinesis
+    shard) and commit the offsets in batches.
+
+    Offsets are committed once `interval_count` updates are pending or `interval_seconds` passed
+    since the last commit, instead of on every update. Sources only update an offset after the
+    records before it are handled, so replaying from the committed offsets after a crash is
+    at-least-once. The checkpoint file is written to a temp file and renamed over the previous
+    checkpoint, so it's never partially written. `commit_func` is called with the offsets on
+    each commit, e.g. to commit them to the broker.
+
+    When the batches are handled asynchronously (e.g. through a batch queue), `start_batch` is
+    called before a batch is handed over and `complete_batch` once it's handled. The offsets
+    updated after `start_batch` belong to that batch, and are only committed once the batch and
+    all the batches started before it are completed. After `fail` is called, nothing is
+    committed anymore.
+    """
+
+    def __init__(
+        self,
+        checkpoint_path: str = None,
+        commit_func: Callable[[Dict[str, Any]], None] = None,
+        interval_count: int = DEFAULT_CHECKPOINT_INTERVAL_COUNT,
+        interval_seconds: float = DEFAULT_CHECKPOINT_INTERVAL_SECONDS,
+    ):
+        self.checkpoint_path = checkpoint_path
+        self.commit_func = commit_func
+        self.interval_count = interval_count
+        self.interval_seconds = interval_seconds
+
+        self.lock = threading.Lock()
+        self.offsets = self.__read()
+        self.last_commit_time = time.monotonic()
+        self.pending_count = 0
+
+        # The offsets of the started batches that aren't committable yet, by batch ID.
+        self.batches = OrderedDict()
+        self.batch_count = 0
+        self.failed = False
+
+    def get(self, partition: str) -> Any:
+        return self.offsets.get(str(partition))
+
+    def update(self, partition: str, offset: Any) -> bool:
+        """
+        Set the offset of the partition. Returns whether the offsets were committed.
+        """
+        with self.lock:
+            # The offsets of the latest batch are applied once it and the batches before it
+            # are completed. Afterwards, the offsets are applied right away.
+            if self.batch_count in self.batches:
+                self.batches[self.batch_count]['offsets'][str(partition)] = offset
+                return False
+            self.offsets[str(partition)] = offset
+            self.pending_count += 1
+            return self.__commit_if_due()
+
+    def start_batch(self) -> int:
+        """
+        Returns the ID of a new batch. The offsets updated until the next batch is started
+        belong to this batch.
+        """
+        with self.lock:
+            self.batch_count += 1
+            self.batches[self.batch_count] = dict(completed=False, offsets=dict())
+            return self.batch_count
+
+    def complete_batch(self, batch_id: int) -> bool:
+        """
+        Mark the batch as handled and apply the offsets of the completed batches that aren't
+        preceded by an uncompleted batch. Returns whether the offsets were committed.
+        """
+        with self.lock:
+            if batch_id not in self.batches:
+                return False
+            self.batches[batch_id]['completed'] = True
+            while self.batches:
+                first_batch_id, batch = next(iter(self.batches.items()))
+                if not batch['completed']:
+                    break
+                self.batches.pop(first_batch_id)
+                self.offsets.update(batch['offsets'])
+                self.pending_count += len(batch['offsets'])
+            return self.__commit_if_due()
+
+    def fail(self) -> None:
+        """
+        Stop committing offsets, e.g. after a batch failed, so that the records of the failed
+        batch and of the batches after it are read again.
+        """
+        with self.lock:
+            self.failed = True
+            self.batches.clear()
+
+    def commit(self) -> None:
+        """
+        Commit the pending offsets, e.g. before the source stops.
+        """
+        with self.lock:
+            if self.pending_count > 0 and not self.failed:
+                self.__commit()
+
+    def __commit_if_due(self) -> bool:
+        if self.failed or self.pending_count == 0:
+            return False
+        if self.pending_count < max(self.interval_count, 1) and \
+                time.monotonic() - self.last_commit_time < self.interval_seconds:
+            return False
+        self.__commit()
+        return True
+
+    def __commit(self) -> None:
+        offsets = dict(self.offsets)
+        if self.commit_func is not None:
+            self.commit_func(offsets)
+        if self.checkpoint_path is not None:
+            self.__write(offsets)
+        self.last_commit_time = time.monotonic()
+        self.pending_count = 0
+
+    def __read(self) -> Dict[str, Any]:
+        if self.checkpoint_path is None or not os.path.exists(self.checkpoint_path):
+            return dict()
+        try:
+            with open(self.checkpoint_path) as fp:
+                checkpoint = json.load(fp)
+            if type(checkpoint) is dict:
+                return checkpoint
+        except Exception:
+            traceback.print_exc()
+        return dict()
+
+    def __write(self, offsets: Dict[str, Any]) -> None:
+        tmp_path = f'{self.checkpoint_path}.tmp'
+        try:
+            with open(tmp_path, 'w') as fp:
+                json.dump(offsets, fp)
+                fp.flush()
+                os.fsync(fp.fileno())
+            os.replace(tmp_path, self.checkpoint_path)
+        except Exception:
+            traceback.print_exc()
@@ -1,14 +1,21 @@
 import importlib
 import json
+import threading
 import time
 from dataclasses import dataclass
 from enum import Enum
 from typing import Callable, Dict
 
 from kafka import KafkaConsumer
+from kafka.structs import OffsetAndMetadata, TopicPartition
 
 from mage_ai.shared.config import BaseConfig
-from mage_ai.streaming.constants import DEFAULT_BATCH_SIZE, DEFAULT_TIMEOUT_MS
+from mage_ai.streaming.constants import (
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_CHECKPOINT_INTERVAL_COUNT,
+    DEFAULT_CHECKPOINT_INTERVAL_SECONDS,
+    DEFAULT_TIMEOUT_MS,
+)
 from mage_ai.streaming.sources.base import BaseSource
 from mage_ai.streaming.sources.shared import SerDeConfig, SerializationMethod
 
@@ -42,6 +49,11 @@ class KafkaConfig(BaseConfig):
     api_version: str = '0.10.2'
     batch_size: int = DEFAULT_BATCH_SIZE
     timeout_ms: int = DEFAULT_TIMEOUT_MS
+    # With auto commit disabled, the offsets of the handled messages are committed to the
+    # consumer group in batches.
+    enable_auto_commit: bool = True
+    checkpoint_interval_count: int = DEFAULT_CHECKPOINT_INTERVAL_COUNT
+    checkpoint_interval_seconds: float = DEFAULT_CHECKPOINT_INTERVAL_SECONDS
     security_protocol: SecurityProtocol = None
     ssl_config: SSLConfig = None
     sasl_config: SASLConfig = None
@@ -62,8 +74,16 @@ class KafkaConfig(BaseConfig):
 
 
 class KafkaSource(BaseSource):
+    checkpoint_to_file = False
     config_class = KafkaConfig
 
+    def __init__(self, config: Dict, **kwargs):
+        # The offsets to commit on the consuming thread. KafkaConsumer isn't thread-safe, and
+        # the offsets can be checkpointed by the thread that handles the batches.
+        self.offsets_to_commit = dict()
+        self.offsets_lock = threading.Lock()
+        super().__init__(config, **kwargs)
+
     def init_client(self):
         self._print('Start initializing consumer.')
         # Initialize kafka consumer
@@ -71,7 +91,7 @@ class KafkaSource(BaseSource):
             group_id=self.config.consumer_group,
             bootstrap_servers=self.config.bootstrap_server,
             api_version=self.config.api_version,
-            enable_auto_commit=True,
+            enable_auto_commit=self.config.enable_auto_commit,
         )
         if self.config.security_protocol == SecurityProtocol.SSL:
             consumer_kwargs['security_protocol'] = SecurityProtocol.SSL
@@ -146,27 +166,74 @@ class KafkaSource(BaseSource):
         else:
             timeout_ms = DEFAULT_TIMEOUT_MS
 
-        while True:
-            # Response format is {TopicPartiton('topic1', 1): [msg1, msg2]}
-            msg_pack = self.consumer.poll(
-                max_records=batch_size,
-                timeout_ms=timeout_ms,
-            )
-
-            message_values = []
-            msg_printed = False
-            for _tp, messages in msg_pack.items():
-                for message in messages:
-                    if not msg_printed:
-                        self.__print_message(message)
-                        msg_printed = True
-                    message_values.append(self.__deserialize_message(message.value))
-            if len(message_values) > 0:
-                handler(message_values)
+        try:
+            while True:
+                self.__update_paused_partitions()
+                self.__commit_offsets()
+                # Response format is {TopicPartiton('topic1', 1): [msg1, msg2]}
+                msg_pack = self.consumer.poll(
+                    max_records=batch_size,
+                    timeout_ms=timeout_ms,
+                )
+
+                message_values = []
+                msg_printed = False
+                for _tp, messages in msg_pack.items():
+                    for message in messages:
+                        if not msg_printed:
+                            self.__print_message(message)
+                            msg_printed = True
+                        message_values.append(self.__deserialize_message(message.value))
+                if len(message_values) > 0:
+                    handler(message_values)
+                    if not self.config.enable_auto_commit:
+                        for tp, messages in msg_pack.items():
+                            if not messages:
+                                continue
+                            # The committed offset is the offset of the next message to read.
+                            self.update_checkpoint(
+                                f'{tp.topic}:{tp.partition}',
+                                messages[-1].offset + 1,
+                            )
+        finally:
+            if not self.config.enable_auto_commit:
+                # Only the offsets of the handled batches are committed, and nothing is
+                # committed after a batch failed.
+                self.commit_checkpoint()
+                self.__commit_offsets()
+
+    def commit_offsets(self, offsets: Dict[str, int]):
+        # Committed by the consuming loop, before the next poll.
+        with self.offsets_lock:
+            self.offsets_to_commit.update(offsets)
 
     def test_connection(self):
         return True
 
+    def __commit_offsets(self):
+        with self.offsets_lock:
+            offsets = self.offsets_to_commit
+            self.offsets_to_commit = dict()
+        if not offsets:
+            return
+        commit_offsets = dict()
+        for partition, offset in offsets.items():
+            topic, partition = partition.rsplit(':', 1)
+            commit_offsets[TopicPartition(topic, int(partition))] = \
+                OffsetAndMetadata(offset, None)
+        self.consumer.commit(commit_offsets)
+
+    def __update_paused_partitions(self):
+        # The consumer keeps polling while its partitions are paused, so that it stays in the
+        # consumer group.
+        paused_partitions = self.consumer.paused()
+        if self.paused:
+            partitions = self.consumer.assignment() - paused_partitions
+            if partitions:
+                self.consumer.pause(*partitions)
+        elif paused_partitions:
+            self.consumer.resume(*paused_partitions)
+
     def __deserialize_message(self, message):
         if self.config.serde_config is None:
             return self.__deserialize_json(message)
@@ -1,6 +1,10 @@
 from dataclasses import dataclass
 from mage_ai.shared.config import BaseConfig
-from mage_ai.streaming.constants import DEFAULT_BATCH_SIZE
+from mage_ai.streaming.constants import (
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_CHECKPOINT_INTERVAL_COUNT,
+    DEFAULT_CHECKPOINT_INTERVAL_SECONDS,
+)
 from mage_ai.streaming.sources.base import BaseSource
 from typing import Callable
 import boto3
@@ -11,6 +15,8 @@ import json
 class KinesisConfig(BaseConfig):
     stream_name: str
     batch_size: int = DEFAULT_BATCH_SIZE
+    checkpoint_interval_count: int = DEFAULT_CHECKPOINT_INTERVAL_COUNT
+    checkpoint_interval_seconds: float = DEFAULT_CHECKPOINT_INTERVAL_SECONDS
 
 
 class KinesisSource(BaseSource):
@@ -42,10 +48,11 @@ class KinesisSource(BaseSource):
                 iterator_kwargs = dict(
                     ShardIteratorType='LATEST',
                 )
-                if self.checkpoint is not None and self.checkpoint.get(shard_id):
+                sequence_number = self.checkpoint_manager.get(shard_id)
+                if sequence_number:
                     iterator_kwargs = dict(
                         ShardIteratorType='AFTER_SEQUENCE_NUMBER',
-                        StartingSequenceNumber=self.checkpoint.get(shard_id),
+                        StartingSequenceNumber=sequence_number,
                     )
                 self._print(f'Shard {shard_id} args: {iterator_kwargs}')
                 shard_iterator = self.kinesis_client.get_shard_iterator(
@@ -74,20 +81,24 @@ class KinesisSource(BaseSource):
                         self._print(f'Got {len(records)} records from shard {shard_id}. '
                                     f'Sample: {records[0]}')
                         handler([json.loads(r['Data'].decode('utf-8')) for r in records])
-                        max_seq_number = max(r['SequenceNumber'] for r in records)
-                        self.update_checkpoint(shard_id, max_seq_number)
+                        self.update_checkpoint(
+                            shard_id,
+                            max((r['SequenceNumber'] for r in records), key=int),
+                        )
                 if len(closed_streams) == len(shard_iterators):
                     self._print(f'All shards {list(shard_iterators.keys())} are closed.')
                     break
         except Exception:
             self._print(f'Couldn\'t get records from stream {self.config.stream_name}.')
             raise
+        finally:
+            # Only the sequence numbers of the handled batches are committed, and nothing is
+            # committed after a batch failed.
+            self.commit_checkpoint()
 
     def update_checkpoint(self, shard_id, sequence_number):
-        if self.checkpoint is None:
-            self.checkpoint = {}
-        if not self.checkpoint.get(shard_id):
-            self.checkpoint[shard_id] = sequence_number
-        elif sequence_number > self.checkpoint.get(shard_id):
-            self.checkpoint[shard_id] = sequence_number
-        super().update_checkpoint()
+        # Sequence numbers are strings of digits with varying lengths.
+        current_sequence_number = self.checkpoint_manager.get(shard_id)
+        if current_sequence_number and int(sequence_number) <= int(current_sequence_number):
+            return
+        super().update_checkpoint(shard_id, sequence_number)
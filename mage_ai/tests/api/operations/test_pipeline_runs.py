@@ -0,0 +1,106 @@
+from datetime import datetime
+
+from mage_ai.api.operations.constants import META_KEY_CURSOR, META_KEY_LIMIT
+from mage_ai.api.resources.PipelineRunResource import count_cache
+from mage_ai.orchestration.db.models.schedules import BlockRun, PipelineRun
+from mage_ai.tests.api.operations.test_base import BaseApiTestCase
+from mage_ai.tests.factory import (
+    create_pipeline_run_with_schedule,
+    create_pipeline_with_blocks,
+)
+
+
+class PipelineRunOperationTests(BaseApiTestCase):
+    model_class = PipelineRun
+
+    @property
+    def model_class_name(self) -> str:
+        return 'pipeline_run'
+
+    @classmethod
+    def setUpClass(self):
+        super().setUpClass()
+        self.pipeline = create_pipeline_with_blocks('test pipeline runs', self.repo_path)
+
+    def setUp(self):
+        super().setUp()
+        count_cache.clear()
+        pipeline_run = create_pipeline_run_with_schedule(
+            pipeline_uuid=self.pipeline.uuid,
+            execution_date=datetime(2023, 1, 1),
+        )
+        self.pipeline_runs = [pipeline_run]
+        for execution_date in [
+            datetime(2023, 1, 2),
+            datetime(2023, 1, 2),
+            datetime(2023, 1, 3),
+            None,
+        ]:
+            self.pipeline_runs.append(create_pipeline_run_with_schedule(
+                pipeline_uuid=self.pipeline.uuid,
+                execution_date=execution_date,
+                pipeline_schedule_id=pipeline_run.pipeline_schedule_id,
+            ))
+        self.pipeline_runs[0].block_runs[0].update(status='completed')
+
+    def tearDown(self):
+        BlockRun.query.delete()
+        PipelineRun.query.delete()
+        super().tearDown()
+
+    async def test_execute_list_with_cursor(self):
+        pipeline_run_ids = []
+        cursor = ''
+        while cursor is not None:
+            response = await self.build_list_operation(
+                meta={META_KEY_CURSOR: cursor, META_KEY_LIMIT: 2},
+                query=dict(pipeline_uuid=[self.pipeline.uuid]),
+            ).execute()
+            pipeline_run_ids += [r['id'] for r in response['pipeline_runs']]
+            self.assertEqual(response['metadata']['count'], 5)
+            cursor = response['metadata']['next_cursor']
+            self.assertEqual(response['metadata']['next'], cursor is not None)
+
+        expected_ids = [r.id for r in sorted(
+            self.pipeline_runs[:4],
+            key=lambda r: (r.execution_date, r.id),
+            reverse=True,
+        )] + [self.pipeline_runs[4].id]
+        self.assertEqual(pipeline_run_ids, expected_ids)
+
+    async def test_execute_list_summary(self):
+        response = await self.build_list_operation(
+            meta={META_KEY_CURSOR: '', META_KEY_LIMIT: 10},
+            query=dict(pipeline_uuid=[self.pipeline.uuid], summary=['true']),
+        ).execute()
+
+        pipeline_runs = {r['id']: r for r in response['pipeline_runs']}
+        pipeline_run = pipeline_runs[self.pipeline_runs[0].id]
+        self.assertNotIn('block_runs', pipeline_run)
+        self.assertEqual(pipeline_run['block_runs_count'], 4)
+        self.assertEqual(
+            pipeline_run['block_run_status_counts'],
+            dict(completed=1, initial=3),
+        )
+        self.assertEqual(
+            pipeline_runs[self.pipeline_runs[1].id]['block_run_status_counts'],
+            dict(initial=4),
+        )
+
+    async def test_execute_list_summary_false(self):
+        for value in ['false', '0']:
+            response = await self.build_list_operation(
+                meta={META_KEY_CURSOR: '', META_KEY_LIMIT: 10},
+                query=dict(pipeline_uuid=[self.pipeline.uuid], summary=[value]),
+            ).execute()
+
+            pipeline_runs = {r['id']: r for r in response['pipeline_runs']}
+            pipeline_run = pipeline_runs[self.pipeline_runs[0].id]
+            self.assertNotIn('block_run_status_counts', pipeline_run)
+            self.assertEqual(len(pipeline_run['block_runs']), 4)
+
+    async def test_execute_list_invalid_cursor(self):
+        response = await self.build_list_operation(
+            meta={META_KEY_CURSOR: 'invalid', META_KEY_LIMIT: 2},
+        ).execute()
+        self.assertIn('error', response)
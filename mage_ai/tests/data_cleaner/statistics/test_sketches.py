@@ -0,0 +1,147 @@
+import numpy as np
+import pandas as pd
+
+from mage_ai.data_cleaner.column_types.constants import ColumnType
+from mage_ai.data_cleaner.statistics.calculator import StatisticsCalculator
+from mage_ai.data_cleaner.statistics.constants import ProfilingMode
+from mage_ai.data_cleaner.statistics.sketches import (
+    ColumnProfile,
+    CountMinSketch,
+    DataFrameProfile,
+    HyperLogLog,
+    Moments,
+    TDigest,
+    hash_values,
+)
+from mage_ai.tests.base_test import TestCase
+
+
+class SketchesTest(TestCase):
+    def test_hyper_log_log(self):
+        sketch = HyperLogLog()
+        self.assertEqual(sketch.count(), 0)
+        sketch.add_hashes(hash_values(pd.Series(['a', 'b', 'a', 'c'])))
+        self.assertEqual(sketch.count(), 3)
+
+        sketch1 = HyperLogLog()
+        sketch2 = HyperLogLog()
+        sketch1.add_hashes(hash_values(pd.Series(np.arange(0, 60000))))
+        sketch2.add_hashes(hash_values(pd.Series(np.arange(40000, 100000))))
+        sketch1.merge(sketch2)
+        self.assertAlmostEqual(sketch1.count(), 100000, delta=3000)
+
+    def test_tdigest(self):
+        values = np.random.default_rng(0).normal(size=100000)
+        digest = TDigest()
+        for chunk in np.array_split(values, 4):
+            other = TDigest()
+            other.update(chunk)
+            digest.merge(other)
+
+        self.assertLess(len(digest.means), 1000)
+        self.assertEqual(digest.total_weight, 100000)
+        for q in [0.01, 0.25, 0.5, 0.75, 0.99]:
+            self.assertAlmostEqual(digest.quantile(q), np.quantile(values, q), delta=0.02)
+        self.assertEqual(digest.quantile(0), values.min())
+        self.assertEqual(digest.quantile(1), values.max())
+
+        digest = TDigest()
+        digest.update(np.array([1, 2, 3, 4, np.nan]))
+        self.assertEqual(digest.quantile(0.5), 2.5)
+
+    def test_count_min_sketch(self):
+        rng = np.random.default_rng(0)
+        values = pd.Series(np.concatenate([
+            np.repeat(['a', 'b', 'c'], [5000, 3000, 1000]),
+            rng.integers(0, 100000, 50000).astype(str),
+        ])).sample(frac=1, random_state=0)
+        sketch = CountMinSketch()
+        for chunk in np.array_split(values, 5):
+            sketch.update(chunk, hash_values(chunk))
+
+        heavy_hitters = sketch.heavy_hitters(3)
+        self.assertEqual([value for value, _ in heavy_hitters], ['a', 'b', 'c'])
+        for (_, count), expected in zip(heavy_hitters, [5000, 3000, 1000]):
+            self.assertGreaterEqual(count, expected)
+            self.assertLess(count, expected + 200)
+
+    def test_moments(self):
+        values = np.random.default_rng(0).exponential(size=1000) + 1e9
+        moments = Moments()
+        for chunk in np.array_split(values, 3):
+            moments.update(chunk)
+        series = pd.Series(values)
+        self.assertAlmostEqual(moments.mean, series.mean())
+        self.assertAlmostEqual(moments.std(), series.std())
+        self.assertAlmostEqual(moments.skew(), series.skew(), places=6)
+
+    def test_column_profile_null_sequences(self):
+        series = pd.Series([None, None, 1, None, None, None, 2, 3, None, None])
+        for split in range(len(series) + 1):
+            profile = ColumnProfile(ColumnType.NUMBER)
+            profile.update(series.iloc[:split])
+            other = ColumnProfile(ColumnType.NUMBER)
+            other.update(series.iloc[split:])
+            profile.merge(other)
+            self.assertEqual(profile.longest_null_sequence, 3)
+            self.assertEqual(profile.leading_null_count, 2)
+            self.assertEqual(profile.trailing_null_count, 2)
+            self.assertEqual(profile.null_count, 7)
+            self.assertEqual(profile.count, 3)
+
+    def test_data_frame_profile_duplicate_row_count(self):
+        df = pd.DataFrame(dict(a=[1, 2, 1, 1], b=['x', 'y', 'x', 'z']))
+        profile = DataFrameProfile(dict(a=ColumnType.NUMBER, b=ColumnType.CATEGORY))
+        profile.update(df.iloc[:2])
+        other = DataFrameProfile(dict(a=ColumnType.NUMBER, b=ColumnType.CATEGORY))
+        other.update(df.iloc[2:])
+        profile.merge(other)
+        self.assertEqual(profile.duplicate_row_count(), 1)
+        self.assertEqual(profile.row_count, 4)
+
+    def test_calculate_statistics_overview_sketch(self):
+        rng = np.random.default_rng(0)
+        df = pd.DataFrame(dict(
+            amount=rng.normal(100, 10, 5000),
+            category=rng.choice(['a', 'b', 'c'], 5000, p=[0.6, 0.3, 0.1]),
+            created_at=pd.Timestamp('2023-01-01') + pd.to_timedelta(
+                rng.integers(0, 86400, 5000),
+                unit='s',
+            ),
+        ))
+        df.loc[10:14, 'amount'] = np.nan
+        column_types = dict(
+            amount=ColumnType.NUMBER_WITH_DECIMALS,
+            category=ColumnType.CATEGORY,
+            created_at=ColumnType.DATETIME,
+        )
+
+        full = StatisticsCalculator(column_types).process(df)
+        sketch = StatisticsCalculator(
+            column_types,
+            profiling_mode=ProfilingMode.SKETCH,
+        ).process(df)
+
+        for key in [
+            'amount/count',
+            'amount/count_distinct',
+            'amount/null_value_count',
+            'amount/max_null_seq',
+            'amount/max',
+            'amount/min',
+            'category/count_distinct',
+            'category/mode',
+            'category/mode_ratio',
+            'created_at/max',
+            'created_at/min',
+            'duplicate_row_count',
+            'total_null_value_count',
+        ]:
+            self.assertEqual(sketch[key], full[key], key)
+        for key in ['amount/average', 'amount/std', 'amount/skew', 'amount/sum']:
+            self.assertAlmostEqual(sketch[key], full[key], places=6, msg=key)
+        self.assertAlmostEqual(sketch['amount/median'], full['amount/median'], delta=0.2)
+        self.assertEqual(
+            list(sketch['category/value_counts'].items()),
+            list(full['category/value_counts'].items()),
+        )
@@ -355,6 +355,26 @@ class ColumnTypeDetectorTests(TestCase):
         for col in ctypes:
             self.assertEqual(ctypes[col], ColumnType.DATETIME)
 
+    def test_infer_column_types_repeated_and_quoted_values(self):
+        df = pd.DataFrame(
+            dict(
+                category=['a', ' "b" ', 'c', '', None, 'a'] * 100,
+                emails=['fire@mage.ai', "'mage@fire.com'", 'n/a', 'none', 'null', ''] * 100,
+                mixed_numbers=[1, '2', ' 3 ', 4.0, '5', None] * 100,
+                quoted_booleans=['"yes"', 'yes', ' no ', '', None, 'no'] * 100,
+            )
+        )
+        ctypes = infer_column_types(df)
+        self.assertEqual(
+            ctypes,
+            dict(
+                category=ColumnType.CATEGORY,
+                emails=ColumnType.EMAIL,
+                mixed_numbers=ColumnType.NUMBER,
+                quoted_booleans=ColumnType.TRUE_OR_FALSE,
+            ),
+        )
+
     def __build_test_df(self):
         columns = [
             'true_or_false',
@@ -560,3 +580,20 @@ class ColumnTypeDetectorTests(TestCase):
             not_a_list=ColumnType.TEXT,
         )
         self.assertEqual(ctypes, expected_ctypes)
+
+    def test_infer_column_types_mixed_values(self):
+        df = pd.DataFrame(
+            {
+                'strings_and_tuple': ['abc', 'def', 'ghi', ('a', 'b'), 'jkl'],
+                # 1 and True are equal but their strings differ.
+                'numbers_and_booleans': [2.5, 1, True, '1', np.nan],
+                'integers_and_floats': [1, 1.0, 2, 3, 4],
+            }
+        )
+        ctypes = infer_column_types(df)
+        expected_ctypes = {
+            'strings_and_tuple': ColumnType.TEXT,
+            'numbers_and_booleans': ColumnType.CATEGORY,
+            'integers_and_floats': ColumnType.NUMBER,
+        }
+        self.assertEqual(ctypes, expected_ctypes)
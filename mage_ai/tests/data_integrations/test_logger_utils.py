@@ -0,0 +1,32 @@
+import json
+
+from mage_ai.data_integrations.logger.utils import is_log_line
+from mage_ai.tests.base_test import TestCase
+
+
+class LoggerUtilsTest(TestCase):
+    def test_is_log_line(self):
+        record = json.dumps(dict(
+            type='RECORD',
+            stream='users',
+            record=dict(level='ERROR', message='LOG'),
+        ))
+        state = json.dumps(dict(type='STATE', value=dict(bookmarks=dict(users=dict(id=1)))))
+        log = json.dumps(dict(
+            caller='Source',
+            level='INFO',
+            message='Syncing stream users.',
+            type='LOG',
+        ))
+        for line, expected in [
+            (record, False),
+            (state, False),
+            (json.dumps(dict(type='RECORD', record=dict(id=1))), False),
+            (json.dumps(dict(type='RECORD', record=dict(level=1))), True),
+            (log, True),
+            (json.dumps(dict(level='ERROR', message='Failed.')), True),
+            (' [1, 2]', True),
+            ('Not JSON', False),
+        ]:
+            self.assertEqual(is_log_line(line), expected, line)
+            self.assertEqual(is_log_line(line.encode()), expected, line)
@@ -0,0 +1,210 @@
+import json
+import os
+from unittest.mock import MagicMock, patch
+
+from mage_ai.data_preparation.executors.streaming_pipeline_executor import (
+    StreamingPipelineExecutor,
+)
+from mage_ai.data_preparation.models.block import Block
+from mage_ai.data_preparation.models.constants import PipelineType
+from mage_ai.data_preparation.models.pipeline import Pipeline
+from mage_ai.streaming.sinks.dummy import DummySink
+from mage_ai.streaming.sinks.segment_buffer import SegmentBuffer
+from mage_ai.streaming.sources.base import SourceConsumeMethod
+from mage_ai.tests.base_test import DBTestCase
+
+TRANSFORMER_CODE = """
+@transformer
+def transform(messages, *args, **kwargs):
+    for message in messages:
+        message['value'] += {increment}
+    return messages
+"""
+
+
+class StreamingPipelineExecutorTest(DBTestCase):
+    def test_execute(self):
+        self.__test_execute('streaming pipeline')
+
+    def test_execute_concurrently(self):
+        self.__test_execute(
+            'streaming pipeline concurrent',
+            executor_config=dict(
+                streaming_execution_config=dict(
+                    high_watermark_records=4,
+                    low_watermark_records=2,
+                    max_in_flight_batches=2,
+                    max_in_flight_records=6,
+                    max_workers=3,
+                ),
+            ),
+        )
+
+    def test_execute_sink_buffers(self):
+        pipeline = Pipeline.create(
+            'streaming pipeline sink buffers',
+            pipeline_type=PipelineType.STREAMING,
+            repo_path=self.repo_path,
+        )
+        source = Block.create(f'{pipeline.uuid}_source', 'data_loader', self.repo_path,
+                              language='yaml')
+        transformer = Block.create(f'{pipeline.uuid}_transformer', 'transformer',
+                                   self.repo_path, language='python')
+        source.update_content('connector_type: kafka\n')
+        transformer.update_content(TRANSFORMER_CODE.format(increment=1))
+        sink_blocks = [
+            Block.create(f'{pipeline.uuid}_sink{i}', 'data_exporter', self.repo_path,
+                         language='yaml')
+            for i in range(2)
+        ]
+        for sink_block in sink_blocks:
+            sink_block.update_content('connector_type: dummy\nprint_msg: false\n')
+        pipeline.add_block(source)
+        pipeline.add_block(transformer, upstream_block_uuids=[source.uuid])
+        pipeline.add_block(sink_blocks[0], upstream_block_uuids=[source.uuid])
+        pipeline.add_block(sink_blocks[1], upstream_block_uuids=[transformer.uuid])
+
+        mock_source = MagicMock()
+        mock_source.consume_method = SourceConsumeMethod.BATCH_READ
+        mock_source.batch_read = lambda handler: handler([dict(value=1)])
+
+        with patch(
+            'mage_ai.streaming.sources.source_factory.SourceFactory.get_source',
+            return_value=mock_source,
+        ):
+            # Keep the records in the buffers, like a sink that failed to upload them.
+            with patch.object(DummySink, 'batch_write', DummySink.write_buffer):
+                StreamingPipelineExecutor(pipeline).execute()
+
+        buffer_dir = os.path.join(pipeline.pipeline_variables_dir, 'buffer')
+        self.assertEqual(
+            sorted(os.listdir(buffer_dir)),
+            sorted(sink_block.uuid for sink_block in sink_blocks),
+        )
+        self.assertEqual(
+            SegmentBuffer(os.path.join(buffer_dir, sink_blocks[0].uuid)).read(),
+            [dict(value=1)],
+        )
+        self.assertEqual(
+            SegmentBuffer(os.path.join(buffer_dir, sink_blocks[1].uuid)).read(),
+            [dict(value=2)],
+        )
+
+    def test_execute_legacy_sink_buffer(self):
+        pipeline = Pipeline.create(
+            'streaming pipeline legacy buffer',
+            pipeline_type=PipelineType.STREAMING,
+            repo_path=self.repo_path,
+        )
+        source = Block.create(f'{pipeline.uuid}_source', 'data_loader', self.repo_path,
+                              language='yaml')
+        source.update_content('connector_type: kafka\n')
+        sink_blocks = [
+            Block.create(f'{pipeline.uuid}_sink{i}', 'data_exporter', self.repo_path,
+                         language='yaml')
+            for i in range(2)
+        ]
+        for sink_block in sink_blocks:
+            sink_block.update_content('connector_type: dummy\nprint_msg: false\n')
+        pipeline.add_block(source)
+        for sink_block in sink_blocks:
+            pipeline.add_block(sink_block, upstream_block_uuids=[source.uuid])
+
+        # The JSON lines buffer file shared by the sinks before each sink had its own buffer.
+        buffer_dir = os.path.join(pipeline.pipeline_variables_dir, 'buffer')
+        os.makedirs(pipeline.pipeline_variables_dir, exist_ok=True)
+        with open(buffer_dir, 'w') as fp:
+            fp.write(json.dumps(dict(value=0)) + '\n')
+
+        mock_source = MagicMock()
+        mock_source.consume_method = SourceConsumeMethod.BATCH_READ
+        mock_source.batch_read = lambda handler: handler([dict(value=1)])
+
+        with patch(
+            'mage_ai.streaming.sources.source_factory.SourceFactory.get_source',
+            return_value=mock_source,
+        ):
+            with patch.object(DummySink, 'batch_write', DummySink.write_buffer):
+                StreamingPipelineExecutor(pipeline).execute()
+
+        self.assertEqual(
+            sorted(os.listdir(buffer_dir)),
+            sorted(sink_block.uuid for sink_block in sink_blocks),
+        )
+        self.assertFalse(os.path.exists(f'{buffer_dir}.legacy'))
+        for sink_block in sink_blocks:
+            self.assertEqual(
+                SegmentBuffer(os.path.join(buffer_dir, sink_block.uuid)).read(),
+                [dict(value=0), dict(value=1)],
+            )
+
+    def __test_execute(self, name: str, executor_config=None):
+        pipeline = Pipeline.create(
+            name,
+            pipeline_type=PipelineType.STREAMING,
+            repo_path=self.repo_path,
+        )
+        if executor_config:
+            pipeline.executor_config = executor_config
+        source = Block.create(f'{pipeline.uuid}_source', 'data_loader', self.repo_path,
+                              language='yaml')
+        transformer1 = Block.create(f'{pipeline.uuid}_transformer1', 'transformer',
+                                    self.repo_path, language='python')
+        transformer2 = Block.create(f'{pipeline.uuid}_transformer2', 'transformer',
+                                    self.repo_path, language='python')
+        source.update_content('connector_type: kafka\n')
+        transformer1.update_content(TRANSFORMER_CODE.format(increment=1))
+        transformer2.update_content(TRANSFORMER_CODE.format(increment=10))
+        sink_blocks = [
+            Block.create(f'{pipeline.uuid}_sink{i}', 'data_exporter', self.repo_path,
+                         language='yaml')
+            for i in range(3)
+        ]
+        for sink_block in sink_blocks:
+            sink_block.update_content('connector_type: opensearch\n')
+        pipeline.add_block(source)
+        pipeline.add_block(transformer1, upstream_block_uuids=[source.uuid])
+        pipeline.add_block(transformer2, upstream_block_uuids=[source.uuid])
+        pipeline.add_block(sink_blocks[0], upstream_block_uuids=[transformer1.uuid])
+        pipeline.add_block(sink_blocks[1], upstream_block_uuids=[transformer2.uuid])
+        pipeline.add_block(sink_blocks[2], upstream_block_uuids=[source.uuid])
+
+        batches = [[dict(value=i), dict(value=i + 100)] for i in range(5)]
+
+        def batch_read(handler):
+            for batch in batches:
+                handler(batch)
+
+        mock_source = MagicMock()
+        mock_source.consume_method = SourceConsumeMethod.BATCH_READ
+        mock_source.batch_read = batch_read
+        written_by_sink = [[] for _ in sink_blocks]
+        mock_sinks = []
+        for written in written_by_sink:
+            mock_sink = MagicMock()
+            mock_sink.batch_write = written.append
+            mock_sinks.append(mock_sink)
+
+        with patch(
+            'mage_ai.streaming.sources.source_factory.SourceFactory.get_source',
+            return_value=mock_source,
+        ):
+            with patch(
+                'mage_ai.streaming.sinks.sink_factory.SinkFactory.get_sink',
+                side_effect=mock_sinks,
+            ):
+                StreamingPipelineExecutor(pipeline).execute()
+
+        def values(written):
+            return [[m['value'] for m in batch] for batch in written]
+
+        original_values = [[m['value'] for m in batch] for batch in batches]
+        self.assertEqual(
+            values(written_by_sink[0]),
+            [[v + 1 for v in batch] for batch in original_values],
+        )
+        self.assertEqual(
+            values(written_by_sink[1]),
+            [[v + 10 for v in batch] for batch in original_values],
+        )
+        self.assertEqual(values(written_by_sink[2]), original_values)
@@ -0,0 +1,129 @@
+import logging
+import os
+import shutil
+import tempfile
+import time
+
+from mage_ai.data_preparation.logging.log_index import (
+    IndexedRotatingFileHandler,
+    LogFilter,
+    filter_log_content,
+    index_filepath,
+    load_log_index,
+    read_log_file,
+)
+from mage_ai.data_preparation.logging.logger import DictLogger
+from mage_ai.tests.base_test import TestCase
+
+
+class LogIndexTest(TestCase):
+    def setUp(self):
+        super().setUp()
+        self.logs_dir = tempfile.mkdtemp()
+        self.log_filepath = os.path.join(self.logs_dir, 'pipeline.log')
+        self.handlers = []
+
+    def tearDown(self):
+        for logger, handler in self.handlers:
+            logger.removeHandler(handler)
+            handler.close()
+        shutil.rmtree(self.logs_dir)
+        super().tearDown()
+
+    def test_read_log_file(self):
+        logger = self.__build_logger('test_read_log_file')
+        for i in range(10):
+            if i % 3 == 0:
+                logger.error(f'error {i}')
+            else:
+                logger.info(f'info {i}')
+
+        self.assertEqual(len(load_log_index(self.log_filepath)), 10)
+
+        result = read_log_file(self.log_filepath, LogFilter())
+        with open(self.log_filepath) as f:
+            self.assertEqual(result['content'], f.read())
+        self.assertIsNone(result['next_cursor'])
+
+        result = read_log_file(self.log_filepath, LogFilter(levels=['ERROR']))
+        self.assertEqual(self.__messages(result), ['error 0', 'error 3', 'error 6', 'error 9'])
+
+        result = read_log_file(self.log_filepath, LogFilter(limit=4, tail=True))
+        self.assertEqual(self.__messages(result), ['error 6', 'info 7', 'info 8', 'error 9'])
+        self.assertEqual(len(result['content'].splitlines()), 4)
+        result = read_log_file(
+            self.log_filepath,
+            LogFilter(cursor=result['next_cursor'], limit=4, tail=True),
+        )
+        self.assertEqual(self.__messages(result), ['info 2', 'error 3', 'info 4', 'info 5'])
+        self.assertIsNotNone(result['next_cursor'])
+
+        result = read_log_file(self.log_filepath, LogFilter(end_time=0))
+        self.assertEqual(result['content'], '')
+
+    def test_read_log_file_without_index(self):
+        logger = self.__build_logger('test_read_log_file_without_index')
+        logger.info('indexed')
+        os.remove(index_filepath(self.log_filepath))
+        with open(self.log_filepath, 'a') as f:
+            f.write('2023-01-01T00:00:00 not indexed\nsecond line\n')
+        logger.warning('indexed again')
+
+        index = load_log_index(self.log_filepath)
+        self.assertEqual(len(index), 3)
+        self.assertEqual(int(index['offset'][0]), 0)
+
+        result = read_log_file(self.log_filepath, LogFilter(start_time=1, levels=['WARNING']))
+        self.assertEqual(self.__messages(result), ['indexed again'])
+
+        result = read_log_file(self.log_filepath, LogFilter(end_time=time.time() - 86400))
+        self.assertEqual(result['content'], '2023-01-01T00:00:00 not indexed\nsecond line\n')
+
+    def test_rotate_index(self):
+        logger = self.__build_logger('test_rotate_index', max_bytes=1000)
+        for i in range(20):
+            logger.info(f'message {i}')
+
+        self.assertTrue(os.path.exists(index_filepath(f'{self.log_filepath}.1')))
+        for log_filepath in [self.log_filepath, f'{self.log_filepath}.1']:
+            with open(log_filepath) as f:
+                content = f.read()
+            self.assertEqual(read_log_file(log_filepath, LogFilter())['content'], content)
+            self.assertEqual(
+                len(load_log_index(log_filepath)),
+                len(content.splitlines()),
+            )
+
+    def test_filter_log_content(self):
+        content = '\n'.join([
+            '2023-01-01T00:00:00 {"level": "INFO", "message": "a"}',
+            '2023-01-01T00:00:01 {"level": "ERROR", "message": "b"}',
+            'Traceback',
+            '2023-01-01T00:00:02 {"level": "INFO", "message": "c"}',
+        ]) + '\n'
+
+        result = filter_log_content(content, LogFilter(levels=['error']))
+        self.assertEqual(
+            result['content'],
+            '2023-01-01T00:00:01 {"level": "ERROR", "message": "b"}\nTraceback\n',
+        )
+
+    def __build_logger(self, name: str, max_bytes: int = 0) -> DictLogger:
+        logger = logging.getLogger(name)
+        logger.setLevel(logging.INFO)
+        handler = IndexedRotatingFileHandler(
+            self.log_filepath,
+            backupCount=2,
+            maxBytes=max_bytes,
+        )
+        handler.setFormatter(logging.Formatter('%(asctime)s %(message)s', '%Y-%m-%dT%H:%M:%S'))
+        logger.addHandler(handler)
+        self.handlers.append((logger, handler))
+        return DictLogger(logger)
+
+    def __messages(self, result):
+        return [
+            line.split('"message": "')[1].split('"')[0]
+            for line in result['content'].splitlines()
+            if '"message": "' in line
+        ]
@@ -0,0 +1,91 @@
+import os
+import shutil
+import sys
+import tempfile
+
+from mage_ai.data_preparation.models.block.integration.streaming import (
+    IntegrationStreamingConfig,
+    stream_source_to_destination,
+    streamed_filepath,
+)
+from mage_ai.tests.base_test import TestCase
+
+SOURCE_CODE = '''
+import json
+for i in range(1000):
+    print(json.dumps(dict(type='RECORD', record=dict(id=i))), flush=True)
+'''
+
+DESTINATION_CODE = '''
+import sys
+lines = sys.stdin.readlines()
+with open(sys.argv[1], 'w') as f:
+    f.write(''.join(lines))
+print(f'Loaded {len(lines)} lines.')
+'''
+
+
+class IntegrationStreamingTest(TestCase):
+    def setUp(self):
+        super().setUp()
+        self.output_dir = tempfile.mkdtemp()
+        self.source_output_file_path = os.path.join(self.output_dir, '00')
+        self.destination_file_path = os.path.join(self.output_dir, 'destination')
+
+    def tearDown(self):
+        shutil.rmtree(self.output_dir)
+        super().tearDown()
+
+    def test_stream_source_to_destination(self):
+        destination_lines = []
+        result = stream_source_to_destination(
+            [sys.executable, '-c', SOURCE_CODE],
+            [sys.executable, '-c', DESTINATION_CODE, self.destination_file_path],
+            self.source_output_file_path,
+            lambda line: None,
+            destination_lines.append,
+            IntegrationStreamingConfig(enabled=True, buffer_size=10),
+        )
+
+        self.assertTrue(result['loaded'])
+        self.assertIsNone(result['destination_error'])
+        self.assertEqual(result['lines'], 1000)
+        self.assertEqual(destination_lines, [b'Loaded 1000 lines.\n'])
+        with open(self.destination_file_path) as f:
+            destination_content = f.read()
+        with open(self.source_output_file_path) as f:
+            self.assertEqual(f.read(), destination_content)
+        self.assertEqual(len(destination_content.splitlines()), 1000)
+        self.assertTrue(os.path.exists(streamed_filepath(self.source_output_file_path)))
+
+    def test_stream_source_to_destination_destination_failure(self):
+        result = stream_source_to_destination(
+            [sys.executable, '-c', SOURCE_CODE],
+            [sys.executable, '-c', 'import sys; sys.stdin.readline(); sys.exit(1)'],
+            self.source_output_file_path,
+            lambda line: None,
+            lambda line: None,
+            IntegrationStreamingConfig(enabled=True, buffer_size=10),
+        )
+
+        self.assertFalse(result['loaded'])
+        self.assertIsNotNone(result['destination_error'])
+        with open(self.source_output_file_path) as f:
+            self.assertEqual(len(f.read().splitlines()), 1000)
+        self.assertFalse(os.path.exists(streamed_filepath(self.source_output_file_path)))
+
+    def test_stream_source_to_destination_source_error(self):
+        def log_source_line(line):
+            if b'"id": 10}' in line:
+                raise Exception('Source error.')
+
+        with self.assertRaisesRegex(Exception, 'Source error.'):
+            stream_source_to_destination(
+                [sys.executable, '-c', SOURCE_CODE],
+                [sys.executable, '-c', DESTINATION_CODE, self.destination_file_path],
+                self.source_output_file_path,
+                log_source_line,
+                lambda line: None,
+                IntegrationStreamingConfig(enabled=True, spill_to_disk=False),
+            )
+        self.assertFalse(os.path.exists(streamed_filepath(self.source_output_file_path)))
@@ -1,4 +1,5 @@
 import os
+import threading
 from unittest.mock import patch
 
 import pandas as pd
@@ -9,6 +10,9 @@ from pandas.testing import assert_frame_equal
 # from mage_ai.data_cleaner.column_types.constants import ColumnType
 from mage_ai.data_preparation.models.block import Block, BlockType
 from mage_ai.data_preparation.models.block.errors import HasDownstreamDependencies
+from mage_ai.data_preparation.models.block.output_analysis import (
+    wait_for_output_analyses,
+)
 from mage_ai.data_preparation.models.pipeline import Pipeline
 from mage_ai.data_preparation.repo_manager import get_repo_config
 from mage_ai.data_preparation.variable_manager import VariableManager
@@ -88,6 +92,75 @@ def remove_duplicate_rows(df):
         # self.assertTrue(len(analysis['statistics']) > 0)
         # self.assertTrue(len(analysis['insights']) > 0)
 
+    def test_execute_generator_output_shape(self):
+        pipeline = Pipeline.create(
+            'test pipeline generator',
+            repo_path=self.repo_path,
+        )
+        block = Block.create('test_data_loader', 'data_loader', self.repo_path, pipeline=pipeline)
+        with open(block.file_path, 'w') as file:
+            file.write('''import pandas as pd
+@data_loader
+def load_data():
+    for i in range(3):
+        yield pd.DataFrame({'col1': [i * 2, i * 2 + 1]})
+            ''')
+        asyncio.run(block.execute(analyze_outputs=True))
+
+        outputs = block.get_outputs()
+        self.assertEqual(len(outputs), 1)
+        self.assertEqual(outputs[0]['shape'], [6, 1])
+        self.assertEqual(outputs[0]['sample_data']['columns'], ['col1'])
+
+    def test_analyze_outputs_asynchronous(self):
+        pipeline = Pipeline.create(
+            'test pipeline async analysis',
+            repo_path=self.repo_path,
+        )
+        pipeline.repo_config.output_analysis_config = dict(asynchronous=True)
+        block = Block.create('test_data_loader', 'data_loader', self.repo_path, pipeline=pipeline)
+        variable_manager = VariableManager(
+            variables_dir=get_repo_config(self.repo_path).variables_dir,
+        )
+        df = pd.DataFrame({'col1': [1, 1, 3], 'col2': ['a', 'b', 'c']})
+
+        from mage_ai.data_cleaner.data_cleaner import clean
+        started = threading.Event()
+        resume = threading.Event()
+
+        def clean_after_resume(*args, **kwargs):
+            started.set()
+            resume.wait(10)
+            return clean(*args, **kwargs)
+
+        with patch('mage_ai.data_cleaner.data_cleaner.clean', side_effect=clean_after_resume):
+            block.analyze_outputs(dict(output_0=df))
+            self.assertTrue(started.wait(10))
+            analysis = variable_manager.get_variable(
+                pipeline.uuid,
+                block.uuid,
+                'output_0',
+                variable_type='dataframe_analysis',
+            )
+            self.assertEqual(analysis['metadata'], dict(analysis_status='pending'))
+            self.assertEqual(
+                analysis['statistics'],
+                dict(original_row_count=3, original_column_count=2),
+            )
+
+            resume.set()
+            wait_for_output_analyses()
+
+        analysis = variable_manager.get_variable(
+            pipeline.uuid,
+            block.uuid,
+            'output_0',
+            variable_type='dataframe_analysis',
+        )
+        self.assertEqual(analysis['metadata']['analysis_status'], 'completed')
+        self.assertEqual(set(analysis['metadata']['column_types']), {'col1', 'col2'})
+        self.assertEqual(analysis['statistics']['count'], 3)
+
     def test_execute_dicts_and_lists(self):
         pipeline = Pipeline.create(
             'test_pipeline_execute_dicts_and_lists',
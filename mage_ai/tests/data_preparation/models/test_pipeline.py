@@ -9,6 +9,7 @@ import yaml
 from mage_ai.data_preparation.models.block import Block
 from mage_ai.data_preparation.models.constants import PipelineType
 from mage_ai.data_preparation.models.pipeline import InvalidPipelineError, Pipeline
+from mage_ai.data_preparation.models.pipelines.cache import pipeline_config_cache
 from mage_ai.data_preparation.models.widget import Widget
 from mage_ai.tests.base_test import DBTestCase
 from mage_ai.tests.factory import create_pipeline_run_with_schedule
@@ -685,6 +686,40 @@ class PipelineTest(DBTestCase):
                 pipeline.save()
             self.assertTrue('Writing empty pipeline metadata is prevented.' in str(err.exception))
 
+    def test_get_cached_config(self):
+        pipeline = self.__create_pipeline_with_blocks('test pipeline 12')
+        pipeline_config_cache.clear()
+
+        pipeline1 = Pipeline.get('test_pipeline_12', repo_path=self.repo_path)
+        pipeline2 = Pipeline.get('test_pipeline_12', repo_path=self.repo_path)
+        self.assertEqual(pipeline_config_cache.metrics()['hits'], 1)
+        self.assertEqual(pipeline_config_cache.metrics()['misses'], 1)
+        self.assertEqual(pipeline1.to_dict(), pipeline2.to_dict())
+
+        # Each pipeline gets its own blocks.
+        pipeline1.blocks_by_uuid['block1'].configuration['dynamic'] = True
+        self.assertIsNot(pipeline1.blocks_by_uuid['block1'], pipeline2.blocks_by_uuid['block1'])
+        self.assertFalse(
+            Pipeline.get('test_pipeline_12').blocks_by_uuid['block1'].configuration.get('dynamic'),
+        )
+
+        # Saving invalidates the cache.
+        pipeline.name = 'test pipeline 12 renamed'
+        pipeline.save()
+        self.assertEqual(Pipeline.get('test_pipeline_12').name, 'test pipeline 12 renamed')
+
+        # Changing the file invalidates the cache.
+        with open(pipeline.config_path) as fp:
+            config = yaml.safe_load(fp)
+        config['description'] = 'Updated outside of mage'
+        with open(pipeline.config_path, 'w') as fp:
+            yaml.dump(config, fp)
+        self.assertEqual(Pipeline.get('test_pipeline_12').description, 'Updated outside of mage')
+        self.assertEqual(
+            asyncio.run(Pipeline.get_async('test_pipeline_12')).description,
+            'Updated outside of mage',
+        )
+
     def __create_pipeline_with_blocks(self, name):
         pipeline = Pipeline.create(
             name,
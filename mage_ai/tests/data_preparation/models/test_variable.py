@@ -1,6 +1,10 @@
 from mage_ai.data_preparation.models.block import Block
 from mage_ai.data_preparation.models.pipeline import Pipeline
-from mage_ai.data_preparation.models.variable import Variable, VariableType
+from mage_ai.data_preparation.models.variable import (
+    DataframeStorageFormat,
+    Variable,
+    VariableType,
+)
 from mage_ai.tests.base_test import DBTestCase
 from pandas.testing import assert_frame_equal
 import numpy as np
@@ -68,6 +72,116 @@ class VariableTest(DBTestCase):
         assert_frame_equal(variable2.read_data(), df2)
         assert_frame_equal(variable2.read_data(sample=True, sample_count=1), df2.iloc[:1])
 
+    def test_write_and_read_dataframe_arrow_format(self):
+        pipeline = self.__create_pipeline('test pipeline arrow')
+        variable1 = Variable(
+            'var1',
+            pipeline.dir_path,
+            'block1',
+            dataframe_storage_format=DataframeStorageFormat.ARROW,
+        )
+        variable2 = Variable(
+            'var2',
+            pipeline.dir_path,
+            'block1',
+            dataframe_storage_format=DataframeStorageFormat.ARROW,
+        )
+        df1 = pd.DataFrame(
+            [
+                [1, 'test', 3.123, np.NaN],
+                [2, 'test2', 4.321, np.NaN],
+            ],
+            columns=['col1', 'col2', 'col3', 'col4']
+        )
+        df1['col4'] = df1['col4'].astype('Int64')
+        df2 = pd.DataFrame(
+            [
+                [1, dict(k='v')],
+                [2, dict(k='v2')],
+            ],
+            columns=['col1', 'col2']
+        )
+        variable1.write_data(df1)
+        variable2.write_data(df2)
+        variable_dir_path = os.path.join(pipeline.dir_path, '.variables', 'block1')
+        self.assertTrue(os.path.exists(os.path.join(variable_dir_path, 'var1', 'data.arrow')))
+        self.assertFalse(os.path.exists(os.path.join(variable_dir_path, 'var1', 'data.parquet')))
+        self.assertFalse(
+            os.path.exists(os.path.join(variable_dir_path, 'var1', 'sample_data.parquet')),
+        )
+        # Nested values fall back to parquet
+        self.assertFalse(os.path.exists(os.path.join(variable_dir_path, 'var2', 'data.arrow')))
+        self.assertTrue(os.path.exists(os.path.join(variable_dir_path, 'var2', 'data.parquet')))
+
+        variable = Variable('var1', pipeline.dir_path, 'block1')
+        self.assertEqual(variable.variable_type, VariableType.DATAFRAME)
+        assert_frame_equal(variable.read_data(), df1)
+        # The frames read from the memory-mapped file can be modified in place
+        df_read = variable.read_data()
+        df_read.loc[0, 'col1'] = 5
+        self.assertEqual(df_read.loc[0, 'col1'], 5)
+        # Writing the variable again replaces the file instead of truncating it
+        variable1.write_data(df1.iloc[:1])
+        assert_frame_equal(variable.read_data(), df1.iloc[:1])
+        self.assertEqual(os.listdir(os.path.join(variable_dir_path, 'var1')), ['data.arrow'])
+        assert_frame_equal(df_read.iloc[1:], df1.iloc[1:])
+        assert_frame_equal(variable.read_data(sample=True, sample_count=1), df1.iloc[:1])
+        assert_frame_equal(variable2.read_data(), df2)
+
+        variable.delete()
+        self.assertFalse(os.path.exists(os.path.join(variable_dir_path, 'var1')))
+
+    def test_write_and_read_chunked_dataframe(self):
+        pipeline = self.__create_pipeline('test pipeline chunked')
+        variable = Variable('var1', pipeline.dir_path, 'block1')
+        dfs = [
+            pd.DataFrame([[i * 2, f'test{i * 2}'], [i * 2 + 1, None]], columns=['col1', 'col2'])
+            for i in range(3)
+        ]
+
+        def chunks():
+            for df in dfs:
+                yield df
+
+        variable.write_data(chunks())
+        self.assertEqual(variable.variable_type, VariableType.CHUNKED_DATAFRAME)
+        variable_path = os.path.join(pipeline.dir_path, '.variables', 'block1', 'var1')
+        self.assertTrue(os.path.exists(os.path.join(variable_path, 'chunked_data.parquet')))
+        self.assertTrue(os.path.exists(os.path.join(variable_path, 'sample_data.parquet')))
+
+        variable = Variable('var1', pipeline.dir_path, 'block1')
+        self.assertEqual(variable.variable_type, VariableType.CHUNKED_DATAFRAME)
+        chunks_read = list(variable.read_data())
+        self.assertEqual(len(chunks_read), 3)
+        for df_read, df in zip(chunks_read, dfs):
+            assert_frame_equal(df_read, df.reset_index(drop=True))
+        assert_frame_equal(variable.read_data(sample=True, sample_count=1), dfs[0].iloc[:1])
+
+        analysis = Variable(
+            'var1',
+            pipeline.dir_path,
+            'block1',
+            variable_type=VariableType.DATAFRAME_ANALYSIS,
+        ).read_data(dataframe_analysis_keys=['statistics'])
+        self.assertEqual(
+            analysis['statistics'],
+            dict(original_row_count=6, original_column_count=2),
+        )
+
+        variable.delete()
+        self.assertFalse(os.path.exists(variable_path))
+
+    def test_write_chunked_dataframe_with_mismatched_chunks(self):
+        pipeline = self.__create_pipeline('test pipeline chunked mismatch')
+        variable = Variable('var1', pipeline.dir_path, 'block1')
+
+        def chunks():
+            yield pd.DataFrame([[1, 'a']], columns=['col1', 'col2'])
+            yield pd.DataFrame([[1.5]], columns=['col3'])
+
+        with self.assertRaises(Exception):
+            variable.write_data(chunks())
+
     def test_write_and_read_dataframe_analysis(self):
         pipeline = self.__create_pipeline('test pipeline 3')
         variable = Variable(
@@ -121,6 +235,38 @@ class VariableTest(DBTestCase):
             results=[100] * 20,
         ))
 
+    def test_write_and_read_items(self):
+        pipeline = self.__create_pipeline('test pipeline 5')
+        variable1 = Variable('var1', pipeline.dir_path, 'block1')
+        variable2 = Variable(
+            'var2',
+            pipeline.dir_path,
+            'block1',
+            variable_type=VariableType.DATAFRAME,
+        )
+        variable3 = Variable('var3', pipeline.dir_path, 'block1')
+        data = [[1, 'a'], dict(id=2, value=np.NaN), 'item3']
+        df = pd.DataFrame([[1, 'test'], [2, 'test2']], columns=['col1', 'col2'])
+        variable1.write_data(data, index_items=True)
+        variable2.write_data(df, index_items=True)
+        variable3.write_data(data)
+
+        self.assertTrue(os.path.exists(os.path.join(variable1.variable_path, 'items.index')))
+        self.assertEqual(variable1.read_item(0), [1, 'a'])
+        self.assertEqual(variable1.read_item(1), dict(id=2, value=None))
+        self.assertEqual(variable1.read_item(2), 'item3')
+        self.assertIsNone(variable1.read_item(3))
+        self.assertEqual(variable1.read_data(), [[1, 'a'], dict(id=2, value=None), 'item3'])
+
+        variable2 = Variable('var2', pipeline.dir_path, 'block1')
+        self.assertEqual(variable2.read_item(1), dict(col1=2, col2='test2'))
+        self.assertIsNone(variable2.read_item(2))
+
+        # Variables written without the index are read whole.
+        self.assertFalse(os.path.exists(os.path.join(variable3.variable_path, 'items.index')))
+        self.assertEqual(variable3.read_item(2), 'item3')
+        self.assertIsNone(variable3.read_item(3))
+
     def __create_pipeline(self, name):
         pipeline = Pipeline.create(
             name,
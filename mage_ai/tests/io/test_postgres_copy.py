@@ -0,0 +1,124 @@
+import struct
+from unittest.mock import MagicMock
+
+import numpy as np
+import pandas as pd
+
+from mage_ai.io.postgres import Postgres
+from mage_ai.io.postgres_copy import (
+    BINARY_COPY_HEADER,
+    BINARY_COPY_TRAILER,
+    CopyStream,
+    binary_copy_values,
+    iter_binary_copy_chunks,
+    iter_csv_copy_chunks,
+)
+from mage_ai.tests.base_test import TestCase
+
+
+class PostgresCopyTests(TestCase):
+    def setUp(self):
+        super().setUp()
+        self.df = pd.DataFrame(dict(
+            id=[1, 2, 300],
+            amount=[1.5, -2.0, 3.25],
+            active=[True, False, True],
+            created_at=pd.to_datetime(['2000-01-01', '2000-01-02', '1999-12-31 23:59:59']),
+        ))
+        self.column_types = dict(
+            id='smallint',
+            amount='double precision',
+            active='boolean',
+            created_at='timestamp without time zone',
+        )
+
+    def test_iter_binary_copy_chunks(self):
+        values = binary_copy_values(self.df, self.column_types)
+        chunks = list(iter_binary_copy_chunks(values, chunk_size=2))
+        self.assertEqual(len(chunks), 4)
+        self.assertEqual(chunks[0], BINARY_COPY_HEADER)
+        self.assertEqual(chunks[-1], BINARY_COPY_TRAILER)
+
+        data = b''.join(chunks[1:-1])
+        row_format = '>h' + 'ih' + 'id' + 'i?' + 'iq'
+        rows = list(struct.iter_unpack(row_format, data))
+        self.assertEqual(rows, [
+            (4, 2, 1, 8, 1.5, 1, True, 8, 0),
+            (4, 2, 2, 8, -2.0, 1, False, 8, 86400000000),
+            (4, 2, 300, 8, 3.25, 1, True, 8, -1000000),
+        ])
+
+    def test_binary_copy_values_unsupported(self):
+        self.assertIsNone(binary_copy_values(
+            self.df,
+            dict(self.column_types, id='text'),
+        ))
+        self.assertIsNone(binary_copy_values(
+            self.df.assign(amount=[1.5, np.nan, 3.0]),
+            self.column_types,
+        ))
+        # 70000 doesn't fit in a smallint.
+        self.assertIsNone(binary_copy_values(
+            self.df.assign(id=[1, 2, 70000]),
+            self.column_types,
+        ))
+
+    def test_iter_csv_copy_chunks(self):
+        df = pd.DataFrame(dict(
+            id=[1, 2, 3],
+            data=[dict(a=1), None, dict(b=2)],
+        ))
+        chunks = list(iter_csv_copy_chunks(
+            df,
+            dict(data=lambda v: f'json:{len(v)}'),
+            chunk_size=2,
+        ))
+        self.assertEqual(chunks, [b'1,json:1\n2,\n', b'3,json:1\n'])
+        # The data frame isn't modified.
+        self.assertEqual(df['data'].iloc[0], dict(a=1))
+
+    def test_copy_stream(self):
+        stream = CopyStream(iter([b'abc', b'', b'defgh', b'i']))
+        self.assertEqual(stream.read(2), b'ab')
+        self.assertEqual(stream.read(4), b'cdef')
+        self.assertEqual(stream.read(), b'ghi')
+        self.assertEqual(stream.read(10), b'')
+
+    def test_upload_dataframe_with_binary_copy(self):
+        postgres = Postgres('db', 'user', 'password', 'host', verbose=False)
+        cursor = MagicMock()
+        cursor.fetchall.return_value = list(self.column_types.items())
+        data = []
+        cursor.copy_expert.side_effect = \
+            lambda query, stream, size: data.append((query, stream.read()))
+
+        postgres.upload_dataframe(cursor, self.df, None, dict(), 'test_table')
+
+        query, copied = data[0]
+        self.assertEqual(
+            query,
+            'COPY test_table ("id", "amount", "active", "created_at") FROM STDIN '
+            '(FORMAT binary)',
+        )
+        self.assertTrue(copied.startswith(BINARY_COPY_HEADER))
+
+    def test_upload_dataframe_with_csv_copy(self):
+        postgres = Postgres('db', 'user', 'password', 'host', verbose=False)
+        cursor = MagicMock()
+        cursor.fetchall.return_value = [('id', 'integer'), ('data', 'jsonb')]
+        data = []
+        cursor.copy_expert.side_effect = \
+            lambda query, stream, size: data.append((query, stream.read()))
+
+        df = pd.DataFrame(dict(id=[1, 2], data=[dict(a=1), None]))
+        postgres.upload_dataframe(
+            cursor,
+            df,
+            None,
+            dict(id='integer', data='mixed'),
+            'test_table',
+        )
+
+        query, copied = data[0]
+        self.assertTrue('FORMAT csv' in query)
+        self.assertEqual(copied, b'1,"{""a"": 1}"\n2,\n')
@@ -11,7 +11,11 @@ from mage_ai.data_preparation.models.triggers import (
     ScheduleType,
 )
 from mage_ai.data_preparation.repo_manager import get_repo_config
-from mage_ai.orchestration.db.models.schedules import PipelineRun, PipelineSchedule
+from mage_ai.orchestration.db.models.schedules import (
+    BlockRun,
+    PipelineRun,
+    PipelineSchedule,
+)
 from mage_ai.orchestration.pipeline_scheduler import configure_pipeline_run_payload
 from mage_ai.shared.hash import merge_dict
 from mage_ai.tests.base_test import DBTestCase
@@ -635,6 +639,29 @@ class PipelineRunTests(DBTestCase):
         )
         self.assertEqual(pipeline_run.logs.get('path'), expected_file_path)
 
+    def test_bulk_create_block_runs(self):
+        pipeline_run = create_pipeline_run_with_schedule(pipeline_uuid='test_pipeline')
+        pipeline_run.create_block_run('block2:0', metrics=dict(dynamic_block_index=0))
+        block_runs = pipeline_run.bulk_create_block_runs([
+            dict(block_uuid='block2:0', metrics=dict(dynamic_block_index=0)),
+            dict(block_uuid='block2:1', metrics=dict(dynamic_block_index=1)),
+            dict(block_uuid='block2:2', metrics=dict(dynamic_block_index=2)),
+            dict(block_uuid='block2:1', metrics=dict(dynamic_block_index=1)),
+        ], chunk_size=1)
+        self.assertEqual(
+            [(br.block_uuid, br.metrics, br.status) for br in block_runs],
+            [
+                ('block2:0', dict(dynamic_block_index=0), BlockRun.BlockRunStatus.INITIAL),
+                ('block2:1', dict(dynamic_block_index=1), BlockRun.BlockRunStatus.INITIAL),
+                ('block2:2', dict(dynamic_block_index=2), BlockRun.BlockRunStatus.INITIAL),
+            ],
+        )
+        self.assertEqual(
+            len([br for br in pipeline_run.refresh_block_runs() if br.block_uuid == 'block2:1']),
+            1,
+        )
+        self.assertEqual(pipeline_run.bulk_create_block_runs([]), [])
+
     def test_active_runs_for_pipelines(self):
         create_pipeline_with_blocks(
             'test active run 1',
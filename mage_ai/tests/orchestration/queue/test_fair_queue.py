@@ -0,0 +1,68 @@
+from mage_ai.orchestration.queue.fair_queue import (
+    FairQueue,
+    JobPriority,
+    QueueWaitHistogram,
+)
+from mage_ai.tests.base_test import TestCase
+
+
+class FairQueueTests(TestCase):
+    def test_priority_classes(self):
+        queue = FairQueue()
+        queue.put('low_1', priority=JobPriority.LOW)
+        queue.put('normal_1')
+        queue.put('high_1', priority='high')
+        queue.put('normal_2')
+        self.assertEqual(len(queue), 4)
+        self.assertEqual(
+            [queue.get() for _ in range(4)],
+            ['high_1', 'normal_1', 'normal_2', 'low_1'],
+        )
+        self.assertIsNone(queue.get(timeout=0))
+
+    def test_fair_queuing_across_groups(self):
+        queue = FairQueue()
+        for i in range(100):
+            queue.put(f'backfill_{i}', group='backfill')
+        queue.get()
+        queue.put('hourly_0', group='hourly')
+        queue.put('hourly_1', group='hourly')
+        jobs = [queue.get() for _ in range(4)]
+        self.assertEqual(jobs, ['hourly_0', 'backfill_1', 'hourly_1', 'backfill_2'])
+
+    def test_weighted_fair_queuing(self):
+        queue = FairQueue(weights=dict(pipeline_a=3))
+        for i in range(30):
+            queue.put(f'a_{i}', group='pipeline_a')
+            queue.put(f'b_{i}', group='pipeline_b')
+        jobs = [queue.get() for _ in range(20)]
+        self.assertEqual(len([j for j in jobs if j.startswith('a_')]), 15)
+        self.assertEqual(jobs[:4], ['a_0', 'b_0', 'a_1', 'a_2'])
+
+    def test_metrics(self):
+        queue = FairQueue()
+        queue.put('high_1', priority=JobPriority.HIGH)
+        queue.put('normal_1')
+        queue.get()
+        metrics = queue.metrics()
+        self.assertEqual(metrics['high']['jobs_queued'], 0)
+        self.assertEqual(metrics['high']['queue_wait_seconds']['count'], 1)
+        self.assertEqual(metrics['normal']['jobs_queued'], 1)
+        self.assertEqual(metrics['normal']['queue_wait_seconds']['count'], 0)
+        self.assertEqual(metrics['low']['jobs_queued'], 0)
+
+
+class QueueWaitHistogramTests(TestCase):
+    def test_observe(self):
+        histogram = QueueWaitHistogram(buckets=[1, 10])
+        for seconds in [0.5, 1, 5, 20]:
+            histogram.observe(seconds)
+        self.assertEqual(
+            histogram.to_dict(),
+            dict(
+                buckets={'1': 2, '10': 1, '+Inf': 1},
+                count=4,
+                max=20,
+                sum=26.5,
+            ),
+        )
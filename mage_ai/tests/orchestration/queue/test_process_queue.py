@@ -1,8 +1,19 @@
+import time
+
 from mage_ai.orchestration.queue.config import QueueConfig
-from mage_ai.orchestration.queue.process_queue import JobStatus, ProcessQueue
+from mage_ai.orchestration.queue.fair_queue import JobPriority
+from mage_ai.orchestration.queue.process_queue import (
+    JobStatus,
+    ProcessQueue,
+    retire_worker_stats,
+)
 from mage_ai.tests.base_test import TestCase
 
 
+def noop():
+    pass
+
+
 class ProcessQueueTests(TestCase):
     def setUp(self):
         queue_config = QueueConfig.load(config=dict(concurrency=100))
@@ -32,3 +43,78 @@ class ProcessQueueTests(TestCase):
         self.assertFalse(self.queue.has_job('block_run_3'))
         self.assertFalse(self.queue.has_job('block_run_4'))
         self.assertFalse(self.queue.has_job('block_run_5'))
+
+    def test_metrics(self):
+        self.queue.job_dict['block_run_1'] = JobStatus.QUEUED
+        self.queue.job_dict['block_run_2'] = 100
+        self.queue.job_dict['block_run_3'] = JobStatus.COMPLETED
+        now = time.time()
+        self.queue.worker_stats[100] = dict(
+            busy_seconds=2,
+            job_started_at=None,
+            jobs=2,
+            max_queue_wait_seconds=3,
+            queue_wait_seconds=4,
+            started_at=now - 10,
+        )
+        self.queue.worker_stats[101] = dict(
+            busy_seconds=3,
+            job_started_at=None,
+            jobs=1,
+            max_queue_wait_seconds=1,
+            queue_wait_seconds=1,
+            started_at=now - 10,
+        )
+        retire_worker_stats(self.queue.worker_stats, 101)
+        metrics = self.queue.metrics()
+        self.assertEqual(metrics['jobs_queued'], 1)
+        self.assertEqual(metrics['jobs_running'], 1)
+        self.assertEqual(metrics['jobs_run'], 3)
+        self.assertEqual(metrics['queue_latency_avg_seconds'], round(5 / 3, 3))
+        self.assertEqual(metrics['queue_latency_max_seconds'], 3)
+        self.assertAlmostEqual(metrics['worker_utilization'], 0.2, places=2)
+        self.assertEqual(metrics['workers'], 1)
+
+    def test_prefork_worker_pool(self):
+        queue_config = QueueConfig.load(config=dict(
+            concurrency=2,
+            process_queue_config=dict(prefork=True, max_jobs_per_worker=2),
+        ))
+        queue = ProcessQueue(queue_config=queue_config)
+        job_ids = [f'block_run_{i}' for i in range(6)]
+        for job_id in job_ids:
+            queue.enqueue(job_id, noop)
+
+        deadline = time.time() + 30
+        while time.time() < deadline and \
+                any(queue.job_dict.get(job_id) != JobStatus.COMPLETED for job_id in job_ids):
+            time.sleep(0.1)
+        try:
+            for job_id in job_ids:
+                self.assertEqual(queue.job_dict[job_id], JobStatus.COMPLETED)
+            self.assertEqual(queue.metrics()['jobs_run'], 6)
+        finally:
+            queue.worker_pool_proc.kill()
+
+    def test_job_priority(self):
+        queue_config = QueueConfig.load(config=dict(
+            pipeline_priorities=dict(backfill_pipeline='low'),
+        ))
+        queue = ProcessQueue(queue_config=queue_config)
+        self.assertEqual(
+            queue._job_priority(queue_config, None, 'backfill_pipeline'),
+            JobPriority.LOW,
+        )
+        self.assertEqual(
+            queue._job_priority(queue_config, 'high', 'backfill_pipeline'),
+            JobPriority.HIGH,
+        )
+        self.assertEqual(
+            queue._job_priority(queue_config, None, 'hourly_pipeline'),
+            JobPriority.NORMAL,
+        )
+        self.assertEqual(queue._job_priority(queue_config, None, None), JobPriority.NORMAL)
+        self.assertEqual(
+            queue._job_priority(queue_config, 'urgent', 'hourly_pipeline'),
+            JobPriority.NORMAL,
+        )
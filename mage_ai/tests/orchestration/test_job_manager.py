@@ -22,6 +22,8 @@ class JobManagerTests(TestCase):
             test_func,
             1,
             2,
+            priority=None,
+            group=None,
         )
 
     def test_clean_up_jobs(self):
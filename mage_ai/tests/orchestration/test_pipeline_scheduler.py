@@ -25,6 +25,7 @@ from mage_ai.orchestration.pipeline_scheduler import (
     check_sla,
     schedule_all,
 )
+from mage_ai.orchestration.utils.scheduler_shard import SchedulerShardManager
 from mage_ai.shared.hash import merge_dict
 from mage_ai.tests.base_test import DBTestCase
 from mage_ai.tests.factory import (
@@ -89,6 +90,44 @@ class PipelineSchedulerTests(DBTestCase):
             else:
                 self.assertEqual(b.status, BlockRun.BlockRunStatus.INITIAL)
 
+    def test_executable_block_runs_with_remaining_upstream_counts(self):
+        pipeline_run = create_pipeline_run_with_schedule(pipeline_uuid='test_pipeline')
+        scheduler = PipelineScheduler(pipeline_run=pipeline_run)
+
+        def block_run_by_uuid():
+            pipeline_run.refresh_block_runs()
+            return {b.block_uuid: b for b in pipeline_run.block_runs}
+
+        self.assertEqual([b.block_uuid for b in scheduler.executable_block_runs], ['block1'])
+        self.assertEqual(
+            {k: b.remaining_upstream_count for k, b in block_run_by_uuid().items()},
+            dict(block1=0, block2=1, block3=1, block4=2),
+        )
+
+        block_run_by_uuid()['block1'].update(status=BlockRun.BlockRunStatus.RUNNING)
+        scheduler.on_block_complete_without_schedule('block1')
+        block_runs = block_run_by_uuid()
+        self.assertEqual(block_runs['block2'].remaining_upstream_count, 0)
+        self.assertEqual(block_runs['block3'].remaining_upstream_count, 0)
+        self.assertEqual(block_runs['block4'].remaining_upstream_count, 2)
+        self.assertEqual(
+            sorted(b.block_uuid for b in scheduler.executable_block_runs),
+            ['block2', 'block3'],
+        )
+
+        # A count that is out of date is corrected instead of scheduling the block run.
+        block_runs['block2'].update(status=BlockRun.BlockRunStatus.RUNNING)
+        block_runs['block3'].update(status=BlockRun.BlockRunStatus.RUNNING)
+        block_runs['block4'].update(remaining_upstream_count=0)
+        block_run_by_uuid()
+        self.assertEqual(scheduler.executable_block_runs, [])
+        self.assertEqual(block_run_by_uuid()['block4'].remaining_upstream_count, 2)
+
+        scheduler.on_block_complete_without_schedule('block2')
+        scheduler.on_block_complete_without_schedule('block3')
+        block_run_by_uuid()
+        self.assertEqual([b.block_uuid for b in scheduler.executable_block_runs], ['block4'])
+
     def test_schedule_all_blocks_completed(self):
         pipeline_run = PipelineRun.create(pipeline_uuid='test_pipeline')
         pipeline_run.update(status=PipelineRun.PipelineRunStatus.RUNNING)
@@ -213,6 +252,110 @@ class PipelineSchedulerTests(DBTestCase):
             all()
         )), 1)
 
+    @freeze_time('2023-10-11 12:13:14')
+    def test_schedule_all_does_not_create_duplicate_pipeline_runs(self):
+        pipeline_schedule = PipelineSchedule.create(
+            name='test_schedule_all_duplicate_runs',
+            pipeline_uuid='test_pipeline',
+            schedule_interval=ScheduleInterval.HOURLY,
+            schedule_type=ScheduleType.TIME,
+            start_time=datetime(2023, 10, 1, 0, 0, 0),
+            status=ScheduleStatus.ACTIVE,
+        )
+        # Old pipeline run from a previous execution date
+        PipelineRun.create(
+            execution_date=datetime(2023, 10, 11, 11, 0, 0),
+            pipeline_schedule_id=pipeline_schedule.id,
+            pipeline_uuid=pipeline_schedule.pipeline_uuid,
+            status=PipelineRun.PipelineRunStatus.COMPLETED,
+        )
+
+        with patch.object(PipelineScheduler, 'schedule'):
+            metrics = schedule_all()
+            pipeline_run = PipelineRun.query.filter(
+                PipelineRun.pipeline_schedule_id == pipeline_schedule.id,
+                PipelineRun.status == PipelineRun.PipelineRunStatus.RUNNING,
+            ).one()
+            self.assertEqual(pipeline_run.execution_date.hour, 12)
+            # A completed pipeline run for the current execution date isn't initial or running,
+            # so it has to be found through the execution date.
+            pipeline_run.update(status=PipelineRun.PipelineRunStatus.COMPLETED)
+            schedule_all()
+
+        pipeline_runs = PipelineRun.query.filter(
+            PipelineRun.pipeline_schedule_id == pipeline_schedule.id,
+        ).all()
+        self.assertEqual(len(pipeline_runs), 2)
+        self.assertGreaterEqual(metrics['counts']['created_pipeline_runs'], 1)
+        self.assertIn('schedule_pipeline_schedules', metrics['timings'])
+        self.assertIn('schedule_active_pipeline_runs', metrics['timings'])
+
+    def test_schedule_all_logs_queue_metrics(self):
+        queue_metrics = dict(jobs_queued=1, jobs_running=2)
+        with patch(
+            'mage_ai.orchestration.pipeline_scheduler.job_manager.metrics',
+            return_value=queue_metrics,
+        ):
+            with patch('mage_ai.orchestration.pipeline_scheduler.logger') as mock_logger:
+                schedule_all()
+        mock_logger.info.assert_any_call(f'Job queue metrics: {queue_metrics}')
+
+    @freeze_time('2023-10-11 12:13:14')
+    def test_schedule_all_with_sharding(self):
+        try:
+            import fakeredis
+        except ImportError:
+            self.skipTest('fakeredis is not installed')
+
+        server = fakeredis.FakeServer()
+        shard_managers = [
+            SchedulerShardManager(
+                instance_id=f'scheduler{i}',
+                redis_client=fakeredis.FakeRedis(server=server, decode_responses=True),
+                sharding_enabled=True,
+            )
+            for i in range(2)
+        ]
+        shard_managers[1].heartbeat()
+
+        pipeline_schedules = [
+            PipelineSchedule.create(
+                name=f'test_schedule_all_with_sharding_{i}',
+                pipeline_uuid='test_pipeline',
+                schedule_interval=ScheduleInterval.HOURLY,
+                schedule_type=ScheduleType.TIME,
+                start_time=datetime(2023, 10, 1, 0, 0, 0),
+                status=ScheduleStatus.ACTIVE,
+            )
+            for i in range(10)
+        ]
+
+        with patch(
+            'mage_ai.orchestration.pipeline_scheduler.shard_manager',
+            shard_managers[0],
+        ):
+            with patch.object(PipelineScheduler, 'schedule'):
+                with patch(
+                    'mage_ai.orchestration.pipeline_scheduler.lock.release_lock',
+                ) as mock_release_lock:
+                    metrics = schedule_all()
+
+        self.assertEqual(metrics['counts']['shard_members'], 2)
+        # The schedule locks aren't acquired when the schedules are sharded.
+        for call in mock_release_lock.call_args_list:
+            self.assertFalse(call.args[0].startswith('pipeline_schedule_'))
+        assigned_count = 0
+        for pipeline_schedule in pipeline_schedules:
+            pipeline_runs_count = PipelineRun.query.filter(
+                PipelineRun.pipeline_schedule_id == pipeline_schedule.id,
+            ).count()
+            if shard_managers[0].is_assigned(str(pipeline_schedule.id)):
+                assigned_count += 1
+                self.assertEqual(pipeline_runs_count, 1)
+            else:
+                self.assertEqual(pipeline_runs_count, 0)
+        self.assertTrue(0 < assigned_count < len(pipeline_schedules))
+
     def test_schedule_all_blocks_completed_with_failures(self):
         pipeline_run = create_pipeline_run_with_schedule(
             pipeline_uuid='test_pipeline',
@@ -287,6 +430,8 @@ class PipelineSchedulerTests(DBTestCase):
                 pipeline_schedule_id=pipeline_run.pipeline_schedule_id,
                 pipeline_uuid='test_pipeline_2',
             ),
+            priority=None,
+            group='test_pipeline_2',
         )
 
     def test_on_block_complete(self):
@@ -446,6 +591,14 @@ class PipelineSchedulerTests(DBTestCase):
                         block_uuid='block2:for_user_2',
                     )
                     self.assertTrue(block_run2 is not None)
+                    block_run3 = BlockRun.get(
+                        pipeline_run_id=pipeline_run.id,
+                        block_uuid='block3:for_user_2',
+                    )
+                    self.assertEqual(
+                        block_run3.metrics['dynamic_upstream_block_uuids'],
+                        ['block2:for_user_2'],
+                    )
 
     @freeze_time('2023-05-01 01:20:33')
     def test_send_sla_message(self):
@@ -0,0 +1,114 @@
+import unittest
+
+from freezegun import freeze_time
+
+from mage_ai.orchestration.utils.scheduler_shard import (
+    ConsistentHashRing,
+    SchedulerShardManager,
+)
+from mage_ai.tests.base_test import TestCase
+
+try:
+    import fakeredis
+except ImportError:
+    fakeredis = None
+
+KEYS = [str(i) for i in range(200)]
+
+
+class SchedulerShardManagerTests(TestCase):
+    def setUp(self):
+        super().setUp()
+        self.server = fakeredis.FakeServer() if fakeredis is not None else None
+
+    def __create_manager(self, instance_id: str) -> SchedulerShardManager:
+        return SchedulerShardManager(
+            instance_id=instance_id,
+            lease_timeout=30,
+            redis_client=fakeredis.FakeRedis(server=self.server, decode_responses=True),
+            sharding_enabled=True,
+        )
+
+    def test_consistent_hash_ring_only_moves_keys_of_removed_member(self):
+        ring1 = ConsistentHashRing(['a', 'b', 'c'])
+        ring2 = ConsistentHashRing(['a', 'b'])
+        owners1 = {k: ring1.get_member(k) for k in KEYS}
+        self.assertEqual(set(owners1.values()), set(['a', 'b', 'c']))
+        for key in KEYS:
+            if owners1[key] != 'c':
+                self.assertEqual(ring2.get_member(key), owners1[key])
+        self.assertIsNone(ConsistentHashRing([]).get_member('1'))
+
+    @unittest.skipIf(fakeredis is None, 'fakeredis is not installed')
+    def test_acquire_leases_and_rebalance(self):
+        manager1 = self.__create_manager('scheduler1')
+        manager2 = self.__create_manager('scheduler2')
+
+        # scheduler1 is the only member, so it leases every key.
+        self.assertEqual(manager1.heartbeat(), ['scheduler1'])
+        self.assertEqual(manager1.acquire_leases('pipeline_schedules', KEYS), set(KEYS))
+
+        # scheduler2 joins, but scheduler1 still holds the leases of its keys.
+        self.assertEqual(manager2.heartbeat(), ['scheduler1', 'scheduler2'])
+        self.assertEqual(manager2.acquire_leases('pipeline_schedules', KEYS), set())
+
+        # scheduler1 releases the keys that are no longer assigned to it.
+        manager1.heartbeat()
+        leased1 = manager1.acquire_leases('pipeline_schedules', KEYS)
+        leased2 = manager2.acquire_leases('pipeline_schedules', KEYS)
+        self.assertTrue(len(leased1) > 0)
+        self.assertTrue(len(leased2) > 0)
+        self.assertEqual(leased1 & leased2, set())
+        self.assertEqual(leased1 | leased2, set(KEYS))
+
+        # Leases are renewed on the following ticks.
+        self.assertEqual(manager1.acquire_leases('pipeline_schedules', KEYS), leased1)
+        # Leases in different groups are independent.
+        self.assertEqual(manager1.acquire_leases('pipeline_runs', KEYS), leased1)
+
+        manager2.leave()
+        self.assertEqual(manager1.heartbeat(), ['scheduler1'])
+        self.assertEqual(manager1.acquire_leases('pipeline_schedules', KEYS), set(KEYS))
+
+    @unittest.skipIf(fakeredis is None, 'fakeredis is not installed')
+    def test_leases_of_dead_member_expire(self):
+        with freeze_time('2023-10-11 12:00:00') as frozen_time:
+            manager1 = self.__create_manager('scheduler1')
+            manager2 = self.__create_manager('scheduler2')
+            manager2.heartbeat()
+            manager1.heartbeat()
+            manager1.acquire_leases('pipeline_schedules', KEYS)
+            leased2 = manager2.acquire_leases('pipeline_schedules', KEYS)
+            self.assertTrue(len(leased2) > 0)
+
+            # scheduler2 stops heartbeating.
+            frozen_time.tick(31)
+            self.assertEqual(manager1.heartbeat(), ['scheduler1'])
+            self.assertEqual(manager1.acquire_leases('pipeline_schedules', KEYS), set(KEYS))
+
+    @unittest.skipIf(fakeredis is None, 'fakeredis is not installed')
+    def test_renew_leases_during_tick(self):
+        with freeze_time('2023-10-11 12:00:00') as frozen_time:
+            manager1 = self.__create_manager('scheduler1')
+            manager2 = self.__create_manager('scheduler2')
+            manager1.heartbeat()
+            self.assertEqual(manager1.acquire_leases('pipeline_schedules', KEYS), set(KEYS))
+
+            # The leases are renewed during a tick longer than the lease timeout, so that
+            # scheduler2 can't take them.
+            frozen_time.tick(20)
+            self.assertEqual(manager1.renew_leases('pipeline_schedules'), set(KEYS))
+            frozen_time.tick(20)
+            self.assertEqual(manager2.heartbeat(), ['scheduler1', 'scheduler2'])
+            self.assertEqual(manager2.acquire_leases('pipeline_schedules', KEYS), set())
+            self.assertEqual(manager1.renew_leases('pipeline_schedules'), set(KEYS))
+
+            # The leases that expired and were taken by scheduler2 are dropped.
+            frozen_time.tick(31)
+            manager2.heartbeat()
+            leased2 = manager2.acquire_leases('pipeline_schedules', KEYS)
+            self.assertTrue(len(leased2) > 0)
+            self.assertEqual(
+                manager1.renew_leases('pipeline_schedules'),
+                set(KEYS) - leased2,
+            )
@@ -0,0 +1,93 @@
+import json
+import os
+import shutil
+
+from mage_ai.streaming.sinks.dummy import DummySink
+from mage_ai.streaming.sinks.segment_buffer import SegmentBuffer
+from mage_ai.tests.base_test import TestCase
+
+
+class SegmentBufferTests(TestCase):
+    def setUp(self):
+        super().setUp()
+        self.buffer_path = os.path.join(self.repo_path, 'buffer')
+        shutil.rmtree(self.buffer_path, ignore_errors=True)
+
+    def test_append_commit_and_recover(self):
+        segment_buffer = SegmentBuffer(self.buffer_path, segment_size_bytes=100)
+        segment_buffer.append([dict(id=1), dict(id=2)])
+        offset = segment_buffer.offset
+        segment_buffer.append([dict(id=3, value='a' * 100)])
+        segment_buffer.append([dict(id=4)])
+        self.assertEqual(len(os.listdir(self.buffer_path)), 3)
+        self.assertEqual([r['id'] for r in segment_buffer.read()], [1, 2, 3, 4])
+
+        segment_buffer.commit(offset)
+        self.assertEqual([r['id'] for r in segment_buffer.read()], [3, 4])
+        segment_buffer.close()
+
+        # Recovery only replays the uncommitted records.
+        segment_buffer = SegmentBuffer(self.buffer_path, segment_size_bytes=100)
+        self.assertEqual([r['id'] for r in segment_buffer.read()], [3, 4])
+        segment_buffer.append([dict(id=5)])
+        self.assertEqual([r['id'] for r in segment_buffer.read()], [3, 4, 5])
+
+        segment_buffer.commit()
+        self.assertEqual(segment_buffer.read(), [])
+        self.assertEqual(os.listdir(self.buffer_path), ['commit.json'])
+        segment_buffer.append([dict(id=6)])
+        segment_buffer.close()
+        self.assertEqual(SegmentBuffer(self.buffer_path).read(), [dict(id=6)])
+
+    def test_recover_from_partially_written_frame(self):
+        segment_buffer = SegmentBuffer(self.buffer_path)
+        segment_buffer.append([dict(id=1)])
+        segment_buffer.append([dict(id=2)])
+        segment_buffer.close()
+        segment_path = os.path.join(self.buffer_path, sorted(os.listdir(self.buffer_path))[0])
+        with open(segment_path, 'r+b') as fp:
+            fp.truncate(os.path.getsize(segment_path) - 1)
+
+        segment_buffer = SegmentBuffer(self.buffer_path)
+        self.assertEqual(segment_buffer.read(), [dict(id=1)])
+        segment_buffer.append([dict(id=3)])
+        self.assertEqual(segment_buffer.read(), [dict(id=1), dict(id=3)])
+
+    def test_migrate_legacy_buffer(self):
+        with open(self.buffer_path, 'w') as fp:
+            for i in range(2):
+                fp.write(json.dumps(dict(id=i)) + '\n')
+
+        segment_buffer = SegmentBuffer(self.buffer_path)
+        self.assertTrue(os.path.isdir(self.buffer_path))
+        self.assertEqual(segment_buffer.read(), [dict(id=0), dict(id=1)])
+
+    def test_migrate_shared_legacy_buffer(self):
+        shared_legacy_path = f'{self.buffer_path}.shared'
+        with open(shared_legacy_path, 'w') as fp:
+            fp.write(json.dumps(dict(id=1)) + '\n')
+
+        segment_buffer = SegmentBuffer(self.buffer_path, shared_legacy_path=shared_legacy_path)
+        self.assertEqual(segment_buffer.read(), [dict(id=1)])
+        segment_buffer.commit()
+        segment_buffer.close()
+        self.assertTrue(os.path.isfile(shared_legacy_path))
+
+        # The records are only appended when the buffer is created.
+        segment_buffer = SegmentBuffer(self.buffer_path, shared_legacy_path=shared_legacy_path)
+        self.assertEqual(segment_buffer.read(), [])
+        os.remove(shared_legacy_path)
+
+    def test_sink_buffer(self):
+        sink = DummySink(dict(connector_type='dummy'), buffer_path=self.buffer_path)
+        sink.write_buffer([dict(id=1)])
+        buffer_offset = sink.buffer_offset
+        sink.write_buffer([dict(id=2)])
+        sink.clear_buffer(buffer_offset)
+        self.assertEqual(sink.buffer, [dict(id=2)])
+
+        sink = DummySink(dict(connector_type='dummy'), buffer_path=self.buffer_path)
+        self.assertEqual(sink.buffer, [dict(id=2)])
+        sink.clear_buffer()
+        self.assertEqual(sink.buffer, [])
+        self.assertEqual(sink.read_buffer(), [])
@@ -0,0 +1,115 @@
+import json
+import os
+import shutil
+import tempfile
+from unittest.mock import MagicMock, patch
+
+from mage_ai.streaming.sources.checkpoint import CheckpointManager
+from mage_ai.tests.base_test import TestCase
+
+
+class CheckpointManagerTests(TestCase):
+    def setUp(self):
+        super().setUp()
+        self.checkpoint_dir = tempfile.mkdtemp()
+        self.checkpoint_path = os.path.join(self.checkpoint_dir, 'streaming_checkpoint')
+
+    def tearDown(self):
+        shutil.rmtree(self.checkpoint_dir)
+        super().tearDown()
+
+    def __read_checkpoint_file(self):
+        with open(self.checkpoint_path) as fp:
+            return json.load(fp)
+
+    def test_update_commits_every_interval_count(self):
+        commit_func = MagicMock()
+        manager = CheckpointManager(
+            checkpoint_path=self.checkpoint_path,
+            commit_func=commit_func,
+            interval_count=3,
+            interval_seconds=3600,
+        )
+        self.assertFalse(manager.update('shard1', '1'))
+        self.assertFalse(manager.update('shard2', '5'))
+        self.assertFalse(os.path.exists(self.checkpoint_path))
+        self.assertTrue(manager.update('shard1', '2'))
+        self.assertEqual(self.__read_checkpoint_file(), dict(shard1='2', shard2='5'))
+        commit_func.assert_called_once_with(dict(shard1='2', shard2='5'))
+        self.assertFalse(os.path.exists(f'{self.checkpoint_path}.tmp'))
+
+        manager.update('shard2', '6')
+        manager.commit()
+        self.assertEqual(self.__read_checkpoint_file(), dict(shard1='2', shard2='6'))
+        self.assertEqual(CheckpointManager(self.checkpoint_path).get('shard2'), '6')
+
+        # Nothing is pending.
+        manager.commit()
+        self.assertEqual(commit_func.call_count, 2)
+
+    def test_update_commits_every_interval_seconds(self):
+        with patch('mage_ai.streaming.sources.checkpoint.time.monotonic') as mock_monotonic:
+            mock_monotonic.return_value = 100
+            manager = CheckpointManager(
+                checkpoint_path=self.checkpoint_path,
+                interval_count=100,
+                interval_seconds=10,
+            )
+            self.assertFalse(manager.update(0, 10))
+            mock_monotonic.return_value = 111
+            self.assertTrue(manager.update(0, 20))
+            self.assertEqual(self.__read_checkpoint_file(), {'0': 20})
+
+    def test_read_invalid_checkpoint(self):
+        with open(self.checkpoint_path, 'w') as fp:
+            fp.write('{"shard1": ')
+        manager = CheckpointManager(checkpoint_path=self.checkpoint_path)
+        self.assertEqual(manager.offsets, dict())
+
+    def test_complete_batches_out_of_order(self):
+        commit_func = MagicMock()
+        manager = CheckpointManager(
+            checkpoint_path=self.checkpoint_path,
+            commit_func=commit_func,
+            interval_count=1,
+            interval_seconds=3600,
+        )
+        batch1 = manager.start_batch()
+        self.assertFalse(manager.update('shard1', '1'))
+        batch2 = manager.start_batch()
+        self.assertFalse(manager.update('shard1', '2'))
+        self.assertFalse(os.path.exists(self.checkpoint_path))
+
+        # The first batch isn't handled yet.
+        self.assertFalse(manager.complete_batch(batch2))
+        commit_func.assert_not_called()
+
+        self.assertTrue(manager.complete_batch(batch1))
+        commit_func.assert_called_once_with(dict(shard1='2'))
+        self.assertEqual(self.__read_checkpoint_file(), dict(shard1='2'))
+
+        # Without a pending batch, the offset is applied right away.
+        self.assertTrue(manager.update('shard1', '3'))
+        self.assertEqual(self.__read_checkpoint_file(), dict(shard1='3'))
+
+    def test_fail(self):
+        commit_func = MagicMock()
+        manager = CheckpointManager(
+            checkpoint_path=self.checkpoint_path,
+            commit_func=commit_func,
+            interval_count=1,
+            interval_seconds=3600,
+        )
+        batch1 = manager.start_batch()
+        manager.update('shard1', '1')
+        batch2 = manager.start_batch()
+        manager.update('shard1', '2')
+        self.assertTrue(manager.complete_batch(batch1))
+        commit_func.assert_called_once_with(dict(shard1='1'))
+
+        manager.fail()
+        self.assertFalse(manager.complete_batch(batch2))
+        self.assertFalse(manager.update('shard1', '3'))
+        manager.commit()
+        commit_func.assert_called_once()
+        self.assertEqual(self.__read_checkpoint_file(), dict(shard1='1'))
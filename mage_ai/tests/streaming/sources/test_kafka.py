@@ -1,4 +1,6 @@
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
+
+from kafka.structs import TopicPartition
 
 from mage_ai.streaming.sources.kafka import KafkaSource
 from mage_ai.tests.base_test import TestCase
@@ -66,3 +68,108 @@ class KafkaTests(TestCase):
             self.assertEqual(source.config.serde_config.serialization_method, 'PROTOBUF')
             self.assertEqual(
                 source.config.serde_config.schema_classpath, 'mage_ai.tests.base_test.TestCase')
+
+    def test_batch_read_pauses_partitions(self):
+        with patch.object(KafkaSource, 'init_client'):
+            source = KafkaSource(dict(
+                connector_type='kafka',
+                bootstrap_server='test_server',
+                consumer_group='test_group',
+                topic='test_topic',
+            ))
+        partitions = set(['partition0', 'partition1'])
+        paused_partitions = set()
+        source.consumer = MagicMock()
+        source.consumer.assignment.return_value = partitions
+        source.consumer.paused.side_effect = lambda: set(paused_partitions)
+        source.consumer.pause.side_effect = lambda *args: paused_partitions.update(args)
+        source.consumer.resume.side_effect = \
+            lambda *args: paused_partitions.difference_update(args)
+
+        polls = []
+
+        def poll(**kwargs):
+            polls.append(set(paused_partitions))
+            if len(polls) == 1:
+                source.pause()
+            elif len(polls) == 2:
+                source.resume()
+            elif len(polls) == 3:
+                raise StopIteration()
+            return dict()
+
+        source.consumer.poll.side_effect = poll
+        with self.assertRaises(StopIteration):
+            source.batch_read(handler=MagicMock())
+        self.assertEqual(polls, [set(), partitions, set()])
+
+    def test_batch_read_commits_offsets_in_batches(self):
+        with patch.object(KafkaSource, 'init_client'):
+            source = KafkaSource(dict(
+                connector_type='kafka',
+                bootstrap_server='test_server',
+                consumer_group='test_group',
+                topic='test_topic',
+                enable_auto_commit=False,
+                checkpoint_interval_count=3,
+            ))
+        source.consumer = MagicMock()
+        source.consumer.paused.return_value = set()
+
+        def message(offset):
+            return MagicMock(offset=offset, value=b'{"id": 1}')
+
+        msg_packs = [
+            {MagicMock(topic='test_topic', partition=0): [message(0), message(1)]},
+            {MagicMock(topic='test_topic', partition=1): [message(5)]},
+            {MagicMock(topic='test_topic', partition=0): [message(2)]},
+            {MagicMock(topic='test_topic', partition=1): [message(6)]},
+        ]
+
+        def poll(**kwargs):
+            if not msg_packs:
+                raise StopIteration()
+            return msg_packs.pop(0)
+
+        source.consumer.poll.side_effect = poll
+        with patch('mage_ai.streaming.sources.kafka.OffsetAndMetadata') as offset_and_metadata:
+            offset_and_metadata.side_effect = lambda offset, metadata: offset
+            with self.assertRaises(StopIteration):
+                source.batch_read(handler=MagicMock())
+
+        committed = [
+            {(tp.topic, tp.partition): offset for tp, offset in call.args[0].items()}
+            for call in source.consumer.commit.call_args_list
+        ]
+        self.assertEqual(committed, [
+            {('test_topic', 0): 3, ('test_topic', 1): 6},
+            {('test_topic', 0): 3, ('test_topic', 1): 7},
+        ])
+
+    def test_commit_offsets_on_consuming_thread(self):
+        with patch.object(KafkaSource, 'init_client'):
+            source = KafkaSource(dict(
+                connector_type='kafka',
+                bootstrap_server='test_server',
+                consumer_group='test_group',
+                topic='test_topic',
+                enable_auto_commit=False,
+            ))
+        source.consumer = MagicMock()
+        source.consumer.paused.return_value = set()
+
+        # E.g. the batch handler thread completed a batch.
+        source.commit_offsets({'test_topic:0': 3})
+        source.consumer.commit.assert_not_called()
+
+        def poll(**kwargs):
+            self.assertEqual(source.consumer.commit.call_count, 1)
+            raise StopIteration()
+
+        source.consumer.poll.side_effect = poll
+        with patch('mage_ai.streaming.sources.kafka.OffsetAndMetadata') as offset_and_metadata:
+            offset_and_metadata.side_effect = lambda offset, metadata: offset
+            with self.assertRaises(StopIteration):
+                source.batch_read(handler=MagicMock())
+
+        source.consumer.commit.assert_called_once_with({TopicPartition('test_topic', 0): 3})
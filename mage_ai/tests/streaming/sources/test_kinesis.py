@@ -1,6 +1,10 @@
 from mage_ai.streaming.sources.kinesis import KinesisSource
 from mage_ai.tests.base_test import TestCase
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
+import json
+import os
+import shutil
+import tempfile
 
 
 class KinesisTests(TestCase):
@@ -25,3 +29,54 @@ class KinesisTests(TestCase):
                 in str(context.exception),
             )
             self.assertEqual(mock_init_client.call_count, 0)
+
+    def test_batch_read_checkpoints_shards(self):
+        checkpoint_dir = tempfile.mkdtemp()
+        checkpoint_path = os.path.join(checkpoint_dir, 'streaming_checkpoint')
+        with open(checkpoint_path, 'w') as fp:
+            json.dump(dict(shard1='95'), fp)
+        self.addCleanup(shutil.rmtree, checkpoint_dir)
+
+        with patch.object(KinesisSource, 'init_client'):
+            source = KinesisSource(
+                dict(
+                    connector_type='kinesis',
+                    stream_name='test_stream',
+                    checkpoint_interval_count=100,
+                ),
+                checkpoint_path=checkpoint_path,
+            )
+        source.details = dict(Shards=[dict(ShardId='shard1'), dict(ShardId='shard2')])
+        source.kinesis_client = MagicMock()
+        source.kinesis_client.get_shard_iterator.side_effect = \
+            lambda **kwargs: dict(ShardIterator=kwargs['ShardId'])
+
+        def record(sequence_number):
+            return dict(Data=b'{"id": 1}', SequenceNumber=sequence_number)
+
+        responses = dict(
+            shard1=[
+                dict(NextShardIterator='shard1', Records=[record('99'), record('100')]),
+                dict(),
+            ],
+            shard2=[
+                dict(NextShardIterator='shard2', Records=[record('7')]),
+                dict(),
+            ],
+        )
+        source.kinesis_client.get_records.side_effect = \
+            lambda **kwargs: responses[kwargs['ShardIterator']].pop(0)
+
+        source.batch_read(handler=MagicMock())
+
+        self.assertEqual(
+            source.kinesis_client.get_shard_iterator.call_args_list[0].kwargs,
+            dict(
+                StreamName='test_stream',
+                ShardId='shard1',
+                ShardIteratorType='AFTER_SEQUENCE_NUMBER',
+                StartingSequenceNumber='95',
+            ),
+        )
+        with open(checkpoint_path) as fp:
+            self.assertEqual(json.load(fp), dict(shard1='100', shard2='7'))
@@ -0,0 +1,83 @@
+import threading
+import time
+
+from mage_ai.streaming.batch_queue import BatchQueue
+from mage_ai.tests.base_test import TestCase
+
+
+class BatchQueueTests(TestCase):
+    def test_watermarks(self):
+        events = []
+        batch_queue = BatchQueue(
+            max_batches=10,
+            high_watermark=4,
+            low_watermark=2,
+            on_high_watermark=lambda: events.append('pause'),
+            on_low_watermark=lambda: events.append('resume'),
+        )
+        batch_queue.put([1, 2])
+        self.assertEqual(events, [])
+        batch_queue.put([3, 4], channel='test')
+        self.assertEqual(events, ['pause'])
+        batch_queue.put([5])
+        self.assertEqual(events, ['pause'])
+
+        self.assertEqual(batch_queue.get(), ([1, 2], dict()))
+        batch_queue.task_done()
+        self.assertEqual(events, ['pause'])
+        self.assertEqual(batch_queue.get(), ([3, 4], dict(channel='test')))
+        batch_queue.task_done()
+        self.assertEqual(events, ['pause', 'resume'])
+
+        metrics = batch_queue.metrics()
+        self.assertEqual(metrics['depth_batches'], 1)
+        self.assertEqual(metrics['depth_records'], 1)
+        self.assertEqual(metrics['max_depth_records'], 5)
+        self.assertEqual(metrics['pause_count'], 1)
+        self.assertEqual(metrics['records_processed'], 4)
+        self.assertFalse(metrics['paused'])
+        self.assertGreaterEqual(metrics['lag_seconds'], 0)
+
+    def test_put_blocks_when_full(self):
+        batch_queue = BatchQueue(max_batches=10, max_records=3)
+        batch_queue.put([1, 2])
+        put_finished = threading.Event()
+
+        def put():
+            batch_queue.put([3, 4])
+            put_finished.set()
+
+        thread = threading.Thread(target=put)
+        thread.start()
+        time.sleep(0.1)
+        self.assertFalse(put_finished.is_set())
+
+        batch_queue.get()
+        batch_queue.task_done()
+        thread.join(timeout=5)
+        self.assertTrue(put_finished.is_set())
+        self.assertEqual(batch_queue.metrics()['depth_records'], 2)
+
+    def test_close(self):
+        batch_queue = BatchQueue()
+        batch_queue.close()
+        self.assertIsNone(batch_queue.get())
+        with self.assertRaises(Exception):
+            batch_queue.put([1])
+
+    def test_on_done(self):
+        done = []
+        batch_queue = BatchQueue(max_batches=10)
+        batch_queue.put([1], on_done=lambda: done.append(1))
+        batch_queue.put([2], on_done=lambda: done.append(2))
+        batch_queue.put([3])
+
+        self.assertEqual(batch_queue.get(), ([1], dict()))
+        self.assertEqual(done, [])
+        batch_queue.task_done()
+        self.assertEqual(done, [1])
+        batch_queue.get()
+        batch_queue.task_done()
+        batch_queue.get()
+        batch_queue.task_done()
+        self.assertEqual(done, [1, 2])
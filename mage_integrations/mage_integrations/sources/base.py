@@ -429,7 +429,7 @@ class Source:
                 ),
             )
 
-        if bookmark_properties and not self.is_sorted:
+        if bookmark_properties and not self._is_sorted_for_stream(stream):
             if max_bookmark:
                 state = {}
 
@@ -471,42 +471,35 @@ class Source:
             columns = list(properties.keys())
         columns += self.internal_column_schema(stream, bookmarks=bookmarks).keys()
 
-        final_record = None
-        for row in rows:
-            tap_stream_id = stream.tap_stream_id
-            record = {col: row.get(col) for col in columns}
-            write_records(
-                tap_stream_id,
-                [
-                    record,
-                ],
-            )
-            final_record = record
-
-            if (stream.replication_method in [
-                    REPLICATION_METHOD_INCREMENTAL,
-                    REPLICATION_METHOD_LOG_BASED,
-                ]
-                    and bookmark_properties):
-                if self.is_sorted:
-                    state = {}
-
-                    for idx, col in enumerate(bookmark_properties):
-                        singer.write_bookmark(
-                            state,
-                            tap_stream_id,
-                            col,
-                            row.get(col),
-                        )
+        tap_stream_id = stream.tap_stream_id
+        records = [{col: row.get(col) for col in columns} for row in rows]
+        write_records(tap_stream_id, records)
+        final_record = records[-1] if records else None
+
+        if (rows and stream.replication_method in [
+                REPLICATION_METHOD_INCREMENTAL,
+                REPLICATION_METHOD_LOG_BASED,
+            ]
+                and bookmark_properties):
+            if self._is_sorted_for_stream(stream):
+                # The state of the last row of the page includes the rows before it.
+                state = {}
 
-                    write_state(state)
-                else:
-                    # If data unsorted, save max value until end of writes
-                    max_bookmark = max(
-                        max_bookmark,
-                        [row.get(col) for col in bookmark_properties],
+                for idx, col in enumerate(bookmark_properties):
+                    singer.write_bookmark(
+                        state,
+                        tap_stream_id,
+                        col,
+                        rows[-1].get(col),
                     )
 
+                write_state(state)
+            else:
+                # If data unsorted, save max value until end of writes
+                max_bookmark = max(
+                    [row.get(col) for col in bookmark_properties] for row in rows
+                )
+
         return dict(
             final_record=final_record,
             max_bookmark=max_bookmark,
@@ -698,6 +691,13 @@ class Source:
 
         return schemas
 
+    def _is_sorted_for_stream(self, stream) -> bool:
+        """
+        Whether the rows of the stream are loaded in ascending order of the bookmark properties.
+        If they aren't, the state is written once all the rows are loaded.
+        """
+        return self.is_sorted
+
     def _get_bookmark_properties_for_stream(self, stream, bookmarks: Dict = None) -> List[str]:
         bookmark_properties = []
 
@@ -42,3 +42,11 @@ UNIQUE_CONFLICT_METHOD_UPDATE = 'UPDATE'
 
 BATCH_FETCH_LIMIT = 50000
 SUBBATCH_FETCH_LIMIT = 10000
+
+# How the SQL sources page through a table: with LIMIT/OFFSET, or by seeking past the
+# ORDER BY values of the last row of the previous page.
+PAGINATION_METHOD_KEYSET = 'keyset'
+PAGINATION_METHOD_OFFSET = 'offset'
+
+# Number of pages that each key range can load ahead of the pages written by the source.
+KEY_RANGE_BUFFER_SIZE_PER_PARTITION = 2
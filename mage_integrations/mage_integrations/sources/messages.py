@@ -43,6 +43,18 @@ class SchemaMessage(SchemaMessageOriginal):
         return result
 
 
+# Number of records serialized and written to stdout at a time.
+RECORDS_WRITE_BATCH_SIZE = 1000
+
+# The options of the encoder must be the same as the options of simplejson.dumps in
+# format_message.
+RECORD_ENCODER = simplejson.JSONEncoder(
+    default=encode_complex,
+    ignore_nan=True,
+    use_decimal=True,
+)
+
+
 def format_message(message):
     try:
         return simplejson.dumps(
@@ -115,9 +127,21 @@ def write_records(stream_name, records):
     chris = {"id": 1, "email": "chris@stitchdata.com"}
     mike = {"id": 2, "email": "mike@stitchdata.com"}
     write_records("users", [chris, mike])
+
+    The RECORD messages are the same as the messages written by write_record, but they're
+    serialized with one encoder and written to stdout in batches, with one flush.
     """
-    for record in records:
-        write_record(stream_name, record)
+    for idx in range(0, len(records), RECORDS_WRITE_BATCH_SIZE):
+        lines = []
+        for record in records[idx:idx + RECORDS_WRITE_BATCH_SIZE]:
+            message = dict(type='RECORD', stream=stream_name, record=record)
+            try:
+                lines.append(RECORD_ENCODER.encode(message))
+            except ValueError as err:
+                raise Exception(f'Fail to serialize message {message}') from err
+        lines.append('')
+        sys.stdout.write('\n'.join(lines))
+    sys.stdout.flush()
 
 
 def write_state(value):
@@ -1,5 +1,6 @@
-from time import sleep
-from typing import Any, Dict, Generator, List, Tuple
+import queue
+import threading
+from typing import Any, Callable, Dict, Generator, List, Tuple
 
 from singer.schema import Schema
 
@@ -14,6 +15,9 @@ from mage_integrations.sources.constants import (
     COLUMN_TYPE_NUMBER,
     COLUMN_TYPE_OBJECT,
     COLUMN_TYPE_STRING,
+    KEY_RANGE_BUFFER_SIZE_PER_PARTITION,
+    PAGINATION_METHOD_KEYSET,
+    PAGINATION_METHOD_OFFSET,
     REPLICATION_METHOD_FULL_TABLE,
     REPLICATION_METHOD_LOG_BASED,
     SUBBATCH_FETCH_LIMIT,
@@ -21,13 +25,15 @@ from mage_integrations.sources.constants import (
 )
 from mage_integrations.sources.sql.utils import (
     build_comparison_statement,
+    build_key_range_boundaries,
     column_type_mapping,
 )
 from mage_integrations.sources.sql.utils import (
     wrap_column_in_quotes as wrap_column_in_quotes_orig,
 )
 from mage_integrations.sources.utils import get_standard_metadata
-from mage_integrations.utils.dictionary import group_by
+from mage_integrations.utils.dictionary import group_by, merge_dict
+from mage_integrations.utils.parsers import encode_complex
 from mage_integrations.utils.schema_helpers import (
     extract_selected_columns,
     filter_columns,
@@ -181,31 +187,13 @@ class Source(BaseSource):
                 yield data
             return
 
-        rows_temp = None
-        loops = 0
-
-        while rows_temp is None or len(rows_temp) >= 1:
-            if loops >= 1:
-                sleep(1)
-
-            custom_limit = query.get('_limit')
-            limit = SUBBATCH_FETCH_LIMIT
-            offset = query.get('_offset', 0) + SUBBATCH_FETCH_LIMIT * loops
-
-            rows, rows_temp = self.__fetch_rows(
-                stream,
-                bookmarks,
-                query,
-                limit=limit,
-                offset=offset,
-            )
-            yield rows
-
-            loops += 1
-
-            if (custom_limit is not None and limit * loops >= custom_limit) or \
-                    len(rows_temp) < SUBBATCH_FETCH_LIMIT:
-                break
+        key_ranges = self.__key_ranges(stream, bookmarks, query)
+        if key_ranges:
+            for rows in self.__load_data_in_key_ranges(stream, key_ranges, bookmarks, query):
+                yield rows
+        else:
+            for rows in self.__load_data_in_pages(stream, bookmarks, query):
+                yield rows
 
         # If the query params doesn't have limit, then that's the last query in the batch.
         if not query.get('_limit'):
@@ -264,6 +252,10 @@ WHERE table_schema = '{schema}'
     def _limit_query_string(self, limit, offset):
         return f'LIMIT {limit} OFFSET {offset}'
 
+    def _is_sorted_for_stream(self, stream) -> bool:
+        # The rows of the key ranges are loaded concurrently.
+        return super()._is_sorted_for_stream(stream) and self.__key_range_partitions() <= 1
+
     def _replication_method(self, stream, bookmarks: Dict = None):
         return stream.replication_method
 
@@ -275,19 +267,7 @@ WHERE table_schema = '{schema}'
                 pass
         return bytes_or_str
 
-    def __fetch_rows(
-        self,
-        stream,
-        bookmarks: Dict = None,
-        query: Dict = None,
-        count_records: bool = False,
-        limit: int = SUBBATCH_FETCH_LIMIT,
-        offset: int = 0,
-    ) -> Tuple[List[Dict], List[Any]]:
-        if query is None:
-            query = {}
-        table_name = stream.tap_stream_id
-
+    def __order_by_columns(self, stream, columns: List[str]) -> List[str]:
         key_properties = stream.key_properties
         unique_constraints = stream.unique_constraints
         bookmark_properties = self._get_bookmark_properties_for_stream(stream)
@@ -308,9 +288,6 @@ WHERE table_schema = '{schema}'
                 if col not in order_by_columns:
                     order_by_columns.append(col)
 
-        columns = extract_selected_columns(stream.metadata)
-        clean_columns = self.update_column_names(columns)
-
         if not order_by_columns:
             order_by_columns = filter_columns(
                 columns,
@@ -322,23 +299,330 @@ WHERE table_schema = '{schema}'
                     COLUMN_TYPE_STRING,
                 ],
             )
-        order_by_columns = self.update_column_names(order_by_columns)
 
-        if order_by_columns and not count_records:
-            order_by_statement = f"ORDER BY {', '.join(order_by_columns)}"
-        else:
-            order_by_statement = ''
+        return order_by_columns
 
-        if count_records:
-            columns_statement = 'COUNT(*) AS number_of_records'
-        else:
-            columns_statement = '\n, '.join(clean_columns)
+    def __load_data_in_pages(
+        self,
+        stream,
+        bookmarks: Dict = None,
+        query: Dict = None,
+        where_statements: List[str] = None,
+    ) -> Generator[List[Dict], None, None]:
+        keyset_columns = self.__keyset_columns(stream)
+        if keyset_columns:
+            for rows in self.__load_data_with_keyset(
+                stream,
+                keyset_columns,
+                bookmarks,
+                query,
+                where_statements=where_statements,
+            ):
+                yield rows
+            return
+
+        rows_temp = None
+        loops = 0
+
+        while rows_temp is None or len(rows_temp) >= 1:
+            custom_limit = query.get('_limit')
+            limit = SUBBATCH_FETCH_LIMIT
+            offset = query.get('_offset', 0) + SUBBATCH_FETCH_LIMIT * loops
+
+            rows, rows_temp = self.__fetch_rows(
+                stream,
+                bookmarks,
+                query,
+                limit=limit,
+                offset=offset,
+                where_statements=where_statements,
+            )
+            yield rows
+
+            loops += 1
+
+            if (custom_limit is not None and limit * loops >= custom_limit) or \
+                    len(rows_temp) < SUBBATCH_FETCH_LIMIT:
+                break
+
+    def __key_range_partitions(self) -> int:
+        return int((self.config or dict()).get('key_range_partitions') or 1)
+
+    def __key_ranges(
+        self,
+        stream,
+        bookmarks: Dict = None,
+        query: Dict = None,
+    ) -> List[List[str]]:
+        """
+        Splits the rows of the stream into disjoint ranges of the first numeric or datetime
+        ORDER BY column, between its minimum and maximum values, if the key range partitioning
+        is enabled.
+
+        Returns:
+            List[List[str]]: The WHERE statements of each range, or None if the rows can't be
+                split.
+        """
+        partitions = self.__key_range_partitions()
+        # The batches of the query are already a partition of the rows.
+        if partitions <= 1 or query.get('_limit') is not None or query.get('_offset'):
+            return None
+
+        columns = extract_selected_columns(stream.metadata)
+        properties = stream.schema.to_dict()['properties']
+        key_column = None
+        for col in self.__order_by_columns(stream, columns):
+            column_types = properties.get(col, {}).get('type', [])
+            if col in columns and (
+                COLUMN_TYPE_INTEGER in column_types or
+                COLUMN_TYPE_NUMBER in column_types or
+                COLUMN_FORMAT_DATETIME == properties[col].get('format')
+            ):
+                key_column = col
+                break
+
+        tags = dict(partitions=partitions, stream=stream.tap_stream_id)
+        if key_column is None:
+            self.logger.info(
+                f'Key range partitioning can’t be used for stream {stream.tap_stream_id}, none '
+                'of the ORDER BY columns is a selected numeric or datetime column.',
+                tags=tags,
+            )
+            return None
 
+        column_cleaned = self.update_column_names([key_column])[0]
         query_string = '\n'.join([
             'SELECT',
-            columns_statement,
+            f'MIN({column_cleaned}), MAX({column_cleaned})',
             f'FROM {self.build_table_name(stream)}',
         ])
+        where_statements = self.__build_where_statements(stream, bookmarks, query, columns)
+        if where_statements:
+            query_string = f"{query_string}\nWHERE {' AND '.join(where_statements)}"
+        min_value, max_value = self.build_connection().load(query_string)[0]
+
+        boundaries = build_key_range_boundaries(min_value, max_value, partitions)
+        if not boundaries:
+            return None
+
+        self.logger.info(
+            f'Loading stream {stream.tap_stream_id} in {len(boundaries) + 1} ranges of column '
+            f'{key_column}.',
+            tags=merge_dict(tags, dict(
+                column=key_column,
+                max_value=str(max_value),
+                min_value=str(min_value),
+            )),
+        )
+
+        def compare(operator: str, val: Any) -> str:
+            return self._build_comparison_statement(
+                key_column,
+                self.__escape_value(val),
+                properties,
+                operator=operator,
+            )
+
+        # The first and the last ranges are open, so that the rows written after the minimum and
+        # maximum values are computed and the NULL values are also loaded.
+        key_ranges = [[
+            f'({compare("<", boundaries[0])} OR {self.wrap_column_in_quotes(key_column)} IS NULL)',
+        ]]
+        for lower, upper in zip(boundaries, boundaries[1:]):
+            key_ranges.append([compare('>=', lower), compare('<', upper)])
+        key_ranges.append([compare('>=', boundaries[-1])])
+
+        return key_ranges
+
+    def __load_data_in_key_ranges(
+        self,
+        stream,
+        key_ranges: List[List[str]],
+        bookmarks: Dict = None,
+        query: Dict = None,
+    ) -> Generator[List[Dict], None, None]:
+        """
+        Loads the pages of each key range in its own thread, with its own connection and its own
+        position in the range, and yields the pages in the order they are fetched.
+        """
+        pages = queue.Queue(maxsize=len(key_ranges) * KEY_RANGE_BUFFER_SIZE_PER_PARTITION)
+        stop_event = threading.Event()
+        errors = []
+
+        def load_key_range(where_statements: List[str]) -> None:
+            try:
+                for rows in self.__load_data_in_pages(
+                    stream,
+                    bookmarks,
+                    query,
+                    where_statements=where_statements,
+                ):
+                    if stop_event.is_set():
+                        break
+                    pages.put(rows)
+            except Exception as err:
+                errors.append(err)
+            finally:
+                pages.put(None)
+
+        threads = [
+            threading.Thread(target=load_key_range, args=(where_statements,), daemon=True)
+            for where_statements in key_ranges
+        ]
+        for thread in threads:
+            thread.start()
+
+        try:
+            ranges_completed = 0
+            while ranges_completed < len(threads):
+                rows = pages.get()
+                if rows is None:
+                    ranges_completed += 1
+                    if errors:
+                        raise errors[0]
+                    continue
+                yield rows
+        finally:
+            stop_event.set()
+            # Unblock the threads waiting for space in the queue.
+            while any(thread.is_alive() for thread in threads):
+                try:
+                    pages.get(timeout=0.1)
+                except queue.Empty:
+                    pass
+
+    def __keyset_columns(self, stream) -> List[str]:
+        """
+        Returns the ORDER BY columns if the keyset pagination is enabled and can be used for the
+        stream: the columns must include a unique key, be selected and not be nullable, so
+        that each row is after the last row of the previous page in the order of the columns.
+        """
+        pagination_method = (self.config or dict()).get(
+            'pagination_method',
+            PAGINATION_METHOD_OFFSET,
+        )
+        if PAGINATION_METHOD_KEYSET != pagination_method:
+            return None
+
+        columns = extract_selected_columns(stream.metadata)
+        order_by_columns = self.__order_by_columns(stream, columns)
+        properties = stream.schema.to_dict()['properties']
+
+        unique_columns = stream.key_properties or stream.unique_constraints
+        if not unique_columns or any(
+            col not in columns or COLUMN_TYPE_NULL in properties[col].get('type', [])
+            for col in order_by_columns
+        ):
+            self.logger.info(
+                f'Keyset pagination can’t be used for stream {stream.tap_stream_id}, the '
+                'ORDER BY columns must include a unique key, be selected and not be '
+                'nullable. Paginating with LIMIT and OFFSET.',
+                tags=dict(order_by_columns=order_by_columns, stream=stream.tap_stream_id),
+            )
+            return None
+
+        return order_by_columns
+
+    def __load_data_with_keyset(
+        self,
+        stream,
+        keyset_columns: List[str],
+        bookmarks: Dict = None,
+        query: Dict = None,
+        where_statements: List[str] = None,
+    ) -> Generator[List[Dict], None, None]:
+        """
+        Fetches each page with the rows after the last row of the previous page in the ORDER BY
+        columns, instead of skipping the rows of the previous pages with OFFSET. All the pages
+        are fetched with the same database connection.
+        """
+        connection = self.build_connection()
+        if hasattr(connection, 'execute_with_connection'):
+            db_connection = connection.build_connection()
+
+            def load(query_string: str) -> List[Any]:
+                return connection.execute_with_connection(db_connection, [query_string])[0]
+        else:
+            db_connection = None
+            load = connection.load
+
+        try:
+            custom_limit = query.get('_limit')
+            # Only the first page of a batch skips the rows of the previous batches.
+            offset = query.get('_offset', 0)
+            keyset_values = None
+            rows_fetched = 0
+
+            while True:
+                limit = SUBBATCH_FETCH_LIMIT
+                if custom_limit is not None:
+                    limit = min(limit, custom_limit - rows_fetched)
+                    if limit <= 0:
+                        break
+
+                rows, rows_temp = self.__fetch_rows(
+                    stream,
+                    bookmarks,
+                    query,
+                    limit=limit,
+                    offset=offset if keyset_values is None else 0,
+                    keyset_values=keyset_values,
+                    load_func=load,
+                    where_statements=where_statements,
+                )
+                yield rows
+
+                rows_fetched += len(rows_temp)
+                if len(rows_temp) < limit:
+                    break
+                keyset_values = {col: rows[-1][col] for col in keyset_columns}
+        finally:
+            if db_connection is not None:
+                connection.close_connection(db_connection)
+
+    def __build_keyset_statement(self, keyset_values: Dict, properties: Dict) -> str:
+        """
+        Returns the condition of the rows after the values in the order of the columns:
+        (c1 > v1) OR (c1 = v1 AND c2 > v2) OR ...
+        """
+        statements = []
+        keyset_items = list(keyset_values.items())
+        for idx, (col, val) in enumerate(keyset_items):
+            comparisons = [
+                self._build_comparison_statement(
+                    col_previous,
+                    self.__escape_value(val_previous),
+                    properties,
+                )
+                for col_previous, val_previous in keyset_items[:idx]
+            ]
+            comparisons.append(self._build_comparison_statement(
+                col,
+                self.__escape_value(val),
+                properties,
+                operator='>',
+            ))
+            statements.append(f"({' AND '.join(comparisons)})")
+
+        return f"({' OR '.join(statements)})"
+
+    def __escape_value(self, val: Any) -> Any:
+        # Serialize the value like the bookmarks are serialized in the state, e.g. datetimes
+        # as ISO 8601 strings, so that convert_datetime gets the same values.
+        val = encode_complex(val)
+        if type(val) is str:
+            return val.replace("'", "''")
+        return val
+
+    def __build_where_statements(
+        self,
+        stream,
+        bookmarks: Dict,
+        query: Dict,
+        columns: List[str],
+    ) -> List[str]:
+        unique_constraints = stream.unique_constraints
+        bookmark_properties = self._get_bookmark_properties_for_stream(stream)
 
         where_statements = []
         if bookmarks:
@@ -368,6 +652,58 @@ WHERE table_schema = '{schema}'
                         )
                     )
 
+        return where_statements
+
+    def __fetch_rows(
+        self,
+        stream,
+        bookmarks: Dict = None,
+        query: Dict = None,
+        count_records: bool = False,
+        limit: int = SUBBATCH_FETCH_LIMIT,
+        offset: int = 0,
+        keyset_values: Dict = None,
+        load_func: Callable[[str], List[Any]] = None,
+        where_statements: List[str] = None,
+    ) -> Tuple[List[Dict], List[Any]]:
+        if query is None:
+            query = {}
+        table_name = stream.tap_stream_id
+
+        columns = extract_selected_columns(stream.metadata)
+        clean_columns = self.update_column_names(columns)
+
+        order_by_columns = self.update_column_names(self.__order_by_columns(stream, columns))
+
+        if order_by_columns and not count_records:
+            order_by_statement = f"ORDER BY {', '.join(order_by_columns)}"
+        else:
+            order_by_statement = ''
+
+        if count_records:
+            columns_statement = 'COUNT(*) AS number_of_records'
+        else:
+            columns_statement = '\n, '.join(clean_columns)
+
+        query_string = '\n'.join([
+            'SELECT',
+            columns_statement,
+            f'FROM {self.build_table_name(stream)}',
+        ])
+
+        where_statements = self.__build_where_statements(
+            stream,
+            bookmarks,
+            query,
+            columns,
+        ) + (where_statements or [])
+
+        if keyset_values:
+            where_statements.append(self.__build_keyset_statement(
+                keyset_values,
+                stream.schema.to_dict()['properties'],
+            ))
+
         if where_statements:
             where_statement = ' AND '.join(where_statements)
             query_string = f"{query_string}\nWHERE {where_statement}"
@@ -387,7 +723,9 @@ WHERE table_schema = '{schema}'
             ]
         with_limit_query_string = '\n'.join(with_limit_query_string)
 
-        rows_temp = self.build_connection().load(with_limit_query_string)
+        if load_func is None:
+            load_func = self.build_connection().load
+        rows_temp = load_func(with_limit_query_string)
         if count_records:
             rows = [dict(number_of_records=row[0]) for row in rows_temp]
             self.logger.info(f'Counting records for {table_name} completed.', tags=dict(
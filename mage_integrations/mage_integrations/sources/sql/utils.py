@@ -7,7 +7,9 @@ from mage_integrations.sources.constants import (
     COLUMN_TYPE_OBJECT,
 )
 from mage_integrations.utils.array import find
-from typing import Any, Callable, Dict
+from datetime import date
+from decimal import Decimal
+from typing import Any, Callable, Dict, List
 
 
 def build_comparison_statement(
@@ -33,6 +35,29 @@ def build_comparison_statement(
     return f"{column_cleaned if column_cleaned else col} {operator} CAST('{val}' AS {col_type})"
 
 
+def build_key_range_boundaries(min_value: Any, max_value: Any, partitions: int) -> List[Any]:
+    """
+    Returns the values that split the interval between the minimum and the maximum values into
+    partitions of the same width, without the duplicate values of narrow intervals.
+    """
+    if min_value is None or max_value is None or min_value >= max_value:
+        return []
+
+    boundaries = []
+    for idx in range(1, partitions):
+        if type(min_value) is int:
+            boundary = min_value + (max_value - min_value) * idx // partitions
+        elif isinstance(min_value, (date, Decimal, float)):
+            boundary = min_value + (max_value - min_value) * idx / partitions
+        else:
+            return []
+
+        if boundary > min_value and (not boundaries or boundary > boundaries[-1]):
+            boundaries.append(boundary)
+
+    return boundaries
+
+
 def column_type_mapping(column_type: str, column_format: str = None) -> str:
     if COLUMN_TYPE_BOOLEAN == column_type:
         return 'BOOL'
@@ -1,6 +1,9 @@
+from datetime import datetime
 from mage_integrations.sources.catalog import CatalogEntry
 from mage_integrations.sources.sql.base import Source
+from mage_integrations.sources.sql.utils import build_key_range_boundaries
 from mage_integrations.tests.sources.test_base import build_sample_streams_catalog
+from singer.schema import Schema
 from unittest.mock import MagicMock, patch
 import unittest
 
@@ -210,3 +213,151 @@ class BaseSQLSourceTests(unittest.TestCase):
                             },
                         ],
                     )
+
+    def test_load_data_keyset_pagination(self):
+        source = Source(config=dict(pagination_method='keyset'))
+        catalog = build_sample_streams_catalog()
+        stream = catalog.streams[1]
+        stream.key_properties = ['id']
+        build_connection_result = MagicMock()
+        build_connection_result.execute_with_connection.side_effect = [
+            [[
+                (18, '2', 'scott', 'jason', 'red'),
+                (17, "3'", 'hart', 'kimberly', 'pink'),
+            ]],
+            [[
+                (16, '4', 'smith', 'trini', 'yellow'),
+            ]],
+        ]
+        with patch('mage_integrations.sources.sql.base.SUBBATCH_FETCH_LIMIT', 2):
+            with patch.object(
+                source,
+                'build_connection',
+                return_value=build_connection_result,
+            ) as mock_build_connection:
+                result = list(source.load_data(stream))
+                mock_build_connection.assert_called_once()
+                build_connection_result.build_connection.assert_called_once()
+                build_connection_result.close_connection.assert_called_once()
+                build_connection_result.load.assert_not_called()
+
+        self.assertEqual(
+            [[row['id'] for row in rows] for rows in result],
+            [['2', "3'"], ['4']],
+        )
+        queries = [
+            call.args[1][0]
+            for call in build_connection_result.execute_with_connection.call_args_list
+        ]
+        self.assertIn('OFFSET 0', queries[0])
+        self.assertNotIn('WHERE', queries[0])
+        self.assertIn('WHERE (("id" > CAST(\'3\'\'\' AS VARCHAR)))', queries[1])
+        self.assertIn('OFFSET 0', queries[1])
+
+    def test_load_data_keyset_pagination_datetime(self):
+        source = Source(config=dict(pagination_method='keyset'))
+        catalog = build_sample_streams_catalog()
+        stream = catalog.streams[1]
+        schema = stream.schema.to_dict()
+        schema['properties']['age'] = dict(type=['string'], format='date-time')
+        stream.schema = Schema.from_dict(schema)
+        stream.key_properties = ['age']
+        build_connection_result = MagicMock()
+        build_connection_result.execute_with_connection.side_effect = [
+            [[
+                (datetime(2023, 1, 1), '1', 'scott', 'jason', 'red'),
+                (datetime(2023, 1, 2, 3, 4, 5, 678000), '2', 'hart', 'kimberly', 'pink'),
+            ]],
+            [[]],
+        ]
+
+        def convert_datetime(val):
+            # Like the MSSQL source, only strings can be converted.
+            return val.split('.')[0]
+
+        with patch('mage_integrations.sources.sql.base.SUBBATCH_FETCH_LIMIT', 2):
+            with patch.object(source, 'build_connection', return_value=build_connection_result):
+                with patch.object(source, 'convert_datetime', side_effect=convert_datetime):
+                    list(source.load_data(stream))
+
+        queries = [
+            call.args[1][0]
+            for call in build_connection_result.execute_with_connection.call_args_list
+        ]
+        self.assertIn('"age" > CAST(\'2023-01-02T03:04:05\'', queries[1])
+
+    def test_load_data_key_ranges(self):
+        source = Source(config=dict(key_range_partitions=3))
+        catalog = build_sample_streams_catalog()
+        stream = catalog.streams[1]
+        stream.bookmark_properties = ['age']
+        rows_by_range = {
+            'WHERE ("age" < CAST(\'10\'': [(5, '1', 'scott', 'jason', 'red')],
+            'WHERE "age" >= CAST(\'10\'': [(18, '2', 'hart', 'kimberly', 'pink')],
+            'WHERE "age" >= CAST(\'20\'': [(30, '3', 'smith', 'trini', 'yellow')],
+        }
+
+        def load(query_string):
+            if 'MIN(' in query_string:
+                return [(0, 30)]
+            return next(rows for key, rows in rows_by_range.items() if key in query_string)
+
+        build_connection_result = MagicMock()
+        build_connection_result.load.side_effect = load
+        with patch.object(source, 'build_connection', return_value=build_connection_result):
+            result = list(source.load_data(stream))
+
+        self.assertEqual(
+            sorted(row['age'] for rows in result for row in rows),
+            [5, 18, 30],
+        )
+        queries = [call.args[0] for call in build_connection_result.load.call_args_list]
+        self.assertIn('SELECT\nMIN(age), MAX(age)\nFROM demo_users', queries[0])
+        self.assertTrue(any('"age" IS NULL' in query_string for query_string in queries))
+        self.assertTrue(any(
+            '"age" >= CAST(\'10\' AS VARCHAR) AND "age" < CAST(\'20\' AS VARCHAR)' in query_string
+            for query_string in queries
+        ))
+        self.assertFalse(source._is_sorted_for_stream(stream))
+
+    def test_load_data_key_ranges_datetime(self):
+        source = Source(config=dict(key_range_partitions=2))
+        catalog = build_sample_streams_catalog()
+        stream = catalog.streams[1]
+        schema = stream.schema.to_dict()
+        schema['properties']['age'] = dict(type=['string'], format='date-time')
+        stream.schema = Schema.from_dict(schema)
+        stream.bookmark_properties = ['age']
+
+        def load(query_string):
+            if 'MIN(' in query_string:
+                return [(datetime(2023, 1, 1), datetime(2023, 1, 3))]
+            return []
+
+        def convert_datetime(val):
+            # Like the MSSQL source, only strings can be converted.
+            return val.split('.')[0]
+
+        build_connection_result = MagicMock()
+        build_connection_result.load.side_effect = load
+        with patch.object(source, 'build_connection', return_value=build_connection_result):
+            with patch.object(source, 'convert_datetime', side_effect=convert_datetime):
+                list(source.load_data(stream))
+
+        queries = [call.args[0] for call in build_connection_result.load.call_args_list]
+        self.assertTrue(any(
+            '"age" < CAST(\'2023-01-02T00:00:00\'' in query_string for query_string in queries
+        ))
+        self.assertTrue(any(
+            '"age" >= CAST(\'2023-01-02T00:00:00\'' in query_string for query_string in queries
+        ))
+
+    def test_build_key_range_boundaries(self):
+        self.assertEqual(build_key_range_boundaries(0, 30, 3), [10, 20])
+        self.assertEqual(build_key_range_boundaries(0, 2, 4), [1])
+        self.assertEqual(build_key_range_boundaries(5, 5, 4), [])
+        self.assertEqual(build_key_range_boundaries(None, 5, 4), [])
+        self.assertEqual(
+            build_key_range_boundaries(datetime(2023, 1, 1), datetime(2023, 1, 3), 2),
+            [datetime(2023, 1, 2)],
+        )
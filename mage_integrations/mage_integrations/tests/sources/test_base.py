@@ -1,10 +1,12 @@
 from mage_integrations.sources.base import Source
 from mage_integrations.sources.catalog import Catalog, CatalogEntry
 from mage_integrations.sources.intercom import Intercom
+from mage_integrations.sources.messages import write_record
 from mage_integrations.sources.postgresql import PostgreSQL
 from mage_integrations.sources.stripe import Stripe
 from singer.schema import Schema
 from unittest.mock import MagicMock, patch
+import io
 import os
 import unittest
 import json
@@ -291,6 +293,36 @@ class BaseSourceTests(unittest.TestCase):
                 ),
             )
 
+    def test_write_records_page(self):
+        source = Source(is_sorted=True)
+        stream = build_sample_streams_catalog().streams[1]
+        rows = [
+            dict(age=18, color='red', first_name='jason', id=2, last_name='scott'),
+            dict(age=17, color=None, first_name='kimberly', id=3, last_name='hart'),
+        ]
+        with patch('sys.stdout', new_callable=io.StringIO) as stdout:
+            write_record(stream.tap_stream_id, dict(id=1))
+            expected_line = stdout.getvalue()
+        with patch('sys.stdout', new_callable=io.StringIO) as stdout:
+            source.write_records(stream, rows)
+            lines = stdout.getvalue().splitlines()
+
+        self.assertEqual(lines[0], expected_line.replace('{"id": 1}', json.dumps(dict(
+            age=18,
+            id=2,
+            last_name='scott',
+            first_name='jason',
+            color='red',
+        ))).rstrip('\n'))
+        self.assertEqual(
+            [json.loads(line)['type'] for line in lines],
+            ['RECORD', 'RECORD', 'STATE'],
+        )
+        self.assertEqual(
+            json.loads(lines[2])['value'],
+            {'bookmarks': {'demo_users': {'id': 3}}},
+        )
+
     def test_sync(self):
         catalog = build_sample_streams_catalog()
         catalog.get_selected_streams = MagicMock()
@@ -0,0 +1,181 @@
+"""
+Benchmark the type inference of string columns on wide and long data frames, against the
+previous implementation of `infer_object_type`, which stripped the values with Python lambdas,
+counted the matches of each pattern over all the values and computed the number of unique
+values twice.
+
+The inferred types of both implementations are checked to be the same.
+
+    python scripts/benchmarks/column_type_inference.py --wide-columns 500 --long-rows 100000
+"""
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from mage_ai.data_cleaner.column_types.column_type_detector import (
+    DATETIME_MATCHES_THRESHOLD,
+    MAXIMUM_WORD_LENGTH_FOR_CATEGORY_FEATURES,
+    NUMBER_TYPE_MATCHES_THRESHOLD,
+    REGEX_DATETIME,
+    REGEX_EMAIL,
+    REGEX_INTEGER,
+    REGEX_LIST,
+    REGEX_NUMBER,
+    REGEX_PHONE_NUMBER,
+    REGEX_ZIP_CODE,
+    RESERVED_PHONE_NUMBER_WORDS,
+    RESERVED_ZIP_CODE_WORDS,
+    STRING_TYPE_MATCHES_THRESHOLD,
+    infer_object_type,
+    str_in_set,
+)
+from mage_ai.data_cleaner.column_types.constants import ColumnType
+
+
+def previous_infer_object_type(series, column_name, kwargs):
+    clean_series = series.apply(lambda x: x.strip(' \'\"') if type(x) is str else x)
+    clean_series = clean_series.map(lambda x: x if (not isinstance(x, str) or x != '') else np.nan)
+    clean_series = clean_series.dropna()
+
+    exact_dtype = type(clean_series.iloc[0]) if clean_series.count() else None
+    if exact_dtype in [list, tuple, set]:
+        return ColumnType.LIST
+
+    series_nunique = series.nunique(dropna=False)
+    clean_series_nunique = clean_series.nunique()
+    if np.issubdtype(exact_dtype, np.bool_):
+        if clean_series_nunique <= 2:
+            return ColumnType.TRUE_OR_FALSE
+        else:
+            return ColumnType.CATEGORY
+    elif clean_series_nunique <= 2:
+        return ColumnType.TRUE_OR_FALSE
+
+    clean_series = clean_series.astype(str)
+    length = len(clean_series)
+    if all(clean_series.str.match(REGEX_NUMBER)):
+        if not all(clean_series.str.match(REGEX_INTEGER)):
+            return ColumnType.NUMBER_WITH_DECIMALS
+        else:
+            lowercase_column_name = column_name.lower()
+            correct_phone_nums = clean_series.str.match(REGEX_PHONE_NUMBER).sum()
+            correct_zip_codes = clean_series.str.match(REGEX_ZIP_CODE).sum()
+            if correct_phone_nums / length >= NUMBER_TYPE_MATCHES_THRESHOLD and str_in_set(
+                lowercase_column_name, RESERVED_PHONE_NUMBER_WORDS
+            ):
+                return ColumnType.PHONE_NUMBER
+            elif correct_zip_codes / length >= NUMBER_TYPE_MATCHES_THRESHOLD and str_in_set(
+                lowercase_column_name, RESERVED_ZIP_CODE_WORDS
+            ):
+                return ColumnType.ZIP_CODE
+            else:
+                clean_series = clean_series.str.replace(r'\.0*', '', regex=True)
+                try:
+                    clean_series.astype(int)
+                    return ColumnType.NUMBER
+                except OverflowError:
+                    if clean_series_nunique <= kwargs.get('category_cardinality_threshold', 255):
+                        return ColumnType.CATEGORY
+                    else:
+                        return ColumnType.CATEGORY_HIGH_CARDINALITY
+
+    else:
+        matches = clean_series.str.match(REGEX_DATETIME).sum()
+        if matches / length >= DATETIME_MATCHES_THRESHOLD:
+            return ColumnType.DATETIME
+        correct_emails = clean_series.str.match(REGEX_EMAIL).sum()
+        correct_phone_nums = clean_series.str.match(REGEX_PHONE_NUMBER).sum()
+        correct_zip_codes = clean_series.str.match(REGEX_ZIP_CODE).sum()
+        correct_lists = clean_series.str.match(REGEX_LIST).sum()
+        lowercase_column_name = column_name.lower()
+        if correct_emails / length >= STRING_TYPE_MATCHES_THRESHOLD:
+            return ColumnType.EMAIL
+        elif correct_phone_nums / length >= STRING_TYPE_MATCHES_THRESHOLD and str_in_set(
+            lowercase_column_name, RESERVED_PHONE_NUMBER_WORDS
+        ):
+            return ColumnType.PHONE_NUMBER
+        elif correct_zip_codes / length >= STRING_TYPE_MATCHES_THRESHOLD and str_in_set(
+            lowercase_column_name, RESERVED_ZIP_CODE_WORDS
+        ):
+            return ColumnType.ZIP_CODE
+        elif correct_lists / length >= STRING_TYPE_MATCHES_THRESHOLD:
+            return ColumnType.LIST
+        elif series_nunique == 2:
+            return ColumnType.TRUE_OR_FALSE
+
+        if clean_series_nunique / length >= 0.8:
+            return ColumnType.TEXT
+
+        word_count = clean_series.map(lambda x: len(str(x).split(' '))).max()
+        if word_count > MAXIMUM_WORD_LENGTH_FOR_CATEGORY_FEATURES:
+            return ColumnType.TEXT
+
+        if clean_series_nunique <= kwargs.get('category_cardinality_threshold', 255):
+            return ColumnType.CATEGORY
+        else:
+            return ColumnType.CATEGORY_HIGH_CARDINALITY
+
+
+def build_columns(rows: int, rng: np.random.Generator):
+    words = np.array(['alpha', 'beta', 'gamma', 'delta', 'epsilon', 'zeta', 'eta', 'theta'])
+    dates = pd.Timestamp('2023-01-01') + pd.to_timedelta(rng.integers(0, 10**7, rows), unit='s')
+    return dict(
+        category=pd.Series(rng.choice(words, rows), dtype=object),
+        datetime=pd.Series(dates.strftime('%Y-%m-%d %H:%M:%S'), dtype=object),
+        email=pd.Series([f'user{i}@example.com' for i in rng.integers(0, rows, rows)]),
+        integer=pd.Series(rng.integers(0, 1000, rows).astype(str), dtype=object),
+        decimal=pd.Series(np.round(rng.normal(100, 10, rows), 2).astype(str), dtype=object),
+        phone=pd.Series([
+            f'({i // 10**7:03}) {i // 10**4 % 1000:03}-{i % 10**4:04}'
+            for i in rng.integers(2 * 10**9, 10**10, rows)
+        ]),
+        text=pd.Series([
+            ' '.join(sentence) for sentence in rng.choice(words, (rows, 6))
+        ]),
+    )
+
+
+def build_frame(columns: int, rows: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    by_kind = build_columns(rows, rng)
+    kinds = list(by_kind.keys())
+    data = dict()
+    for i in range(columns):
+        kind = kinds[i % len(kinds)]
+        series = by_kind[kind].copy()
+        # Some nulls and values with quotes and spaces to strip.
+        series[rng.integers(0, rows, rows // 20)] = None
+        series[rng.integers(0, rows, rows // 50)] = ' "' + str(series.iloc[0]) + '" '
+        data[f'{kind}_{i}'] = series
+    return pd.DataFrame(data)
+
+
+def measure(df: pd.DataFrame, infer) -> tuple:
+    start = time.perf_counter()
+    types = [infer(df[column], column, dict()) for column in df.columns]
+    return time.perf_counter() - start, types
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--wide-columns', type=int, default=500)
+    parser.add_argument('--wide-rows', type=int, default=1000)
+    parser.add_argument('--long-columns', type=int, default=14)
+    parser.add_argument('--long-rows', type=int, default=100000)
+    args = parser.parse_args()
+
+    print(f'{"frame":>18} {"previous":>10} {"current":>10} {"speedup":>8}')
+    for columns, rows in [
+        (args.wide_columns, args.wide_rows),
+        (args.long_columns, args.long_rows),
+    ]:
+        df = build_frame(columns, rows)
+        previous_seconds, previous_types = measure(df, previous_infer_object_type)
+        current_seconds, current_types = measure(df, infer_object_type)
+        assert previous_types == current_types, 'The inferred column types are different.'
+        print(
+            f'{f"{columns}x{rows}":>18} {previous_seconds:>9.3f}s {current_seconds:>9.3f}s '
+            f'{previous_seconds / current_seconds:>7.1f}x'
+        )
@@ -0,0 +1,48 @@
+"""
+Benchmark the time it takes the children of a dynamic block to read their input, as the
+number of items the dynamic block returns grows.
+
+Reading the whole output in each child grows quadratically with the number of items, while
+reading each child's item from the item index grows linearly.
+
+    python scripts/benchmarks/dynamic_fan_out.py --items 1000 2000 4000 8000
+"""
+import argparse
+import shutil
+import tempfile
+import time
+
+from mage_ai.data_preparation.models.variable import Variable
+
+
+def build_items(count: int):
+    return [
+        dict(id=i, name=f'item_{i}', tags=['mage', 'dynamic'], values=list(range(10)))
+        for i in range(count)
+    ]
+
+
+def measure(count: int, indexed: bool) -> float:
+    pipeline_path = tempfile.mkdtemp()
+    try:
+        Variable('output_0', pipeline_path, 'dynamic_block').write_data(
+            build_items(count),
+            index_items=indexed,
+        )
+        start = time.perf_counter()
+        for index in range(count):
+            # Each child creates its own variable object, like fetch_input_variables does.
+            Variable('output_0', pipeline_path, 'dynamic_block').read_item(index)
+        return time.perf_counter() - start
+    finally:
+        shutil.rmtree(pipeline_path)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--items', type=int, nargs='+', default=[1000, 2000, 4000])
+    args = parser.parse_args()
+
+    print(f'{"items":>8} {"whole output":>14} {"item index":>12}')
+    for count in args.items:
+        print(f'{count:>8} {measure(count, False):>13.3f}s {measure(count, True):>11.3f}s')
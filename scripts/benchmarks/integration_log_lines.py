@@ -0,0 +1,67 @@
+"""
+Benchmark the throughput of the loop that reads the output of a source in the parent process
+and passes each line to print_log_from_line, on a synthetic output of Singer RECORD messages
+with a log message every 1000 records.
+
+Parsing every line as JSON, like print_log_from_line did before, is compared to skipping the
+lines that can't be logs.
+
+    PYTHONPATH=.:mage_integrations python scripts/benchmarks/integration_log_lines.py
+"""
+import argparse
+import json
+import logging
+import time
+
+import simplejson
+
+from mage_ai.data_integrations.logger.utils import print_log_from_line
+
+
+def build_lines(count: int, columns: int):
+    record = {f'column_{i}': f'value {i}' if i % 2 else i * 1.5 for i in range(columns)}
+    log = simplejson.dumps(dict(
+        caller='Source',
+        level='INFO',
+        message='Fetched 1000 records.',
+        tags=dict(stream='users'),
+        timestamp=int(time.time()),
+        type='LOG',
+    ))
+    lines = []
+    for i in range(count):
+        if i % 1000 == 0:
+            lines.append(f'{log}\n'.encode())
+        lines.append(
+            f'{simplejson.dumps(dict(type="RECORD", stream="users", record=record))}\n'.encode(),
+        )
+    return lines
+
+
+def measure(lines, parse_every_line: bool) -> float:
+    logger = logging.getLogger('integration_log_lines')
+    logger.addHandler(logging.NullHandler())
+    logger.propagate = False
+
+    start = time.perf_counter()
+    for line in lines:
+        if parse_every_line:
+            json.loads(line)
+        print_log_from_line(line, logger=logger)
+    return time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--lines', type=int, default=200_000)
+    parser.add_argument('--columns', type=int, nargs='+', default=[5, 20, 100])
+    args = parser.parse_args()
+
+    print(f'{"columns":>8} {"parse every line":>18} {"skip records":>14}')
+    for columns in args.columns:
+        lines = build_lines(args.lines, columns)
+        results = []
+        for parse_every_line in [True, False]:
+            seconds = measure(lines, parse_every_line)
+            results.append(f'{len(lines) / seconds:,.0f} lines/s')
+        print(f'{columns:>8} {results[0]:>18} {results[1]:>14}')
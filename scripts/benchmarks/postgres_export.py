@@ -0,0 +1,131 @@
+"""
+Benchmark the rows/sec of exporting a data frame to PostgreSQL with COPY.
+
+Without --host, only the encoding of the COPY data is measured: the previous implementation,
+which serialized a full copy of the data frame into one CSV buffer, against the chunked CSV
+and binary encoders. With --host, the data frame is also exported to a table with
+`Postgres.export` and with the previous implementation.
+
+    python scripts/benchmarks/postgres_export.py --rows 1000000
+    python scripts/benchmarks/postgres_export.py --rows 1000000 --host localhost \
+        --dbname postgres --user postgres --password postgres
+"""
+import argparse
+import time
+from io import StringIO
+
+import numpy as np
+import pandas as pd
+
+from mage_ai.io.postgres_copy import (
+    binary_copy_values,
+    iter_binary_copy_chunks,
+    iter_csv_copy_chunks,
+)
+
+COLUMN_TYPES = dict(
+    id='bigint',
+    amount='double precision',
+    quantity='integer',
+    active='boolean',
+    created_at='timestamp without time zone',
+)
+
+
+def build_df(rows: int, with_text: bool) -> pd.DataFrame:
+    df = pd.DataFrame(dict(
+        id=np.arange(rows, dtype=np.int64),
+        amount=np.random.rand(rows) * 1000,
+        quantity=np.random.randint(0, 1000, rows),
+        active=np.random.rand(rows) > 0.5,
+        created_at=pd.Timestamp('2023-01-01') + pd.to_timedelta(np.arange(rows), unit='s'),
+    ))
+    if with_text:
+        df['name'] = np.random.choice(['mage', 'data', 'pipeline', 'block'], rows)
+    return df
+
+
+def legacy_copy_buffer(df: pd.DataFrame) -> StringIO:
+    df_ = df.copy()
+    for col in df_.columns:
+        if df_[col].dtype == object:
+            df_[col] = df_[col].apply(lambda x: x)
+    df_.replace({np.NaN: None}, inplace=True)
+    buffer = StringIO()
+    df_.to_csv(buffer, header=False, index=False, na_rep='')
+    buffer.seek(0)
+    return buffer
+
+
+def measure(name: str, rows: int, func) -> None:
+    start = time.perf_counter()
+    func()
+    seconds = time.perf_counter() - start
+    print(f'{name:<40} {seconds:>8.3f}s {rows / seconds:>14,.0f} rows/sec')
+
+
+def consume(chunks) -> None:
+    for _ in chunks:
+        pass
+
+
+def benchmark_encoding(df: pd.DataFrame) -> None:
+    rows = len(df.index)
+    measure('legacy CSV buffer', rows, lambda: legacy_copy_buffer(df))
+    measure('chunked CSV', rows, lambda: consume(iter_csv_copy_chunks(df, dict())))
+    if binary_copy_values(df, COLUMN_TYPES) is not None:
+        measure('chunked binary', rows, lambda: consume(iter_binary_copy_chunks(
+            binary_copy_values(df, COLUMN_TYPES),
+        )))
+
+
+def benchmark_export(df: pd.DataFrame, args) -> None:
+    from mage_ai.io.postgres import Postgres
+
+    rows = len(df.index)
+    table_name = 'mage_benchmark_export'
+    with Postgres(
+        dbname=args.dbname,
+        user=args.user,
+        password=args.password,
+        host=args.host,
+        port=args.port,
+        verbose=False,
+    ) as loader:
+        def export():
+            loader.export(df, args.schema, table_name, if_exists='replace')
+
+        def legacy_export():
+            columns = ', '.join(f'"{col}"' for col in df.columns)
+            with loader.conn.cursor() as cur:
+                cur.execute(f'DELETE FROM {args.schema}.{table_name}')
+                cur.copy_expert(
+                    f'COPY {args.schema}.{table_name} ({columns}) FROM STDIN (FORMAT csv)',
+                    legacy_copy_buffer(df),
+                )
+            loader.conn.commit()
+
+        # Create the table before measuring.
+        export()
+        measure('Postgres.export (legacy COPY)', rows, legacy_export)
+        measure('Postgres.export', rows, export)
+        loader.execute(f'DROP TABLE {args.schema}.{table_name}')
+        loader.commit()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=1000000)
+    parser.add_argument('--with_text', action='store_true')
+    parser.add_argument('--host', type=str)
+    parser.add_argument('--port', type=int, default=5432)
+    parser.add_argument('--dbname', type=str, default='postgres')
+    parser.add_argument('--user', type=str, default='postgres')
+    parser.add_argument('--password', type=str, default='postgres')
+    parser.add_argument('--schema', type=str, default='public')
+    args = parser.parse_args()
+
+    df = build_df(args.rows, args.with_text)
+    benchmark_encoding(df)
+    if args.host:
+        benchmark_export(df, args)
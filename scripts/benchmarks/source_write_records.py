@@ -0,0 +1,129 @@
+"""
+Benchmark the records/sec of Source.write_records on pages of rows shaped like the rows of
+the SQL sources: integers, decimals, strings, datetimes and NULL values, of a sorted
+incremental stream.
+
+The previous implementation, which serialized and flushed one RECORD message and one STATE
+message per row, is compared to writing the RECORD messages of a page in batches and one
+STATE message per page. The messages are written to a pipe, like the output of a source.
+
+    PYTHONPATH=mage_integrations python scripts/benchmarks/source_write_records.py
+"""
+import argparse
+import subprocess
+import sys
+import time
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+import singer
+
+from mage_integrations.sources.base import Source
+from mage_integrations.sources.catalog import Catalog
+from mage_integrations.sources.messages import write_record, write_state
+from mage_integrations.utils.schema_helpers import extract_selected_columns
+
+
+def build_stream(columns: int):
+    properties = dict(id=dict(type=['integer']))
+    for idx in range(1, columns):
+        if idx % 4 == 0:
+            properties[f'column_{idx}'] = dict(type=['null', 'string'], format='date-time')
+        elif idx % 4 == 1:
+            properties[f'column_{idx}'] = dict(type=['null', 'number'])
+        else:
+            properties[f'column_{idx}'] = dict(type=['null', 'string'])
+
+    return Catalog.from_dict(dict(streams=[dict(
+        bookmark_properties=['id'],
+        key_properties=['id'],
+        metadata=[
+            dict(breadcrumb=[], metadata=dict(inclusion='available')),
+        ] + [
+            dict(
+                breadcrumb=['properties', col],
+                metadata=dict(inclusion='available', selected=True),
+            )
+            for col in properties
+        ],
+        replication_method='INCREMENTAL',
+        schema=dict(properties=properties, type='object'),
+        stream='users',
+        tap_stream_id='users',
+    )])).streams[0]
+
+
+def build_rows(stream, count: int):
+    properties = stream.schema.to_dict()['properties']
+    created_at = datetime(2023, 1, 1)
+    rows = []
+    for idx in range(count):
+        row = dict(id=idx)
+        for col, column_properties in properties.items():
+            if col == 'id':
+                continue
+            if idx % 10 == 0:
+                row[col] = None
+            elif column_properties.get('format') == 'date-time':
+                row[col] = created_at + timedelta(seconds=idx)
+            elif 'number' in column_properties['type']:
+                row[col] = Decimal(idx) / 100
+            else:
+                row[col] = f'value {idx}'
+        rows.append(row)
+    return rows
+
+
+def previous_write_records(source: Source, stream, rows):
+    columns = extract_selected_columns(stream.metadata)
+    for row in rows:
+        record = {col: row.get(col) for col in columns}
+        write_record(stream.tap_stream_id, record)
+        state = {}
+        singer.write_bookmark(state, stream.tap_stream_id, 'id', row.get('id'))
+        write_state(state)
+
+
+def measure(write, source: Source, stream, pages) -> float:
+    # Like the integration pipelines, the messages are written to a pipe read by another
+    # process.
+    proc = subprocess.Popen(['cat'], stdin=subprocess.PIPE, stdout=subprocess.DEVNULL, text=True)
+    stdout = sys.stdout
+    sys.stdout = proc.stdin
+    try:
+        start = time.perf_counter()
+        for rows in pages:
+            write(source, stream, rows)
+        return time.perf_counter() - start
+    finally:
+        sys.stdout = stdout
+        proc.stdin.close()
+        proc.wait()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=100_000)
+    parser.add_argument('--page_size', type=int, default=10_000)
+    parser.add_argument('--columns', type=int, nargs='+', default=[5, 20, 50])
+    args = parser.parse_args()
+
+    source = Source(is_sorted=True)
+
+    print(f'{"columns":>8} {"per record":>18} {"per page":>18} {"speedup":>8}')
+    for columns in args.columns:
+        stream = build_stream(columns)
+        rows = build_rows(stream, args.rows)
+        pages = [rows[idx:idx + args.page_size] for idx in range(0, len(rows), args.page_size)]
+
+        previous_seconds = measure(previous_write_records, source, stream, pages)
+        seconds = measure(
+            lambda source, stream, rows: source.write_records(stream, rows),
+            source,
+            stream,
+            pages,
+        )
+        print(
+            f'{columns:>8} {f"{len(rows) / previous_seconds:,.0f} records/s":>18} '
+            f'{f"{len(rows) / seconds:,.0f} records/s":>18} {previous_seconds / seconds:>7.1f}x',
+        )